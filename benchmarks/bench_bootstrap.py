@@ -0,0 +1,92 @@
+"""
+Benchmark: Session Bootstrap and Underwriting Against Stand-in Services
+Runs session bootstrap and the underwriting bureau lookups with CRM, credit
+bureau and offer mart replaced by latency-injecting stand-ins
+
+Run: python benchmarks/bench_bootstrap.py [--profile realistic] [--http]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_data.repository import get_repository
+from mock_data.standin_services import build_http_clients, build_standins, make_http_server
+from services import data_sources
+from services.bureau_client import bureau_client
+from services.metrics import percentile
+from services.prefetch_cache import kyc_prefetch_cache
+from services.session_bootstrap import bootstrap_session_state, invalidate_base_state
+
+SEED = 42
+ROUNDS = 5
+
+
+def reset_caches():
+    invalidate_base_state()
+    kyc_prefetch_cache.invalidate()
+    bureau_client.invalidate()
+
+
+async def time_bootstrap(customer_ids):
+    """Bootstrap every customer concurrently; return per-session latencies in ms."""
+    async def one(customer_id):
+        start = time.perf_counter()
+        await bootstrap_session_state(customer_id)
+        return (time.perf_counter() - start) * 1000
+
+    return await asyncio.gather(*(one(customer_id) for customer_id in customer_ids))
+
+
+async def main(profile: str, use_http: bool):
+    standins = build_standins(profile, seed=SEED)
+    if use_http:
+        server = make_http_server(standins, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        data_sources.use_standins(build_http_clients(base_url), label=f"http:{base_url}")
+    else:
+        data_sources.use_standins(standins, label=f"in-process:{profile}")
+
+    customer_ids = [customer["customer_id"] for customer in get_repository().list_customers()]
+    print(f"Stand-ins: {data_sources.active_sources()} | customers: {len(customer_ids)} | rounds: {ROUNDS}")
+
+    cold, warm = [], []
+    for _ in range(ROUNDS):
+        reset_caches()
+        cold.extend(await time_bootstrap(customer_ids))
+        warm.extend(await time_bootstrap(customer_ids))
+
+    print(f"{'bootstrap':>12} | {'p50 (ms)':>9} | {'p99 (ms)':>9} | {'mean (ms)':>9}")
+    print("-" * 50)
+    for label, samples in (("cold", cold), ("warm", warm)):
+        print(f"{label:>12} | {percentile(samples, 50):>9.1f} | {percentile(samples, 99):>9.1f} | {statistics.mean(samples):>9.1f}")
+
+    # Underwriting: fetch_credit_score + evaluate_loan_eligibility both read the bureau
+    reset_caches()
+    calls_before = bureau_client.snapshot()["bureau_calls"]
+    for customer_id in customer_ids:
+        await bootstrap_session_state(customer_id)
+        for _ in range(2):
+            try:
+                bureau_client.get_credit_score(customer_id)
+            except Exception:
+                pass
+    bureau_calls = bureau_client.snapshot()["bureau_calls"] - calls_before
+    print(f"\nBureau calls for {len(customer_ids)} bootstrap + underwriting journeys: {bureau_calls}")
+    print(f"Stand-in stats: { {name: service.stats for name, service in standins.items()} }")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", default="realistic")
+    parser.add_argument("--http", action="store_true", help="serve the stand-ins over local HTTP")
+    args = parser.parse_args()
+    asyncio.run(main(args.profile, args.http))
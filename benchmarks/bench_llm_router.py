@@ -0,0 +1,95 @@
+"""
+Benchmark: Hedged and Failover LLM Routing Against Fake Providers
+Sends chat completions through services.model_router to local fake
+Mistral-compatible endpoints: a long-tailed primary with and without a
+hedge to a fast secondary, then a primary that is down (failover)
+
+Run: python benchmarks/bench_llm_router.py [--requests 200] [--budget 0.8]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import litellm
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_data.fake_llm_provider import start_fake_provider
+from services.metrics import percentile
+from services.model_router import ModelRouter
+
+SEED = 42
+MODEL = "mistral/mistral-large-2411"
+MESSAGES = [{"role": "user", "content": "ping"}]
+CONCURRENCY = 16
+
+
+def endpoint(api_base: str, name: str, budget: float):
+    return {"model": MODEL, "name": name, "api_base": api_base, "api_key": "fake", "budget_seconds": budget}
+
+
+async def run(router: ModelRouter, requests: int):
+    """Send `requests` completions, CONCURRENCY at a time; return (latencies in ms, answers by provider, errors)."""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies, winners, errors = [], {}, 0
+
+    async def one():
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await router.acompletion(MODEL, MESSAGES)
+            except Exception:
+                errors += 1
+                return
+            latencies.append((time.perf_counter() - start) * 1000)
+            content = response.choices[0].message.content
+            winners[content] = winners.get(content, 0) + 1
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies, winners, errors
+
+
+async def main(requests: int, budget: float):
+    litellm.suppress_debug_info = True
+    _, tail_base, _ = start_fake_provider("primary", "tail", seed=SEED)
+    _, fast_base, _ = start_fake_provider("secondary", "fast", seed=SEED + 1)
+    _, down_base, _ = start_fake_provider("primary-down", "down", seed=SEED + 2)
+
+    scenarios = [
+        ("primary only", [endpoint(tail_base, "primary", budget)]),
+        ("hedged", [endpoint(tail_base, "primary", budget), endpoint(fast_base, "secondary", budget)]),
+        ("failover", [endpoint(down_base, "primary-down", budget), endpoint(fast_base, "secondary", budget)]),
+    ]
+
+    print(f"Requests per scenario: {requests} | concurrency: {CONCURRENCY} | budget: {budget}s")
+    print(f"{'scenario':>14} | {'p50 (ms)':>9} | {'p95 (ms)':>9} | {'p99 (ms)':>9} | {'mean (ms)':>9} | {'errors':>6} | answered by")
+    print("-" * 100)
+    routers = []
+    for label, route in scenarios:
+        router = ModelRouter(routes={MODEL: route})
+        latencies, winners, errors = await run(router, requests)
+        routers.append((label, router))
+        print(f"{label:>14} | {percentile(latencies, 50):>9.1f} | {percentile(latencies, 95):>9.1f} | "
+              f"{percentile(latencies, 99):>9.1f} | {statistics.mean(latencies):>9.1f} | {errors:>6} | {winners}")
+
+    for label, router in routers:
+        snapshot = router.snapshot()
+        print(f"\n{label}: hedged {snapshot['hedged_requests']}, failovers {snapshot['failovers']}, exhausted {snapshot['exhausted']}")
+        for name, stats in snapshot["endpoints"].items():
+            print(f"  {name:>14}: calls {stats['calls']}, wins {stats['wins']}, failures {stats['failures']}, "
+                  f"cancelled {stats['cancelled']}, p95 {stats['latency_ms']['p95']} ms, "
+                  f"hedge delay {stats['hedge_delay_seconds']}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--budget", type=float, default=0.8, help="latency budget (seconds) before hedging")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.budget))
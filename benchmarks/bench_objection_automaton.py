@@ -0,0 +1,160 @@
+"""
+Benchmark: Objection Phrase Automaton vs Substring Scan
+1. Equivalence: detect_objection() against the previous per-phrase substring
+   scan on messages built from the built-in objection phrases (alone, inside
+   sentences, mixed case, several per message) and the labelled sentiment turns,
+   and real words one typo away from a phrase word that must not match
+2. Scaling: per-message detection time over synthetic Hinglish-style phrase
+   dictionaries from 50 to 100k phrases, substring scan vs automaton
+   (exact and with one-typo matching)
+
+Run: python benchmarks/bench_objection_automaton.py [--messages 200] [--max-phrases 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_data.objection_handler import OBJECTION_TYPES, detect_objection
+from mock_data.phrase_automaton import PhraseAutomaton
+from mock_data.sentiment_training_data import LABELLED_TURNS
+
+SEED = 42
+SYLLABLES = ["ka", "ki", "na", "hai", "ra", "ma", "pa", "la", "sa", "ta", "ja", "da", "ba", "cha", "ya", "va",
+             "ho", "ne", "se", "ko", "mein", "tha", "kar", "rah", "bh", "gh", "lo", "an", "en", "in"]
+TEMPLATES = ["{}", "{}.", "Hmm, {}!", "Honestly {} - please help", "{}? Also tell me the next steps", "OK but {}"]
+# Correctly spelled words one edit from a phrase word (reply/repay, shared/scared, water/later,
+# honey/money, store/score): fuzzy matching must leave them alone
+NEAR_MISSES = [
+    "what if I cant reply today?",
+    "I shared of taking loan with my wife",
+    "maybe water",
+    "need honey urgently",
+    "credit store not good",
+]
+
+
+def substring_scan(message: str, phrases: dict) -> dict:
+    """The previous detect_objection() matching: every phrase of every type, `in` the lowercased message."""
+    lowered = message.lower()
+    found = {}
+    for label, items in phrases.items():
+        hits = [index for index, phrase in enumerate(items) if phrase in lowered]
+        if hits:
+            found[label] = hits
+    return found
+
+
+def substring_detect(message: str, fold_phrases: bool = False) -> list:
+    """
+    Previous detect_objection() output, for the equivalence check.
+
+    It lowercased only the message, so phrases with capitals ("will I get
+    approved") never matched; fold_phrases=True lowercases them too.
+    """
+    detected = []
+    for objection_type, details in OBJECTION_TYPES.items():
+        matched = [phrase for phrase in details["common_phrases"]
+                   if (phrase.lower() if fold_phrases else phrase) in message.lower()]
+        if matched:
+            detected.append({
+                "type": objection_type,
+                "category": details["category"],
+                "severity": details["severity"],
+                "confidence": min(len(matched) / len(details["common_phrases"]), 1.0),
+                "matched_phrases": matched,
+                "counter_strategies": list(details["counter_strategies"]),
+            })
+    detected.sort(key=lambda x: x["confidence"], reverse=True)
+    return detected
+
+
+def equivalence_messages(rng: random.Random) -> list:
+    phrases = [phrase for details in OBJECTION_TYPES.values() for phrase in details["common_phrases"]]
+    messages = [template.format(phrase) for phrase in phrases for template in TEMPLATES]
+    messages += [phrase.upper() for phrase in phrases] + [phrase.capitalize() for phrase in phrases]
+    for _ in range(500):
+        messages.append(", and ".join(rng.sample(phrases, rng.randint(2, 4))))
+    messages += [text for text, _ in LABELLED_TURNS]
+    return messages
+
+
+def synthetic_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def synthetic_dictionary(rng: random.Random, phrases: int, labels: int = 100) -> dict:
+    vocabulary = [synthetic_word(rng) for _ in range(max(500, phrases // 5))]
+    dictionary = {f"OBJECTION_{label:03d}": [] for label in range(labels)}
+    for index in range(phrases):
+        dictionary[f"OBJECTION_{index % labels:03d}"].append(" ".join(rng.sample(vocabulary, rng.randint(2, 4))))
+    return dictionary, vocabulary
+
+
+def synthetic_messages(rng: random.Random, dictionary: dict, vocabulary: list, count: int) -> list:
+    all_phrases = [phrase for items in dictionary.values() for phrase in items]
+    messages = []
+    for _ in range(count):
+        words = [rng.choice(vocabulary) for _ in range(25)]
+        for _ in range(rng.randint(0, 2)):
+            position = rng.randint(0, len(words))
+            words[position:position] = [rng.choice(all_phrases)]
+        messages.append(" ".join(words))
+    return messages
+
+
+def per_message_us(fn, messages: list) -> float:
+    start = time.perf_counter()
+    for message in messages:
+        fn(message)
+    return (time.perf_counter() - start) / len(messages) * 1e6
+
+
+def main(messages: int, max_phrases: int):
+    rng = random.Random(SEED)
+
+    corpus = equivalence_messages(rng)
+    different = [message for message in corpus if detect_objection(message) != substring_detect(message)]
+    folded = [message for message in corpus if detect_objection(message) != substring_detect(message, fold_phrases=True)]
+    print(f"Equivalence on built-in phrases: {len(corpus)} messages")
+    print(f"  identical to substring scan:                  {len(corpus) - len(different)}")
+    print(f"  identical with case-folded phrases:           {len(corpus) - len(folded)}")
+    for message in folded[:10]:
+        print(f"  differs: {message!r}")
+    false_hits = [message for message in NEAR_MISSES if detect_objection(message)]
+    print(f"  near-miss words left unmatched:               {len(NEAR_MISSES) - len(false_hits)}/{len(NEAR_MISSES)}")
+    for message in false_hits:
+        print(f"  fuzzy false positive: {message!r}")
+
+    print(f"\n{'phrases':>8} | {'build (ms)':>10} | {'nodes':>8} | {'scan (us/msg)':>13} | "
+          f"{'exact (us/msg)':>14} | {'fuzzy (us/msg)':>14} | {'same hits':>9}")
+    print("-" * 95)
+    for size in (50, 1000, 10000, 100000):
+        if size > max_phrases:
+            break
+        dictionary, vocabulary = synthetic_dictionary(rng, size)
+        sample = synthetic_messages(rng, dictionary, vocabulary, messages)
+        start = time.perf_counter()
+        fuzzy = PhraseAutomaton(dictionary)
+        build_ms = (time.perf_counter() - start) * 1000
+        exact = PhraseAutomaton(dictionary, fuzzy_min_length=0)
+        # Synthetic words are space-separated, so whole-word matches equal substring matches
+        # except where a phrase happens to appear inside longer words
+        same = sum(exact.find(message) == substring_scan(message, dictionary) for message in sample)
+        print(f"{size:>8} | {build_ms:>10.0f} | {fuzzy.stats()['nodes']:>8} | "
+              f"{per_message_us(lambda m: substring_scan(m, dictionary), sample):>13.1f} | "
+              f"{per_message_us(exact.find, sample):>14.1f} | {per_message_us(fuzzy.find, sample):>14.1f} | "
+              f"{same:>4}/{len(sample)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--max-phrases", type=int, default=100000)
+    args = parser.parse_args()
+    main(args.messages, args.max_phrases)
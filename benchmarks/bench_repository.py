@@ -0,0 +1,89 @@
+"""
+Benchmark: Customer Repository at Scale
+Generates (or opens) a synthetic customer book and times the repository
+lookups used by agent tools and the admin endpoints
+
+Run: python benchmarks/bench_repository.py [--count 100000] [--book book.db|book_dir/]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_data.book_generator import DEFAULT_SEED, open_book, write_sqlite
+from mock_data.repository import DEFAULT_PAGE_SIZE
+from services.metrics import percentile
+
+LOOKUPS = 2000
+
+
+def time_calls(function, arguments):
+    """Call function once per argument; return latencies in microseconds."""
+    samples = []
+    for argument in arguments:
+        start = time.perf_counter()
+        function(argument)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def main(count: int, book: str, seed: int):
+    if book is None:
+        book = os.path.join(tempfile.mkdtemp(), "book.db")
+        start = time.perf_counter()
+        write_sqlite(book, count, seed)
+        elapsed = time.perf_counter() - start
+        print(f"Generated {count:,} customers in {elapsed:.1f}s ({count / elapsed:,.0f}/s) -> {book}")
+
+    repository = open_book(book)
+    total = repository.count_customers()
+    print(f"Book: {book} | customers: {total:,}")
+
+    # Sample real keys from across the book
+    rng = random.Random(seed)
+    sample = [
+        repository.list_customers(limit=1, offset=rng.randrange(total))[0]
+        for _ in range(min(LOOKUPS, total))
+    ]
+    ids = [c["customer_id"] for c in sample]
+    phones = [c["phone"] for c in sample]
+    pans = [c["pan_number"] for c in sample]
+    cities = [c["city"] for c in sample[:50]]
+    pages = [rng.randrange(max(1, total // DEFAULT_PAGE_SIZE)) for _ in range(50)]
+
+    benchmarks = [
+        ("customer by id", time_calls(repository.get_customer, ids)),
+        ("customer by phone", time_calls(repository.get_customer_by_phone, phones)),
+        ("bureau by PAN", time_calls(repository.get_credit_report_by_pan, pans)),
+        ("offer by id", time_calls(repository.get_offer, ids)),
+        ("kyc by id", time_calls(repository.get_kyc_record, ids)),
+        ("admin page", time_calls(lambda page: repository.list_customers(limit=DEFAULT_PAGE_SIZE,
+                                                                          offset=page * DEFAULT_PAGE_SIZE), pages)),
+        ("city page", time_calls(lambda city: repository.list_customers(limit=DEFAULT_PAGE_SIZE, city=city), cities)),
+        ("score range page", time_calls(lambda low: repository.find_customers_by_credit_score(
+            low, low + 10, limit=DEFAULT_PAGE_SIZE), [rng.randrange(600, 850) for _ in range(50)])),
+    ]
+
+    print(f"\n{'query':>18} | {'p50 (us)':>10} | {'p99 (us)':>10}")
+    print("-" * 44)
+    for label, samples in benchmarks:
+        print(f"{label:>18} | {percentile(samples, 50):>10.1f} | {percentile(samples, 99):>10.1f}")
+
+    start = time.perf_counter()
+    sources = repository.count_by_campaign_source()
+    print(f"\nCampaign source breakdown ({(time.perf_counter() - start) * 1000:.0f} ms): {sources}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100000, help="customers to generate (ignored with --book)")
+    parser.add_argument("--book", default=None, help="existing SQLite book or JSONL directory")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+    main(args.count, args.book, args.seed)
@@ -0,0 +1,101 @@
+"""
+Benchmark: Micro-Batched Sentiment Classification
+Escalated sentiment classifications from concurrent sessions (Poisson
+arrivals) sent through services.micro_batcher to a simulated provider with
+a per-call latency that grows with the number of messages in the prompt and
+a requests-per-second rate limit; batching off (1 item) vs on. Prompts are
+built with the real single/batched sentiment prompt builders.
+
+Run: python benchmarks/bench_sentiment_batcher.py [--messages 400] [--rate-limit 20]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_data.sentiment_analyzer import _batch_classification_prompt, _classification_prompt
+from mock_data.sentiment_training_data import LABELLED_TURNS
+from services.metrics import percentile
+from services.micro_batcher import MicroBatcher
+
+SEED = 42
+BASE_LATENCY = 0.6       # seconds per provider call
+PER_ITEM_LATENCY = 0.04  # extra seconds per message in a batched prompt
+
+
+class SimulatedProvider:
+    """Latency grows with batch size; at most `rate_limit` calls start per second (callers queue)."""
+
+    def __init__(self, rate_limit: float):
+        self.interval = 1.0 / rate_limit
+        self.next_slot = 0.0
+        self.calls = 0
+        self.prompt_chars = 0
+
+    async def _call(self, prompt: str, items: int):
+        loop = asyncio.get_running_loop()
+        slot = max(loop.time(), self.next_slot)
+        self.next_slot = slot + self.interval
+        await asyncio.sleep(slot - loop.time())
+        self.calls += 1
+        self.prompt_chars += len(prompt)
+        await asyncio.sleep(BASE_LATENCY + PER_ITEM_LATENCY * (items - 1))
+
+    async def classify_one(self, item):
+        await self._call(_classification_prompt(item[0], item[1], with_strategy=False), 1)
+        return {"sentiment": "NEUTRAL"}
+
+    async def classify_many(self, items):
+        await self._call(_batch_classification_prompt(items), len(items))
+        return [{"sentiment": "NEUTRAL"}] * len(items)
+
+
+async def run(messages: int, arrival_rate: float, rate_limit: float, batch_size: int, wait_ms: float):
+    provider = SimulatedProvider(rate_limit)
+    batcher = MicroBatcher("bench", provider.classify_many, provider.classify_one,
+                           max_batch_size=batch_size, max_wait_seconds=wait_ms / 1000)
+    rng = random.Random(SEED)
+    latencies = []
+
+    async def one(text):
+        start = time.perf_counter()
+        await batcher.submit((text, ""))
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    tasks = []
+    for index in range(messages):
+        text = f"{LABELLED_TURNS[index % len(LABELLED_TURNS)][0]} (session {index})"
+        tasks.append(asyncio.create_task(one(text)))
+        await asyncio.sleep(rng.expovariate(arrival_rate))
+    await asyncio.gather(*tasks)
+    return latencies, provider, batcher.snapshot()
+
+
+async def main(messages: int, rate_limit: float, wait_ms: float):
+    print(f"Messages: {messages} | provider: {BASE_LATENCY * 1000:.0f} ms + {PER_ITEM_LATENCY * 1000:.0f} ms/extra item, "
+          f"{rate_limit:.0f} calls/s | wait: {wait_ms} ms")
+    print(f"{'arrivals/s':>10} | {'batching':>8} | {'calls':>6} | {'mean batch':>10} | {'p50 (ms)':>9} | "
+          f"{'p95 (ms)':>9} | {'p99 (ms)':>9} | {'prompt KB':>9}")
+    print("-" * 92)
+    for arrival_rate in (20, 100, 400):
+        for batch_size in (1, 8):
+            latencies, provider, snapshot = await run(messages, arrival_rate, rate_limit, batch_size, wait_ms)
+            print(f"{arrival_rate:>10} | {'on' if batch_size > 1 else 'off':>8} | {provider.calls:>6} | "
+                  f"{snapshot['mean_batch_size'] or 1:>10} | {percentile(latencies, 50):>9.1f} | "
+                  f"{percentile(latencies, 95):>9.1f} | {percentile(latencies, 99):>9.1f} | "
+                  f"{provider.prompt_chars / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=400)
+    parser.add_argument("--rate-limit", type=float, default=20, help="provider calls per second")
+    parser.add_argument("--wait-ms", type=float, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.messages, args.rate_limit, args.wait_ms))
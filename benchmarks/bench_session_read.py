@@ -0,0 +1,79 @@
+"""
+Benchmark: Session State Reads
+Compares InMemorySessionService.get_session (copies the whole session, events included)
+with services.session_state.read_session_state (state projection, no event copy)
+
+Run: python benchmarks/bench_session_read.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from google.adk.events import Event, EventActions
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from services.session_state import read_session_state
+
+APP_NAME = "bench"
+USER_ID = "CUST001"
+TURN_COUNTS = [10, 100, 1000]
+READS = 200
+
+
+async def build_session(session_service, session_id: str, turns: int):
+    """Create a session and append `turns` user/agent exchanges with state deltas."""
+    session = await session_service.create_session(
+        app_name=APP_NAME,
+        user_id=USER_ID,
+        session_id=session_id,
+        state={"customer_id": USER_ID, "application_status": "NOT_STARTED", "credit_score": 780},
+    )
+    for turn in range(turns):
+        for author, text in (("user", f"message {turn}"), ("loan_master_agent", f"reply {turn} " * 20)):
+            event = Event(
+                invocation_id=f"inv-{turn}",
+                author=author,
+                content=types.Content(role="user" if author == "user" else "model", parts=[types.Part(text=text)]),
+                actions=EventActions(state_delta={"last_turn": turn}),
+            )
+            await session_service.append_event(session, event)
+
+
+async def time_reads(read, reads: int = READS) -> float:
+    """Return mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(reads):
+        await read()
+    return (time.perf_counter() - start) / reads * 1_000_000
+
+
+async def main():
+    session_service = InMemorySessionService()
+
+    print(f"{'turns':>8} | {'get_session (µs)':>18} | {'read_session_state (µs)':>24} | {'keys=3 (µs)':>12}")
+    print("-" * 72)
+    for turns in TURN_COUNTS:
+        session_id = f"session_{turns}"
+        await build_session(session_service, session_id, turns)
+
+        full_copy = await time_reads(lambda: session_service.get_session(
+            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+        ))
+        projection = await time_reads(lambda: read_session_state(
+            session_service, APP_NAME, USER_ID, session_id
+        ))
+        keyed = await time_reads(lambda: read_session_state(
+            session_service, APP_NAME, USER_ID, session_id,
+            keys=("customer_id", "application_status", "credit_score"),
+        ))
+        print(f"{turns:>8} | {full_copy:>18.1f} | {projection:>24.1f} | {keyed:>12.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -177,6 +177,7 @@ export default function ChatWindow({ sessionId, userId, onStateUpdate, customerN
                 user_id: userId,
                 message: userMessage.content,
                 language: selectedLanguage.name,
+                idempotency_key: userMessage.id,
             });
 
             const assistantMessage: Message = {
@@ -277,6 +278,7 @@ export default function ChatWindow({ sessionId, userId, onStateUpdate, customerN
                 user_id: userId,
                 message: uploadMessage,
                 language: selectedLanguage.name,
+                idempotency_key: userMessage.id,
             });
 
             const assistantMessage: Message = {
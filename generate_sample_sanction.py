@@ -1,6 +1,7 @@
 """
 Quick script to generate a sample sanction letter PDF
 """
+import asyncio
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -64,7 +65,7 @@ class MockToolContext:
 print("Generating sample sanction letter PDF...")
 tool_context = MockToolContext()
 
-result = generate_sanction_letter_pdf("CUST001", tool_context)
+result = asyncio.run(generate_sanction_letter_pdf("CUST001", tool_context))
 
 if result["status"] == "success":
     print(f"\n✅ SUCCESS!")
@@ -20,12 +20,13 @@ from .sub_agents.sales_agent.agent import sales_agent
 from .sub_agents.verification_agent.agent import verification_agent
 from .sub_agents.underwriting_agent.agent import underwriting_agent
 from .sub_agents.sanction_letter_agent.agent import sanction_letter_agent
+from services.model_router import routed_llm_client
 
 
 # Create the Master Loan Agent (Main Orchestrator)
 loan_master_agent = Agent(
    name="loan_master_agent",
-   model=LiteLlm(model="mistral/mistral-large-2411"),
+   model=LiteLlm(model="mistral/mistral-large-2411", llm_client=routed_llm_client),
     description="Master Agent for Tata Capital Personal Loan Digital Sales Assistant",
     instruction="""
     You are the Master Agent (Digital Sales Assistant) for Tata Capital Personal Loans.
@@ -12,13 +12,15 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
-from mock_data.customer_data import get_customer_by_id
 from mock_data.offer_mart import (
-    get_pre_approved_offer, 
     calculate_emi, 
     get_available_tenures,
     check_loan_eligibility
 )
+from services.customer_360 import aget_customer_360, thaw
+from services.event_log import log_event
+from services.model_router import routed_llm_client
+from services.session_state import StateBatch
 
 # Loan Purpose Categories with special features
 LOAN_PURPOSES = {
@@ -113,7 +115,7 @@ LOAN_PURPOSES = {
 }
 
 
-def get_customer_loan_offer(customer_id: str, tool_context: ToolContext) -> dict:
+async def get_customer_loan_offer(customer_id: str, tool_context: ToolContext) -> dict:
     """
     Fetches pre-approved loan offer details for a customer.
     Use this to show customers their personalized loan offers.
@@ -125,25 +127,27 @@ def get_customer_loan_offer(customer_id: str, tool_context: ToolContext) -> dict
     Returns:
         dict: Pre-approved offer details including amount, interest rate, tenure options
     """
-    result = get_pre_approved_offer(customer_id)
+    customer = await aget_customer_360(customer_id)
+    if customer is None:
+        return {"status": "error", "message": "Customer not found"}
     
-    if result["status"] == "success":
-        offer = result["offer"]
+    if customer.offer is not None:
+        offer = customer.offer
         
+        batch = StateBatch()
         # Update state with offer details
-        tool_context.state["current_offer"] = offer
-        tool_context.state["offer_shown"] = True
+        batch.set("current_offer", thaw(offer))
+        batch.set("offer_shown", True)
         
         # Add to interaction history
-        current_history = tool_context.state.get("interaction_history", [])
-        current_history.append({
+        log_event(batch, tool_context.state, {
             "action": "loan_offer_shown",
             "customer_id": customer_id,
             "pre_approved_amount": offer["pre_approved_amount"],
             "interest_rate": offer["interest_rate"],
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
-        tool_context.state["interaction_history"] = current_history
+        batch.apply(tool_context.state)
         
         return {
             "status": "success",
@@ -157,7 +161,7 @@ def get_customer_loan_offer(customer_id: str, tool_context: ToolContext) -> dict
             "min_loan_amount": f"₹{offer['min_loan_amount']:,}"
         }
     
-    return result
+    return customer.offer_result()
 
 
 def calculate_loan_emi(
@@ -279,7 +283,7 @@ def list_all_loan_purposes(tool_context: ToolContext) -> dict:
     }
 
 
-def initiate_loan_application(
+async def initiate_loan_application(
     customer_id: str,
     loan_amount: float,
     tenure_months: int,
@@ -303,7 +307,7 @@ def initiate_loan_application(
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Get customer details
-    customer = get_customer_by_id(customer_id)
+    customer = await aget_customer_360(customer_id)
     if not customer:
         return {"status": "error", "message": "Customer not found"}
     
@@ -311,7 +315,7 @@ def initiate_loan_application(
     application = {
         "application_id": f"LA{datetime.now().strftime('%Y%m%d%H%M%S')}",
         "customer_id": customer_id,
-        "customer_name": customer["name"],
+        "customer_name": customer.name,
         "loan_amount": loan_amount,
         "tenure_months": tenure_months,
         "purpose": purpose,
@@ -319,14 +323,14 @@ def initiate_loan_application(
         "status": "INITIATED"
     }
     
+    batch = StateBatch()
     # Store in state
-    tool_context.state["loan_application"] = application
-    tool_context.state["application_initiated"] = True
-    tool_context.state["application_status"] = "INITIATED"
+    batch.set("loan_application", application)
+    batch.set("application_initiated", True)
+    batch.set("application_status", "INITIATED")
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "loan_application_initiated",
         "application_id": application["application_id"],
         "loan_amount": loan_amount,
@@ -334,7 +338,7 @@ def initiate_loan_application(
         "purpose": purpose,
         "timestamp": current_time
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     return {
         "status": "success",
@@ -392,7 +396,7 @@ def show_emi_comparison(
 # Create the Sales Agent - Mr. Rajesh Kumar
 sales_agent = Agent(
     name="sales_agent",
-    model=LiteLlm(model="mistral/mistral-large-2411"),
+    model=LiteLlm(model="mistral/mistral-large-2411", llm_client=routed_llm_client),
     description="Mr. Rajesh Kumar - Loan Specialist who negotiates loan terms, discusses customer needs, amount, tenure and interest rates",
     instruction="""
     You are Mr. Rajesh Kumar, a friendly and experienced Loan Specialist at Tata Capital Personal Loans.
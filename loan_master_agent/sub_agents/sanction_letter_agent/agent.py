@@ -19,12 +19,26 @@ warnings.filterwarnings("ignore", category=UserWarning, module="cairocffi")
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
-from mock_data.customer_data import get_customer_by_id
 from mock_data.offer_mart import calculate_emi
 from mock_data.cross_sell_engine import recommend_cross_sell_products, format_cross_sell_message, get_cross_sell_summary
+from services.customer_360 import aget_customer_360
+from services.event_log import (
+    APPLICATION_INITIATED,
+    CREDIT_FETCHED,
+    KYC_COMPLETE,
+    LOAN_APPROVED,
+    LOAN_REJECTED,
+    OFFER_SHOWN,
+    SANCTION_ACCEPTED,
+    SANCTION_GENERATED,
+    iter_events,
+    log_event,
+)
+from services.model_router import routed_llm_client
+from services.session_state import StateBatch
 
 
-def generate_sanction_letter_pdf(customer_id: str, tool_context: ToolContext) -> dict:
+async def generate_sanction_letter_pdf(customer_id: str, tool_context: ToolContext) -> dict:
     """
     Generates a PDF sanction letter and saves it to the device.
     Uses fallback methods if WeasyPrint has font issues on Windows.
@@ -216,10 +230,8 @@ def generate_sanction_letter_pdf(customer_id: str, tool_context: ToolContext) ->
                     "message": f"All PDF generation methods failed: {'; '.join(error_messages)}. Final error: {str(e)}"
                 }
         
-        # Store PDF path in state - ensure sanction_letter dict exists
-        if "sanction_letter" not in tool_context.state:
-            tool_context.state["sanction_letter"] = {}
-        tool_context.state["sanction_letter"]["pdf_file_path"] = pdf_path
+        # Store PDF path in state (merge creates the sanction_letter dict if missing)
+        StateBatch().merge("sanction_letter", pdf_file_path=pdf_path).apply(tool_context.state)
         print(f"DEBUG: Stored PDF path in state: {pdf_path}")
         print(f"DEBUG: Full sanction_letter state: {tool_context.state.get('sanction_letter')}")
         
@@ -228,8 +240,8 @@ def generate_sanction_letter_pdf(customer_id: str, tool_context: ToolContext) ->
         email_message = ""
         try:
             # Get customer email
-            customer = get_customer_by_id(customer_id)
-            customer_email = tool_context.state.get("customer_email") or customer.get("email")
+            customer = await aget_customer_360(customer_id)
+            customer_email = tool_context.state.get("customer_email") or customer.email
             
             # Check if SMTP is configured
             smtp_email = os.getenv("SMTP_EMAIL")
@@ -299,7 +311,7 @@ def generate_sanction_letter_pdf(customer_id: str, tool_context: ToolContext) ->
         }
 
 
-def generate_sanction_letter(customer_id: str, tool_context: ToolContext) -> dict:
+async def generate_sanction_letter(customer_id: str, tool_context: ToolContext) -> dict:
     """
     Generates a sanction letter for approved loan.
     Creates PDF document with all loan details and terms.
@@ -326,7 +338,7 @@ def generate_sanction_letter(customer_id: str, tool_context: ToolContext) -> dic
     current_offer = tool_context.state.get("current_offer", {})
     
     # Get customer details
-    customer = get_customer_by_id(customer_id)
+    customer = await aget_customer_360(customer_id)
     if not customer:
         return {"status": "error", "message": "Customer not found"}
     
@@ -432,12 +444,12 @@ def generate_sanction_letter(customer_id: str, tool_context: ToolContext) -> dic
         "validity_until": validity_date,
         
         "borrower_details": {
-            "name": customer["name"],
+            "name": customer.name,
             "customer_id": customer_id,
-            "pan": customer["pan_number"],
-            "address": f"{customer['city']}",
-            "phone": customer["phone"],
-            "email": customer["email"]
+            "pan": customer.pan_number,
+            "address": f"{customer.city}",
+            "phone": customer.phone,
+            "email": customer.email
         },
         
         "loan_details": {
@@ -462,31 +474,30 @@ def generate_sanction_letter(customer_id: str, tool_context: ToolContext) -> dic
         },
         
         "disbursement_details": {
-            "bank_name": customer["bank_name"],
-            "account_number": customer["account_number"],
+            "bank_name": customer.bank_name,
+            "account_number": customer.account_number,
             "disbursement_mode": "NEFT/IMPS",
             "expected_disbursement": "Within 24-48 hours of document submission"
         }
     }
     
+    batch = StateBatch()
     # Store in state
-    tool_context.state["sanction_letter"] = sanction_letter
-    tool_context.state["sanction_reference"] = sanction_ref
-    tool_context.state["application_status"] = "SANCTION_GENERATED"
+    batch.set("sanction_letter", sanction_letter)
+    batch.set("sanction_reference", sanction_ref)
+    batch.set("application_status", "SANCTION_GENERATED")
     
     if "loan_application" in tool_context.state:
-        tool_context.state["loan_application"]["status"] = "SANCTION_GENERATED"
-        tool_context.state["loan_application"]["sanction_reference"] = sanction_ref
+        batch.merge("loan_application", status="SANCTION_GENERATED", sanction_reference=sanction_ref)
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "sanction_letter_generated",
         "sanction_reference": sanction_ref,
         "sanctioned_amount": loan_amount,
         "timestamp": current_time.strftime("%Y-%m-%d %H:%M:%S")
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     return {
         "status": "success",
@@ -494,7 +505,7 @@ def generate_sanction_letter(customer_id: str, tool_context: ToolContext) -> dic
         "sanction_reference": sanction_ref,
         "sanction_date": sanction_date,
         "validity_until": validity_date,
-        "borrower_name": customer["name"],
+        "borrower_name": customer.name,
         "loan_variant": loan_variant,
         "variant_special_features": variant_features,
         "sanctioned_amount": f"₹{loan_amount:,.0f}",
@@ -507,7 +518,7 @@ def generate_sanction_letter(customer_id: str, tool_context: ToolContext) -> dic
             "total_fee": f"₹{total_processing_fee:,.0f}"
         },
         "disbursement_amount": f"₹{disbursement_amount:,.0f}",
-        "disbursement_account": f"{customer['bank_name']} - {customer['account_number'][-4:].rjust(len(customer['account_number']), 'X')}",
+        "disbursement_account": f"{customer.bank_name} - {customer.account_number[-4:].rjust(len(customer.account_number), 'X')}",
         "first_emi_date": first_emi_date,
         "repayment_terms": {
             "foreclosure_within_12_months": "6.5% of outstanding principal",
@@ -669,7 +680,7 @@ Email: support@tatacapital.com
     }
 
 
-def send_sanction_letter(
+async def send_sanction_letter(
     customer_id: str,
     send_email: bool,
     send_sms: bool,
@@ -695,7 +706,7 @@ def send_sanction_letter(
             "message": "Sanction letter not found. Please generate it first."
         }
     
-    customer = get_customer_by_id(customer_id)
+    customer = await aget_customer_360(customer_id)
     if not customer:
         return {"status": "error", "message": "Customer not found"}
     
@@ -706,7 +717,7 @@ def send_sanction_letter(
         # Simulate email sending
         delivery_status.append({
             "channel": "Email",
-            "recipient": customer["email"],
+            "recipient": customer.email,
             "status": "Sent",
             "timestamp": current_time
         })
@@ -715,24 +726,24 @@ def send_sanction_letter(
         # Simulate SMS sending
         delivery_status.append({
             "channel": "SMS",
-            "recipient": customer["phone"],
+            "recipient": customer.phone,
             "status": "Sent",
             "message": f"Your Tata Capital Personal Loan of ₹{sanction_letter['loan_details']['sanctioned_amount']:,.0f} is sanctioned. Ref: {sanction_letter['sanction_reference']}",
             "timestamp": current_time
         })
     
+    batch = StateBatch()
     # Update state
-    tool_context.state["sanction_letter_sent"] = True
-    tool_context.state["delivery_status"] = delivery_status
+    batch.set("sanction_letter_sent", True)
+    batch.set("delivery_status", delivery_status)
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "sanction_letter_sent",
         "channels": [d["channel"] for d in delivery_status],
         "timestamp": current_time
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     return {
         "status": "success",
@@ -742,7 +753,7 @@ def send_sanction_letter(
     }
 
 
-def accept_sanction(customer_id: str, tool_context: ToolContext) -> dict:
+async def accept_sanction(customer_id: str, tool_context: ToolContext) -> dict:
     """
     Records customer's acceptance of sanction letter terms.
     This is the final step before disbursement.
@@ -764,24 +775,24 @@ def accept_sanction(customer_id: str, tool_context: ToolContext) -> dict:
     
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
+    batch = StateBatch()
     # Update state
-    tool_context.state["sanction_accepted"] = True
-    tool_context.state["acceptance_time"] = current_time
-    tool_context.state["application_status"] = "SANCTION_ACCEPTED"
+    batch.set("sanction_accepted", True)
+    batch.set("acceptance_time", current_time)
+    batch.set("application_status", "SANCTION_ACCEPTED")
     
     if "loan_application" in tool_context.state:
-        tool_context.state["loan_application"]["status"] = "SANCTION_ACCEPTED"
+        batch.merge("loan_application", status="SANCTION_ACCEPTED")
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "sanction_accepted",
         "sanction_reference": sanction_letter["sanction_reference"],
         "timestamp": current_time
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
-    customer = get_customer_by_id(customer_id)
+    customer = await aget_customer_360(customer_id)
     
     return {
         "status": "success",
@@ -792,13 +803,13 @@ def accept_sanction(customer_id: str, tool_context: ToolContext) -> dict:
             "1. E-Sign the loan agreement (link will be sent via email)",
             "2. Complete e-NACH mandate for EMI auto-debit",
             "3. Loan will be disbursed within 24-48 hours",
-            f"4. Amount of ₹{sanction_letter['loan_details']['disbursement_amount']:,.0f} will be credited to your {customer['bank_name']} account"
+            f"4. Amount of ₹{sanction_letter['loan_details']['disbursement_amount']:,.0f} will be credited to your {customer.bank_name} account"
         ],
         "support_contact": "1800-XXX-XXXX (Toll Free)"
     }
 
 
-def offer_cross_sell_products(customer_id: str, tool_context: ToolContext) -> dict:
+async def offer_cross_sell_products(customer_id: str, tool_context: ToolContext) -> dict:
     """
     🎁 Contextual Cross-Sell Engine
     Offers relevant additional products after successful loan approval.
@@ -810,7 +821,7 @@ def offer_cross_sell_products(customer_id: str, tool_context: ToolContext) -> di
     Returns:
         dict: Cross-sell product recommendations
     """
-    customer = get_customer_by_id(customer_id)
+    customer = await aget_customer_360(customer_id)
     loan_application = tool_context.state.get("loan_application", {})
     
     if not customer or not loan_application:
@@ -820,28 +831,28 @@ def offer_cross_sell_products(customer_id: str, tool_context: ToolContext) -> di
         }
     
     # Get recommended products
-    products = recommend_cross_sell_products(customer, loan_application)
+    products = recommend_cross_sell_products(customer.profile, loan_application)
     
     # Format the message
     cross_sell_message = format_cross_sell_message(
-        customer["name"],
+        customer.name,
         loan_application.get("loan_amount", 0),
         products
     )
     
+    batch = StateBatch()
     # Store in state
-    tool_context.state["cross_sell_products"] = products
-    tool_context.state["cross_sell_offered"] = True
-    tool_context.state["cross_sell_message"] = cross_sell_message
+    batch.set("cross_sell_products", products)
+    batch.set("cross_sell_offered", True)
+    batch.set("cross_sell_message", cross_sell_message)
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "cross_sell_offered",
         "products": [p["name"] for p in products],
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     return {
         "status": "success",
@@ -864,18 +875,18 @@ def log_cross_sell_response(customer_id: str, interested: bool, product_name: st
     Returns:
         dict: Confirmation message
     """
-    tool_context.state["cross_sell_accepted"] = interested
-    tool_context.state["cross_sell_product_selected"] = product_name if interested else None
+    batch = StateBatch()
+    batch.set("cross_sell_accepted", interested)
+    batch.set("cross_sell_product_selected", product_name if interested else None)
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "cross_sell_response",
         "interested": interested,
         "product": product_name,
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     if interested:
         return {
@@ -891,7 +902,20 @@ def log_cross_sell_response(customer_id: str, interested: bool, product_name: st
         }
 
 
-def get_loan_summary(customer_id: str, tool_context: ToolContext) -> dict:
+# Milestone events shown in the loan summary's journey timeline
+TIMELINE_EVENTS = (
+    OFFER_SHOWN,
+    APPLICATION_INITIATED,
+    KYC_COMPLETE,
+    CREDIT_FETCHED,
+    LOAN_APPROVED,
+    SANCTION_GENERATED,
+    SANCTION_ACCEPTED,
+    LOAN_REJECTED,
+)
+
+
+async def get_loan_summary(customer_id: str, tool_context: ToolContext) -> dict:
     """
     Provides complete loan journey summary.
     
@@ -904,7 +928,7 @@ def get_loan_summary(customer_id: str, tool_context: ToolContext) -> dict:
     """
     loan_application = tool_context.state.get("loan_application", {})
     sanction_letter = tool_context.state.get("sanction_letter", {})
-    customer = get_customer_by_id(customer_id)
+    customer = await aget_customer_360(customer_id)
     
     if not loan_application:
         return {
@@ -914,7 +938,7 @@ def get_loan_summary(customer_id: str, tool_context: ToolContext) -> dict:
     
     summary = {
         "status": "success",
-        "customer_name": customer["name"] if customer else "Customer",
+        "customer_name": customer.name if customer else "Customer",
         "application_id": loan_application.get("application_id", "N/A"),
         "application_date": loan_application.get("application_date", "N/A"),
         "current_status": tool_context.state.get("application_status", "UNKNOWN"),
@@ -930,8 +954,8 @@ def get_loan_summary(customer_id: str, tool_context: ToolContext) -> dict:
         "journey_timeline": []
     }
     
-    # Build timeline from interaction history
-    for interaction in tool_context.state.get("interaction_history", []):
+    # Build timeline from the event log's per-type chains (only milestone events are read)
+    for interaction in iter_events(tool_context.state, TIMELINE_EVENTS):
         action = interaction.get("action", "")
         timestamp = interaction.get("timestamp", "")
         
@@ -946,11 +970,10 @@ def get_loan_summary(customer_id: str, tool_context: ToolContext) -> dict:
             "loan_rejected": f"❌ Application declined ({interaction.get('reason', 'N/A')})"
         }
         
-        if action in action_map:
-            summary["journey_timeline"].append({
-                "event": action_map[action],
-                "timestamp": timestamp
-            })
+        summary["journey_timeline"].append({
+            "event": action_map[action],
+            "timestamp": timestamp
+        })
     
     if sanction_letter:
         summary["sanction_details"] = {
@@ -966,7 +989,7 @@ def get_loan_summary(customer_id: str, tool_context: ToolContext) -> dict:
 # Create the Sanction Letter Agent - Mr. Vikram Mehta
 sanction_letter_agent = Agent(
     name="sanction_letter_agent",
-    model=LiteLlm(model="mistral/mistral-large-2411"),
+    model=LiteLlm(model="mistral/mistral-large-2411", llm_client=routed_llm_client),
     description="Mr. Vikram Mehta - Documentation Officer who generates official sanction letters for approved loans",
     instruction="""
     You are Mr. Vikram Mehta, a meticulous and friendly Documentation Officer at Tata Capital.
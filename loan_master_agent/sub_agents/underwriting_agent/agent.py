@@ -20,12 +20,17 @@ try:
 except:
     pass  # Tesseract config is optional
 
-from mock_data.credit_bureau import get_credit_score, check_eligibility_by_score
-from mock_data.offer_mart import get_pre_approved_offer, calculate_emi, check_loan_eligibility
-from mock_data.customer_data import get_customer_by_id
+from mock_data.credit_bureau import check_eligibility_by_score
+from mock_data.offer_mart import calculate_emi, check_loan_eligibility
+from mock_data.standin_services import StandInError
+from services.event_log import log_event
+from services.bureau_client import bureau_client
+from services.customer_360 import aget_customer_360
+from services.model_router import routed_llm_client
+from services.session_state import StateBatch
 
 
-def fetch_credit_score(customer_id: str, tool_context: ToolContext) -> dict:
+async def fetch_credit_score(customer_id: str, tool_context: ToolContext) -> dict:
     """
     Fetches credit score from mock credit bureau API.
     ⚡ PARALLEL PROCESSING: Uses pre-fetched data if available
@@ -38,32 +43,40 @@ def fetch_credit_score(customer_id: str, tool_context: ToolContext) -> dict:
     Returns:
         dict: Credit score and credit history details
     """
-    # ⚡ Check if data was pre-fetched in parallel
-    prefetched_credit = tool_context.state.get("_prefetched_credit")
+    # ⚡ Check the bureau client cache (warmed in parallel at session start)
+    prefetched_credit = bureau_client.peek(customer_id)
     
-    if prefetched_credit and prefetched_credit.get("status") == "success":
+    if prefetched_credit is not None:
         result = prefetched_credit
         retrieval_time = "Instant (Pre-fetched)"
     else:
-        # Fetch normally if not pre-fetched
-        result = get_credit_score(customer_id)
+        # Fetch normally if not pre-fetched (shared with concurrent callers, off the event loop)
+        try:
+            result = await bureau_client.aget_credit_score(customer_id)
+        except (StandInError, OSError) as e:
+            print(f"⚠️ Credit bureau lookup failed for {customer_id}: {e}")
+            return {
+                "status": "error",
+                "message": "Credit bureau is temporarily unavailable. Please try again in a moment.",
+                "retryable": True
+            }
         retrieval_time = "Standard"
     
     if result["status"] == "success":
+        batch = StateBatch()
         # Store credit score in state
-        tool_context.state["credit_score"] = result["credit_score"]
-        tool_context.state["credit_history"] = result["credit_history"]
+        batch.set("credit_score", result["credit_score"])
+        batch.set("credit_history", result["credit_history"])
         
         # Add to interaction history
-        current_history = tool_context.state.get("interaction_history", [])
-        current_history.append({
+        log_event(batch, tool_context.state, {
             "action": "credit_score_fetched",
             "customer_id": customer_id,
             "credit_score": result["credit_score"],
             "retrieval_method": retrieval_time,
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
-        tool_context.state["interaction_history"] = current_history
+        batch.apply(tool_context.state)
         
         # Check basic eligibility
         eligibility = check_eligibility_by_score(result["credit_score"])
@@ -88,7 +101,7 @@ def fetch_credit_score(customer_id: str, tool_context: ToolContext) -> dict:
     return result
 
 
-def evaluate_loan_eligibility(
+async def evaluate_loan_eligibility(
     customer_id: str,
     requested_amount: float,
     tenure_months: int,
@@ -114,26 +127,26 @@ def evaluate_loan_eligibility(
     Returns:
         dict: Eligibility evaluation result with approval type
     """
-    # Get customer details first
-    customer = get_customer_by_id(customer_id)
+    # Profile, offer and bureau report in one view (built once per customer and data version)
+    customer = await aget_customer_360(customer_id)
     if not customer:
         return {"status": "error", "message": "Customer not found"}
     
-    monthly_salary = customer["monthly_salary"]
+    monthly_salary = customer.monthly_salary
     
     # Rule 1: Minimum income check (₹25,000)
     if monthly_salary < 25000:
-        tool_context.state["application_status"] = "REJECTED"
-        tool_context.state["rejection_reason"] = "Income below minimum threshold"
+        batch = StateBatch()
+        batch.set("application_status", "REJECTED")
+        batch.set("rejection_reason", "Income below minimum threshold")
         
-        current_history = tool_context.state.get("interaction_history", [])
-        current_history.append({
+        log_event(batch, tool_context.state, {
             "action": "loan_rejected",
             "reason": "Monthly income below minimum requirement of ₹25,000",
             "monthly_income": monthly_salary,
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
-        tool_context.state["interaction_history"] = current_history
+        batch.apply(tool_context.state)
         
         return {
             "status": "success",
@@ -147,17 +160,17 @@ def evaluate_loan_eligibility(
     
     # Rule 2: Maximum tenure check (72 months)
     if tenure_months > 72:
-        tool_context.state["application_status"] = "REJECTED"
-        tool_context.state["rejection_reason"] = "Tenure exceeds maximum limit"
+        batch = StateBatch()
+        batch.set("application_status", "REJECTED")
+        batch.set("rejection_reason", "Tenure exceeds maximum limit")
         
-        current_history = tool_context.state.get("interaction_history", [])
-        current_history.append({
+        log_event(batch, tool_context.state, {
             "action": "loan_rejected",
             "reason": "Requested tenure exceeds maximum of 72 months",
             "requested_tenure": tenure_months,
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
-        tool_context.state["interaction_history"] = current_history
+        batch.apply(tool_context.state)
         
         return {
             "status": "success",
@@ -170,25 +183,24 @@ def evaluate_loan_eligibility(
         }
     
     # Get credit score
-    credit_result = get_credit_score(customer_id)
-    if credit_result["status"] != "success":
+    if customer.credit_report is None:
         return {"status": "error", "message": "Unable to fetch credit score"}
     
-    credit_score = credit_result["credit_score"]
+    credit_score = customer.credit_score
     
     # Rule 3: Credit score must be >= 700 (Tata Capital minimum CIBIL requirement)
     if credit_score < 700:
-        tool_context.state["application_status"] = "REJECTED"
-        tool_context.state["rejection_reason"] = "Low credit score"
+        batch = StateBatch()
+        batch.set("application_status", "REJECTED")
+        batch.set("rejection_reason", "Low credit score")
         
-        current_history = tool_context.state.get("interaction_history", [])
-        current_history.append({
+        log_event(batch, tool_context.state, {
             "action": "loan_rejected",
             "reason": "CIBIL score below minimum threshold (700)",
             "credit_score": credit_score,
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
-        tool_context.state["interaction_history"] = current_history
+        batch.apply(tool_context.state)
         
         return {
             "status": "success",
@@ -200,21 +212,13 @@ def evaluate_loan_eligibility(
             "suggestion": "Please work on improving your credit score by: 1) Clearing any pending dues, 2) Maintaining timely EMI/credit card payments, 3) Reducing credit utilization below 30%, 4) Avoiding multiple loan applications. Check back after 6 months of good credit behavior."
         }
     
-    # Get customer salary only for reference
-    customer = get_customer_by_id(customer_id)
-    if not customer:
-        return {"status": "error", "message": "Customer not found"}
-    
-    monthly_salary = customer["monthly_salary"]
-    
     # Check eligibility against pre-approved limits
     # For conditional approvals (exceeding pre-approved), pass None to trigger salary slip requirement
     # For instant approvals (within pre-approved), we can use registered salary
     
     # First check if amount is within pre-approved limit
-    offer_result = get_pre_approved_offer(customer_id)
-    if offer_result["status"] == "success":
-        pre_approved_limit = offer_result["offer"]["pre_approved_amount"]
+    if customer.offer is not None:
+        pre_approved_limit = customer.offer["pre_approved_amount"]
         
         # If within pre-approved limit, can use registered salary
         if requested_amount <= pre_approved_limit:
@@ -226,23 +230,23 @@ def evaluate_loan_eligibility(
         # If no pre-approved offer, use registered salary
         eligibility = check_loan_eligibility(customer_id, requested_amount, monthly_salary)
     
+    batch = StateBatch()
     # Store evaluation result in state
-    tool_context.state["eligibility_evaluation"] = eligibility
-    tool_context.state["credit_score"] = credit_score
+    batch.set("eligibility_evaluation", eligibility)
+    batch.set("credit_score", credit_score)
     
     # Store requested amount for later use
-    tool_context.state["requested_amount"] = requested_amount
+    batch.set("requested_amount", requested_amount)
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "eligibility_evaluated",
         "customer_id": customer_id,
         "requested_amount": requested_amount,
         "approval_type": eligibility.get("approval_type", "UNKNOWN"),
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     # If conditional, add explicit salary slip requirement to result
     if eligibility.get("approval_type") == "CONDITIONAL":
@@ -273,17 +277,17 @@ def request_salary_slip(customer_id: str, tool_context: ToolContext) -> dict:
         "status": "PENDING"
     }
     
-    tool_context.state["salary_slip_request"] = request
-    tool_context.state["awaiting_salary_slip"] = True
+    batch = StateBatch()
+    batch.set("salary_slip_request", request)
+    batch.set("awaiting_salary_slip", True)
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "salary_slip_requested",
         "customer_id": customer_id,
         "timestamp": current_time
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     return {
         "status": "success",
@@ -605,7 +609,7 @@ def extract_salary_from_text(text: str) -> dict:
     }
 
 
-def upload_and_verify_salary_slip(
+async def upload_and_verify_salary_slip(
     customer_id: str,
     file_path: str,
     tool_context: ToolContext
@@ -677,12 +681,13 @@ def upload_and_verify_salary_slip(
     verified_salary = salary_extraction["monthly_salary"]
     
     # Step 4: Store extraction results
-    tool_context.state["salary_slip_uploaded"] = True
-    tool_context.state["salary_slip_file_path"] = file_path
-    tool_context.state["salary_extraction_result"] = salary_extraction
+    batch = StateBatch()
+    batch.set("salary_slip_uploaded", True)
+    batch.set("salary_slip_file_path", file_path)
+    batch.set("salary_extraction_result", salary_extraction)
     
     # Step 5: Verify eligibility with extracted salary
-    verification_result = verify_salary_with_amount(
+    verification_result = await verify_salary_with_amount(
         customer_id,
         verified_salary,
         tool_context
@@ -700,8 +705,7 @@ def upload_and_verify_salary_slip(
     }
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "salary_slip_uploaded_and_verified",
         "customer_id": customer_id,
         "file_path": file_path,
@@ -709,12 +713,12 @@ def upload_and_verify_salary_slip(
         "confidence": salary_extraction["confidence"],
         "timestamp": current_time
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     return verification_result
 
 
-def verify_salary_with_amount(
+async def verify_salary_with_amount(
     customer_id: str,
     verified_salary: float,
     tool_context: ToolContext
@@ -748,12 +752,11 @@ def verify_salary_with_amount(
         tenure = tool_context.state.get("tenure", 60)
     
     # Get offer details
-    offer_result = get_pre_approved_offer(customer_id)
-    if offer_result["status"] != "success":
+    customer = await aget_customer_360(customer_id)
+    if customer is None or customer.offer is None:
         return {"status": "error", "message": "Unable to fetch loan offer details"}
     
-    offer = offer_result["offer"]
-    interest_rate = offer["interest_rate"]
+    interest_rate = customer.offer["interest_rate"]
     
     # Calculate EMI
     emi_details = calculate_emi(requested_amount, interest_rate, tenure)
@@ -762,22 +765,22 @@ def verify_salary_with_amount(
     # Check EMI to salary ratio (must be <= 50%)
     emi_to_salary_ratio = (emi / verified_salary) * 100
     
-    tool_context.state["salary_slip_verified"] = True
-    tool_context.state["verified_salary"] = verified_salary
-    tool_context.state["emi_to_salary_ratio"] = emi_to_salary_ratio
+    batch = StateBatch()
+    batch.set("salary_slip_verified", True)
+    batch.set("verified_salary", verified_salary)
+    batch.set("emi_to_salary_ratio", emi_to_salary_ratio)
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "salary_slip_verified",
         "verified_salary": verified_salary,
         "emi_to_salary_ratio": emi_to_salary_ratio,
         "timestamp": current_time
     })
-    tool_context.state["interaction_history"] = current_history
     
     if emi_to_salary_ratio <= 50:
-        tool_context.state["salary_verification_passed"] = True
+        batch.set("salary_verification_passed", True)
+        batch.apply(tool_context.state)
         return {
             "status": "success",
             "verified": True,
@@ -788,9 +791,9 @@ def verify_salary_with_amount(
             "can_proceed": True
         }
     else:
-        tool_context.state["salary_verification_passed"] = False
-        tool_context.state["application_status"] = "REJECTED"
-        tool_context.state["rejection_reason"] = "EMI exceeds 50% of verified salary"
+        batch.set("salary_verification_passed", False)
+        batch.set("application_status", "REJECTED")
+        batch.set("rejection_reason", "EMI exceeds 50% of verified salary")
         
         # Calculate max eligible amount
         max_emi = verified_salary * 0.5
@@ -798,7 +801,7 @@ def verify_salary_with_amount(
         max_amount = max_emi * (((1 + monthly_rate) ** tenure) - 1) / (monthly_rate * ((1 + monthly_rate) ** tenure))
         
         # Add rejection to history
-        current_history.append({
+        log_event(batch, tool_context.state, {
             "action": "loan_rejected",
             "reason": "EMI exceeds 50% of verified salary",
             "verified_salary": verified_salary,
@@ -807,7 +810,7 @@ def verify_salary_with_amount(
             "max_eligible_amount": max_amount,
             "timestamp": current_time
         })
-        tool_context.state["interaction_history"] = current_history
+        batch.apply(tool_context.state)
         
         return {
             "status": "rejected",
@@ -825,7 +828,7 @@ def verify_salary_with_amount(
         }
 
 
-def approve_loan(customer_id: str, tool_context: ToolContext) -> dict:
+async def approve_loan(customer_id: str, tool_context: ToolContext) -> dict:
     """
     Approves the loan after all checks pass.
     Updates application status and prepares for sanction letter generation.
@@ -881,33 +884,32 @@ def approve_loan(customer_id: str, tool_context: ToolContext) -> dict:
     # Generate approval reference
     approval_reference = f"APR{datetime.now().strftime('%Y%m%d%H%M%S')}"
     
+    batch = StateBatch()
     # Update state
-    tool_context.state["loan_approved"] = True
-    tool_context.state["approval_reference"] = approval_reference
-    tool_context.state["approval_time"] = current_time
-    tool_context.state["application_status"] = "APPROVED"
+    batch.set("loan_approved", True)
+    batch.set("approval_reference", approval_reference)
+    batch.set("approval_time", current_time)
+    batch.set("application_status", "APPROVED")
     
     if "loan_application" in tool_context.state:
-        tool_context.state["loan_application"]["status"] = "APPROVED"
-        tool_context.state["loan_application"]["approval_reference"] = approval_reference
+        batch.merge("loan_application", status="APPROVED", approval_reference=approval_reference)
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "loan_approved",
         "approval_reference": approval_reference,
         "loan_amount": loan_application.get("loan_amount"),
         "timestamp": current_time
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
-    customer = get_customer_by_id(customer_id)
+    customer = await aget_customer_360(customer_id)
     
     return {
         "status": "success",
         "message": "🎉 Congratulations! Your loan has been approved!",
         "approval_reference": approval_reference,
-        "customer_name": customer["name"] if customer else "Customer",
+        "customer_name": customer.name if customer else "Customer",
         "loan_amount": f"₹{loan_application.get('loan_amount', 0):,.0f}",
         "tenure": f"{loan_application.get('tenure_months', 0)} months",
         "credit_score": credit_score,
@@ -930,24 +932,23 @@ def reject_loan(customer_id: str, reason: str, tool_context: ToolContext) -> dic
     """
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
+    batch = StateBatch()
     # Update state
-    tool_context.state["loan_approved"] = False
-    tool_context.state["rejection_reason"] = reason
-    tool_context.state["rejection_time"] = current_time
-    tool_context.state["application_status"] = "REJECTED"
+    batch.set("loan_approved", False)
+    batch.set("rejection_reason", reason)
+    batch.set("rejection_time", current_time)
+    batch.set("application_status", "REJECTED")
     
     if "loan_application" in tool_context.state:
-        tool_context.state["loan_application"]["status"] = "REJECTED"
-        tool_context.state["loan_application"]["rejection_reason"] = reason
+        batch.merge("loan_application", status="REJECTED", rejection_reason=reason)
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "loan_rejected",
         "reason": reason,
         "timestamp": current_time
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     # Get suggestions based on reason
     suggestions = get_rejection_suggestions(reason)
@@ -999,7 +1000,7 @@ def get_rejection_suggestions(reason: str) -> list:
 # Create the Underwriting Agent - Ms. Ananya Desai
 underwriting_agent = Agent(
     name="underwriting_agent",
-    model=LiteLlm(model="mistral/mistral-large-2411"),
+    model=LiteLlm(model="mistral/mistral-large-2411", llm_client=routed_llm_client),
     description="Ms. Ananya Desai - Credit Evaluation Specialist who assesses creditworthiness and makes approval decisions",
     instruction="""
     You are Ms. Ananya Desai, a thorough and professional Credit Evaluation Specialist at Tata Capital.
@@ -12,10 +12,17 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
-from mock_data.crm_data import get_kyc_data, verify_phone, verify_address, get_kyc_status
+from mock_data.crm_data import verify_phone, verify_address, get_kyc_status
+from mock_data.standin_services import StandInError
+from services.customer_360 import aget_customer_360
+from services.event_log import log_event
+from services.model_router import routed_llm_client
+from services.memory_governor import history_cap
+from services.prefetch_cache import kyc_prefetch_cache
+from services.session_state import StateBatch
 
 
-def fetch_kyc_details(customer_id: str, tool_context: ToolContext) -> dict:
+async def fetch_kyc_details(customer_id: str, tool_context: ToolContext) -> dict:
     """
     Fetches KYC details for a customer from CRM system.
     ⚡ PARALLEL PROCESSING: Uses pre-fetched data if available
@@ -27,17 +34,19 @@ def fetch_kyc_details(customer_id: str, tool_context: ToolContext) -> dict:
     Returns:
         dict: Customer's KYC information including verification status
     """
-    # ⚡ Check if data was pre-fetched in parallel
-    prefetched_kyc = tool_context.state.get("_prefetched_kyc")
-    
-    if prefetched_kyc and prefetched_kyc.get("status") == "success":
-        kyc_data = prefetched_kyc
-        # Mark as instant retrieval
-        retrieval_time = "Instant (Pre-fetched)"
-    else:
-        # Fetch normally if not pre-fetched
-        kyc_data = get_kyc_data(customer_id)
-        retrieval_time = "Standard"
+    # ⚡ Read through the shared prefetch cache (warmed in parallel at session start);
+    # on a miss, concurrent callers share one CRM load, which fills the cache
+    prefetched = kyc_prefetch_cache.version(customer_id) is not None
+    try:
+        kyc_data = await kyc_prefetch_cache.get(customer_id)
+    except (StandInError, OSError) as e:
+        print(f"⚠️ CRM lookup failed for {customer_id}: {e}")
+        return {
+            "status": "error",
+            "message": "CRM system is temporarily unavailable. Please try again in a moment.",
+            "retryable": True
+        }
+    retrieval_time = "Instant (Pre-fetched)" if prefetched else "Standard"
     
     if not kyc_data:
         return {
@@ -45,19 +54,19 @@ def fetch_kyc_details(customer_id: str, tool_context: ToolContext) -> dict:
             "message": "Customer not found in CRM system"
         }
     
+    batch = StateBatch()
     # Store KYC data in state
-    tool_context.state["kyc_data"] = kyc_data
+    batch.set("kyc_data", kyc_data)
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "kyc_details_fetched",
         "customer_id": customer_id,
         "kyc_status": kyc_data["kyc_status"],
         "retrieval_method": retrieval_time,
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     # Format address for display
     address = kyc_data["address"]
@@ -98,15 +107,15 @@ def verify_customer_phone(customer_id: str, phone: str, tool_context: ToolContex
     
     # Update verification status in state
     if result.get("verified"):
-        tool_context.state["phone_verified"] = True
+        batch = StateBatch()
+        batch.set("phone_verified", True)
         
-        current_history = tool_context.state.get("interaction_history", [])
-        current_history.append({
+        log_event(batch, tool_context.state, {
             "action": "phone_verified",
             "customer_id": customer_id,
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
-        tool_context.state["interaction_history"] = current_history
+        batch.apply(tool_context.state)
     
     return result
 
@@ -127,15 +136,15 @@ def verify_customer_address(customer_id: str, pincode: str, tool_context: ToolCo
     
     # Update verification status in state
     if result.get("verified"):
-        tool_context.state["address_verified"] = True
+        batch = StateBatch()
+        batch.set("address_verified", True)
         
-        current_history = tool_context.state.get("interaction_history", [])
-        current_history.append({
+        log_event(batch, tool_context.state, {
             "action": "address_verified",
             "customer_id": customer_id,
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
-        tool_context.state["interaction_history"] = current_history
+        batch.apply(tool_context.state)
     
     return result
 
@@ -154,7 +163,7 @@ def get_verification_status(customer_id: str, tool_context: ToolContext) -> dict
     return get_kyc_status(customer_id)
 
 
-def complete_kyc_verification(customer_id: str, tool_context: ToolContext) -> dict:
+async def complete_kyc_verification(customer_id: str, tool_context: ToolContext) -> dict:
     """
     Marks KYC verification as complete after all checks pass.
     This allows the application to proceed to underwriting.
@@ -166,7 +175,15 @@ def complete_kyc_verification(customer_id: str, tool_context: ToolContext) -> di
     Returns:
         dict: KYC completion status and next steps
     """
-    kyc_data = get_kyc_data(customer_id)
+    customer = await aget_customer_360(customer_id)
+    kyc_data = customer.kyc if customer else None
+    
+    if customer and not kyc_data and not customer.complete:
+        return {
+            "status": "error",
+            "message": "CRM system is temporarily unavailable. Please try again in a moment.",
+            "retryable": True
+        }
     
     if not kyc_data:
         return {
@@ -194,22 +211,22 @@ def complete_kyc_verification(customer_id: str, tool_context: ToolContext) -> di
     
     # Update state
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    tool_context.state["kyc_verified"] = True
-    tool_context.state["kyc_completion_time"] = current_time
-    tool_context.state["application_status"] = "KYC_VERIFIED"
+    batch = StateBatch()
+    batch.set("kyc_verified", True)
+    batch.set("kyc_completion_time", current_time)
+    batch.set("application_status", "KYC_VERIFIED")
     
     # Update loan application if exists
     if "loan_application" in tool_context.state:
-        tool_context.state["loan_application"]["status"] = "KYC_VERIFIED"
+        batch.merge("loan_application", status="KYC_VERIFIED")
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "kyc_verification_complete",
         "customer_id": customer_id,
         "timestamp": current_time
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     return {
         "status": "success",
@@ -256,19 +273,17 @@ def request_document_update(
     }
     
     # Store request in state
-    pending_updates = tool_context.state.get("pending_document_updates", [])
-    pending_updates.append(update_request)
-    tool_context.state["pending_document_updates"] = pending_updates
+    batch = StateBatch()
+    batch.append("pending_document_updates", update_request, maxlen=history_cap("pending_document_updates"))
     
     # Add to interaction history
-    current_history = tool_context.state.get("interaction_history", [])
-    current_history.append({
+    log_event(batch, tool_context.state, {
         "action": "document_update_requested",
         "document_type": document_type,
         "reason": reason,
         "timestamp": current_time
     })
-    tool_context.state["interaction_history"] = current_history
+    batch.apply(tool_context.state)
     
     return {
         "status": "success",
@@ -294,7 +309,7 @@ def get_update_instructions(document_type: str) -> str:
 # Create the Verification Agent - Mr. Soham Patel
 verification_agent = Agent(
     name="verification_agent",
-    model=LiteLlm(model="mistral/mistral-large-2411"),
+    model=LiteLlm(model="mistral/mistral-large-2411", llm_client=routed_llm_client),
     description="Mr. Soham Patel - KYC Verification Officer who confirms identity and document details from CRM",
     instruction="""
     You are Mr. Soham Patel, a friendly and efficient KYC Verification Officer at Tata Capital.
@@ -18,18 +18,22 @@ from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 
 from loan_master_agent.agent import loan_master_agent
-from mock_data.customer_data import CUSTOMERS, get_customer_by_id
-from mock_data.offer_mart import get_pre_approved_offer
-from mock_data.campaign_data import get_campaign_data, get_personalized_opening
+from services.data_sources import configure_from_env
+from services.enrichment import EnrichmentPipeline
+from services.session_bootstrap import bootstrap_session_state
+from services.session_state import read_session_state
+from mock_data.customer_data import get_customer_by_id
+from mock_data.repository import DEFAULT_PAGE_SIZE, get_repository
+from mock_data.local_sentiment import get_local_model
 from mock_data.persuasion_strategy import get_strategy_prompt, determine_customer_profile
 from mock_data.objection_handler import detect_objection, get_objection_handling_prompt
 from mock_data.analytics_tracker import log_conversation, display_performance_dashboard
 from utils import (
-    add_user_query_to_history,
     call_agent_async,
     display_welcome_banner,
     display_customer_offer,
     display_state,
+    display_enrichment_result,
     display_help,
     display_intelligence_dashboard,
     display_parallel_processing_status,
@@ -39,6 +43,9 @@ from utils import (
 # Load environment variables FIRST before importing agents
 load_dotenv(override=True)
 
+# Optionally route CRM / bureau / offer mart lookups through latency-injecting stand-ins
+configure_from_env()
+
 # Verify Mistral API key is set
 mistral_api_key = os.getenv('MISTRAL_API_KEY')
 if not mistral_api_key or mistral_api_key == 'your_mistral_api_key_here':
@@ -58,12 +65,14 @@ def select_customer():
     print(f"\n{Colors.CYAN}{Colors.BOLD}Available Test Customers:{Colors.RESET}")
     print(f"{Colors.YELLOW}{'='*80}{Colors.RESET}")
     
-    for idx, (cust_id, customer) in enumerate(CUSTOMERS.items(), 1):
+    # Only the first page is listed; any other customer can be picked by ID
+    customers = get_repository().list_customers(limit=DEFAULT_PAGE_SIZE)
+    for idx, customer in enumerate(customers, 1):
         score_color = Colors.GREEN if customer['credit_score'] >= 750 else (
             Colors.YELLOW if customer['credit_score'] >= 700 else Colors.RED
         )
         print(f"  {idx}. {Colors.CYAN}{customer['name']:<20}{Colors.RESET} | "
-              f"ID: {cust_id} | "
+              f"ID: {customer['customer_id']} | "
               f"City: {customer['city']:<12} | "
               f"Salary: ₹{customer['monthly_salary']:,} | "
               f"Credit: {score_color}{customer['credit_score']}{Colors.RESET} | "
@@ -73,16 +82,16 @@ def select_customer():
     
     while True:
         try:
-            choice = input(f"\n{Colors.GREEN}Select customer (1-{len(CUSTOMERS)}) or enter Customer ID: {Colors.RESET}")
+            choice = input(f"\n{Colors.GREEN}Select customer (1-{len(customers)}) or enter Customer ID: {Colors.RESET}")
             
             # Check if it's a number
             if choice.isdigit():
                 idx = int(choice)
-                if 1 <= idx <= len(CUSTOMERS):
-                    customer_id = list(CUSTOMERS.keys())[idx - 1]
+                if 1 <= idx <= len(customers):
+                    customer_id = customers[idx - 1]["customer_id"]
                     return customer_id
             # Check if it's a customer ID
-            elif choice.upper() in CUSTOMERS:
+            elif get_customer_by_id(choice.upper()):
                 return choice.upper()
             
             print(f"{Colors.RED}Invalid selection. Please try again.{Colors.RESET}")
@@ -90,110 +99,6 @@ def select_customer():
             print(f"{Colors.RED}Invalid input. Please enter a number or customer ID.{Colors.RESET}")
 
 
-def get_initial_state(customer_id: str) -> dict:
-    """Create initial state for a customer session with intelligence layers."""
-    customer = get_customer_by_id(customer_id)
-    offer_result = get_pre_approved_offer(customer_id)
-    offer = offer_result.get("offer", {}) if offer_result["status"] == "success" else {}
-    
-    # 🎯 Pre-Conversation Intelligence Layer
-    campaign_data = get_campaign_data(customer_id)
-    credit_score = customer.get("credit_score", 750)
-    
-    # 🧠 Smart Persuasion Strategy (LLM-driven, dynamic)
-    # Instead of hard-coded profiles, we provide context and let the AI adapt
-    persuasion_context = f"""
-CUSTOMER CONTEXT FOR INTELLIGENT ADAPTATION:
-- Credit Score: {credit_score} ({"Excellent" if credit_score >= 800 else "Good" if credit_score >= 750 else "Fair" if credit_score >= 700 else "Needs Improvement"})
-- Income: ₹{customer.get('monthly_salary', 0):,}/month ({"High" if customer.get('monthly_salary', 0) >= 100000 else "Medium" if customer.get('monthly_salary', 0) >= 50000 else "Budget-conscious"})
-- Campaign: {campaign_data.get('campaign', {}).get('source', 'Direct')} - {campaign_data.get('campaign', {}).get('keyword', 'personal loan')}
-- Intent: {campaign_data.get('campaign', {}).get('intent', 'GENERAL_PURPOSE')}
-- Urgency: {campaign_data.get('campaign', {}).get('urgency_level', 'MEDIUM')}
-- Customer Type: {campaign_data.get('customer_type', 'FIRST_TIME')}
-- Payment History: {campaign_data.get('journey', {}).get('payment_history', 'N/A')}
-
-ADAPT YOUR APPROACH INTELLIGENTLY:
-- If urgent need → Emphasize speed ("2-hour approval, 24-hour disbursement")
-- If repeat customer → Show appreciation ("As a valued customer for X years...")
-- If high credit score → Highlight premium rates ("Your excellent score qualifies you for our best 10.99% rate")
-- If budget-conscious → Focus on EMI affordability ("Just ₹X/month - less than dining expenses")
-- If skeptical/researcher → Provide transparency ("Complete breakdown, zero hidden charges")
-- If first-time borrower → Be educational and patient
-"""
-    
-    # 💡 Personalized Opening
-    personalized_opening = get_personalized_opening(customer_id, customer["name"], campaign_data)
-    
-    # Extract campaign intelligence for state
-    campaign = campaign_data.get("campaign", {})
-    journey = campaign_data.get("journey", {})
-    
-    return {
-        # Customer information
-        "customer_id": customer_id,
-        "customer_name": customer["name"],
-        "customer_phone": customer["phone"],
-        "customer_email": customer["email"],
-        "customer_city": customer["city"],
-        "customer_salary": customer["monthly_salary"],
-        "customer_occupation": customer["occupation"],
-        "customer_employer": customer["employer"],
-        "customer_pan": customer["pan_number"],
-        "customer_bank": customer["bank_name"],
-        "customer_account": customer["account_number"],
-        
-        # Pre-approved offer
-        "pre_approved_limit": customer["pre_approved_limit"],
-        "credit_score": customer["credit_score"],
-        "current_offer": offer,
-        
-        # 🎯 Pre-Conversation Intelligence
-        "campaign_source": campaign.get("source", "Direct"),
-        "campaign_keyword": campaign.get("keyword", "personal loan"),
-        "customer_intent": campaign.get("intent", "GENERAL_PURPOSE"),
-        "urgency_level": campaign.get("urgency_level", "MEDIUM"),
-        "customer_type": campaign_data.get("customer_type", "FIRST_TIME"),
-        "relationship_tenure_years": journey.get("relationship_tenure_years", 0),
-        "payment_history": journey.get("payment_history", "N/A"),
-        "current_loans_count": len(journey.get("current_loans", [])),
-        "previous_interactions_count": len(journey.get("previous_interactions", [])),
-        "offer_expiry_hours": campaign.get("offer_expiry_hours", 48),
-        
-        # 🧠 Persuasion Strategy (Smart, LLM-driven)
-        "persuasion_strategy": persuasion_context,
-        "personalized_opening": personalized_opening,
-        
-        # ⚠️ Objection Handling
-        "objection_handling_context": "No objections detected yet. Monitor customer responses.",
-        "detected_objections": [],
-        
-        # 💚 Emotional Intelligence
-        "current_sentiment": {"status": "neutral", "primary_sentiment": "NEUTRAL"},
-        "sentiment_adaptive_strategy": "No strong sentiment detected. Maintain professional, balanced tone.",
-        "sentiment_history": [],
-        
-        # Application tracking
-        "loan_application": {},
-        "application_status": "NOT_STARTED",
-        "application_initiated": False,
-        
-        # Verification status
-        "kyc_verified": False,
-        "kyc_data": {},
-        
-        # Underwriting status
-        "eligibility_evaluation": {},
-        "loan_approved": False,
-        
-        # Sanction letter
-        "sanction_letter": {},
-        
-        # Interaction tracking
-        "interaction_history": [],
-        "offer_shown": False,
-    }
-
-
 async def main_async():
     """Main async function to run the chatbot."""
     # Constants
@@ -211,34 +116,21 @@ async def main_async():
     # Display pre-approved offer
     display_customer_offer(customer)
     
+    # Load the local sentiment model now rather than inside the first turn
+    get_local_model()
+
     # Initialize session service
     session_service = InMemorySessionService()
     
     # Create initial state for the customer
-    initial_state = get_initial_state(customer_id)
-    
-    # ⚡ PARALLEL PROCESSING: Pre-fetch background data
-    # Start pre-loading KYC and credit data while customer is being greeted
+    # ⚡ PARALLEL PROCESSING: CRM, credit bureau, offer mart and campaign lookups run concurrently
     print(f"{Colors.CYAN}⚡ Pre-loading customer data in parallel...{Colors.RESET}")
+    initial_state = await bootstrap_session_state(customer_id)
     
-    # Import background data fetchers
-    from mock_data.crm_data import get_kyc_data
-    from mock_data.credit_bureau import get_credit_score
-    
-    # Pre-fetch in parallel (data already exists, but simulates async fetch)
-    try:
-        kyc_data = get_kyc_data(customer_id)
-        credit_data = get_credit_score(customer_id)
-        
-        # Store pre-fetched data in state for instant access
-        initial_state["_prefetched_kyc"] = kyc_data
-        initial_state["_prefetched_credit"] = credit_data
-        initial_state["_parallel_processing_enabled"] = True
-        
+    if initial_state["_parallel_processing_enabled"]:
         print(f"{Colors.GREEN}✓ Background data pre-loaded (KYC + Credit Score){Colors.RESET}")
-    except Exception as e:
-        print(f"{Colors.YELLOW}⚠ Background data pre-fetch failed: {e}{Colors.RESET}")
-        initial_state["_parallel_processing_enabled"] = False
+    else:
+        print(f"{Colors.YELLOW}⚠ Background data pre-fetch incomplete, agents will fetch on demand{Colors.RESET}")
     
     # 🧠 Display Intelligence Dashboard
     display_intelligence_dashboard(initial_state)
@@ -264,6 +156,7 @@ async def main_async():
         app_name=APP_NAME,
         session_service=session_service,
     )
+    enrichment = EnrichmentPipeline(session_service, APP_NAME)
     
     print(f"\n{Colors.CYAN}{'='*80}{Colors.RESET}")
     print(f"{Colors.CYAN}Chat started! Type your message below.{Colors.RESET}")
@@ -300,10 +193,10 @@ async def main_async():
                 display_performance_dashboard()
                 continue
             
-            # Add user query to history
-            await add_user_query_to_history(
-                session_service, APP_NAME, USER_ID, SESSION_ID, user_input
-            )
+            # Record the message; sentiment enrichment runs alongside the agent turn
+            enrichment_task = await enrichment.start(USER_ID, SESSION_ID, user_input)
+            enrichment_task.add_done_callback(display_enrichment_result)
+            await enrichment.wait(enrichment_task)
             
             # Process through agent
             await call_agent_async(runner, USER_ID, SESSION_ID, user_input)
@@ -314,30 +207,31 @@ async def main_async():
         except Exception as e:
             print(f"{Colors.RED}Error: {e}{Colors.RESET}")
     
+    # Let the last message's sentiment land before the summary/analytics
+    await enrichment.drain()
+    
     # Show final state
     print(f"\n{Colors.YELLOW}{'='*80}{Colors.RESET}")
     print(f"{Colors.YELLOW}SESSION SUMMARY{Colors.RESET}")
     print(f"{Colors.YELLOW}{'='*80}{Colors.RESET}")
     
-    final_session = await session_service.get_session(
-        app_name=APP_NAME, user_id=USER_ID, session_id=SESSION_ID
-    )
+    final_state = await read_session_state(session_service, APP_NAME, USER_ID, SESSION_ID)
     
-    print(f"{Colors.CYAN}Customer:{Colors.RESET} {final_session.state.get('customer_name')}")
-    print(f"{Colors.CYAN}Final Status:{Colors.RESET} {final_session.state.get('application_status')}")
+    print(f"{Colors.CYAN}Customer:{Colors.RESET} {final_state.get('customer_name')}")
+    print(f"{Colors.CYAN}Final Status:{Colors.RESET} {final_state.get('application_status')}")
     
-    loan_app = final_session.state.get("loan_application", {})
+    loan_app = final_state.get("loan_application", {})
     if loan_app:
         print(f"{Colors.CYAN}Loan Amount:{Colors.RESET} ₹{loan_app.get('loan_amount', 0):,.0f}")
         print(f"{Colors.CYAN}Application ID:{Colors.RESET} {loan_app.get('application_id', 'N/A')}")
     
-    sanction = final_session.state.get("sanction_letter", {})
+    sanction = final_state.get("sanction_letter", {})
     if sanction:
         print(f"{Colors.CYAN}Sanction Reference:{Colors.RESET} {sanction.get('sanction_reference', 'N/A')}")
     
     # 📈 Log conversation for analytics and self-improvement
     try:
-        log_conversation(final_session.state)
+        log_conversation(final_state.to_dict())
         print(f"\n{Colors.GREEN}✓ Conversation logged for performance analytics{Colors.RESET}")
     except Exception as e:
         print(f"{Colors.YELLOW}⚠ Analytics logging skipped: {e}{Colors.RESET}")
@@ -2,6 +2,8 @@
 # Contains synthetic customer data, CRM data, credit bureau API, and offer mart data
 # NEW: Campaign intelligence, persuasion strategies, objection handling, sentiment analysis, analytics, cross-sell
 
+from .repository import CustomerRepository, SQLiteRepository, get_repository, load_mock_data, set_repository
+from .reference_data import ReferenceSnapshot, current as current_reference_data, reload as reload_reference_data
 from .customer_data import CUSTOMERS, get_customer_by_phone, get_customer_by_id
 from .crm_data import CRM_DATA, get_kyc_data
 from .credit_bureau import CREDIT_SCORES, get_credit_score
@@ -9,11 +11,21 @@ from .offer_mart import LOAN_OFFERS, get_pre_approved_offer
 from .campaign_data import CAMPAIGNS, get_campaign_data, get_personalized_opening
 from .persuasion_strategy import determine_customer_profile, get_strategy_prompt
 from .objection_handler import detect_objection, get_objection_handling_prompt
-from .sentiment_analyzer import detect_sentiment, get_sentiment_context_for_agent, track_sentiment_evolution
+from .strategy_table import StrategyTable, strategy_table
+from .sentiment_analyzer import adetect_sentiment, detect_sentiment, get_sentiment_context_for_agent, track_sentiment_evolution
+from .sentiment_trend import new_sentiment_trend, summarize_sentiment_trend, update_sentiment_trend
 from .analytics_tracker import log_conversation, get_performance_dashboard, display_performance_dashboard
 from .cross_sell_engine import recommend_cross_sell_products, format_cross_sell_message, get_cross_sell_summary
 
 __all__ = [
+    "CustomerRepository",
+    "SQLiteRepository",
+    "get_repository",
+    "load_mock_data",
+    "set_repository",
+    "ReferenceSnapshot",
+    "current_reference_data",
+    "reload_reference_data",
     "CUSTOMERS",
     "get_customer_by_phone",
     "get_customer_by_id",
@@ -30,9 +42,15 @@ __all__ = [
     "get_strategy_prompt",
     "detect_objection",
     "get_objection_handling_prompt",
+    "StrategyTable",
+    "strategy_table",
+    "adetect_sentiment",
     "detect_sentiment",
     "get_sentiment_context_for_agent",
     "track_sentiment_evolution",
+    "new_sentiment_trend",
+    "summarize_sentiment_trend",
+    "update_sentiment_trend",
     "log_conversation",
     "get_performance_dashboard",
     "display_performance_dashboard",
@@ -9,6 +9,8 @@ from datetime import datetime
 from typing import Dict, List
 from collections import defaultdict
 
+from services.event_log import event_count, time_to_decision
+
 
 ANALYTICS_FILE = "analytics_data.json"
 
@@ -69,7 +71,7 @@ def log_conversation(session_data: Dict):
         "sentiment_evolution": session_data.get("sentiment_history", []),
         "drop_off_stage": get_drop_off_stage(session_data),
         "time_to_decision": calculate_time_to_decision(session_data),
-        "interaction_count": len(session_data.get("interaction_history", [])),
+        "interaction_count": event_count(session_data) or len(session_data.get("interaction_history", [])),
         "cross_sell_offered": session_data.get("cross_sell_offered", False),
         "cross_sell_accepted": session_data.get("cross_sell_accepted", False)
     }
@@ -136,6 +138,10 @@ def get_drop_off_stage(session_data: Dict) -> str:
 
 def calculate_time_to_decision(session_data: Dict) -> int:
     """Calculate time from start to approval/rejection in seconds."""
+    # Event-logged sessions: first event to first decision, read through the log's indexes
+    if event_count(session_data):
+        return time_to_decision(session_data) or 0
+    
     history = session_data.get("interaction_history", [])
     if len(history) < 2:
         return 0
@@ -0,0 +1,498 @@
+"""
+Synthetic Customer Book Generator
+Deterministic, seedable generator of mutually consistent customer, CRM, credit
+bureau, offer mart and campaign journey records at 10^5-10^7 scale for load
+and capacity testing. Records are generated one customer at a time and
+streamed to JSONL files or a SQLite repository database, so memory stays flat
+regardless of book size.
+
+Run: python -m mock_data.book_generator --count 1000000 --sqlite book.db
+     python -m mock_data.book_generator --count 100000 --jsonl book/
+Serve it: CUSTOMER_DB_PATH=book.db python server.py
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from itertools import accumulate, islice
+from typing import Dict, Iterator, Optional
+
+from .repository import IMPORT_BATCH_SIZE, SQLiteRepository, load_mock_data
+
+# Tables (and JSONL file stems) written for every customer, in repository order
+DATASETS = ("customers", "kyc_records", "credit_reports", "loan_offers", "campaign_journeys")
+
+DEFAULT_SEED = 42
+
+# Mobile numbers: primaries in 6000000000-7499999999, alternates in 7500000000-8999999999
+PHONE_BASE = 6_000_000_000
+ALTERNATE_PHONE_BASE = 7_500_000_000
+PHONE_RANGE = 1_500_000_000
+
+# Reference date for generated timestamps; fixed so output depends only on the seed
+AS_OF = datetime(2024, 12, 1)
+
+# (city, state, pincode prefix, localities, weight)
+CITIES = [
+    ("Mumbai", "Maharashtra", "400", ["Andheri West", "Powai", "Bandra East", "Borivali", "Thane West"], 14),
+    ("Delhi", "Delhi", "110", ["Dwarka", "Rohini", "Saket", "Laxmi Nagar", "Janakpuri"], 13),
+    ("Bangalore", "Karnataka", "560", ["Koramangala", "Whitefield", "HSR Layout", "Jayanagar", "Hebbal"], 12),
+    ("Hyderabad", "Telangana", "500", ["Gachibowli", "Kukatpally", "Madhapur", "Begumpet"], 8),
+    ("Chennai", "Tamil Nadu", "600", ["Adyar", "T Nagar", "Velachery", "Anna Nagar"], 8),
+    ("Pune", "Maharashtra", "411", ["Kothrud", "Hinjewadi", "Viman Nagar", "Baner"], 7),
+    ("Kolkata", "West Bengal", "700", ["Salt Lake", "New Town", "Ballygunge", "Behala"], 7),
+    ("Ahmedabad", "Gujarat", "380", ["Navrangpura", "Satellite", "Bopal", "Maninagar"], 5),
+    ("Jaipur", "Rajasthan", "302", ["Malviya Nagar", "Vaishali Nagar", "Mansarovar"], 4),
+    ("Lucknow", "Uttar Pradesh", "226", ["Gomti Nagar", "Hazratganj", "Aliganj"], 4),
+    ("Indore", "Madhya Pradesh", "452", ["Vijay Nagar", "Palasia", "Rau"], 3),
+    ("Chandigarh", "Chandigarh", "160", ["Sector 17", "Sector 35", "Sector 44"], 3),
+    ("Kochi", "Kerala", "682", ["Kakkanad", "Edappally", "Vyttila"], 3),
+    ("Surat", "Gujarat", "395", ["Adajan", "Vesu", "Athwa"], 3),
+    ("Nagpur", "Maharashtra", "440", ["Dharampeth", "Sitabuldi", "Manish Nagar"], 2),
+]
+
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Amit", "Ananya", "Anil", "Anjali", "Arjun", "Deepa", "Divya", "Gaurav",
+    "Kavita", "Kiran", "Lakshmi", "Manoj", "Meera", "Neha", "Nikhil", "Pooja", "Priya", "Rahul",
+    "Rajesh", "Ramesh", "Ravi", "Rohan", "Sanjay", "Shreya", "Sneha", "Sunita", "Suresh", "Vikram",
+]
+
+LAST_NAMES = [
+    "Agarwal", "Banerjee", "Bhat", "Chopra", "Das", "Desai", "Gupta", "Iyer", "Joshi", "Kapoor",
+    "Kumar", "Menon", "Mishra", "Nair", "Patel", "Reddy", "Rao", "Shah", "Sharma", "Singh",
+    "Tiwari", "Verma",
+]
+
+# (occupation, employers, salary multiplier over the median, employment type, weight)
+OCCUPATIONS = [
+    ("Software Engineer", ["TCS", "Infosys", "Wipro", "HCL", "Tech Mahindra"], 1.5, "SALARIED", 16),
+    ("Teacher", ["Kendriya Vidyalaya", "Delhi Public School", "State Government School"], 0.7, "SALARIED", 9),
+    ("Bank Manager", ["State Bank of India", "HDFC Bank", "Canara Bank", "ICICI Bank"], 1.4, "SALARIED", 6),
+    ("Doctor", ["Apollo Hospitals", "Fortis Healthcare", "Manipal Hospitals"], 2.2, "SALARIED", 5),
+    ("Sales Executive", ["Reliance Retail", "Bajaj Auto", "Hindustan Unilever"], 0.8, "SALARIED", 12),
+    ("Accountant", ["Deloitte", "KPMG", "EY", "Grant Thornton"], 1.0, "SALARIED", 9),
+    ("Marketing Manager", ["Asian Paints", "ITC", "Godrej"], 1.3, "SALARIED", 7),
+    ("Government Officer", ["Government of India", "Indian Railways", "State Government"], 1.0, "SALARIED", 10),
+    ("Nurse", ["AIIMS", "Max Healthcare", "Narayana Health"], 0.6, "SALARIED", 6),
+    ("Business Owner", ["Self Employed"], 1.6, "SELF_EMPLOYED", 12),
+    ("Lawyer", ["Self Employed"], 1.7, "SELF_EMPLOYED", 4),
+    ("Consultant", ["Self Employed"], 1.3, "SELF_EMPLOYED", 4),
+]
+
+# (bank name, account number prefix)
+BANKS = [
+    ("State Bank of India", "SBI"), ("HDFC Bank", "HDFC"), ("ICICI Bank", "ICICI"), ("Axis Bank", "AXIS"),
+    ("Kotak Mahindra Bank", "KOTAK"), ("Canara Bank", "CAN"), ("Punjab National Bank", "PNB"),
+    ("Federal Bank", "FED"), ("IDBI Bank", "IDBI"),
+]
+
+# (loan type, amount range, EMI as a fraction of amount, tenure range in months)
+LOAN_TYPES = [
+    ("Home Loan", (1500000, 6000000), 0.0088, (120, 240)),
+    ("Car Loan", (300000, 1200000), 0.021, (12, 84)),
+    ("Personal Loan", (100000, 800000), 0.024, (6, 60)),
+    ("Education Loan", (300000, 2000000), 0.013, (24, 120)),
+]
+
+# Campaign source -> weight; EMAIL_TOPUP is only drawn for existing customers
+CAMPAIGN_WEIGHTS = {
+    "GOOGLE_MEDICAL_EMERGENCY": 10,
+    "GOOGLE_HOME_RENOVATION": 12,
+    "FACEBOOK_WEDDING": 10,
+    "ORGANIC_TRAVEL": 10,
+    "EMAIL_TOPUP": 8,
+    "REFERRAL": 10,
+    "DIRECT_WEBSITE": 25,
+    "SMS_PREAPPROVED": 15,
+}
+
+CAMPAIGN_LANDING_PAGES = {
+    "GOOGLE_MEDICAL_EMERGENCY": "medical-loan",
+    "GOOGLE_HOME_RENOVATION": "home-renovation-loan",
+    "FACEBOOK_WEDDING": "wedding-loan",
+    "ORGANIC_TRAVEL": "travel-loan",
+    "EMAIL_TOPUP": "top-up-offer",
+    "REFERRAL": "referral",
+    "DIRECT_WEBSITE": "home",
+    "SMS_PREAPPROVED": "pre-approved-offer",
+}
+
+SITE_PAGES = ["personal-loan", "emi-calculator", "interest-rates", "documents-required", "compare",
+              "customer-reviews", "apply"]
+
+SPECIAL_OFFERS = [
+    "Festive Special - 0.25% rate discount",
+    "Processing fee waiver for salary account holders",
+    "Women borrowers - processing fee starting 0.5%",
+    "Flexible EMI options for the first 6 months",
+]
+
+# Score bands: (min score, score range label, payment history, interest rate range, max tenure, limit multiplier)
+SCORE_BANDS = [
+    (750, "Excellent (750-900)", "Excellent", (10.5, 12.0), 72, 10),
+    (700, "Good (700-749)", "Good", (12.0, 15.0), 60, 7),
+    (650, "Fair (650-699)", "Fair", (15.0, 18.0), 36, 4),
+    (300, "Poor (300-649)", "Poor", (18.0, 24.0), 24, 0),
+]
+
+MEDIAN_SALARY = 55000
+
+# Cumulative weights, computed once instead of on every draw
+_CITY_WEIGHTS = list(accumulate(city[-1] for city in CITIES))
+_OCCUPATION_WEIGHTS = list(accumulate(occupation[-1] for occupation in OCCUPATIONS))
+
+
+def _score_band(credit_score: int) -> tuple:
+    return next(band for band in SCORE_BANDS if credit_score >= band[0])
+
+
+def _permute(index: int, modulus: int, multiplier: int) -> int:
+    """Bijective scramble of 0..modulus-1 (multiplier must be coprime with modulus)."""
+    return (index * multiplier + 12345) % modulus
+
+
+def _pan_number(index: int) -> str:
+    # 5 letters, 4 digits, 1 letter; unique for the first 26^5 * 10^4 customers
+    value = _permute(index, 26 ** 5 * 10 ** 4, 7_919_083)
+    digits = value % 10_000
+    value //= 10_000
+    letters = ""
+    for _ in range(5):
+        letters = chr(65 + value % 26) + letters
+        value //= 26
+    return f"{letters}{digits:04d}{chr(65 + index % 26)}"
+
+
+def _aadhar_number(index: int) -> str:
+    number = f"{_permute(index, 10 ** 12, 982_451_653):012d}"
+    return f"{number[:4]}-{number[4:8]}-{number[8:]}"
+
+
+def generate_customer(index: int, seed: int = DEFAULT_SEED, as_of: datetime = AS_OF) -> Dict[str, Optional[dict]]:
+    """
+    Generate one customer's records across all five datasets.
+
+    Output depends only on (index, seed, as_of), so any slice of a book can be
+    regenerated independently.
+
+    Args:
+        index: Customer number (unique within the book)
+        seed: Book seed
+        as_of: Reference date for landing, score and KYC dates
+
+    Returns:
+        dict: Dataset name (see DATASETS) -> record; "loan_offers" is None for
+              customers without a pre-approved offer
+    """
+    rng = random.Random(seed * 1_000_003 + index)
+    # Distinct prefix so synthetic customers sort after the demo customers (CUST001...)
+    customer_id = f"SYN{index:08d}"
+
+    # Profile
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    city, state, pincode_prefix, localities, _ = rng.choices(CITIES, cum_weights=_CITY_WEIGHTS)[0]
+    occupation, employers, salary_multiplier, employment_type, _ = rng.choices(OCCUPATIONS, cum_weights=_OCCUPATION_WEIGHTS)[0]
+    age = int(rng.triangular(19, 65, 33))
+    total_experience = max(0, int((age - 21) * rng.uniform(0.5, 1.0)))
+    years_with_employer = rng.randint(0, total_experience) if total_experience else 0
+    monthly_salary = int(rng.lognormvariate(math.log(MEDIAN_SALARY * salary_multiplier), 0.45) // 500 * 500)
+    monthly_salary = min(max(monthly_salary, 12000), 1500000)
+
+    # Credit score: centred around 735, nudged up with income
+    credit_score = int(rng.gauss(735, 55) + 15 * math.log(monthly_salary / MEDIAN_SALARY))
+    credit_score = min(max(credit_score, 300), 900)
+    min_score, score_range, payment_history, rate_range, max_tenure, limit_multiplier = _score_band(credit_score)
+
+    # Existing loans
+    current_loans = []
+    for _ in range(rng.choices([0, 1, 2], weights=[50, 35, 15])[0]):
+        loan_type, amount_range, emi_fraction, tenure_range = rng.choice(LOAN_TYPES)
+        amount = rng.randrange(amount_range[0], amount_range[1], 50000)
+        current_loans.append({
+            "type": loan_type,
+            "amount": amount,
+            "emi": int(amount * emi_fraction // 100 * 100),
+            "remaining_tenure": rng.randint(*tenure_range),
+        })
+    total_emi = sum(loan["emi"] for loan in current_loans)
+
+    pre_approved_limit = monthly_salary * limit_multiplier - total_emi * 6
+    pre_approved_limit = min(max(0, pre_approved_limit // 10000 * 10000), 4000000)
+    if pre_approved_limit < 50000:
+        pre_approved_limit = 0
+
+    bank_name, bank_code = rng.choice(BANKS)
+    # Primary and alternate numbers come from disjoint ranges, so no customer's
+    # alternate is another customer's primary (the demo book uses 98765432xx)
+    phone = str(PHONE_BASE + _permute(index, PHONE_RANGE, 2_654_435_761))
+    alternate_phone = str(ALTERNATE_PHONE_BASE + _permute(index, PHONE_RANGE, 2_654_435_761))
+    pan_number = _pan_number(index)
+    aadhar_number = _aadhar_number(index)
+    email = f"{name.lower().replace(' ', '.')}.{index}@email.com"
+
+    customer = {
+        "customer_id": customer_id,
+        "name": name,
+        "age": age,
+        "city": city,
+        "phone": phone,
+        "email": email,
+        "pan_number": pan_number,
+        "aadhar_number": aadhar_number,
+        "occupation": occupation,
+        "employer": rng.choice(employers),
+        "monthly_salary": monthly_salary,
+        "employment_type": employment_type,
+        "years_with_current_employer": years_with_employer,
+        "total_work_experience": total_experience,
+        "current_loans": current_loans,
+        "credit_score": credit_score,
+        "pre_approved_limit": pre_approved_limit,
+        "account_number": f"{bank_code}{rng.randrange(10 ** 9, 10 ** 10)}",
+        "bank_name": bank_name,
+    }
+
+    # CRM / KYC
+    verified = {
+        "phone_verified": rng.random() < 0.97,
+        "address_verified": rng.random() < 0.92,
+        "pan_verified": rng.random() < 0.98,
+        "aadhar_verified": rng.random() < 0.95,
+        "email_verified": rng.random() < 0.90,
+    }
+    kyc_complete = all(verified.values())
+    kyc_record = {
+        "customer_id": customer_id,
+        "name": name,
+        "phone_verified": verified["phone_verified"],
+        "phone": phone,
+        "alternate_phone": alternate_phone,
+        "address": {
+            "line1": f"{rng.choice(['Flat', 'House No.', 'Plot'])} {rng.randint(1, 999)}, {rng.choice(LAST_NAMES)} Residency",
+            "line2": rng.choice(localities),
+            "city": city,
+            "state": state,
+            "pincode": f"{pincode_prefix}{rng.randint(1, 120):03d}",
+        },
+        "address_verified": verified["address_verified"],
+        "pan_verified": verified["pan_verified"],
+        "pan_number": pan_number,
+        "aadhar_verified": verified["aadhar_verified"],
+        "aadhar_number": aadhar_number,
+        "email_verified": verified["email_verified"],
+        "kyc_status": "COMPLETED" if kyc_complete else "PARTIAL",
+    }
+    if kyc_complete:
+        kyc_record["kyc_completion_date"] = (as_of - timedelta(days=rng.randint(30, 1500))).strftime("%Y-%m-%d")
+
+    # Credit bureau
+    total_accounts = len(current_loans) + rng.randint(1, 8)
+    active_accounts = len(current_loans) + rng.randint(0, total_accounts - len(current_loans))
+    credit_report = {
+        "customer_id": customer_id,
+        "pan_number": pan_number,
+        "credit_score": credit_score,
+        "score_date": as_of.strftime("%Y-%m-%d"),
+        "score_range": score_range,
+        "credit_history": {
+            "total_accounts": total_accounts,
+            "active_accounts": active_accounts,
+            "closed_accounts": total_accounts - active_accounts,
+            "overdue_accounts": 0 if credit_score >= 750 else rng.choices([0, 1, 2], weights=[70, 22, 8])[0],
+            "credit_utilization": min(max(int(rng.gauss((900 - credit_score) / 4 + 15, 10)), 0), 100),
+            "oldest_account_age_months": rng.randint(6, max(12, total_experience * 12)),
+            "recent_inquiries": rng.choices([0, 1, 2, 3, 4], weights=[35, 30, 18, 10, 7])[0],
+            "payment_history": payment_history,
+            "defaults": 0 if credit_score >= 650 else rng.randint(0, 2),
+        },
+    }
+
+    # Campaign journey
+    relationship_tenure = rng.randint(1, 10) if rng.random() < 0.3 else 0
+    sources = [s for s in CAMPAIGN_WEIGHTS if relationship_tenure or s != "EMAIL_TOPUP"]
+    campaign_source = rng.choices(sources, weights=[CAMPAIGN_WEIGHTS[s] for s in sources])[0]
+    visits = min(1 + int(rng.expovariate(0.6)), 12)
+    previous_interactions = [
+        {
+            "date": (as_of - timedelta(days=rng.randint(30, 700))).strftime("%Y-%m-%d"),
+            "action": rng.choice(["Loan inquiry", "EMI calculator", "Rate inquiry"]),
+            "result": rng.choice(["No application", "Applied but withdrawn"]),
+        }
+        for _ in range(rng.choices([0, 1, 2], weights=[65, 25, 10])[0])
+    ]
+    campaign_journey = {
+        "customer_id": customer_id,
+        "campaign_source": campaign_source,
+        "landing_date": (as_of - timedelta(hours=rng.uniform(1, 24 * 14))).isoformat(timespec="seconds"),
+        "visits_count": visits,
+        "pages_viewed": [CAMPAIGN_LANDING_PAGES[campaign_source]] + rng.sample(SITE_PAGES, min(visits, 4)),
+        "time_on_site_minutes": max(2, int(rng.lognormvariate(math.log(8 * visits), 0.5))),
+        "previous_interactions": previous_interactions,
+        "current_loans": [
+            {
+                "type": loan["type"],
+                "amount": loan["amount"],
+                "emi": loan["emi"],
+                "outstanding": int(loan["emi"] * loan["remaining_tenure"] * 0.8 // 1000 * 1000),
+                "status": "ACTIVE",
+            }
+            for loan in current_loans
+        ],
+        "relationship_tenure_years": relationship_tenure,
+        "payment_history": payment_history.upper() if relationship_tenure else None,
+    }
+
+    # Offer mart (only customers with a pre-approved limit)
+    loan_offer = None
+    if pre_approved_limit:
+        special_offer = rng.random() < 0.2
+        loan_offer = {
+            "customer_id": customer_id,
+            "customer_name": name,
+            "pre_approved_amount": pre_approved_limit,
+            "max_tenure_months": max_tenure,
+            "interest_rate": round(rng.uniform(*rate_range) * 4) / 4,
+            "processing_fee_percent": rng.choice([0.5, 1.0, 1.5, 2.0, 2.5, 3.5]),
+            "offer_valid_until": (as_of + timedelta(days=rng.randint(30, 120))).strftime("%Y-%m-%d"),
+            "offer_type": "PRE_APPROVED",
+            "special_offer": special_offer,
+            "min_loan_amount": rng.choice([25000, 50000, 100000]),
+            "max_loan_amount": pre_approved_limit * 5,
+            "is_existing_customer": bool(relationship_tenure),
+            "repayment_history": payment_history.upper() if relationship_tenure else "NEW",
+            "top_up_eligible": bool(relationship_tenure) and credit_score >= 750,
+            "top_up_limit": pre_approved_limit // 20000 * 10000 if relationship_tenure and credit_score >= 750 else 0,
+        }
+        if special_offer:
+            loan_offer["special_offer_details"] = rng.choice(SPECIAL_OFFERS)
+
+    return {
+        "customers": customer,
+        "kyc_records": kyc_record,
+        "credit_reports": credit_report,
+        "loan_offers": loan_offer,
+        "campaign_journeys": campaign_journey,
+    }
+
+
+def generate_book(count: int, seed: int = DEFAULT_SEED, start: int = 1,
+                  as_of: datetime = AS_OF) -> Iterator[Dict[str, Optional[dict]]]:
+    """Lazily generate customers start .. start+count-1 (see generate_customer)."""
+    for index in range(start, start + count):
+        yield generate_customer(index, seed, as_of)
+
+
+def write_jsonl(directory: str, count: int, seed: int = DEFAULT_SEED, start: int = 1,
+                as_of: datetime = AS_OF) -> Dict[str, int]:
+    """
+    Stream a generated book to one JSONL file per dataset (<directory>/<dataset>.jsonl).
+
+    Returns:
+        dict: Dataset name -> records written
+    """
+    os.makedirs(directory, exist_ok=True)
+    written = dict.fromkeys(DATASETS, 0)
+    files = {name: open(os.path.join(directory, f"{name}.jsonl"), "w", encoding="utf-8") for name in DATASETS}
+    try:
+        for records in generate_book(count, seed, start, as_of):
+            for name, record in records.items():
+                if record is not None:
+                    files[name].write(json.dumps(record) + "\n")
+                    written[name] += 1
+    finally:
+        for handle in files.values():
+            handle.close()
+    return written
+
+
+def write_sqlite(path: str, count: int, seed: int = DEFAULT_SEED, start: int = 1,
+                 as_of: datetime = AS_OF, include_mock: bool = True) -> Dict[str, int]:
+    """
+    Stream a generated book into a SQLite repository database, IMPORT_BATCH_SIZE customers at a time.
+
+    Args:
+        path: Database file (created if missing; existing rows with the same IDs are replaced)
+        include_mock: Also load the hand-written demo customers (CUST001...)
+
+    Returns:
+        dict: Dataset name -> records written
+    """
+    repository = SQLiteRepository(path)
+    written = dict.fromkeys(DATASETS, 0)
+    try:
+        if include_mock:
+            for name, rows in load_mock_data(repository).items():
+                written[name] += rows
+        book = generate_book(count, seed, start, as_of)
+        while True:
+            chunk = list(islice(book, IMPORT_BATCH_SIZE))
+            if not chunk:
+                break
+            for name in DATASETS:
+                written[name] += repository.upsert(name, (records[name] for records in chunk if records[name] is not None))
+    finally:
+        repository.close()
+    return written
+
+
+def load_jsonl(repository: SQLiteRepository, directory: str) -> Dict[str, int]:
+    """
+    Stream a JSONL book (as written by write_jsonl) into a repository.
+
+    Returns:
+        dict: Dataset name -> records loaded
+    """
+    loaded = {}
+    for name in DATASETS:
+        path = os.path.join(directory, f"{name}.jsonl")
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as handle:
+            loaded[name] = repository.upsert(name, (json.loads(line) for line in handle if line.strip()))
+    return loaded
+
+
+def open_book(path: str) -> SQLiteRepository:
+    """
+    Open a generated book for the admin/benchmark tooling.
+
+    Args:
+        path: A SQLite database from write_sqlite, or a JSONL directory from
+              write_jsonl (loaded into an in-memory database with the demo customers)
+    """
+    if os.path.isdir(path):
+        repository = SQLiteRepository()
+        load_mock_data(repository)
+        load_jsonl(repository, path)
+        return repository
+    return SQLiteRepository(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic customer book")
+    parser.add_argument("--count", type=int, default=100000, help="number of customers")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--start", type=int, default=1, help="first customer number")
+    parser.add_argument("--as-of", default=AS_OF.strftime("%Y-%m-%d"), help="reference date (YYYY-MM-DD)")
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--sqlite", help="write a SQLite repository database")
+    output.add_argument("--jsonl", help="write one JSONL file per dataset into this directory")
+    parser.add_argument("--no-mock", action="store_true", help="do not include the demo customers (SQLite only)")
+    args = parser.parse_args()
+
+    as_of = datetime.strptime(args.as_of, "%Y-%m-%d")
+    started = time.perf_counter()
+    if args.sqlite:
+        counts = write_sqlite(args.sqlite, args.count, args.seed, args.start, as_of, include_mock=not args.no_mock)
+        target = args.sqlite
+    else:
+        counts = write_jsonl(args.jsonl, args.count, args.seed, args.start, as_of)
+        target = args.jsonl
+    elapsed = time.perf_counter() - started
+    print(f"📚 Generated {args.count:,} customers into {target} in {elapsed:.1f}s ({args.count / elapsed:,.0f}/s)")
+    for name, rows in counts.items():
+        print(f"   {name:<18} {rows:>12,}")
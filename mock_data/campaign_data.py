@@ -1,10 +1,15 @@
 """
 Campaign & Ad Source Intelligence Data
 Tracks how customers discovered Tata Capital and their intent
+CUSTOMER_CAMPAIGNS is seed data for the repository; lookups go through mock_data.repository
+CAMPAIGNS is the default campaign catalog for mock_data.reference_data
 """
 
 from datetime import datetime, timedelta
 
+from .reference_data import current as current_reference_data, thaw
+from .repository import get_repository
+
 # Campaign sources and their associated intents
 CAMPAIGNS = {
     "GOOGLE_MEDICAL_EMERGENCY": {
@@ -167,9 +172,9 @@ CUSTOMER_CAMPAIGNS = {
 
 def get_campaign_data(customer_id: str) -> dict:
     """Get campaign and journey data for a customer"""
-    journey = CUSTOMER_CAMPAIGNS.get(customer_id, {
+    journey = get_repository().get_campaign_journey(customer_id) or {
         "campaign_source": "DIRECT_WEBSITE",
-        "landing_date": datetime.now(),
+        "landing_date": datetime.now().isoformat(),
         "visits_count": 1,
         "pages_viewed": ["home"],
         "time_on_site_minutes": 5,
@@ -177,10 +182,11 @@ def get_campaign_data(customer_id: str) -> dict:
         "current_loans": [],
         "relationship_tenure_years": 0,
         "payment_history": None
-    })
+    }
     
+    campaigns = current_reference_data().campaigns
     campaign_key = journey["campaign_source"]
-    campaign = CAMPAIGNS.get(campaign_key, CAMPAIGNS["DIRECT_WEBSITE"])
+    campaign = thaw(campaigns.get(campaign_key, campaigns["DIRECT_WEBSITE"]))
     
     # Calculate customer type
     if journey["relationship_tenure_years"] > 0:
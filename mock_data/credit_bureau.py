@@ -2,11 +2,16 @@
 Mock Credit Bureau API
 Provides credit scores and credit history for customers
 Credit scores are out of 900 (similar to CIBIL scores in India)
+CREDIT_SCORES is seed data for the repository; lookups go through mock_data.repository
+RATE_CARD is the default rate card for mock_data.reference_data
 """
 
 import random
 from datetime import datetime, timedelta
 
+from .reference_data import current as current_reference_data
+from .repository import get_repository
+
 CREDIT_SCORES = {
     "CUST001": {
         "customer_id": "CUST001",
@@ -232,16 +237,35 @@ def get_credit_score(customer_id: str) -> dict:
     Fetch credit score from mock credit bureau API
     Returns credit score out of 900 with credit history details
     """
-    credit_data = CREDIT_SCORES.get(customer_id)
+    credit_data = get_repository().get_credit_report(customer_id)
     if not credit_data:
         return {
             "status": "error",
             "message": "Customer not found in credit bureau records"
         }
     
+    return _credit_report_response(credit_data)
+
+
+def get_credit_score_by_pan(pan_number: str) -> dict:
+    """
+    Fetch credit score using PAN number
+    """
+    credit_data = get_repository().get_credit_report_by_pan(pan_number)
+    if not credit_data:
+        return {
+            "status": "error",
+            "message": "PAN number not found in credit bureau records"
+        }
+    
+    return _credit_report_response(credit_data)
+
+
+def _credit_report_response(credit_data: dict) -> dict:
+    """Bureau API response for a stored credit record"""
     return {
         "status": "success",
-        "customer_id": customer_id,
+        "customer_id": credit_data["customer_id"],
         "credit_score": credit_data["credit_score"],
         "score_date": credit_data["score_date"],
         "score_range": credit_data["score_range"],
@@ -249,57 +273,49 @@ def get_credit_score(customer_id: str) -> dict:
     }
 
 
-def get_credit_score_by_pan(pan_number: str) -> dict:
-    """
-    Fetch credit score using PAN number
-    """
-    for customer_id, credit_data in CREDIT_SCORES.items():
-        if credit_data["pan_number"] == pan_number:
-            return {
-                "status": "success",
-                "customer_id": customer_id,
-                "credit_score": credit_data["credit_score"],
-                "score_date": credit_data["score_date"],
-                "score_range": credit_data["score_range"],
-                "credit_history": credit_data["credit_history"]
-            }
-    
-    return {
-        "status": "error",
-        "message": "PAN number not found in credit bureau records"
+# Score bands, highest first; the last band must start at 0
+RATE_CARD = [
+    {
+        "min_score": 750,
+        "eligible": True,
+        "risk_category": "Low Risk",
+        "interest_rate_range": "10.5% - 12%",
+        "message": "Excellent credit score. Eligible for best interest rates."
+    },
+    {
+        "min_score": 700,
+        "eligible": True,
+        "risk_category": "Medium Risk",
+        "interest_rate_range": "12% - 15%",
+        "message": "Good credit score. Eligible for standard interest rates."
+    },
+    {
+        "min_score": 650,
+        "eligible": True,
+        "risk_category": "High Risk",
+        "interest_rate_range": "15% - 18%",
+        "message": "Fair credit score. Eligible with higher interest rates."
+    },
+    {
+        "min_score": 0,
+        "eligible": False,
+        "risk_category": "Very High Risk",
+        "interest_rate_range": "N/A",
+        "message": "Credit score below minimum threshold. Not eligible for personal loan."
     }
+]
 
 
 def check_eligibility_by_score(credit_score: int) -> dict:
     """
     Check loan eligibility based on credit score
-    Minimum score required: 700
+    Bands come from the rate card in the current reference data snapshot
     """
-    if credit_score >= 750:
-        return {
-            "eligible": True,
-            "risk_category": "Low Risk",
-            "interest_rate_range": "10.5% - 12%",
-            "message": "Excellent credit score. Eligible for best interest rates."
-        }
-    elif credit_score >= 700:
-        return {
-            "eligible": True,
-            "risk_category": "Medium Risk",
-            "interest_rate_range": "12% - 15%",
-            "message": "Good credit score. Eligible for standard interest rates."
-        }
-    elif credit_score >= 650:
-        return {
-            "eligible": True,
-            "risk_category": "High Risk",
-            "interest_rate_range": "15% - 18%",
-            "message": "Fair credit score. Eligible with higher interest rates."
-        }
-    else:
-        return {
-            "eligible": False,
-            "risk_category": "Very High Risk",
-            "interest_rate_range": "N/A",
-            "message": "Credit score below minimum threshold. Not eligible for personal loan."
-        }
+    for band in current_reference_data().rate_card:
+        if credit_score >= band["min_score"]:
+            return {
+                "eligible": band["eligible"],
+                "risk_category": band["risk_category"],
+                "interest_rate_range": band["interest_rate_range"],
+                "message": band["message"]
+            }
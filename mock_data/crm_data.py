@@ -1,8 +1,11 @@
 """
 Mock CRM Data for KYC Verification
 Contains customer KYC details like phone, address, ID verification status
+CRM_DATA is seed data for the repository; lookups go through mock_data.repository
 """
 
+from .repository import get_repository
+
 CRM_DATA = {
     "CUST001": {
         "customer_id": "CUST001",
@@ -273,12 +276,12 @@ CRM_DATA = {
 
 def get_kyc_data(customer_id: str) -> dict | None:
     """Retrieve KYC data for a customer from CRM"""
-    return CRM_DATA.get(customer_id)
+    return get_repository().get_kyc_record(customer_id)
 
 
 def verify_phone(customer_id: str, phone: str) -> dict:
     """Verify if the phone number matches the customer record"""
-    crm_record = CRM_DATA.get(customer_id)
+    crm_record = get_kyc_data(customer_id)
     if not crm_record:
         return {"status": "error", "message": "Customer not found in CRM"}
     
@@ -289,7 +292,7 @@ def verify_phone(customer_id: str, phone: str) -> dict:
 
 def verify_address(customer_id: str, pincode: str) -> dict:
     """Verify if the pincode matches the customer's address record"""
-    crm_record = CRM_DATA.get(customer_id)
+    crm_record = get_kyc_data(customer_id)
     if not crm_record:
         return {"status": "error", "message": "Customer not found in CRM"}
     
@@ -300,7 +303,7 @@ def verify_address(customer_id: str, pincode: str) -> dict:
 
 def get_kyc_status(customer_id: str) -> dict:
     """Get overall KYC verification status for a customer"""
-    crm_record = CRM_DATA.get(customer_id)
+    crm_record = get_kyc_data(customer_id)
     if not crm_record:
         return {"status": "error", "message": "Customer not found in CRM"}
     
@@ -6,6 +6,8 @@ Offers relevant additional products after successful loan approval
 from typing import Dict, List
 import random
 
+from .reference_data import current as current_reference_data, thaw
+
 
 # Product catalog for cross-selling
 CROSS_SELL_PRODUCTS = {
@@ -122,7 +124,7 @@ def recommend_cross_sell_products(customer_data: Dict, loan_data: Dict) -> List[
     monthly_salary = customer_data.get("monthly_salary", 50000)
     
     # Calculate relevance for each product
-    for product_id, product_info in CROSS_SELL_PRODUCTS.items():
+    for product_id, product_info in current_reference_data().cross_sell_catalog.items():
         relevance_scores = product_info["relevance_score"]
         
         # Determine context-specific relevance
@@ -147,7 +149,7 @@ def recommend_cross_sell_products(customer_data: Dict, loan_data: Dict) -> List[
             "name": product_info["name"],
             "description": product_info["description"],
             "price": product_info["price"],
-            "benefits": product_info["benefits"],
+            "benefits": thaw(product_info["benefits"]),
             "icon": product_info["icon"],
             "relevance_score": round(relevance, 2)
         })
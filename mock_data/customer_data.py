@@ -1,8 +1,11 @@
 """
 Synthetic Customer Data for BFSI Loan Chatbot
 Contains details for 10+ customers including name, age, city, current loans, credit score, and pre-approved limits
+CUSTOMERS is seed data for the repository; lookups go through mock_data.repository
 """
 
+from .repository import get_repository
+
 CUSTOMERS = {
     "CUST001": {
         "customer_id": "CUST001",
@@ -240,20 +243,17 @@ CUSTOMERS = {
 
 def get_customer_by_phone(phone: str) -> dict | None:
     """Retrieve customer data by phone number"""
-    for customer_id, customer in CUSTOMERS.items():
-        if customer["phone"] == phone:
-            return customer
-    return None
+    return get_repository().get_customer_by_phone(phone)
 
 
 def get_customer_by_id(customer_id: str) -> dict | None:
     """Retrieve customer data by customer ID"""
-    return CUSTOMERS.get(customer_id)
+    return get_repository().get_customer(customer_id)
 
 
 def get_all_customers() -> dict:
     """Retrieve all customers"""
-    return CUSTOMERS
+    return {customer["customer_id"]: customer for customer in get_repository().list_customers()}
 
 
 def validate_customer_eligibility(customer_id: str) -> dict:
@@ -265,7 +265,7 @@ def validate_customer_eligibility(customer_id: str) -> dict:
     - Employment: Salaried (2+ years experience, 1+ year with current employer)
                   or Self-employed
     """
-    customer = CUSTOMERS.get(customer_id)
+    customer = get_customer_by_id(customer_id)
     if not customer:
         return {
             "status": "error",
@@ -0,0 +1,141 @@
+"""
+Fake LLM Provider
+Local Mistral/OpenAI-compatible chat completions endpoint with injected latency
+(p50/p99) and error rates, so model routing, hedging and failover can be
+exercised without network access or API keys
+
+Run: python -m mock_data.fake_llm_provider --profile tail --port 8200
+Use: litellm model "mistral/<anything>" with api_base="http://127.0.0.1:8200/v1", api_key="fake"
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from .standin_services import lognormal_params
+
+# p50_ms/p99_ms - latency distribution (log-normal fitted to both percentiles)
+# error_rate    - fraction of calls answered with HTTP 503
+PROFILES: Dict[str, dict] = {
+    "instant": {"p50_ms": 0, "p99_ms": 0, "error_rate": 0.0},
+    "fast": {"p50_ms": 150, "p99_ms": 600, "error_rate": 0.0},
+    "tail": {"p50_ms": 300, "p99_ms": 6000, "error_rate": 0.01},
+    "flaky": {"p50_ms": 300, "p99_ms": 1500, "error_rate": 0.3},
+    "down": {"p50_ms": 20, "p99_ms": 50, "error_rate": 1.0},
+}
+
+
+class FakeLLMProvider:
+    """Latency/error sampler plus canned chat completion responses."""
+
+    def __init__(self, name: str, profile: dict, seed: Optional[int] = None):
+        self.name = name
+        self.profile = dict(profile)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "errors": 0}
+
+        self._mu, self._sigma = lognormal_params(profile)
+
+    def _sample(self):
+        with self._lock:
+            self.stats["calls"] += 1
+            latency_ms = self._random.lognormvariate(self._mu, self._sigma) if self._mu is not None else 0.0
+            failed = self._random.random() < self.profile.get("error_rate", 0)
+            if failed:
+                self.stats["errors"] += 1
+        return latency_ms, failed
+
+    def complete(self, request: dict):
+        """
+        Handle one chat completion request.
+
+        Returns:
+            tuple: (HTTP status, response body)
+        """
+        latency_ms, failed = self._sample()
+        time.sleep(latency_ms / 1000)
+        if failed:
+            return 503, {"error": {"message": f"{self.name}: service unavailable", "type": "server_error"}}
+        return 200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": f"[{self.name}] ok"},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 3, "total_tokens": 13},
+        }
+
+
+def make_fake_provider_server(provider: FakeLLMProvider, host: str = "127.0.0.1", port: int = 8200) -> ThreadingHTTPServer:
+    """
+    HTTP server exposing POST /v1/chat/completions.
+
+    Returns:
+        ThreadingHTTPServer: Call serve_forever() (or run it in a thread)
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                return self._send(404, {"error": {"message": "Unknown endpoint"}})
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                request = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                return self._send(400, {"error": {"message": "Invalid JSON"}})
+            self._send(*provider.complete(request))
+
+        def _send(self, status: int, body):
+            payload = json.dumps(body).encode()
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # the client cancelled (e.g. a hedged request that lost)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_fake_provider(name: str, profile: str = "fast", seed: Optional[int] = None, **overrides):
+    """
+    Serve a fake provider on a free local port in a background thread.
+
+    Returns:
+        tuple: (FakeLLMProvider, api_base URL, server)
+    """
+    provider = FakeLLMProvider(name, {**PROFILES[profile], **overrides}, seed=seed)
+    server = make_fake_provider_server(provider, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return provider, f"http://127.0.0.1:{server.server_address[1]}/v1", server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a fake Mistral/OpenAI-compatible chat endpoint")
+    parser.add_argument("--profile", default="fast", choices=sorted(PROFILES))
+    parser.add_argument("--name", default="fake")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8200)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = make_fake_provider_server(FakeLLMProvider(args.name, PROFILES[args.profile], seed=args.seed), args.host, args.port)
+    print(f"🧪 Fake LLM provider '{args.name}' ({args.profile}) at http://{args.host}:{server.server_address[1]}/v1")
+    server.serve_forever()
@@ -0,0 +1,278 @@
+"""
+Local Sentiment Classifier
+Tier-1 sentiment classifier that runs on the CPU in microseconds: a cue-word
+lexicon plus a small softmax (multinomial logistic regression) model over word
+unigrams/bigrams and lexicon hits (marked as negated right after "not", "dont",
+...), trained offline on labelled turns (mock_data.sentiment_training_data). Covers the same 8 sentiment types as
+detect_sentiment(); the caller escalates to the LLM when it is unsure.
+
+Train / evaluate / export:
+  python -m mock_data.local_sentiment --train [--data turns.jsonl] [--out model.json]
+  (turns.jsonl: one {"text": ..., "label": ...} per line, added to the built-in turns)
+
+Environment:
+- LOCAL_SENTIMENT_MODEL_PATH=model.json   weights exported with --out (default: train on the
+  built-in turns, ~0.3s; server.py and main.py do this at startup)
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .sentiment_training_data import LABELLED_TURNS
+from .strategy_table import SENTIMENT_TYPES
+
+# Sentiment score reported for each class (same scale as the LLM's SCORE)
+CLASS_SCORES: Dict[str, float] = {
+    "EXCITEMENT": 0.8,
+    "TRUST": 0.6,
+    "NEUTRAL": 0.0,
+    "URGENCY": -0.1,
+    "CONFUSION": -0.3,
+    "HESITATION": -0.3,
+    "PRICE_CONCERN": -0.4,
+    "FRUSTRATION": -0.7,
+}
+
+# Cue words (and word pairs, joined with "_") per class; each hit is a model feature
+LEXICON: Dict[str, Tuple[str, ...]] = {
+    "EXCITEMENT": ("great", "awesome", "amazing", "fantastic", "excellent", "perfect", "wonderful", "brilliant",
+                   "excited", "happy", "love", "super", "yay", "mast", "badhiya", "proceed", "lets_go", "sign_me", "go_ahead"),
+    "CONFUSION": ("understand", "confused", "confusing", "explain", "clarify", "meaning", "mean", "unclear", "lost",
+                  "samajh_nahi", "what_is", "what_does", "how_does", "didn't_get", "don't_get", "huh"),
+    "HESITATION": ("sure", "maybe", "think", "later", "decide", "hesitant", "unsure", "worried", "consult",
+                   "discuss", "sochna", "baad", "not_sure", "get_back", "second_thoughts", "not_ready"),
+    "FRUSTRATION": ("annoying", "annoyed", "ridiculous", "useless", "terrible", "worst", "frustrating", "irritating",
+                    "angry", "fed", "nonsense", "broken", "enough", "ugh", "bakwas", "wasting", "already", "again"),
+    "TRUST": ("ok", "okay", "trust", "believe", "fine", "alright", "agree", "understood", "noted", "got_it",
+              "makes_sense", "thanks", "thank", "comfortable", "confident", "reasonable", "theek", "fair"),
+    "URGENCY": ("urgent", "urgently", "asap", "emergency", "immediately", "hurry", "quickly", "fast", "fastest",
+                "today", "tomorrow", "deadline", "jaldi", "turant", "right_away", "hospital", "surgery"),
+    "PRICE_CONCERN": ("expensive", "costly", "cheaper", "discount", "afford", "budget", "mehenga", "zyada", "fee",
+                      "fees", "charges", "waive", "lower", "reduce", "too_high", "too_much", "hidden_charges"),
+    "NEUTRAL": (),
+}
+
+# Words that flip the cues right after them ("not happy", "dont trust"): tokens
+# within NEGATION_SCOPE words of one get neg: features instead of w:/lex:
+NEGATORS = frozenset({"not", "no", "never", "dont", "don't", "didnt", "didn't", "doesnt", "doesn't", "isnt",
+                      "isn't", "wasnt", "wasn't", "cant", "can't", "cannot", "wont", "won't", "hardly"})
+NEGATION_SCOPE = 3
+
+_TOKEN = re.compile(r"[a-z0-9%']+")
+_CLAUSE = re.compile(r"[,.;:!?]")
+_CUE_CLASSES: Dict[str, List[str]] = {}
+for _label, _cues in LEXICON.items():
+    for _cue in _cues:
+        _CUE_CLASSES.setdefault(_cue, []).append(_label)
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _negated_positions(text: str) -> List[bool]:
+    """For each token, whether it falls within NEGATION_SCOPE words after a negator in the same clause."""
+    negated = []
+    for clause in _CLAUSE.split(text.lower()):
+        remaining = 0
+        for token in _TOKEN.findall(clause):
+            if token in NEGATORS:
+                negated.append(False)
+                remaining = NEGATION_SCOPE
+            else:
+                negated.append(remaining > 0)
+                remaining = max(0, remaining - 1)
+    return negated
+
+
+def extract_features(text: str, tokens: Optional[List[str]] = None) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Model features and matched lexicon cues for a message.
+
+    Words and cues shortly after a negator ("not happy", "i dont trust") are
+    reported as neg:/neglex: features and as negated cues, so they do not
+    count towards the class they would otherwise signal. Cues that contain
+    the negator themselves ("not_sure", "don't_get") are ordinary cues.
+
+    Returns:
+        tuple: (feature names, lexicon cues found, negated lexicon cues found)
+    """
+    tokens = tokenize(text) if tokens is None else tokens
+    negated = _negated_positions(text)
+    bigrams = [f"{first}_{second}" for first, second in zip(tokens, tokens[1:])]
+    for index, bigram in enumerate(bigrams):
+        if bigram in _CUE_CLASSES:
+            negated[index + 1] = False
+    features = ["bias"]
+    features.extend(f"neg:{token}" if scoped else f"w:{token}" for token, scoped in zip(tokens, negated))
+    features.extend(f"b:{bigram}" for bigram in bigrams)
+    cues, negated_cues = [], []
+    for term, scoped in zip(tokens + bigrams, negated + negated[:len(bigrams)]):
+        if term in _CUE_CLASSES:
+            (negated_cues if scoped else cues).append(term)
+    for cue in cues:
+        features.extend(f"lex:{label}" for label in _CUE_CLASSES[cue])
+    for cue in negated_cues:
+        features.extend(f"neglex:{label}" for label in _CUE_CLASSES[cue])
+    if "!" in text:
+        features.append("p:!")
+    if "?" in text:
+        features.append("p:?")
+    features.append(f"len:{min(len(tokens), 12) // 4}")
+    return features, cues, negated_cues
+
+
+class LocalSentimentModel:
+    """Softmax classifier over sparse string features (weights: feature -> per-class list)."""
+
+    def __init__(self, weights: Dict[str, List[float]], classes: Sequence[str] = SENTIMENT_TYPES):
+        self.classes = tuple(classes)
+        self.weights = weights
+
+    def _probabilities(self, features: Iterable[str]) -> List[float]:
+        scores = [0.0] * len(self.classes)
+        for feature in features:
+            row = self.weights.get(feature)
+            if row is not None:
+                for index, weight in enumerate(row):
+                    scores[index] += weight
+        top = max(scores)
+        exps = [math.exp(score - top) for score in scores]
+        total = sum(exps)
+        return [value / total for value in exps]
+
+    def predict(self, text: str) -> Dict:
+        """
+        Classify a message.
+
+        Returns:
+            dict: sentiment, confidence (top probability), margin (top minus
+                  runner-up), score, words, cues, negated_cues, runner_up
+        """
+        tokens = tokenize(text)
+        features, cues, negated_cues = extract_features(text, tokens)
+        probabilities = self._probabilities(features)
+        ranked = sorted(range(len(self.classes)), key=probabilities.__getitem__, reverse=True)
+        best, second = ranked[0], ranked[1]
+        sentiment = self.classes[best]
+        return {
+            "sentiment": sentiment,
+            "confidence": probabilities[best],
+            "margin": probabilities[best] - probabilities[second],
+            "runner_up": self.classes[second],
+            "score": CLASS_SCORES.get(sentiment, 0.0),
+            "words": len(tokens),
+            "cues": cues,
+            "negated_cues": negated_cues,
+        }
+
+    @classmethod
+    def train(cls, examples: Sequence[Tuple[str, str]], epochs: int = 30, learning_rate: float = 0.2,
+              l2: float = 1e-3, seed: int = 42) -> "LocalSentimentModel":
+        """
+        Fit by stochastic gradient descent on (text, label) pairs.
+
+        Raises:
+            ValueError: If a label is not one of SENTIMENT_TYPES
+        """
+        classes = SENTIMENT_TYPES
+        index_of = {label: index for index, label in enumerate(classes)}
+        unknown = {label for _, label in examples if label not in index_of}
+        if unknown:
+            raise ValueError(f"Unknown sentiment labels: {', '.join(sorted(unknown))}")
+        samples = [(extract_features(text)[0], index_of[label]) for text, label in examples]
+        model = cls({}, classes)
+        order = list(range(len(samples)))
+        rng = random.Random(seed)
+        for _ in range(epochs):
+            rng.shuffle(order)
+            for sample_index in order:
+                features, target = samples[sample_index]
+                probabilities = model._probabilities(features)
+                for feature in features:
+                    row = model.weights.setdefault(feature, [0.0] * len(classes))
+                    for index in range(len(classes)):
+                        gradient = probabilities[index] - (1.0 if index == target else 0.0)
+                        row[index] -= learning_rate * (gradient + l2 * row[index])
+        return model
+
+    def accuracy(self, examples: Sequence[Tuple[str, str]]) -> float:
+        if not examples:
+            return 0.0
+        return sum(self.predict(text)["sentiment"] == label for text, label in examples) / len(examples)
+
+    def to_json(self) -> Dict:
+        return {"classes": list(self.classes), "weights": {feature: [round(w, 5) for w in row] for feature, row in self.weights.items()}}
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "LocalSentimentModel":
+        return cls(data["weights"], data["classes"])
+
+
+def load_examples(path: str) -> List[Tuple[str, str]]:
+    """(text, label) pairs from a JSONL file of {"text": ..., "label": ...} lines."""
+    with open(path, encoding="utf-8") as handle:
+        return [(row["text"], row["label"].upper()) for row in map(json.loads, handle) if row]
+
+
+def cross_validate(examples: Sequence[Tuple[str, str]], folds: int = 5, seed: int = 42) -> float:
+    """Mean held-out accuracy over `folds` stratified folds."""
+    shuffled = list(examples)
+    random.Random(seed).shuffle(shuffled)
+    shuffled.sort(key=lambda example: example[1])
+    correct = 0
+    for fold in range(folds):
+        held_out = shuffled[fold::folds]
+        training = [example for index, example in enumerate(shuffled) if index % folds != fold]
+        correct += LocalSentimentModel.train(training).accuracy(held_out) * len(held_out)
+    return correct / len(shuffled)
+
+
+_model: Optional[LocalSentimentModel] = None
+_model_lock = threading.Lock()
+
+
+def get_local_model() -> LocalSentimentModel:
+    """The shared model: loaded from LOCAL_SENTIMENT_MODEL_PATH, else trained on the built-in turns."""
+    global _model
+    model = _model
+    if model is None:
+        with _model_lock:
+            if _model is None:
+                path = os.getenv("LOCAL_SENTIMENT_MODEL_PATH")
+                if path:
+                    with open(path, encoding="utf-8") as handle:
+                        _model = LocalSentimentModel.from_json(json.load(handle))
+                else:
+                    _model = LocalSentimentModel.train(LABELLED_TURNS)
+            model = _model
+    return model
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train and evaluate the local sentiment classifier")
+    parser.add_argument("--train", action="store_true", help="train, report accuracy and optionally export")
+    parser.add_argument("--data", help="extra labelled turns (JSONL with text and label)")
+    parser.add_argument("--out", help="write the trained weights here (use as LOCAL_SENTIMENT_MODEL_PATH)")
+    parser.add_argument("text", nargs="*", help="messages to classify")
+    args = parser.parse_args()
+
+    examples = list(LABELLED_TURNS) + (load_examples(args.data) if args.data else [])
+    if args.train:
+        trained = LocalSentimentModel.train(examples)
+        print(f"🧠 Trained on {len(examples)} turns | features: {len(trained.weights)} | "
+              f"train accuracy: {trained.accuracy(examples):.1%} | 5-fold accuracy: {cross_validate(examples):.1%}")
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as handle:
+                json.dump(trained.to_json(), handle)
+            print(f"💾 Weights written to {args.out}")
+        _model = trained
+    for message in args.text:
+        prediction = get_local_model().predict(message)
+        print(f"{prediction['sentiment']:>14} {prediction['confidence']:.2f} (margin {prediction['margin']:.2f}) | {message}")
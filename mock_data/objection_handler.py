@@ -1,8 +1,24 @@
 """
 Intelligent Objection Handling System
 Diagnoses customer objections and provides strategic responses
+OBJECTION_TYPES and COUNTER_STRATEGIES are the defaults for mock_data.reference_data
+
+Objection phrases are compiled into a phrase automaton (mock_data.phrase_automaton)
+once per reference data snapshot; detection is one pass over the message.
+
+Environment:
+- OBJECTION_FUZZY_MIN_LENGTH=5   shortest word matched with one typo (0 = exact words only)
 """
 
+import os
+import threading
+from typing import Optional, Tuple
+
+from .phrase_automaton import PhraseAutomaton
+from .reference_data import ReferenceSnapshot, current as current_reference_data, thaw
+
+OBJECTION_FUZZY_MIN_LENGTH = int(os.getenv("OBJECTION_FUZZY_MIN_LENGTH", "5"))
+
 # Objection taxonomy with classification
 OBJECTION_TYPES = {
     "INTEREST_RATE_HIGH": {
@@ -440,9 +456,36 @@ If we don't disburse within 24 hours (for complete applications), we'll waive yo
 }
 
 
+_compiled: Optional[Tuple[int, PhraseAutomaton]] = None
+_compile_lock = threading.Lock()
+
+
+def objection_automaton(reference: Optional[ReferenceSnapshot] = None) -> PhraseAutomaton:
+    """Phrase automaton for a snapshot's objection taxonomy (compiled on first use per version)."""
+    reference = reference or current_reference_data()
+    compiled = _compiled
+    if compiled is None or compiled[0] != reference.version:
+        with _compile_lock:
+            compiled = _compiled
+            if compiled is None or compiled[0] != reference.version:
+                compiled = _compile(reference)
+    return compiled[1]
+
+
+def _compile(reference: ReferenceSnapshot) -> Tuple[int, PhraseAutomaton]:
+    global _compiled
+    automaton = PhraseAutomaton(
+        {objection_type: details["common_phrases"] for objection_type, details in reference.objection_types.items()},
+        fuzzy_min_length=OBJECTION_FUZZY_MIN_LENGTH,
+    )
+    _compiled = (reference.version, automaton)  # single reference assignment, like snapshot publishing
+    return _compiled
+
+
 def detect_objection(customer_message: str) -> list:
     """
-    Detect objections in customer message using keyword matching
+    Detect objections in customer message using phrase matching
+    (whole words, case/punctuation-insensitive, one typo allowed in longer words)
     
     Args:
         customer_message: The customer's message text
@@ -450,27 +493,20 @@ def detect_objection(customer_message: str) -> list:
     Returns:
         List of detected objection types with confidence scores
     """
-    customer_message_lower = customer_message.lower()
+    reference = current_reference_data()
     detected = []
     
-    for objection_type, details in OBJECTION_TYPES.items():
-        confidence = 0
-        matched_phrases = []
-        
-        for phrase in details["common_phrases"]:
-            if phrase in customer_message_lower:
-                confidence += 1
-                matched_phrases.append(phrase)
-        
-        if confidence > 0:
-            detected.append({
-                "type": objection_type,
-                "category": details["category"],
-                "severity": details["severity"],
-                "confidence": min(confidence / len(details["common_phrases"]), 1.0),
-                "matched_phrases": matched_phrases,
-                "counter_strategies": details["counter_strategies"]
-            })
+    for objection_type, phrase_indices in objection_automaton(reference).find(customer_message).items():
+        details = reference.objection_types[objection_type]
+        phrases = details["common_phrases"]
+        detected.append({
+            "type": objection_type,
+            "category": details["category"],
+            "severity": details["severity"],
+            "confidence": min(len(phrase_indices) / len(phrases), 1.0),
+            "matched_phrases": [phrases[index] for index in phrase_indices],
+            "counter_strategies": thaw(details["counter_strategies"])
+        })
     
     # Sort by confidence
     detected.sort(key=lambda x: x["confidence"], reverse=True)
@@ -489,13 +525,14 @@ def get_objection_response(objection_type: str, customer_data: dict) -> dict:
     Returns:
         Counter-strategy details with response template
     """
-    objection = OBJECTION_TYPES.get(objection_type)
+    reference = current_reference_data()
+    objection = reference.objection_types.get(objection_type)
     if not objection:
         return None
     
     # Get primary counter-strategy
     primary_strategy = objection["counter_strategies"][0]
-    strategy = COUNTER_STRATEGIES.get(primary_strategy)
+    strategy = reference.counter_strategies.get(primary_strategy)
     
     if not strategy:
         return None
@@ -508,7 +545,7 @@ def get_objection_response(objection_type: str, customer_data: dict) -> dict:
         "approach": strategy["approach"],
         "response_template": strategy["response_template"],
         "success_rate": strategy["success_rate"],
-        "alternate_strategies": objection["counter_strategies"][1:]
+        "alternate_strategies": thaw(objection["counter_strategies"][1:])
     }
 
 
@@ -1,10 +1,15 @@
 """
 Mock Offer Mart Server
 Contains pre-approved loan offers for customers
+LOAN_OFFERS is seed data for the repository; lookups go through mock_data.repository
+OFFER_RULES is the default offer policy for mock_data.reference_data
 """
 
 from datetime import datetime, timedelta
 
+from .reference_data import current as current_reference_data
+from .repository import get_repository
+
 LOAN_OFFERS = {
     "CUST001": {
         "customer_id": "CUST001",
@@ -175,12 +180,20 @@ LOAN_OFFERS = {
     }
 }
 
+# Offer policy applied on top of each customer's pre-approved offer
+OFFER_RULES = {
+    "conditional_limit_multiple": 2,     # up to N x pre-approved limit with salary slip
+    "max_emi_to_salary_percent": 50,
+    "tenure_options": [12, 24, 36, 48, 60, 72],
+    "standard_tenure_months": 60
+}
+
 
 def get_pre_approved_offer(customer_id: str) -> dict:
     """
     Fetch pre-approved loan offer for a customer from Offer Mart
     """
-    offer = LOAN_OFFERS.get(customer_id)
+    offer = get_repository().get_offer(customer_id)
     if not offer:
         return {
             "status": "error",
@@ -226,8 +239,12 @@ def check_loan_eligibility(customer_id: str, requested_amount: float, monthly_sa
     - If amount <= pre_approved_limit: Instant approval
     - If amount <= 2x pre_approved_limit: Need salary slip verification, will check EMI after salary verification
     - If amount > 2x pre_approved_limit: Reject
+    (multiple and EMI cap come from the current reference data offer rules)
     """
-    offer = LOAN_OFFERS.get(customer_id)
+    rules = current_reference_data().offer_rules
+    multiple = rules["conditional_limit_multiple"]
+    emi_cap = rules["max_emi_to_salary_percent"]
+    offer = get_repository().get_offer(customer_id)
     if not offer:
         return {
             "status": "error",
@@ -260,7 +277,7 @@ def check_loan_eligibility(customer_id: str, requested_amount: float, monthly_sa
         return result
     
     # Rule 2: Up to 2x pre-approved limit - need salary slip verification
-    elif requested_amount <= 2 * pre_approved_limit:
+    elif requested_amount <= multiple * pre_approved_limit:
         # Mark as conditional - EMI check will happen after salary slip verification
         return {
             "status": "success",
@@ -272,17 +289,17 @@ def check_loan_eligibility(customer_id: str, requested_amount: float, monthly_sa
             "emi_details": emi_details,
             "documents_required": ["Salary Slip (last 3 months) - PDF or Image format"],
             "pre_approved_limit": pre_approved_limit,
-            "note": "⚠️ IMPORTANT: EMI must be ≤ 50% of VERIFIED salary (not registered salary) for approval. Request document upload BEFORE calculating or showing EMI."
+            "note": f"⚠️ IMPORTANT: EMI must be ≤ {emi_cap:g}% of VERIFIED salary (not registered salary) for approval. Request document upload BEFORE calculating or showing EMI."
         }
     
     # Rule 3: More than 2x pre-approved limit - reject
     else:
-        max_allowed = 2 * pre_approved_limit
+        max_allowed = multiple * pre_approved_limit
         return {
             "status": "success",
             "eligible": False,
             "approval_type": "REJECTED",
-            "message": f"Requested amount ₹{requested_amount:,.0f} exceeds maximum allowed limit of ₹{max_allowed:,.0f} (2x your pre-approved limit of ₹{pre_approved_limit:,.0f}).",
+            "message": f"Requested amount ₹{requested_amount:,.0f} exceeds maximum allowed limit of ₹{max_allowed:,.0f} ({multiple:g}x your pre-approved limit of ₹{pre_approved_limit:,.0f}).",
             "max_allowed_amount": max_allowed,
             "pre_approved_limit": pre_approved_limit,
             "suggestion": f"Please request an amount up to ₹{max_allowed:,.0f} to proceed with your application."
@@ -292,8 +309,9 @@ def check_loan_eligibility(customer_id: str, requested_amount: float, monthly_sa
 def calculate_max_eligible_amount(monthly_salary: float, interest_rate: float, tenure_months: int) -> float:
     """
     Calculate maximum eligible loan amount based on 50% EMI to salary ratio
+    (cap from the current reference data offer rules)
     """
-    max_emi = monthly_salary * 0.5
+    max_emi = monthly_salary * current_reference_data().offer_rules["max_emi_to_salary_percent"] / 100
     monthly_rate = interest_rate / (12 * 100)
     
     if monthly_rate == 0:
@@ -308,7 +326,7 @@ def get_available_tenures(customer_id: str) -> dict:
     """
     Get available loan tenures for a customer
     """
-    offer = LOAN_OFFERS.get(customer_id)
+    offer = get_repository().get_offer(customer_id)
     if not offer:
         return {
             "status": "error",
@@ -316,9 +334,7 @@ def get_available_tenures(customer_id: str) -> dict:
         }
     
     max_tenure = offer["max_tenure_months"]
-    tenures = [12, 24, 36, 48, 60]
-    if max_tenure > 60:
-        tenures.append(72)
+    tenures = current_reference_data().offer_rules["tenure_options"]
     
     available_tenures = [t for t in tenures if t <= max_tenure]
     
@@ -337,7 +353,7 @@ def check_top_up_eligibility(customer_id: str) -> dict:
     - At least 12 EMIs paid on time
     - No defaults in last 6 months
     """
-    offer = LOAN_OFFERS.get(customer_id)
+    offer = get_repository().get_offer(customer_id)
     if not offer:
         return {
             "status": "error",
@@ -390,8 +406,11 @@ def calculate_additional_borrowing_capacity(customer_id: str, current_emi: float
     """
     Calculate how much additional loan customer can take based on existing EMI and salary
     Rule: Total EMI should not exceed 50% of monthly salary
+    (cap and standard tenure from the current reference data offer rules)
     """
-    offer = LOAN_OFFERS.get(customer_id)
+    rules = current_reference_data().offer_rules
+    emi_cap = rules["max_emi_to_salary_percent"]
+    offer = get_repository().get_offer(customer_id)
     if not offer:
         return {
             "status": "error",
@@ -399,7 +418,7 @@ def calculate_additional_borrowing_capacity(customer_id: str, current_emi: float
         }
     
     # Maximum allowable EMI = 50% of salary
-    max_total_emi = monthly_salary * 0.5
+    max_total_emi = monthly_salary * emi_cap / 100
     
     # Available EMI capacity
     available_emi = max_total_emi - current_emi
@@ -408,13 +427,13 @@ def calculate_additional_borrowing_capacity(customer_id: str, current_emi: float
         return {
             "status": "success",
             "additional_capacity": 0,
-            "message": "Current EMI is at maximum capacity (50% of salary). No additional borrowing possible.",
+            "message": f"Current EMI is at maximum capacity ({emi_cap:g}% of salary). No additional borrowing possible.",
             "current_emi_ratio": round((current_emi / monthly_salary) * 100, 2)
         }
     
     # Calculate maximum additional loan amount
     # Use standard tenure and interest rate
-    tenure_months = 60  # 5 years standard
+    tenure_months = rules["standard_tenure_months"]
     interest_rate = offer["interest_rate"]
     
     # Reverse EMI calculation to find principal
@@ -0,0 +1,192 @@
+"""
+Phrase Automaton
+Multi-phrase matcher: a phrase dictionary (label -> phrases) compiled once
+into an Aho-Corasick automaton over word tokens, so finding every phrase in
+a message is one linear pass over its tokens whatever the dictionary size.
+Phrases only match on whole tokens ("is it fast" does not match "is it
+faster"). Case, punctuation and apostrophes are ignored ("cant" matches
+"can't").
+
+Light fuzzy matching: a message token that is not in the phrase vocabulary
+is mapped to the vocabulary word one edit away (insertion, deletion,
+substitution or adjacent transposition), for words of at least
+`fuzzy_min_length` characters, e.g. "intrest" -> "interest". Candidates come
+from a precomputed deletion index (symmetric delete), so a lookup costs
+O(token length), independent of the vocabulary size. Real words are never
+treated as typos ("rely" is not "reply", "scored" is not "scared"): tokens in
+`known_words`, by default the English word list in english_words.txt, only
+match exactly.
+"""
+
+import os
+import re
+from collections import deque
+from typing import AbstractSet, Dict, FrozenSet, Hashable, List, Mapping, Optional, Sequence, Set, Tuple
+
+_APOSTROPHES = re.compile(r"['’‘`]")
+_TOKEN = re.compile(r"\w+")
+
+# Shorter words are only matched exactly (too many near neighbours: rate/late, fee/few)
+DEFAULT_FUZZY_MIN_LENGTH = 5
+
+# Out-of-vocabulary tokens whose fuzzy lookup is remembered (cleared when full)
+FUZZY_CACHE_SIZE = 50000
+
+# English words (see the file header for its source); a message token in this set only matches exactly
+WORD_LIST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "english_words.txt")
+
+
+def load_word_list(path: str) -> FrozenSet[str]:
+    """Lowercase words of a word list file (one per line, '#' comment lines skipped)."""
+    with open(path, encoding="utf-8") as handle:
+        return frozenset(
+            line.strip().lower() for line in handle if line.strip() and not line.startswith("#")
+        )
+
+
+KNOWN_WORDS = load_word_list(WORD_LIST_PATH)
+
+
+def phrase_tokens(text: str) -> List[str]:
+    """Normalized word tokens of a phrase or message."""
+    return _TOKEN.findall(_APOSTROPHES.sub("", text.lower()))
+
+
+def _deletions(word: str) -> Set[str]:
+    return {word[:index] + word[index + 1:] for index in range(len(word))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Optimal string alignment distance <= 1."""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) == len(b):
+        diffs = [index for index in range(len(a)) if a[index] != b[index]]
+        if len(diffs) == 1:
+            return True
+        return len(diffs) == 2 and diffs[1] == diffs[0] + 1 and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]]
+    if len(a) > len(b):
+        a, b = b, a
+    index = 0
+    while index < len(a) and a[index] == b[index]:
+        index += 1
+    return a[index:] == b[index + 1:]
+
+
+class PhraseAutomaton:
+    """
+    Aho-Corasick automaton over the token sequences of a labelled phrase dictionary.
+
+    find() reports, per label, the indices of its phrases found in a text,
+    with labels in dictionary order and indices in phrase order.
+    """
+
+    def __init__(self, phrases: Mapping[Hashable, Sequence[str]], fuzzy_min_length: int = DEFAULT_FUZZY_MIN_LENGTH,
+                 known_words: AbstractSet[str] = KNOWN_WORDS):
+        self.labels: List[Hashable] = list(phrases)
+        self.fuzzy_min_length = fuzzy_min_length
+        self.known_words = known_words
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Tuple[Tuple[int, int], ...]] = [()]
+        self.phrase_count = 0
+
+        for label_index, label in enumerate(self.labels):
+            for phrase_index, phrase in enumerate(phrases[label]):
+                tokens = phrase_tokens(phrase)
+                if not tokens:
+                    continue
+                self.phrase_count += 1
+                node = 0
+                for token in tokens:
+                    node = self._child(node, token)
+                self._outputs[node] += ((label_index, phrase_index),)
+        self._link()
+
+        self.vocabulary = {token for edges in self._goto for token in edges}
+        self._deletion_index: Dict[str, Set[str]] = {}
+        self._fuzzy_cache: Dict[str, Optional[str]] = {}
+        if fuzzy_min_length:
+            for word in self.vocabulary:
+                if len(word) >= fuzzy_min_length and not word.isdigit():
+                    self._deletion_index.setdefault(word, set()).add(word)
+                    for deletion in _deletions(word):
+                        self._deletion_index.setdefault(deletion, set()).add(word)
+
+    def _child(self, node: int, token: str) -> int:
+        child = self._goto[node].get(token)
+        if child is None:
+            child = len(self._goto)
+            self._goto[node][token] = child
+            self._goto.append({})
+            self._fail.append(0)
+            self._outputs.append(())
+        return child
+
+    def _link(self):
+        # Breadth-first: failure links point to the longest proper suffix in the trie,
+        # and each node also reports its suffixes' phrases
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                self._outputs[child] += self._outputs[self._fail[child]]
+
+    def canonical(self, token: str) -> Optional[str]:
+        """The vocabulary word a message token stands for (None if it matches no phrase word)."""
+        if token in self.vocabulary:
+            return token
+        if not self._deletion_index or len(token) < self.fuzzy_min_length - 1 or token in self.known_words:
+            return None
+        if token in self._fuzzy_cache:
+            return self._fuzzy_cache[token]
+        candidates = set(self._deletion_index.get(token, ()))
+        for deletion in _deletions(token):
+            candidates.update(self._deletion_index.get(deletion, ()))
+        matches = sorted(word for word in candidates if _within_one_edit(token, word))
+        if len(self._fuzzy_cache) >= FUZZY_CACHE_SIZE:
+            self._fuzzy_cache.clear()
+        self._fuzzy_cache[token] = matches[0] if matches else None
+        return self._fuzzy_cache[token]
+
+    def find(self, text: str) -> Dict[Hashable, List[int]]:
+        """
+        Phrases found in a text.
+
+        Returns:
+            dict: label -> indices of its matched phrases (each phrase once)
+        """
+        found: Set[Tuple[int, int]] = set()
+        node = 0
+        for token in phrase_tokens(text):
+            word = self.canonical(token)
+            if word is None:
+                node = 0
+                continue
+            while node and word not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(word, 0)
+            found.update(self._outputs[node])
+
+        matches: Dict[Hashable, List[int]] = {}
+        for label_index, phrase_index in sorted(found):
+            matches.setdefault(self.labels[label_index], []).append(phrase_index)
+        return matches
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "labels": len(self.labels),
+            "phrases": self.phrase_count,
+            "nodes": len(self._goto),
+            "vocabulary": len(self.vocabulary),
+            "fuzzy_keys": len(self._deletion_index),
+        }
+
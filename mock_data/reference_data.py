@@ -0,0 +1,189 @@
+"""
+Reference Data Snapshots
+Campaigns, rate card, offer rules, cross-sell catalog and objection taxonomy
+held in one immutable, versioned snapshot. Readers take the current snapshot
+with a single reference read (no lock) and use it for the whole operation;
+reload() builds and validates a new snapshot off to the side, then swaps the
+reference atomically. Sessions record the version they were created with.
+
+Per-customer offers are not reference data; they live in the customer
+repository (mock_data.repository), which is also updated without a restart.
+
+Environment:
+- REFERENCE_DATA_PATH=/path/to/reference_data.json  JSON object with any of the
+  dataset keys below; datasets it contains replace the built-in defaults
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+# Dataset name -> (module, attribute) holding the built-in default
+DATASETS: Dict[str, tuple] = {
+    "campaigns": ("campaign_data", "CAMPAIGNS"),
+    "rate_card": ("credit_bureau", "RATE_CARD"),
+    "offer_rules": ("offer_mart", "OFFER_RULES"),
+    "cross_sell_catalog": ("cross_sell_engine", "CROSS_SELL_PRODUCTS"),
+    "objection_types": ("objection_handler", "OBJECTION_TYPES"),
+    "counter_strategies": ("objection_handler", "COUNTER_STRATEGIES"),
+}
+
+
+def freeze(value: Any) -> Any:
+    """Read-only deep copy: dicts become MappingProxyType, lists become tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain, mutable deep copy of a frozen value (for session state and tool results)."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class ReferenceSnapshot:
+    """
+    One immutable version of the reference data.
+
+    Each dataset is an attribute holding a read-only mapping (or tuple for the
+    rate card). checksum identifies the content; version orders snapshots
+    within this process.
+    """
+
+    __slots__ = ("version", "checksum", "source", "loaded_at") + tuple(DATASETS)
+
+    def __init__(self, version: int, datasets: Dict[str, Any], source: str):
+        canonical = json.dumps(datasets, sort_keys=True, default=str).encode()
+        fields = {
+            "version": version,
+            "checksum": hashlib.sha256(canonical).hexdigest()[:12],
+            "source": source,
+            "loaded_at": time.time(),
+        }
+        fields.update({name: freeze(datasets[name]) for name in DATASETS})
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ReferenceSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ReferenceSnapshot is immutable")
+
+    def __repr__(self):
+        return f"ReferenceSnapshot(version={self.version}, checksum={self.checksum!r})"
+
+    def summary(self) -> Dict[str, Any]:
+        """Version, checksum, source and record counts (for admin endpoints)."""
+        return {
+            "version": self.version,
+            "checksum": self.checksum,
+            "source": self.source,
+            "loaded_at": self.loaded_at,
+            "datasets": {name: len(getattr(self, name)) for name in DATASETS},
+        }
+
+
+def _defaults() -> Dict[str, Any]:
+    import importlib
+
+    return {
+        name: getattr(importlib.import_module(f".{module}", __package__), attribute)
+        for name, (module, attribute) in DATASETS.items()
+    }
+
+
+def validate(datasets: Dict[str, Any]):
+    """
+    Check a candidate snapshot before it is published.
+
+    Raises:
+        ValueError: If a dataset is missing or inconsistent
+    """
+    missing = [name for name in DATASETS if name not in datasets]
+    if missing:
+        raise ValueError(f"Reference data missing datasets: {', '.join(missing)}")
+    if "DIRECT_WEBSITE" not in datasets["campaigns"]:
+        raise ValueError("campaigns must define DIRECT_WEBSITE (fallback campaign)")
+    rate_card = datasets["rate_card"]
+    if not rate_card or min(band["min_score"] for band in rate_card) > 0:
+        raise ValueError("rate_card must have a band covering every score (min_score 0)")
+    for key in ("conditional_limit_multiple", "max_emi_to_salary_percent", "tenure_options", "standard_tenure_months"):
+        if key not in datasets["offer_rules"]:
+            raise ValueError(f"offer_rules missing '{key}'")
+    for objection_type, details in datasets["objection_types"].items():
+        if not details.get("common_phrases") or not details.get("counter_strategies"):
+            raise ValueError(f"{objection_type}: needs common_phrases and counter_strategies")
+
+
+_current: Optional[ReferenceSnapshot] = None
+_reload_lock = threading.Lock()
+_versions = iter(range(1, 1 << 62))
+
+
+def _build(path: Optional[str]) -> ReferenceSnapshot:
+    datasets = _defaults()
+    source = "defaults"
+    if path:
+        with open(path, encoding="utf-8") as handle:
+            overrides = json.load(handle)
+        unknown = set(overrides) - set(DATASETS)
+        if unknown:
+            raise ValueError(f"Unknown reference datasets: {', '.join(sorted(unknown))}")
+        datasets.update(overrides)
+        source = path
+    validate(datasets)
+    # Rate card bands are read highest first
+    datasets["rate_card"] = sorted(datasets["rate_card"], key=lambda band: band["min_score"], reverse=True)
+    return ReferenceSnapshot(next(_versions), datasets, source)
+
+
+def current() -> ReferenceSnapshot:
+    """
+    The published snapshot. Lock-free after the first call: hold on to the
+    returned object for the duration of an operation so all reads agree.
+    """
+    snapshot = _current
+    if snapshot is None:
+        with _reload_lock:
+            if _current is None:
+                _publish(_build(os.getenv("REFERENCE_DATA_PATH")))
+            snapshot = _current
+    return snapshot
+
+
+def _publish(snapshot: ReferenceSnapshot):
+    global _current
+    _current = snapshot  # single reference assignment; readers see old or new, never a mix
+
+
+def reload(path: Optional[str] = None) -> ReferenceSnapshot:
+    """
+    Build a new snapshot and publish it. Readers are never blocked; a reload
+    that fails validation leaves the current snapshot in place.
+
+    Args:
+        path: JSON overrides file (defaults to REFERENCE_DATA_PATH; built-in
+              defaults only when neither is set)
+
+    Returns:
+        ReferenceSnapshot: The newly published snapshot
+
+    Raises:
+        ValueError / OSError: If the file cannot be read or fails validation
+    """
+    with _reload_lock:
+        snapshot = _build(path or os.getenv("REFERENCE_DATA_PATH"))
+        _publish(snapshot)
+    print(f"📚 Reference data v{snapshot.version} published ({snapshot.checksum}, {snapshot.source})")
+    return snapshot
@@ -0,0 +1,390 @@
+"""
+Customer Reference-Data Repository
+Customers, CRM (KYC) records, credit bureau reports, pre-approved offers and
+campaign journeys behind one repository interface. The default implementation
+is an embedded SQLite database with indexes on customer ID, phone, PAN, city
+and credit score, so point lookups and score-range queries stay O(log n) as
+the book grows.
+
+The module-level dicts in customer_data, crm_data, credit_bureau, offer_mart
+and campaign_data (CUSTOMER_CAMPAIGNS) are seed data only; load_mock_data()
+imports them, and every lookup function reads through get_repository().
+
+Environment:
+- CUSTOMER_DB_PATH=/path/to/customers.db  use a file database (seeded from the
+  mock dicts if empty); defaults to an in-memory database
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Default page size for listing endpoints
+DEFAULT_PAGE_SIZE = 100
+
+# Rows per executemany() batch when importing
+IMPORT_BATCH_SIZE = 5000
+
+
+class CustomerRepository(ABC):
+    """
+    Read access to customer reference data.
+
+    Records are returned as new dicts with the same shape as the mock data;
+    callers may modify them freely. data_version increases whenever records
+    are written, so derived views can tell when they are out of date.
+    """
+
+    data_version: int = 0
+
+    # ------------------------------------------------------------- customers
+
+    @abstractmethod
+    def get_customer(self, customer_id: str) -> Optional[dict]:
+        """Customer profile by customer ID."""
+
+    @abstractmethod
+    def get_customer_by_phone(self, phone: str) -> Optional[dict]:
+        """Customer profile by registered phone number."""
+
+    @abstractmethod
+    def get_customer_by_pan(self, pan_number: str) -> Optional[dict]:
+        """Customer profile by PAN."""
+
+    @abstractmethod
+    def list_customers(self, limit: Optional[int] = None, offset: int = 0,
+                       city: Optional[str] = None) -> List[dict]:
+        """Customer profiles ordered by customer ID, optionally filtered by city."""
+
+    @abstractmethod
+    def count_customers(self, city: Optional[str] = None) -> int:
+        """Number of customers, optionally in one city."""
+
+    @abstractmethod
+    def find_customers_by_credit_score(self, min_score: int, max_score: int,
+                                       limit: Optional[int] = None, offset: int = 0) -> List[dict]:
+        """Customers whose credit score is within [min_score, max_score]."""
+
+    # ------------------------------------------------------------------- CRM
+
+    @abstractmethod
+    def get_kyc_record(self, customer_id: str) -> Optional[dict]:
+        """CRM KYC record by customer ID."""
+
+    @abstractmethod
+    def list_kyc_records(self, limit: Optional[int] = None, offset: int = 0) -> List[dict]:
+        """CRM KYC records ordered by customer ID."""
+
+    # -------------------------------------------------------- credit bureau
+
+    @abstractmethod
+    def get_credit_report(self, customer_id: str) -> Optional[dict]:
+        """Raw credit bureau record by customer ID."""
+
+    @abstractmethod
+    def get_credit_report_by_pan(self, pan_number: str) -> Optional[dict]:
+        """Raw credit bureau record by PAN."""
+
+    @abstractmethod
+    def list_credit_reports(self, limit: Optional[int] = None, offset: int = 0,
+                            min_score: Optional[int] = None, max_score: Optional[int] = None) -> List[dict]:
+        """Credit bureau records ordered by customer ID, optionally within a score range."""
+
+    # ------------------------------------------------------------ offer mart
+
+    @abstractmethod
+    def get_offer(self, customer_id: str) -> Optional[dict]:
+        """Pre-approved offer by customer ID."""
+
+    @abstractmethod
+    def list_offers(self, limit: Optional[int] = None, offset: int = 0) -> List[dict]:
+        """Pre-approved offers ordered by customer ID."""
+
+    # ------------------------------------------------------------- campaigns
+
+    @abstractmethod
+    def get_campaign_journey(self, customer_id: str) -> Optional[dict]:
+        """Campaign source and site journey by customer ID."""
+
+    @abstractmethod
+    def count_by_campaign_source(self) -> Dict[str, int]:
+        """Number of customer journeys per campaign source."""
+
+
+# Table name -> (indexed columns, function extracting them from a record).
+# The full record is stored as JSON in the `data` column.
+_TABLES: Dict[str, Tuple[Tuple[str, ...], Callable[[dict], tuple]]] = {
+    "customers": (
+        ("phone", "pan_number", "city", "credit_score"),
+        lambda r: (r.get("phone"), r.get("pan_number"), r.get("city"), r.get("credit_score")),
+    ),
+    "kyc_records": (
+        ("phone", "pan_number"),
+        lambda r: (r.get("phone"), r.get("pan_number")),
+    ),
+    "credit_reports": (
+        ("pan_number", "credit_score"),
+        lambda r: (r.get("pan_number"), r.get("credit_score")),
+    ),
+    "loan_offers": (
+        ("pre_approved_amount",),
+        lambda r: (r.get("pre_approved_amount"),),
+    ),
+    "campaign_journeys": (
+        ("campaign_source",),
+        lambda r: (r.get("campaign_source"),),
+    ),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS customers (
+    customer_id TEXT PRIMARY KEY,
+    phone TEXT,
+    pan_number TEXT,
+    city TEXT,
+    credit_score INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_customers_phone ON customers (phone);
+CREATE INDEX IF NOT EXISTS idx_customers_pan ON customers (pan_number);
+CREATE INDEX IF NOT EXISTS idx_customers_city ON customers (city, customer_id);
+CREATE INDEX IF NOT EXISTS idx_customers_credit_score ON customers (credit_score);
+
+CREATE TABLE IF NOT EXISTS kyc_records (
+    customer_id TEXT PRIMARY KEY,
+    phone TEXT,
+    pan_number TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_kyc_phone ON kyc_records (phone);
+CREATE INDEX IF NOT EXISTS idx_kyc_pan ON kyc_records (pan_number);
+
+CREATE TABLE IF NOT EXISTS credit_reports (
+    customer_id TEXT PRIMARY KEY,
+    pan_number TEXT,
+    credit_score INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_credit_pan ON credit_reports (pan_number);
+CREATE INDEX IF NOT EXISTS idx_credit_score ON credit_reports (credit_score);
+
+CREATE TABLE IF NOT EXISTS loan_offers (
+    customer_id TEXT PRIMARY KEY,
+    pre_approved_amount INTEGER,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS campaign_journeys (
+    customer_id TEXT PRIMARY KEY,
+    campaign_source TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_campaign_source ON campaign_journeys (campaign_source);
+"""
+
+
+class SQLiteRepository(CustomerRepository):
+    """
+    CustomerRepository backed by an embedded SQLite database.
+
+    One connection is shared by all threads and serialized with a lock; each
+    lookup is a single indexed query. File databases use WAL journaling.
+
+    Args:
+        path: Database file, or ":memory:" for a private in-memory database
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    # -------------------------------------------------------------- queries
+
+    def _one(self, sql: str, params: tuple) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _many(self, sql: str, params: tuple) -> List[dict]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    @staticmethod
+    def _page(limit: Optional[int], offset: int) -> tuple:
+        # LIMIT -1 means "no limit" in SQLite
+        return (-1 if limit is None else limit, offset)
+
+    def get_customer(self, customer_id: str) -> Optional[dict]:
+        return self._one("SELECT data FROM customers WHERE customer_id = ?", (customer_id,))
+
+    def get_customer_by_phone(self, phone: str) -> Optional[dict]:
+        return self._one("SELECT data FROM customers WHERE phone = ? LIMIT 1", (phone,))
+
+    def get_customer_by_pan(self, pan_number: str) -> Optional[dict]:
+        return self._one("SELECT data FROM customers WHERE pan_number = ? LIMIT 1", (pan_number,))
+
+    def list_customers(self, limit: Optional[int] = None, offset: int = 0,
+                       city: Optional[str] = None) -> List[dict]:
+        if city is None:
+            return self._many("SELECT data FROM customers ORDER BY customer_id LIMIT ? OFFSET ?",
+                              self._page(limit, offset))
+        return self._many("SELECT data FROM customers WHERE city = ? ORDER BY customer_id LIMIT ? OFFSET ?",
+                          (city,) + self._page(limit, offset))
+
+    def count_customers(self, city: Optional[str] = None) -> int:
+        with self._lock:
+            if city is None:
+                return self._conn.execute("SELECT COUNT(*) FROM customers").fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM customers WHERE city = ?", (city,)).fetchone()[0]
+
+    def find_customers_by_credit_score(self, min_score: int, max_score: int,
+                                       limit: Optional[int] = None, offset: int = 0) -> List[dict]:
+        return self._many(
+            "SELECT data FROM customers WHERE credit_score BETWEEN ? AND ? "
+            "ORDER BY credit_score, customer_id LIMIT ? OFFSET ?",
+            (min_score, max_score) + self._page(limit, offset),
+        )
+
+    def get_kyc_record(self, customer_id: str) -> Optional[dict]:
+        return self._one("SELECT data FROM kyc_records WHERE customer_id = ?", (customer_id,))
+
+    def list_kyc_records(self, limit: Optional[int] = None, offset: int = 0) -> List[dict]:
+        return self._many("SELECT data FROM kyc_records ORDER BY customer_id LIMIT ? OFFSET ?",
+                          self._page(limit, offset))
+
+    def get_credit_report(self, customer_id: str) -> Optional[dict]:
+        return self._one("SELECT data FROM credit_reports WHERE customer_id = ?", (customer_id,))
+
+    def get_credit_report_by_pan(self, pan_number: str) -> Optional[dict]:
+        return self._one("SELECT data FROM credit_reports WHERE pan_number = ? LIMIT 1", (pan_number,))
+
+    def list_credit_reports(self, limit: Optional[int] = None, offset: int = 0,
+                            min_score: Optional[int] = None, max_score: Optional[int] = None) -> List[dict]:
+        if min_score is None and max_score is None:
+            return self._many("SELECT data FROM credit_reports ORDER BY customer_id LIMIT ? OFFSET ?",
+                              self._page(limit, offset))
+        return self._many(
+            "SELECT data FROM credit_reports WHERE credit_score BETWEEN ? AND ? "
+            "ORDER BY credit_score, customer_id LIMIT ? OFFSET ?",
+            (min_score if min_score is not None else 0, max_score if max_score is not None else 900)
+            + self._page(limit, offset),
+        )
+
+    def get_offer(self, customer_id: str) -> Optional[dict]:
+        return self._one("SELECT data FROM loan_offers WHERE customer_id = ?", (customer_id,))
+
+    def list_offers(self, limit: Optional[int] = None, offset: int = 0) -> List[dict]:
+        return self._many("SELECT data FROM loan_offers ORDER BY customer_id LIMIT ? OFFSET ?",
+                          self._page(limit, offset))
+
+    def get_campaign_journey(self, customer_id: str) -> Optional[dict]:
+        return self._one("SELECT data FROM campaign_journeys WHERE customer_id = ?", (customer_id,))
+
+    def count_by_campaign_source(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT campaign_source, COUNT(*) FROM campaign_journeys GROUP BY campaign_source"
+            ).fetchall()
+        return dict(rows)
+
+    # -------------------------------------------------------------- writes
+
+    def upsert(self, table: str, records: Iterable[dict]) -> int:
+        """
+        Insert or replace records in one of the tables, in batches.
+
+        Args:
+            table: "customers", "kyc_records", "credit_reports", "loan_offers" or "campaign_journeys"
+            records: Records with a "customer_id" field; may be a generator
+
+        Returns:
+            int: Number of records written
+        """
+        columns, extract = _TABLES[table]
+        sql = (
+            f"INSERT OR REPLACE INTO {table} (customer_id, {', '.join(columns)}, data) "
+            f"VALUES ({', '.join('?' * (len(columns) + 2))})"
+        )
+        written = 0
+        batch = []
+        for record in records:
+            batch.append((record["customer_id"],) + extract(record) + (json.dumps(record, default=str),))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                written += self._write(sql, batch)
+                batch = []
+        if batch:
+            written += self._write(sql, batch)
+        return written
+
+    def _write(self, sql: str, rows: list) -> int:
+        with self._lock, self._conn:
+            self._conn.executemany(sql, rows)
+            self.data_version += 1
+        return len(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def load_mock_data(repository: SQLiteRepository) -> Dict[str, int]:
+    """
+    Import the mock dicts (customers, CRM, credit bureau, offer mart, campaign journeys) into a repository.
+
+    Returns:
+        dict: Table name -> records written
+    """
+    from .campaign_data import CUSTOMER_CAMPAIGNS
+    from .credit_bureau import CREDIT_SCORES
+    from .crm_data import CRM_DATA
+    from .customer_data import CUSTOMERS
+    from .offer_mart import LOAN_OFFERS
+
+    return {
+        "customers": repository.upsert("customers", CUSTOMERS.values()),
+        "kyc_records": repository.upsert("kyc_records", CRM_DATA.values()),
+        "credit_reports": repository.upsert("credit_reports", CREDIT_SCORES.values()),
+        "loan_offers": repository.upsert("loan_offers", LOAN_OFFERS.values()),
+        "campaign_journeys": repository.upsert(
+            "campaign_journeys",
+            ({"customer_id": customer_id, **journey} for customer_id, journey in CUSTOMER_CAMPAIGNS.items()),
+        ),
+    }
+
+
+_repository: Optional[CustomerRepository] = None
+_repository_lock = threading.Lock()
+
+
+def get_repository() -> CustomerRepository:
+    """
+    The process-wide repository, created on first use.
+
+    Opens CUSTOMER_DB_PATH (default: in-memory) and seeds it from the mock
+    dicts if it holds no customers.
+    """
+    global _repository
+    if _repository is None:
+        with _repository_lock:
+            if _repository is None:
+                repository = SQLiteRepository(os.getenv("CUSTOMER_DB_PATH", ":memory:"))
+                if repository.count_customers() == 0:
+                    load_mock_data(repository)
+                _repository = repository
+    return _repository
+
+
+def set_repository(repository: CustomerRepository):
+    """Replace the process-wide repository (e.g. with a generated book)."""
+    global _repository
+    with _repository_lock:
+        _repository = repository
@@ -1,52 +1,137 @@
 """
 Emotional Intelligence & Sentiment Analysis Module (AI-Powered)
 Uses Mistral AI to detect customer sentiment and provide adaptive response strategies
+
+detect_sentiment() is tiered: a local classifier (mock_data.local_sentiment)
+answers confident, short messages in microseconds; the rest escalate to one
+JSON-mode Mistral call. The adaptive strategy comes from the precomputed
+strategy table (mock_data.strategy_table); high-value sessions
+(live_strategy=True) always use the LLM and get the sentiment and a live
+strategy together from one call validated against CLASSIFICATION_SCHEMA.
+
+Escalated async classifications are micro-batched: messages from concurrent
+sessions arriving within a few milliseconds share one multi-item prompt
+(services.micro_batcher), with single calls for items the batch reply does
+not cover.
+
+Both LLM calls go through a circuit breaker: while Mistral is failing or slow
+they are skipped and the local prediction (or neutral/default fallback) is
+served immediately.
+
+Environment:
+- SENTIMENT_TIMEOUT_SECONDS=10        per-call timeout for sentiment and strategy calls
+- LOCAL_SENTIMENT_THRESHOLD=0.6       local confidence needed to skip the LLM
+- LOCAL_SENTIMENT_MIN_MARGIN=0.2      ...and lead over the runner-up class (else ambiguous)
+- LOCAL_SENTIMENT_MAX_WORDS=20        longer messages always escalate
+- LOCAL_SENTIMENT_SHADOW_RATE=0       share of local answers re-checked by the LLM for agreement stats
+- SENTIMENT_BATCH_MAX_ITEMS=8         messages per batched classification (1 disables batching)
+- SENTIMENT_BATCH_WAIT_MS=5           how long an escalated message waits for others to batch with
 """
 
-import litellm
-from typing import Dict, List
+import asyncio
+import json
+import os
+import random
+import re
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from services.llm_gateway import llm_gateway
+from services.micro_batcher import MicroBatcher
+from .local_sentiment import get_local_model
+from .persuasion_strategy import CUSTOMER_PROFILES
+from .sentiment_trend import track_sentiment_evolution
+from .strategy_table import SENTIMENT_TYPES, strategy_table
+
+SENTIMENT_MODEL = "mistral/mistral-large-2411"
+SENTIMENT_TIMEOUT_SECONDS = float(os.getenv("SENTIMENT_TIMEOUT_SECONDS", "10"))
+LOCAL_SENTIMENT_THRESHOLD = float(os.getenv("LOCAL_SENTIMENT_THRESHOLD", "0.6"))
+LOCAL_SENTIMENT_MIN_MARGIN = float(os.getenv("LOCAL_SENTIMENT_MIN_MARGIN", "0.2"))
+LOCAL_SENTIMENT_MAX_WORDS = int(os.getenv("LOCAL_SENTIMENT_MAX_WORDS", "20"))
+LOCAL_SENTIMENT_SHADOW_RATE = float(os.getenv("LOCAL_SENTIMENT_SHADOW_RATE", "0"))
+SENTIMENT_BATCH_MAX_ITEMS = int(os.getenv("SENTIMENT_BATCH_MAX_ITEMS", "8"))
+SENTIMENT_BATCH_WAIT_SECONDS = float(os.getenv("SENTIMENT_BATCH_WAIT_MS", "5")) / 1000
+
+PACES = ("FAST", "MODERATE", "SLOW")
 
-# Use Mistral AI directly via litellm
-def _call_mistral(prompt: str) -> str:
-    """Call Mistral AI via litellm"""
+EMOJI_MAP = {
+    "EXCITEMENT": "😊",
+    "CONFUSION": "😕",
+    "HESITATION": "🤔",
+    "FRUSTRATION": "😤",
+    "TRUST": "👍",
+    "URGENCY": "⚡",
+    "PRICE_CONCERN": "💰",
+    "NEUTRAL": "😐"
+}
+
+# Classifier reply fields: field -> (type, allowed values or (min, max) range)
+SENTIMENT_SCHEMA = {
+    "sentiment": (str, SENTIMENT_TYPES),
+    "confidence": (float, (0.0, 1.0)),
+    "score": (float, (-1.0, 1.0)),
+    "reasoning": (str, None),
+}
+STRATEGY_SCHEMA = {
+    "tone": (str, None),
+    "pace": (str, PACES),
+    "focus": (str, None),
+    "approach": (str, None),
+}
+# Combined sentiment + live strategy reply
+CLASSIFICATION_SCHEMA = {**SENTIMENT_SCHEMA, **STRATEGY_SCHEMA}
+
+# Shared by the sentiment and strategy calls (same model and provider)
+sentiment_breaker = CircuitBreaker("sentiment_llm")
+
+# Which tier answered each turn, why turns escalated, and local/LLM agreement
+tier_stats = {
+    "turns": 0,
+    "local": 0,
+    "llm": 0,
+    "live": 0,
+    "local_fallback": 0,
+    "neutral_fallback": 0,
+    "escalated": {"low_confidence": 0, "ambiguous": 0, "long": 0, "negated": 0},
+    "agreement": {"escalated": {"compared": 0, "agreed": 0}, "shadow": {"compared": 0, "agreed": 0}},
+}
+_shadow_tasks = set()
+
+
+# Mistral AI via the shared LLM gateway (pooled connections, global concurrency limit)
+def _call_mistral(prompt: str, **kwargs) -> str:
+    """Call Mistral AI (blocking; for sync callers)"""
     try:
-        response = litellm.completion(
-            model="mistral/mistral-large-2411",
-            messages=[{"role": "user", "content": prompt}]
+        response = sentiment_breaker.call(
+            llm_gateway.completion, SENTIMENT_MODEL, [{"role": "user", "content": prompt}],
+            timeout=SENTIMENT_TIMEOUT_SECONDS, **kwargs,
         )
         return response.choices[0].message.content
+    except CircuitOpenError:
+        raise
     except Exception as e:
         raise Exception(f"Mistral API call failed: {e}")
 
 
-def detect_sentiment(text: str, conversation_context: str = "") -> Dict:
-    """
-    AI-powered sentiment detection using Mistral AI.
-    Analyzes customer emotion from their message with context awareness.
-    
-    Args:
-        text: Customer's message text
-        conversation_context: Recent conversation history for context
-    
-    Returns:
-        dict: Sentiment analysis result with AI insights
-    """
+async def _acall_mistral(prompt: str, **kwargs) -> str:
+    """Call Mistral AI without blocking the event loop"""
     try:
-        # Build context line
-        context_line = ""
-        if conversation_context:
-            context_line = f"RECENT CONVERSATION CONTEXT:\n{conversation_context}\n\n"
-        
-        # Smart sentiment detection prompt
-        prompt = f"""Analyze the customer's emotional state from their message in a loan application conversation.
+        response = await sentiment_breaker.acall(
+            llm_gateway.acompletion, SENTIMENT_MODEL, [{"role": "user", "content": prompt}],
+            timeout=SENTIMENT_TIMEOUT_SECONDS, **kwargs,
+        )
+        return response.choices[0].message.content
+    except CircuitOpenError:
+        raise
+    except Exception as e:
+        raise Exception(f"Mistral API call failed: {e}")
 
-CUSTOMER MESSAGE: "{text}"
 
-{context_line}Detect the PRIMARY emotion and provide a confidence score (0.0-1.0):
+# JSON mode: the reply is a single JSON object
+JSON_MODE = {"response_format": {"type": "json_object"}}
 
-EMOTION TYPES:
+EMOTION_TYPES = """EMOTION TYPES (detect the PRIMARY one):
 1. EXCITEMENT - Positive, enthusiastic, ready to proceed, eager
 2. CONFUSION - Unclear, needs explanation, doesn't understand concepts
 3. HESITATION - Unsure, considering options, needs reassurance
@@ -54,105 +139,500 @@ EMOTION TYPES:
 5. TRUST - Comfortable, confident, accepting information
 6. URGENCY - Time-sensitive, needs quick resolution, deadline pressure
 7. PRICE_CONCERN - Worried about cost, budget constraints, rates too high
-8. NEUTRAL - Calm, factual, no strong emotion detected
+8. NEUTRAL - Calm, factual, no strong emotion detected"""
+
+
+def _classification_prompt(text: str, conversation_context: str = "", with_strategy: bool = True) -> str:
+    """Sentiment (+ adaptive strategy) prompt for a customer message (JSON reply)"""
+    # Build context line
+    context_line = ""
+    if conversation_context:
+        context_line = f"RECENT CONVERSATION CONTEXT:\n{conversation_context}\n\n"
+    
+    if not with_strategy:
+        return f"""Analyze the customer's emotional state from their message in a loan application conversation.
 
-Respond in this EXACT format (no extra text):
-SENTIMENT: [one of the 8 emotions above]
-CONFIDENCE: [0.0-1.0]
-SCORE: [+0.8 for positive, -0.6 for negative, 0.0 for neutral]
-REASONING: [one brief sentence explaining why]
+CUSTOMER MESSAGE: "{text}"
+
+{context_line}{EMOTION_TYPES}
+
+Respond with ONLY a JSON object with exactly these keys:
+{{
+  "sentiment": one of EXCITEMENT, CONFUSION, HESITATION, FRUSTRATION, TRUST, URGENCY, PRICE_CONCERN, NEUTRAL,
+  "confidence": number 0.0-1.0,
+  "score": number -1.0 to 1.0 (+0.8 for positive, -0.6 for negative, 0.0 for neutral),
+  "reasoning": one brief sentence explaining why
+}}
 
 Example:
-SENTIMENT: CONFUSION
-CONFIDENCE: 0.75
-SCORE: -0.3
-REASONING: Customer is asking clarifying questions and using phrases like "I don't understand"
+{{"sentiment": "CONFUSION", "confidence": 0.75, "score": -0.3, "reasoning": "Customer is asking clarifying questions and using phrases like 'I don't understand'"}}
 
 Now analyze the customer message above:"""
+    
+    # Smart sentiment detection + strategy prompt
+    return f"""Analyze the customer's emotional state from their message in a loan application conversation, then coach the loan agent on how to respond.
 
-        # Get Mistral AI response
-        result_text = _call_mistral(prompt).strip()
-        
-        # Parse AI response
-        sentiment_type = "NEUTRAL"
-        confidence = 0.5
-        score = 0.0
-        reasoning = "No strong emotion detected"
-        
-        for line in result_text.split('\n'):
-            line = line.strip()
-            if line.startswith('SENTIMENT:'):
-                sentiment_type = line.split(':', 1)[1].strip().upper()
-            elif line.startswith('CONFIDENCE:'):
-                try:
-                    confidence = float(line.split(':', 1)[1].strip())
-                except:
-                    confidence = 0.7
-            elif line.startswith('SCORE:'):
-                try:
-                    score = float(line.split(':', 1)[1].strip())
-                except:
-                    score = 0.0
-            elif line.startswith('REASONING:'):
-                reasoning = line.split(':', 1)[1].strip()
-        
-        # Map to emoji
-        emoji_map = {
-            "EXCITEMENT": "😊",
-            "CONFUSION": "😕",
-            "HESITATION": "🤔",
-            "FRUSTRATION": "😤",
-            "TRUST": "👍",
-            "URGENCY": "⚡",
-            "PRICE_CONCERN": "💰",
-            "NEUTRAL": "😐"
+CUSTOMER MESSAGE: "{text}"
+
+{context_line}EMOTION TYPES (detect the PRIMARY one) and response guidelines:
+1. EXCITEMENT - Positive, enthusiastic, ready to proceed, eager -> Match energy, fast-track, celebrate momentum, minimize friction
+2. CONFUSION - Unclear, needs explanation, doesn't understand concepts -> Simplify language, use analogies, slow down, confirm understanding
+3. HESITATION - Unsure, considering options, needs reassurance -> Reassure, provide social proof, address concerns, build confidence
+4. FRUSTRATION - Annoyed, impatient, experiencing difficulty -> Deep empathy, apologize if needed, offer escalation, simplify drastically
+5. TRUST - Comfortable, confident, accepting information -> Professional confidence, reinforce credibility, transparent terms
+6. URGENCY - Time-sensitive, needs quick resolution, deadline pressure -> Acknowledge timeline, provide clear ETA, fast-track process
+7. PRICE_CONCERN - Worried about cost, budget constraints, rates too high -> Show value comparison, break down costs, highlight savings
+8. NEUTRAL - Calm, factual, no strong emotion detected -> Balanced professional, informative, build rapport
+
+Respond with ONLY a JSON object with exactly these keys:
+{{
+  "sentiment": one of EXCITEMENT, CONFUSION, HESITATION, FRUSTRATION, TRUST, URGENCY, PRICE_CONCERN, NEUTRAL,
+  "confidence": number 0.0-1.0,
+  "score": number -1.0 to 1.0 (+0.8 for positive, -0.6 for negative, 0.0 for neutral),
+  "reasoning": one brief sentence explaining why,
+  "tone": the emotional tone to use (max 4 words),
+  "pace": one of FAST, MODERATE, SLOW,
+  "focus": 3 priorities separated by commas,
+  "approach": ONE short example sentence (15-25 words) showing how to respond
+}}
+
+Example:
+{{"sentiment": "CONFUSION", "confidence": 0.75, "score": -0.3, "reasoning": "Customer is asking clarifying questions and using phrases like 'I don't understand'", "tone": "Patient & Educational", "pace": "SLOW", "focus": "Simplify terms, Use analogies, Confirm understanding", "approach": "Let me explain EMI simply - it's like paying for Netflix monthly, but for your loan."}}
+
+Now analyze the customer message above:"""
+
+
+def validate_classification(data: Any, schema: Dict = CLASSIFICATION_SCHEMA) -> Dict:
+    """
+    Strict check of a parsed classification against a schema
+    (CLASSIFICATION_SCHEMA or SENTIMENT_SCHEMA).
+    
+    Returns:
+        dict: The classification (only schema keys)
+    
+    Raises:
+        ValueError: If a key is missing, has the wrong type or is out of range
+    """
+    if not isinstance(data, dict):
+        raise ValueError("classification must be a JSON object")
+    validated = {}
+    for key, (kind, allowed) in schema.items():
+        if key not in data:
+            raise ValueError(f"classification missing '{key}'")
+        value = data[key]
+        if kind is float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"'{key}' must be a number")
+            value = float(value)
+            if not allowed[0] <= value <= allowed[1]:
+                raise ValueError(f"'{key}' must be between {allowed[0]} and {allowed[1]}")
+        else:
+            if not isinstance(value, str) or not value.strip():
+                raise ValueError(f"'{key}' must be a non-empty string")
+            if allowed and value not in allowed:
+                raise ValueError(f"'{key}' must be one of {', '.join(allowed)}")
+        validated[key] = value
+    return validated
+
+
+def _coerce_number(value: Any) -> Any:
+    if isinstance(value, str):
+        match = re.search(r"[-+]?\d*\.?\d+", value)
+        if not match:
+            return value
+        number = float(match.group())
+        return number / 100 if value.strip().endswith("%") else number
+    return value
+
+
+def parse_classification(result_text: str, schema: Dict = CLASSIFICATION_SCHEMA) -> Dict:
+    """
+    Tolerant parse of a classification reply, then strict validation.
+    
+    Accepts the JSON object wrapped in prose or code fences, any key case,
+    numbers as strings or percentages, a list for focus, and "KEY: value"
+    lines if the model ignored JSON mode.
+    
+    Raises:
+        ValueError: If no valid classification can be recovered
+    """
+    data: Any = None
+    start, end = result_text.find("{"), result_text.rfind("}")
+    if start != -1 and end > start:
+        try:
+            data = json.loads(result_text[start:end + 1])
+        except ValueError:
+            data = None
+    if data is None:
+        data = {}
+        for line in result_text.splitlines():
+            key, sep, value = line.strip().partition(":")
+            if sep:
+                data[key.strip().lower()] = value.strip()
+        data["sentiment"] = data.get("sentiment", data.get("primary_sentiment"))
+    if not isinstance(data, dict):
+        raise ValueError("classification must be a JSON object")
+
+    data = {str(key).strip().lower(): value for key, value in data.items()}
+    for key in ("sentiment", "pace"):
+        if isinstance(data.get(key), str):
+            data[key] = re.sub(r"[\s-]+", "_", data[key].strip().strip("[]").upper())
+    for key in ("confidence", "score"):
+        data[key] = _coerce_number(data.get(key))
+    if isinstance(data.get("confidence"), (int, float)) and 1 < data["confidence"] <= 100:
+        data["confidence"] /= 100
+    if isinstance(data.get("score"), (int, float)) and not isinstance(data["score"], bool):
+        data["score"] = max(-1.0, min(1.0, data["score"]))
+    if isinstance(data.get("focus"), list):
+        data["focus"] = ", ".join(str(item) for item in data["focus"])
+    return validate_classification(data, schema)
+
+
+def _batch_classification_prompt(items: List[Tuple[str, str]]) -> str:
+    """Sentiment prompt for several (message, conversation context) pairs from different customers (JSON reply)"""
+    blocks = []
+    for number, (text, conversation_context) in enumerate(items, 1):
+        block = f'[{number}] CUSTOMER MESSAGE: "{text}"'
+        if conversation_context:
+            block += "\n    RECENT CONVERSATION CONTEXT:\n    " + conversation_context.replace("\n", "\n    ")
+        blocks.append(block)
+    messages = "\n\n".join(blocks)
+    return f"""Analyze the emotional state of each customer below. Each numbered message comes from a DIFFERENT customer in a loan application conversation; judge each one on its own.
+
+{messages}
+
+{EMOTION_TYPES}
+
+Respond with ONLY a JSON object with one result per message, in the same order:
+{{
+  "results": [
+    {{
+      "id": the message number,
+      "sentiment": one of EXCITEMENT, CONFUSION, HESITATION, FRUSTRATION, TRUST, URGENCY, PRICE_CONCERN, NEUTRAL,
+      "confidence": number 0.0-1.0,
+      "score": number -1.0 to 1.0 (+0.8 for positive, -0.6 for negative, 0.0 for neutral),
+      "reasoning": one brief sentence explaining why
+    }}
+  ]
+}}
+
+Example for two messages:
+{{"results": [{{"id": 1, "sentiment": "CONFUSION", "confidence": 0.75, "score": -0.3, "reasoning": "Customer asks what EMI means"}}, {{"id": 2, "sentiment": "URGENCY", "confidence": 0.8, "score": -0.1, "reasoning": "Customer needs the money by tomorrow"}}]}}
+
+Now analyze the {len(items)} customer messages above:"""
+
+
+def parse_batch_classification(result_text: str, count: int) -> List[Optional[Dict]]:
+    """
+    Split a batched classification reply into per-message classifications.
+    
+    Results are matched by id (by position when ids are missing); each one
+    is parsed like a single reply against SENTIMENT_SCHEMA.
+    
+    Returns:
+        list: One classification per message, None where the reply has no
+              valid result for it
+    
+    Raises:
+        ValueError: If the reply holds no list of results at all
+    """
+    start, end = result_text.find("{"), result_text.rfind("}")
+    list_start, list_end = result_text.find("["), result_text.rfind("]")
+    data: Any = None
+    if start != -1 and end > start and not (list_start != -1 and list_start < start):
+        data = json.loads(result_text[start:end + 1])
+        if isinstance(data, dict):
+            data = next((value for key, value in data.items() if str(key).lower() == "results"), None)
+    elif list_start != -1 and list_end > list_start:
+        data = json.loads(result_text[list_start:list_end + 1])
+    if not isinstance(data, list):
+        raise ValueError("batched classification has no results list")
+
+    parsed: List[Optional[Dict]] = [None] * count
+    for position, entry in enumerate(data):
+        if not isinstance(entry, dict):
+            continue
+        entry = {str(key).strip().lower(): value for key, value in entry.items()}
+        number = _coerce_number(entry.pop("id", position + 1))
+        if isinstance(number, bool) or not isinstance(number, (int, float)) or number != int(number):
+            continue
+        index = int(number) - 1
+        if not 0 <= index < count or parsed[index] is not None:
+            continue
+        try:
+            parsed[index] = parse_classification(json.dumps(entry), SENTIMENT_SCHEMA)
+        except ValueError:
+            continue
+    return parsed
+
+
+def _classification_result(classification: Dict, strategy: Dict = None) -> Dict:
+    """detect_sentiment() result from a validated classification (live strategy unless one is given)"""
+    sentiment_type = classification["sentiment"]
+    if strategy is None:
+        strategy = {
+            "tone": classification["tone"],
+            "pace": classification["pace"],
+            "focus": classification["focus"],
+            "approach": classification["approach"],
+            "ai_generated": True
         }
-        
-        return {
-            "status": "detected",
-            "primary_sentiment": sentiment_type,
-            "sentiment_score": score,
-            "confidence": confidence,
-            "emoji": emoji_map.get(sentiment_type, "😐"),
-            "reasoning": reasoning,
-            "adaptive_strategy": get_adaptive_strategy(sentiment_type, text),
-            "ai_powered": True
+    return {
+        "status": "detected",
+        "primary_sentiment": sentiment_type,
+        "sentiment_score": classification["score"],
+        "confidence": classification["confidence"],
+        "emoji": EMOJI_MAP.get(sentiment_type, "😐"),
+        "reasoning": classification["reasoning"],
+        "ai_powered": True,
+        "tier": "llm",
+        "adaptive_strategy": strategy
+    }
+
+
+def _neutral_sentiment(error: Exception) -> Dict:
+    """Neutral fallback (with default strategy) when the classification call fails or is skipped"""
+    if not isinstance(error, CircuitOpenError):
+        print(f"⚠️ Mistral AI sentiment detection failed: {error}")
+    return {
+        "status": "neutral",
+        "primary_sentiment": "NEUTRAL",
+        "sentiment_score": 0.0,
+        "confidence": 0.5,
+        "emoji": "😐",
+        "reasoning": "AI unavailable - using neutral fallback",
+        "error": str(error),
+        "adaptive_strategy": _fallback_strategy(error)
+    }
+
+
+def _escalation_reason(prediction: Dict) -> Optional[str]:
+    """Why the local prediction is not good enough (None when it can be served)"""
+    if prediction["words"] > LOCAL_SENTIMENT_MAX_WORDS:
+        return "long"
+    if prediction["confidence"] < LOCAL_SENTIMENT_THRESHOLD:
+        return "low_confidence"
+    if prediction["margin"] < LOCAL_SENTIMENT_MIN_MARGIN:
+        return "ambiguous"
+    # Negated cues ("not happy", "dont trust") are left to the LLM, whatever the local class
+    if prediction["negated_cues"]:
+        return "negated"
+    return None
+
+
+def _local_result(prediction: Dict, customer_profile: str = None, language: str = None) -> Dict:
+    """detect_sentiment() result from a local classifier prediction (strategy from the table)"""
+    sentiment_type = prediction["sentiment"]
+    cues = ", ".join(dict.fromkeys(cue.replace("_", " ") for cue in prediction["cues"]))
+    return {
+        "status": "detected",
+        "primary_sentiment": sentiment_type,
+        "sentiment_score": prediction["score"],
+        "confidence": round(prediction["confidence"], 2),
+        "emoji": EMOJI_MAP.get(sentiment_type, "😐"),
+        "reasoning": f"Local classifier (cues: {cues})" if cues else "Local classifier",
+        "ai_powered": False,
+        "tier": "local",
+        "adaptive_strategy": strategy_table.lookup(sentiment_type, customer_profile, language)
+    }
+
+
+def _local_tier(text: str, live_strategy: bool) -> Tuple[Optional[Dict], Optional[str]]:
+    """Tier 1: (local prediction or None, escalation reason or None when the prediction is served)"""
+    tier_stats["turns"] += 1
+    if live_strategy:
+        tier_stats["live"] += 1
+        return None, "live"
+    prediction = get_local_model().predict(text)
+    reason = _escalation_reason(prediction)
+    if reason is None:
+        tier_stats["local"] += 1
+    else:
+        tier_stats["escalated"][reason] += 1
+    return prediction, reason
+
+
+def _record_agreement(prediction: Optional[Dict], sentiment_type: str, kind: str = "escalated"):
+    if prediction is not None:
+        tier_stats["agreement"][kind]["compared"] += 1
+        tier_stats["agreement"][kind]["agreed"] += prediction["sentiment"] == sentiment_type
+
+
+def _llm_unavailable(error: Exception, prediction: Optional[Dict], customer_profile: str = None,
+                     language: str = None) -> Dict:
+    """LLM tier failed or was skipped: serve the local prediction if there is one, else neutral"""
+    if prediction is None:
+        tier_stats["neutral_fallback"] += 1
+        return _neutral_sentiment(error)
+    if not isinstance(error, CircuitOpenError):
+        print(f"⚠️ Mistral AI sentiment detection failed, using local classifier: {error}")
+    tier_stats["local_fallback"] += 1
+    return {**_local_result(prediction, customer_profile, language), "tier": "local_fallback"}
+
+
+def sentiment_tier_stats() -> Dict:
+    """Tier hit rates and local/LLM agreement (for admin endpoints)"""
+    turns = tier_stats["turns"]
+    snapshot = {
+        "turns": turns,
+        "local_hit_rate": round(tier_stats["local"] / turns, 4) if turns else None,
+        "llm_rate": round(tier_stats["llm"] / turns, 4) if turns else None,
+        **{key: value for key, value in tier_stats.items() if key not in ("turns", "agreement")},
+        "agreement": {},
+        "threshold": LOCAL_SENTIMENT_THRESHOLD,
+        "max_words": LOCAL_SENTIMENT_MAX_WORDS,
+        "shadow_rate": LOCAL_SENTIMENT_SHADOW_RATE,
+    }
+    for kind, counts in tier_stats["agreement"].items():
+        snapshot["agreement"][kind] = {
+            **counts,
+            "rate": round(counts["agreed"] / counts["compared"], 4) if counts["compared"] else None,
         }
-        
+    return snapshot
+
+
+def detect_sentiment(text: str, conversation_context: str = "", live_strategy: bool = False,
+                     customer_profile: str = None, language: str = None) -> Dict:
+    """
+    Tiered sentiment detection: the local classifier answers confident, short
+    messages in microseconds; the rest escalate to Mistral AI (with context
+    awareness). The adaptive strategy comes from the strategy table, or from
+    the same LLM call when live_strategy is set (high-value sessions, which
+    always use the LLM).
+    Blocking; async code should use adetect_sentiment().
+    
+    Args:
+        text: Customer's message text
+        conversation_context: Recent conversation history for context
+        live_strategy: Generate the strategy for this message with the LLM
+        customer_profile: Key from CUSTOMER_PROFILES (strategy table lookup)
+        language: Conversation language (strategy table lookup)
+    
+    Returns:
+        dict: Sentiment analysis result with AI insights
+    """
+    prediction, reason = _local_tier(text, live_strategy)
+    if reason is None:
+        return _local_result(prediction, customer_profile, language)
+    try:
+        if live_strategy:
+            return _classification_result(parse_classification(
+                _call_mistral(_classification_prompt(text, conversation_context), **JSON_MODE)
+            ))
+        classification = parse_classification(
+            _call_mistral(_classification_prompt(text, conversation_context, with_strategy=False), **JSON_MODE),
+            SENTIMENT_SCHEMA,
+        )
     except Exception as e:
-        # Fallback to neutral on error
-        print(f"⚠️ Mistral AI sentiment detection failed: {e}")
-        return {
-            "status": "neutral",
-            "primary_sentiment": "NEUTRAL",
-            "sentiment_score": 0.0,
-            "confidence": 0.5,
-            "emoji": "😐",
-            "reasoning": "AI unavailable - using neutral fallback",
-            "adaptive_strategy": get_adaptive_strategy("NEUTRAL", text),
-            "error": str(e)
-        }
+        return _llm_unavailable(e, prediction, customer_profile, language)
+    tier_stats["llm"] += 1
+    _record_agreement(prediction, classification["sentiment"])
+    return _classification_result(
+        classification, strategy_table.lookup(classification["sentiment"], customer_profile, language)
+    )
+
+
+async def adetect_sentiment(text: str, conversation_context: str = "", live_strategy: bool = False,
+                            customer_profile: str = None, language: str = None) -> Dict:
+    """
+    detect_sentiment() for async callers: the Mistral call goes through the
+    gateway's async path, so the event loop keeps serving other sessions,
+    and escalated messages are micro-batched with other sessions' messages.
+    A LOCAL_SENTIMENT_SHADOW_RATE share of local answers is re-checked by the
+    LLM in the background to measure agreement.
+    
+    Args:
+        text: Customer's message text
+        conversation_context: Recent conversation history for context
+        live_strategy: Generate the strategy for this message with the LLM
+        customer_profile: Key from CUSTOMER_PROFILES (strategy table lookup)
+        language: Conversation language (strategy table lookup)
+    
+    Returns:
+        dict: Sentiment analysis result with AI insights
+    """
+    prediction, reason = _local_tier(text, live_strategy)
+    if reason is None:
+        if LOCAL_SENTIMENT_SHADOW_RATE and random.random() < LOCAL_SENTIMENT_SHADOW_RATE:
+            task = asyncio.get_running_loop().create_task(_shadow_check(text, conversation_context, prediction))
+            _shadow_tasks.add(task)
+            task.add_done_callback(_shadow_tasks.discard)
+        return _local_result(prediction, customer_profile, language)
+    try:
+        if live_strategy:
+            return _classification_result(parse_classification(
+                await _acall_mistral(_classification_prompt(text, conversation_context), **JSON_MODE)
+            ))
+        classification = await sentiment_batcher.submit((text, conversation_context))
+    except Exception as e:
+        return _llm_unavailable(e, prediction, customer_profile, language)
+    tier_stats["llm"] += 1
+    _record_agreement(prediction, classification["sentiment"])
+    return _classification_result(
+        classification, strategy_table.lookup(classification["sentiment"], customer_profile, language)
+    )
+
+
+async def _classify_message(item: Tuple[str, str]) -> Dict:
+    """One (message, context) pair, one LLM call: validated SENTIMENT_SCHEMA classification"""
+    text, conversation_context = item
+    return parse_classification(
+        await _acall_mistral(_classification_prompt(text, conversation_context, with_strategy=False), **JSON_MODE),
+        SENTIMENT_SCHEMA,
+    )
+
+
+async def _classify_messages(items: List[Tuple[str, str]]) -> List[Optional[Dict]]:
+    """Several (message, context) pairs, one LLM call (None for messages the reply does not cover)"""
+    return parse_batch_classification(await _acall_mistral(_batch_classification_prompt(items), **JSON_MODE), len(items))
+
+
+# Escalated and shadow classifications from concurrent sessions share LLM calls
+sentiment_batcher = MicroBatcher(
+    "sentiment", _classify_messages, _classify_message,
+    max_batch_size=SENTIMENT_BATCH_MAX_ITEMS, max_wait_seconds=SENTIMENT_BATCH_WAIT_SECONDS,
+)
+
+
+async def _shadow_check(text: str, conversation_context: str, prediction: Dict):
+    """Classify a locally-answered message with the LLM too, for agreement metrics only"""
+    try:
+        classification = await sentiment_batcher.submit((text, conversation_context))
+    except Exception:
+        return
+    _record_agreement(prediction, classification["sentiment"], kind="shadow")
 
 
-def get_adaptive_strategy(sentiment_type: str, customer_message: str = "") -> Dict:
+def get_adaptive_strategy(sentiment_type: str, customer_message: str = "", customer_profile: str = None,
+                          language: str = None) -> Dict:
     """
     AI-powered adaptive response strategy generation using Mistral AI.
     Creates context-aware response guidelines based on detected sentiment.
+    Also used to (re)generate strategy table entries, without a message.
     
     Args:
         sentiment_type: The detected sentiment type
         customer_message: The actual customer message for context
+        customer_profile: Key from CUSTOMER_PROFILES to tailor the strategy to
+        language: Language for the example approach
     
     Returns:
         dict: Adaptive strategy with tone, pace, focus, and AI example
     """
     try:
+        # Optional context lines
+        context_lines = ""
+        if customer_message:
+            context_lines += f'CUSTOMER MESSAGE: "{customer_message}"\n\n'
+        if customer_profile in CUSTOMER_PROFILES:
+            context_lines += f"CUSTOMER PROFILE: {customer_profile} - {CUSTOMER_PROFILES[customer_profile]['description']}\n\n"
+        if language and language != "en":
+            context_lines += f"Write the APPROACH sentence in {language}.\n\n"
+        
         # Smart adaptive strategy prompt
         prompt = f"""You are an expert loan sales coach. The customer is feeling {sentiment_type}.
 
-CUSTOMER MESSAGE: "{customer_message}"
-
-Provide an adaptive response strategy for the loan agent:
+{context_lines}Provide an adaptive response strategy for the loan agent:
 
 EMOTION-SPECIFIC GUIDELINES:
 - EXCITEMENT: Match energy, fast-track, celebrate momentum, minimize friction
@@ -164,159 +644,86 @@ EMOTION-SPECIFIC GUIDELINES:
 - PRICE_CONCERN: Show value comparison, break down costs, highlight savings
 - NEUTRAL: Balanced professional, informative, build rapport
 
-Respond in this EXACT format (no extra text):
-TONE: [describe the emotional tone to use - max 4 words]
-PACE: [FAST/MODERATE/SLOW]
-FOCUS: [3 priorities separated by commas]
-APPROACH: [Write ONE short example sentence (15-25 words) showing how to respond]
+Respond with ONLY a JSON object with exactly these keys:
+{{
+  "tone": the emotional tone to use (max 4 words),
+  "pace": one of FAST, MODERATE, SLOW,
+  "focus": 3 priorities separated by commas,
+  "approach": ONE short example sentence (15-25 words) showing how to respond
+}}
 
 Example:
-TONE: Patient & Educational
-PACE: SLOW
-FOCUS: Simplify terms, Use analogies, Confirm understanding
-APPROACH: Let me explain EMI simply - it's like paying for Netflix monthly, but for your loan.
+{{"tone": "Patient & Educational", "pace": "SLOW", "focus": "Simplify terms, Use analogies, Confirm understanding", "approach": "Let me explain EMI simply - it's like paying for Netflix monthly, but for your loan."}}
 
 Now create the strategy for {sentiment_type}:"""
 
-        # Get Mistral AI response via LiteLlm
-        response = _sentiment_mod
-        result_text = _call_mistral(prompt)
-        # Parse AI response
-        strategy = {
-            "tone": "Professional & Friendly",
-            "pace": "MODERATE",
-            "focus": "Build rapport, Provide information, Move forward",
-            "approach": "Happy to help! Let me guide you through the next steps.",
-            "ai_generated": True
-        }
-        
-        for line in result_text.split('\n'):
-            line = line.strip()
-            if line.startswith('TONE:'):
-                strategy["tone"] = line.split(':', 1)[1].strip()
-            elif line.startswith('PACE:'):
-                strategy["pace"] = line.split(':', 1)[1].strip().upper()
-                # Validate pace
-                if strategy["pace"] not in ["FAST", "MODERATE", "SLOW"]:
-                    strategy["pace"] = "MODERATE"
-            elif line.startswith('FOCUS:'):
-                focus_text = line.split(':', 1)[1].strip()
-                strategy["focus"] = focus_text
-            elif line.startswith('APPROACH:'):
-                strategy["approach"] = line.split(':', 1)[1].strip()
+        # Get Mistral AI response via the gateway (JSON mode)
+        result_text = _call_mistral(prompt, **JSON_MODE)
+        # Strict parse: a reply without a valid strategy raises ValueError (-> fallback with "error")
+        strategy = parse_classification(result_text, STRATEGY_SCHEMA)
+        strategy["ai_generated"] = True
         
         return strategy
         
     except Exception as e:
-        # Fallback strategy
-        print(f"⚠️ Mistral AI strategy generation failed: {e}")
-        return {
-            "tone": "Professional & Friendly",
-            "pace": "MODERATE",
-            "focus": "Build rapport, Provide information, Move forward",
-            "approach": "I'm here to help! Let me know if you have any questions.",
-            "error": str(e)
-        }
+        if not isinstance(e, CircuitOpenError):
+            print(f"⚠️ Mistral AI strategy generation failed: {e}")
+        return _fallback_strategy(e)
+
+
+def _fallback_strategy(error: Exception) -> Dict:
+    """Default strategy when no AI strategy is available"""
+    return {
+        "tone": "Professional & Friendly",
+        "pace": "MODERATE",
+        "focus": "Build rapport, Provide information, Move forward",
+        "approach": "I'm here to help! Let me know if you have any questions.",
+        "error": str(error)
+    }
 
 
 def get_sentiment_context_for_agent(sentiment_result: Dict) -> str:
     """
-    Generates formatted sentiment context for agent prompt with Mistral AI insights.
-    
+    Generates formatted sentiment context for the agent prompt.
+
+    The header names what produced the result (Mistral AI or the local
+    classifier, see `tier`) and the strategy says whether it was generated by
+    Mistral AI or is a curated default (see `ai_generated`).
+
     Args:
         sentiment_result: Result from detect_sentiment()
-    
+
     Returns:
         str: Formatted context for agent instruction
     """
     if sentiment_result["status"] == "neutral":
         return "No strong sentiment detected. Maintain professional, balanced tone."
-    
+
     strategy = sentiment_result["adaptive_strategy"]
-    
+    if sentiment_result.get("tier") == "llm":
+        detected_by = "🎭 MISTRAL AI EMOTIONAL INTELLIGENCE DETECTED"
+    else:
+        detected_by = "🎭 LOCAL SENTIMENT CLASSIFIER DETECTED"
+    if strategy.get("ai_generated"):
+        strategy_header, strategy_source = "🤖 MISTRAL AI-GENERATED ADAPTIVE STRATEGY", "Mistral AI-generated strategy"
+    else:
+        strategy_header, strategy_source = "📘 CURATED ADAPTIVE STRATEGY", "curated strategy"
+
     context = f"""
-🎭 MISTRAL AI EMOTIONAL INTELLIGENCE DETECTED:
+{detected_by}:
 Customer Sentiment: {sentiment_result['emoji']} {sentiment_result['primary_sentiment']}
 Confidence: {sentiment_result['confidence']:.0%} | Score: {sentiment_result['sentiment_score']:.2f}
-AI Reasoning: {sentiment_result.get('reasoning', 'N/A')}
+Reasoning: {sentiment_result.get('reasoning', 'N/A')}
 
-🤖 MISTRAL AI-POWERED ADAPTIVE STRATEGY:
+{strategy_header}:
 Tone: {strategy['tone']}
 Response Pace: {strategy['pace']}
 Focus On: {strategy['focus']}
 
-💡 AI EXAMPLE APPROACH:
+💡 EXAMPLE APPROACH:
 "{strategy['approach']}"
 
-⚡ INSTRUCTION: Apply this Mistral AI-generated strategy in your next response!
+⚡ INSTRUCTION: Apply this {strategy_source} in your next response!
 """
-    
-    return context
 
-
-def track_sentiment_evolution(conversation_history: List[Dict]) -> Dict:
-    """
-    Tracks how sentiment evolves throughout a conversation.
-    
-    Args:
-        conversation_history: List of messages with sentiment data
-    
-    Returns:
-        dict: Sentiment trend analysis
-    """
-    if not conversation_history:
-        return {
-            "trend": "NEUTRAL",
-            "improvement": 0.0,
-            "risk_level": "LOW"
-        }
-    
-    # Extract sentiment scores
-    scores = []
-    for msg in conversation_history:
-        if isinstance(msg, dict) and "sentiment" in msg:
-            sentiment = msg["sentiment"]
-            if isinstance(sentiment, dict) and "sentiment_score" in sentiment:
-                scores.append(sentiment["sentiment_score"])
-    
-    if len(scores) < 2:
-        latest_score = scores[0] if scores else 0.0
-        risk_level = "CRITICAL" if latest_score < -0.5 else ("HIGH" if latest_score < -0.3 else "LOW")
-        return {
-            "trend": "NEUTRAL",
-            "improvement": 0.0,
-            "risk_level": risk_level,
-            "latest_score": latest_score
-        }
-    
-    # Calculate trend
-    first_half_avg = sum(scores[:len(scores)//2]) / (len(scores)//2)
-    second_half_avg = sum(scores[len(scores)//2:]) / (len(scores) - len(scores)//2)
-    
-    improvement = second_half_avg - first_half_avg
-    
-    # Determine trend
-    if improvement > 0.2:
-        trend = "IMPROVING"
-        risk_level = "LOW"
-    elif improvement < -0.2:
-        trend = "DECLINING"
-        risk_level = "HIGH"
-    else:
-        trend = "STABLE"
-        risk_level = "MEDIUM"
-    
-    # Latest sentiment determines immediate risk
-    latest_score = scores[-1]
-    if latest_score < -0.5:
-        risk_level = "CRITICAL"
-    elif latest_score < -0.3:
-        risk_level = "HIGH"
-    
-    return {
-        "trend": trend,
-        "improvement": improvement,
-        "risk_level": risk_level,
-        "latest_score": latest_score,
-        "average_score": sum(scores) / len(scores)
-    }
+    return context
@@ -0,0 +1,251 @@
+"""
+Labelled Sentiment Turns
+Customer messages from loan conversations labelled with the 8 sentiment types
+detect_sentiment() uses; training data for the local sentiment classifier
+(mock_data.local_sentiment). Extend with reviewed production turns via
+`python -m mock_data.local_sentiment --train --data turns.jsonl`.
+"""
+
+LABELLED_TURNS = [
+    # EXCITEMENT
+    ("Wow that's great, let's do it!", "EXCITEMENT"),
+    ("Awesome, I want to apply right now", "EXCITEMENT"),
+    ("Yes please proceed, this is exactly what I needed", "EXCITEMENT"),
+    ("Amazing offer! Sign me up", "EXCITEMENT"),
+    ("Perfect, let's go ahead", "EXCITEMENT"),
+    ("That's fantastic news, thank you so much!", "EXCITEMENT"),
+    ("Great, I'm ready to start the application", "EXCITEMENT"),
+    ("Excellent! When can I get the money?", "EXCITEMENT"),
+    ("Super, book it for me", "EXCITEMENT"),
+    ("I'm so happy I got approved!", "EXCITEMENT"),
+    ("yes yes let's proceed", "EXCITEMENT"),
+    ("Brilliant, this rate is better than I expected", "EXCITEMENT"),
+    ("Bahut badhiya, chalo aage badhte hain", "EXCITEMENT"),
+    ("Love it, please go ahead with 5 lakhs", "EXCITEMENT"),
+    ("That sounds wonderful, I'm in", "EXCITEMENT"),
+    ("Great! let's finish this quickly", "EXCITEMENT"),
+    ("Fantastic, I accept the offer", "EXCITEMENT"),
+    ("This is great, my wedding plans are sorted now!", "EXCITEMENT"),
+    ("Yay, approved already? Amazing", "EXCITEMENT"),
+    ("wonderful, let's do this", "EXCITEMENT"),
+    ("I'm excited, what are the next steps?", "EXCITEMENT"),
+    ("Perfect perfect, go ahead", "EXCITEMENT"),
+    ("great news!!", "EXCITEMENT"),
+    ("sounds awesome", "EXCITEMENT"),
+    ("ekdum mast, proceed karo", "EXCITEMENT"),
+    ("yes proceed", "EXCITEMENT"),
+    ("Please proceed with the application", "EXCITEMENT"),
+    ("Go ahead, proceed", "EXCITEMENT"),
+
+    # CONFUSION
+    ("I don't understand what EMI means", "CONFUSION"),
+    ("What is a processing fee?", "CONFUSION"),
+    ("Can you explain how the interest is calculated?", "CONFUSION"),
+    ("I'm confused, is the rate fixed or floating?", "CONFUSION"),
+    ("What does tenure mean?", "CONFUSION"),
+    ("Sorry, I didn't get that", "CONFUSION"),
+    ("How does this work exactly?", "CONFUSION"),
+    ("What is the difference between pre-approved and conditional?", "CONFUSION"),
+    ("I'm not clear about the documents needed", "CONFUSION"),
+    ("what is EMI?", "CONFUSION"),
+    ("Can you explain that again in simple words?", "CONFUSION"),
+    ("Which documents do I need to upload?", "CONFUSION"),
+    ("Mujhe samajh nahi aaya, EMI kya hota hai?", "CONFUSION"),
+    ("I don't get it, why is my limit different?", "CONFUSION"),
+    ("What do you mean by salary slip verification?", "CONFUSION"),
+    ("This is confusing, what happens after KYC?", "CONFUSION"),
+    ("how is the amount decided?", "CONFUSION"),
+    ("What is a sanction letter?", "CONFUSION"),
+    ("I'm lost, what should I do next?", "CONFUSION"),
+    ("Can you clarify the foreclosure charges?", "CONFUSION"),
+    ("what's the meaning of credit score here", "CONFUSION"),
+    ("huh? what does that mean", "CONFUSION"),
+    ("explain please", "CONFUSION"),
+    ("I am not sure I understand the terms", "CONFUSION"),
+    ("What is APR and how is it different from interest rate?", "CONFUSION"),
+
+    # HESITATION
+    ("I'm not sure, let me think about it", "HESITATION"),
+    ("Maybe later", "HESITATION"),
+    ("I need some time to decide", "HESITATION"),
+    ("Let me discuss with my wife first", "HESITATION"),
+    ("I'm still thinking whether I should take a loan", "HESITATION"),
+    ("Hmm, I don't know", "HESITATION"),
+    ("Not sure if this is the right time", "HESITATION"),
+    ("I will get back to you", "HESITATION"),
+    ("Let me check other options before deciding", "HESITATION"),
+    ("I'm a bit worried about taking debt", "HESITATION"),
+    ("Sochna padega, baad mein batata hoon", "HESITATION"),
+    ("can I decide tomorrow?", "HESITATION"),
+    ("I'm hesitant to commit for 5 years", "HESITATION"),
+    ("What if I can't repay?", "HESITATION"),
+    ("I'm unsure about the amount", "HESITATION"),
+    ("Let me consult my family", "HESITATION"),
+    ("I'll think it over", "HESITATION"),
+    ("hmm maybe", "HESITATION"),
+    ("Is it safe to share my PAN?", "HESITATION"),
+    ("I'm not ready yet", "HESITATION"),
+    ("Not sure I want this loan anymore", "HESITATION"),
+    ("Let me compare with my bank first", "HESITATION"),
+    ("I'm having second thoughts", "HESITATION"),
+    ("Should I really take this loan?", "HESITATION"),
+    ("give me a day to think", "HESITATION"),
+    ("not excited about this loan", "HESITATION"),
+    ("I don't trust these online loans yet", "HESITATION"),
+    ("not happy with the offer, let me think", "HESITATION"),
+    ("I'm not comfortable with this yet", "HESITATION"),
+    ("I don't love the terms", "HESITATION"),
+    ("not confident about the EMI", "HESITATION"),
+
+    # FRUSTRATION
+    ("This is taking forever!", "FRUSTRATION"),
+    ("Why do you keep asking the same thing?", "FRUSTRATION"),
+    ("I already uploaded the document, this is ridiculous", "FRUSTRATION"),
+    ("Your process is so annoying", "FRUSTRATION"),
+    ("Stop wasting my time", "FRUSTRATION"),
+    ("This is the third time I'm telling you", "FRUSTRATION"),
+    ("Useless, nothing works", "FRUSTRATION"),
+    ("I'm fed up with this", "FRUSTRATION"),
+    ("Why was I rejected? This is unfair", "FRUSTRATION"),
+    ("The upload keeps failing, so irritating", "FRUSTRATION"),
+    ("Kitna time lagega yaar, pagal kar diya", "FRUSTRATION"),
+    ("I want to talk to a real person now", "FRUSTRATION"),
+    ("This is terrible service", "FRUSTRATION"),
+    ("Ugh, not again", "FRUSTRATION"),
+    ("Are you even listening to me?", "FRUSTRATION"),
+    ("Too many steps, I'm annoyed", "FRUSTRATION"),
+    ("This is so frustrating", "FRUSTRATION"),
+    ("What nonsense is this", "FRUSTRATION"),
+    ("I told you already!!", "FRUSTRATION"),
+    ("worst experience ever", "FRUSTRATION"),
+    ("Your system is broken", "FRUSTRATION"),
+    ("Enough! Cancel everything", "FRUSTRATION"),
+    ("I'm angry, nobody is helping", "FRUSTRATION"),
+    ("why is this so complicated, it's irritating", "FRUSTRATION"),
+    ("bakwas process hai", "FRUSTRATION"),
+    ("not happy at all", "FRUSTRATION"),
+    ("this is not great", "FRUSTRATION"),
+    ("I dont trust you", "FRUSTRATION"),
+    ("not fine, this is taking forever", "FRUSTRATION"),
+    ("never a good experience with you guys", "FRUSTRATION"),
+    ("not okay, why was it rejected", "FRUSTRATION"),
+    ("this is not fair", "FRUSTRATION"),
+    ("no thanks, this is useless", "FRUSTRATION"),
+
+    # TRUST
+    ("Okay, I trust Tata Capital", "TRUST"),
+    ("Sounds good, that makes sense", "TRUST"),
+    ("Alright, that's clear now, thanks", "TRUST"),
+    ("I believe you, go ahead", "TRUST"),
+    ("Fine, I'm comfortable with these terms", "TRUST"),
+    ("Thank you for explaining, I'm confident now", "TRUST"),
+    ("Okay noted", "TRUST"),
+    ("That's reasonable", "TRUST"),
+    ("I've been a customer for years, I know you're reliable", "TRUST"),
+    ("ok", "TRUST"),
+    ("okay thanks", "TRUST"),
+    ("Got it, thank you", "TRUST"),
+    ("Theek hai, samajh gaya", "TRUST"),
+    ("Understood, makes sense", "TRUST"),
+    ("I'm satisfied with the explanation", "TRUST"),
+    ("Fair enough", "TRUST"),
+    ("Sure, I agree", "TRUST"),
+    ("Thanks, that's helpful", "TRUST"),
+    ("Right, that works for me", "TRUST"),
+    ("I'm fine with that", "TRUST"),
+    ("cool, got it", "TRUST"),
+    ("That's transparent, I appreciate it", "TRUST"),
+    ("Alright", "TRUST"),
+    ("yes that's correct", "TRUST"),
+    ("sure", "TRUST"),
+    ("no problem, that works", "TRUST"),
+    ("not bad at all, I agree", "TRUST"),
+    ("no worries, I understood", "TRUST"),
+
+    # URGENCY
+    ("I need the money urgently", "URGENCY"),
+    ("How fast can I get the loan?", "URGENCY"),
+    ("I need it by tomorrow", "URGENCY"),
+    ("It's an emergency, my father is in hospital", "URGENCY"),
+    ("Please hurry, I have to pay the fees today", "URGENCY"),
+    ("Can you disburse today itself?", "URGENCY"),
+    ("ASAP please", "URGENCY"),
+    ("Time is running out, I need funds this week", "URGENCY"),
+    ("Jaldi chahiye, kal tak", "URGENCY"),
+    ("How quickly will it be approved?", "URGENCY"),
+    ("I can't wait long, medical emergency", "URGENCY"),
+    ("Need the amount immediately", "URGENCY"),
+    ("Deadline is Monday, please speed it up", "URGENCY"),
+    ("When exactly will the money reach my account?", "URGENCY"),
+    ("urgent requirement", "URGENCY"),
+    ("Can this be done in 2 hours?", "URGENCY"),
+    ("I'm in a hurry", "URGENCY"),
+    ("Need funds right away for the surgery", "URGENCY"),
+    ("fast please", "URGENCY"),
+    ("quick disbursal needed", "URGENCY"),
+    ("The offer expires today right? Let's do it fast", "URGENCY"),
+    ("Please process quickly", "URGENCY"),
+    ("I need it within 24 hours", "URGENCY"),
+    ("turant chahiye", "URGENCY"),
+    ("what's the fastest way to get the money?", "URGENCY"),
+
+    # PRICE_CONCERN
+    ("The interest rate is too high", "PRICE_CONCERN"),
+    ("EMI is too much for me", "PRICE_CONCERN"),
+    ("Can you reduce the rate?", "PRICE_CONCERN"),
+    ("That's expensive", "PRICE_CONCERN"),
+    ("Other banks are offering lower rates", "PRICE_CONCERN"),
+    ("I can't afford this EMI", "PRICE_CONCERN"),
+    ("Why is the processing fee so high?", "PRICE_CONCERN"),
+    ("Is there any discount?", "PRICE_CONCERN"),
+    ("Bahut mehenga hai", "PRICE_CONCERN"),
+    ("The total interest is a lot of money", "PRICE_CONCERN"),
+    ("Can the EMI be lower?", "PRICE_CONCERN"),
+    ("My budget is tight", "PRICE_CONCERN"),
+    ("HDFC gave me 10.5%, can you match it?", "PRICE_CONCERN"),
+    ("Too costly for me", "PRICE_CONCERN"),
+    ("Are there hidden charges?", "PRICE_CONCERN"),
+    ("I'm worried about the cost", "PRICE_CONCERN"),
+    ("rate is too much", "PRICE_CONCERN"),
+    ("any cheaper option?", "PRICE_CONCERN"),
+    ("The fees are not worth it", "PRICE_CONCERN"),
+    ("I can only pay 10000 per month", "PRICE_CONCERN"),
+    ("Can you waive the processing fee?", "PRICE_CONCERN"),
+    ("12% is too high", "PRICE_CONCERN"),
+    ("Is this the lowest rate you have?", "PRICE_CONCERN"),
+    ("EMI zyada hai", "PRICE_CONCERN"),
+    ("prepayment charges are expensive", "PRICE_CONCERN"),
+    ("I can't afford this EMI", "PRICE_CONCERN"),
+    ("the rate is not reasonable", "PRICE_CONCERN"),
+    ("not a fair price for the processing fee", "PRICE_CONCERN"),
+
+    # NEUTRAL
+    ("I want a personal loan", "NEUTRAL"),
+    ("My salary is 75000", "NEUTRAL"),
+    ("I live in Mumbai", "NEUTRAL"),
+    ("I need 3 lakhs", "NEUTRAL"),
+    ("For 36 months", "NEUTRAL"),
+    ("My PAN is ABCDE1234F", "NEUTRAL"),
+    ("I work at Infosys", "NEUTRAL"),
+    ("Show me the offer", "NEUTRAL"),
+    ("The loan is for home renovation", "NEUTRAL"),
+    ("Here is my salary slip", "NEUTRAL"),
+    ("I am uploading the document", "NEUTRAL"),
+    ("My phone number is 9876543210", "NEUTRAL"),
+    ("Tell me about the loan", "NEUTRAL"),
+    ("I want to check my eligibility", "NEUTRAL"),
+    ("What are the tenure options?", "NEUTRAL"),
+    ("60 months", "NEUTRAL"),
+    ("5 lakh rupees", "NEUTRAL"),
+    ("Hello", "NEUTRAL"),
+    ("Hi", "NEUTRAL"),
+    ("I am a salaried employee", "NEUTRAL"),
+    ("Mujhe personal loan chahiye", "NEUTRAL"),
+    ("My email is rahul@example.com", "NEUTRAL"),
+    ("The purpose is education", "NEUTRAL"),
+    ("I have an account with HDFC bank", "NEUTRAL"),
+    ("Please check my credit score", "NEUTRAL"),
+    ("no, I don't have any other loans", "NEUTRAL"),
+    ("I am not married", "NEUTRAL"),
+    ("Not today, for next month", "NEUTRAL"),
+]
@@ -0,0 +1,134 @@
+"""
+Incremental Sentiment Trend
+Running summary of a conversation's sentiment scores, kept in session state
+under "sentiment_trend" and updated in constant time per message: count,
+EWMA, last score, slope (EWMA of score changes) and a short window of recent
+scores for the windowed mean/min and the trend. Risk levels and alerts come
+from the summary, so the sentiment history is never re-walked.
+
+Environment:
+- SENTIMENT_TREND_WINDOW=6     recent scores kept for the windowed mean/min and trend
+- SENTIMENT_TREND_ALPHA=0.3    EWMA weight of the newest score
+"""
+
+import os
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+TREND_WINDOW = max(2, int(os.getenv("SENTIMENT_TREND_WINDOW", "6")))
+TREND_ALPHA = float(os.getenv("SENTIMENT_TREND_ALPHA", "0.3"))
+
+# Window half-to-half change that counts as improving/declining
+TREND_THRESHOLD = 0.2
+
+# Latest score below which risk is CRITICAL / HIGH whatever the trend
+CRITICAL_SCORE = -0.5
+HIGH_RISK_SCORE = -0.3
+
+
+def new_sentiment_trend() -> Dict[str, Any]:
+    """Empty trend state (what a session starts with)."""
+    return {"count": 0, "ewma": 0.0, "last": 0.0, "slope": 0.0, "window": []}
+
+
+def update_sentiment_trend(trend: Optional[Mapping], score: float) -> Dict[str, Any]:
+    """
+    Fold one sentiment score into the trend state.
+
+    Args:
+        trend: Current trend state (None for a new conversation); not modified
+        score: Sentiment score of the new message (-1.0 to 1.0)
+
+    Returns:
+        dict: The new trend state
+    """
+    if not trend or not trend.get("count"):
+        return {"count": 1, "ewma": round(score, 4), "last": round(score, 4), "slope": 0.0, "window": [round(score, 4)]}
+    window = (list(trend["window"]) + [round(score, 4)])[-TREND_WINDOW:]
+    change = score - trend["last"]
+    slope = change if trend["count"] == 1 else TREND_ALPHA * change + (1 - TREND_ALPHA) * trend["slope"]
+    return {
+        "count": trend["count"] + 1,
+        "ewma": round(TREND_ALPHA * score + (1 - TREND_ALPHA) * trend["ewma"], 4),
+        "last": round(score, 4),
+        "slope": round(slope, 4),
+        "window": window,
+    }
+
+
+def summarize_sentiment_trend(trend: Optional[Mapping]) -> Dict[str, Any]:
+    """
+    Trend and risk level from the trend state.
+
+    Returns:
+        dict: trend (IMPROVING/DECLINING/STABLE, NEUTRAL under 2 messages),
+              improvement (recent vs earlier half of the window), risk_level
+              (LOW/MEDIUM/HIGH/CRITICAL), latest_score, average_score (EWMA),
+              window_mean, window_min, slope, count
+    """
+    if not trend or not trend.get("count"):
+        return {"trend": "NEUTRAL", "improvement": 0.0, "risk_level": "LOW"}
+
+    window: List[float] = list(trend["window"])
+    latest_score = trend["last"]
+    summary = {
+        "latest_score": latest_score,
+        "average_score": trend["ewma"],
+        "window_mean": round(sum(window) / len(window), 4),
+        "window_min": min(window),
+        "slope": trend["slope"],
+        "count": trend["count"],
+    }
+    if trend["count"] < 2:
+        risk_level = "CRITICAL" if latest_score < CRITICAL_SCORE else ("HIGH" if latest_score < HIGH_RISK_SCORE else "LOW")
+        return {"trend": "NEUTRAL", "improvement": 0.0, "risk_level": risk_level, **summary}
+
+    half = len(window) // 2
+    improvement = sum(window[half:]) / (len(window) - half) - sum(window[:half]) / half
+    if improvement > TREND_THRESHOLD:
+        trend_name, risk_level = "IMPROVING", "LOW"
+    elif improvement < -TREND_THRESHOLD:
+        trend_name, risk_level = "DECLINING", "HIGH"
+    else:
+        trend_name, risk_level = "STABLE", "MEDIUM"
+
+    # Latest sentiment determines immediate risk
+    if latest_score < CRITICAL_SCORE:
+        risk_level = "CRITICAL"
+    elif latest_score < HIGH_RISK_SCORE:
+        risk_level = "HIGH"
+    return {"trend": trend_name, "improvement": round(improvement, 4), "risk_level": risk_level, **summary}
+
+
+def _entry_score(entry: Any) -> Optional[float]:
+    """Score of a sentiment_history entry (or a message carrying a detect_sentiment() result)."""
+    if not isinstance(entry, Mapping):
+        return None
+    if isinstance(entry.get("sentiment_score"), (int, float)):
+        return entry["sentiment_score"]
+    nested = entry.get("sentiment")
+    if isinstance(nested, Mapping) and isinstance(nested.get("sentiment_score"), (int, float)):
+        return nested["sentiment_score"]
+    return None
+
+
+def track_sentiment_evolution(conversation_history: Iterable[Any]) -> Dict[str, Any]:
+    """
+    Tracks how sentiment evolves throughout a conversation.
+
+    Folds the history through update_sentiment_trend(); callers with a stored
+    trend state should use update_sentiment_trend() + summarize_sentiment_trend()
+    instead of re-walking the history.
+
+    Args:
+        conversation_history: sentiment_history entries (or messages with a
+            "sentiment" detect_sentiment() result)
+
+    Returns:
+        dict: Sentiment trend analysis (see summarize_sentiment_trend)
+    """
+    trend = None
+    for entry in conversation_history or []:
+        score = _entry_score(entry)
+        if score is not None:
+            trend = update_sentiment_trend(trend, score)
+    return summarize_sentiment_trend(trend)
@@ -0,0 +1,288 @@
+"""
+Stand-in Services for CRM, Credit Bureau and Offer Mart
+Wrap the mock lookups with realistic latency (p50/p99), error rates, timeouts
+and rate limits, in-process or over local HTTP, so caching, prefetching and
+concurrency work can be benchmarked without network access
+
+Run as HTTP server: python -m mock_data.standin_services --profile realistic --port 8100
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+
+from .credit_bureau import get_credit_score, get_credit_score_by_pan
+from .crm_data import get_kyc_data
+from .offer_mart import get_pre_approved_offer
+
+# z-score of the 99th percentile of a standard normal distribution
+_Z_P99 = 2.3263
+
+
+def lognormal_params(profile: dict) -> Tuple[Optional[float], float]:
+    """
+    Log-normal (mu, sigma) with median p50_ms and 99th percentile p99_ms.
+
+    Returns:
+        tuple: (mu, or None when the profile has no latency; sigma)
+    """
+    p50 = max(profile.get("p50_ms", 0), 0)
+    p99 = max(profile.get("p99_ms", p50), p50)
+    mu = math.log(p50) if p50 > 0 else None
+    sigma = math.log(p99 / p50) / _Z_P99 if p50 > 0 and p99 > p50 else 0.0
+    return mu, sigma
+
+
+# Functions exposed by each stand-in service, with the name of their single argument
+SERVICE_FUNCTIONS: Dict[str, Dict[str, tuple]] = {
+    "crm": {
+        "get_kyc_data": (get_kyc_data, "customer_id"),
+    },
+    "bureau": {
+        "get_credit_score": (get_credit_score, "customer_id"),
+        "get_credit_score_by_pan": (get_credit_score_by_pan, "pan_number"),
+    },
+    "offers": {
+        "get_pre_approved_offer": (get_pre_approved_offer, "customer_id"),
+    },
+}
+
+# Behaviour per service:
+# p50_ms/p99_ms     - latency distribution (log-normal fitted to both percentiles)
+# error_rate        - fraction of calls failing with StandInUnavailable (HTTP 503)
+# timeout_rate      - fraction of calls hanging for timeout_seconds, then StandInTimeout (HTTP 504)
+# rate_limit_per_second - token bucket refill rate (burst = one second's worth); 0 disables
+PROFILES: Dict[str, Dict[str, dict]] = {
+    "instant": {
+        "crm": {"p50_ms": 0, "p99_ms": 0, "error_rate": 0.0, "timeout_rate": 0.0, "timeout_seconds": 0, "rate_limit_per_second": 0},
+        "bureau": {"p50_ms": 0, "p99_ms": 0, "error_rate": 0.0, "timeout_rate": 0.0, "timeout_seconds": 0, "rate_limit_per_second": 0},
+        "offers": {"p50_ms": 0, "p99_ms": 0, "error_rate": 0.0, "timeout_rate": 0.0, "timeout_seconds": 0, "rate_limit_per_second": 0},
+    },
+    "realistic": {
+        "crm": {"p50_ms": 40, "p99_ms": 250, "error_rate": 0.01, "timeout_rate": 0.002, "timeout_seconds": 5, "rate_limit_per_second": 200},
+        "bureau": {"p50_ms": 180, "p99_ms": 1200, "error_rate": 0.02, "timeout_rate": 0.005, "timeout_seconds": 8, "rate_limit_per_second": 20},
+        "offers": {"p50_ms": 25, "p99_ms": 120, "error_rate": 0.005, "timeout_rate": 0.0, "timeout_seconds": 0, "rate_limit_per_second": 500},
+    },
+    "degraded": {
+        "crm": {"p50_ms": 150, "p99_ms": 1500, "error_rate": 0.05, "timeout_rate": 0.02, "timeout_seconds": 5, "rate_limit_per_second": 50},
+        "bureau": {"p50_ms": 600, "p99_ms": 4000, "error_rate": 0.10, "timeout_rate": 0.05, "timeout_seconds": 8, "rate_limit_per_second": 5},
+        "offers": {"p50_ms": 80, "p99_ms": 600, "error_rate": 0.02, "timeout_rate": 0.01, "timeout_seconds": 3, "rate_limit_per_second": 100},
+    },
+}
+
+
+class StandInError(Exception):
+    """Base class for injected stand-in failures."""
+    http_status = 500
+
+
+class StandInUnavailable(StandInError):
+    """Injected service error."""
+    http_status = 503
+
+
+class StandInTimeout(StandInError, TimeoutError):
+    """Injected hang that ended without a response."""
+    http_status = 504
+
+
+class StandInRateLimited(StandInError):
+    """Call rejected by the stand-in's rate limiter."""
+    http_status = 429
+
+
+class _TokenBucket:
+    """Thread-safe token bucket; capacity equals one second of refill."""
+
+    def __init__(self, rate_per_second: float):
+        self.rate = rate_per_second
+        self.tokens = rate_per_second
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class StandInService:
+    """
+    One stand-in service (e.g. the credit bureau).
+
+    Functions are exposed as attributes with the same names and return shapes
+    as the mock lookups (service.get_credit_score(customer_id)). Each call
+    first passes the rate limiter, then sleeps for a sampled latency and may
+    fail according to the profile.
+    """
+
+    def __init__(self, name: str, profile: dict, seed: Optional[int] = None):
+        self.name = name
+        self.profile = dict(profile)
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        rate = profile.get("rate_limit_per_second", 0)
+        self._bucket = _TokenBucket(rate) if rate else None
+        self.stats = {"calls": 0, "errors": 0, "timeouts": 0, "rate_limited": 0}
+
+        # Log-normal parameters: median = p50, 99th percentile = p99
+        self._mu, self._sigma = lognormal_params(profile)
+
+        for function_name, (function, _) in SERVICE_FUNCTIONS[name].items():
+            setattr(self, function_name, self._wrap(function))
+
+    def sample_latency_ms(self) -> float:
+        """Draw one latency sample from the configured distribution."""
+        if self._mu is None:
+            return 0.0
+        with self._random_lock:
+            return self._random.lognormvariate(self._mu, self._sigma)
+
+    def _roll(self) -> float:
+        with self._random_lock:
+            return self._random.random()
+
+    def _wrap(self, function: Callable) -> Callable:
+        def call(argument):
+            self.stats["calls"] += 1
+            if self._bucket is not None and not self._bucket.try_acquire():
+                self.stats["rate_limited"] += 1
+                raise StandInRateLimited(f"{self.name}: rate limit exceeded")
+
+            roll = self._roll()
+            if roll < self.profile.get("timeout_rate", 0):
+                self.stats["timeouts"] += 1
+                time.sleep(self.profile.get("timeout_seconds", 0))
+                raise StandInTimeout(f"{self.name}: request timed out")
+
+            time.sleep(self.sample_latency_ms() / 1000)
+            if roll < self.profile.get("timeout_rate", 0) + self.profile.get("error_rate", 0):
+                self.stats["errors"] += 1
+                raise StandInUnavailable(f"{self.name}: service unavailable")
+            return function(argument)
+
+        call.__name__ = function.__name__
+        call.__doc__ = function.__doc__
+        return call
+
+
+def build_standins(profile: str = "realistic", seed: Optional[int] = None,
+                   overrides: Optional[Dict[str, dict]] = None) -> Dict[str, StandInService]:
+    """
+    Create in-process stand-ins for CRM, bureau and offer mart.
+
+    Args:
+        profile: Name of a profile in PROFILES
+        seed: Seed for reproducible latency/failure sampling
+        overrides: Per-service profile fields to override, e.g. {"bureau": {"error_rate": 0.2}}
+
+    Returns:
+        dict: Service name -> StandInService
+    """
+    overrides = overrides or {}
+    services = {}
+    for index, (name, settings) in enumerate(PROFILES[profile].items()):
+        service_seed = None if seed is None else seed + index
+        services[name] = StandInService(name, {**settings, **overrides.get(name, {})}, seed=service_seed)
+    return services
+
+
+# ---------------------------------------------------------------- HTTP mode
+
+class HttpStandInClient:
+    """
+    Client for a stand-in served over HTTP; exposes the same functions as StandInService.
+
+    HTTP 429/503/504 responses are raised as the matching StandIn* exceptions.
+    """
+
+    def __init__(self, name: str, base_url: str, timeout: float = 10.0):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        for function_name, (_, argument_name) in SERVICE_FUNCTIONS[name].items():
+            setattr(self, function_name, self._remote(function_name, argument_name))
+
+    def _remote(self, function_name: str, argument_name: str) -> Callable:
+        errors = {cls.http_status: cls for cls in (StandInRateLimited, StandInUnavailable, StandInTimeout)}
+
+        def call(argument):
+            query = urllib.parse.urlencode({argument_name: argument})
+            url = f"{self.base_url}/{self.name}/{function_name}?{query}"
+            try:
+                with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                    return json.loads(response.read())
+            except urllib.error.HTTPError as e:
+                raise errors.get(e.code, StandInError)(f"{self.name}: HTTP {e.code}") from e
+
+        call.__name__ = function_name
+        return call
+
+
+def build_http_clients(base_url: str, timeout: float = 10.0) -> Dict[str, HttpStandInClient]:
+    """Clients for every stand-in service behind one HTTP server."""
+    return {name: HttpStandInClient(name, base_url, timeout) for name in SERVICE_FUNCTIONS}
+
+
+def make_http_server(services: Dict[str, StandInService], host: str = "127.0.0.1", port: int = 8100) -> ThreadingHTTPServer:
+    """
+    HTTP server exposing stand-ins as GET /<service>/<function>?<argument>=<value>.
+
+    Returns:
+        ThreadingHTTPServer: Call serve_forever() (or run it in a thread)
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parsed = urllib.parse.urlparse(self.path)
+            parts = parsed.path.strip("/").split("/")
+            if len(parts) != 2 or parts[0] not in services or parts[1] not in SERVICE_FUNCTIONS[parts[0]]:
+                return self._send(404, {"status": "error", "message": "Unknown endpoint"})
+
+            service_name, function_name = parts
+            argument_name = SERVICE_FUNCTIONS[service_name][function_name][1]
+            argument = urllib.parse.parse_qs(parsed.query).get(argument_name, [""])[0]
+            try:
+                result = getattr(services[service_name], function_name)(argument)
+            except StandInError as e:
+                return self._send(e.http_status, {"status": "error", "message": str(e)})
+            self._send(200, result)
+
+        def _send(self, status: int, body):
+            payload = json.dumps(body, default=str).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve CRM / bureau / offer mart stand-ins over HTTP")
+    parser.add_argument("--profile", default="realistic", choices=sorted(PROFILES))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = make_http_server(build_standins(args.profile, seed=args.seed), args.host, args.port)
+    print(f"🧪 Stand-in services ({args.profile}) at http://{args.host}:{args.port}")
+    server.serve_forever()
@@ -0,0 +1,247 @@
+"""
+Adaptive Strategy Table
+Response strategy (tone, pace, focus, example approach) per sentiment type,
+optionally specialised by customer profile and language. Lookups are a dict
+read (O(1)). The table starts from built-in strategies for the 8 sentiment
+types and is refreshed in the background by asking Mistral for every entry;
+the new table is swapped in atomically, and entries the LLM could not produce
+keep their previous value. Live per-message strategy generation is kept for
+sessions flagged high value (detect_sentiment(live_strategy=True)).
+
+Environment:
+- STRATEGY_TABLE_REFRESH_SECONDS=3600   background refresh interval (0 disables LLM refresh)
+- STRATEGY_TABLE_PROFILES=none          customer profiles to specialise ("all", "none" or comma-separated keys;
+                                        each profile adds 8 LLM calls per refresh)
+- STRATEGY_TABLE_LANGUAGES=en           languages to hold entries for (comma-separated; first is the default)
+- LIVE_STRATEGY_MIN_LIMIT=1000000       pre-approved limit from which a session is high value
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .persuasion_strategy import CUSTOMER_PROFILES
+
+SENTIMENT_TYPES = ("EXCITEMENT", "CONFUSION", "HESITATION", "FRUSTRATION", "TRUST", "URGENCY", "PRICE_CONCERN", "NEUTRAL")
+
+DEFAULT_REFRESH_SECONDS = float(os.getenv("STRATEGY_TABLE_REFRESH_SECONDS", "3600"))
+LIVE_STRATEGY_MIN_LIMIT = int(os.getenv("LIVE_STRATEGY_MIN_LIMIT", "1000000"))
+
+# Profiles that always get live strategies
+LIVE_STRATEGY_PROFILES = ("HIGH_CREDIT_AFFLUENT",)
+
+
+def _profiles_from_env() -> List[str]:
+    value = os.getenv("STRATEGY_TABLE_PROFILES", "none").strip()
+    if value == "all":
+        return list(CUSTOMER_PROFILES)
+    if value in ("", "none"):
+        return []
+    return [profile.strip() for profile in value.split(",") if profile.strip() in CUSTOMER_PROFILES]
+
+
+def _languages_from_env() -> List[str]:
+    return [language.strip() for language in os.getenv("STRATEGY_TABLE_LANGUAGES", "en").split(",") if language.strip()] or ["en"]
+
+
+# Built-in strategy per sentiment type (the guidelines the LLM prompt is given)
+BUILTIN_STRATEGIES: Dict[str, Dict[str, str]] = {
+    "EXCITEMENT": {
+        "tone": "Energetic & Encouraging",
+        "pace": "FAST",
+        "focus": "Match energy, Fast-track, Minimize friction",
+        "approach": "That's great to hear! Let's lock in your offer right away - it only takes a couple of minutes.",
+    },
+    "CONFUSION": {
+        "tone": "Patient & Educational",
+        "pace": "SLOW",
+        "focus": "Simplify terms, Use analogies, Confirm understanding",
+        "approach": "Let me explain EMI simply - it's like paying for Netflix monthly, but for your loan.",
+    },
+    "HESITATION": {
+        "tone": "Reassuring & Supportive",
+        "pace": "MODERATE",
+        "focus": "Address concerns, Provide social proof, Build confidence",
+        "approach": "It's completely normal to think it over - thousands of customers like you chose this loan and there's no obligation.",
+    },
+    "FRUSTRATION": {
+        "tone": "Deeply Empathetic & Calm",
+        "pace": "SLOW",
+        "focus": "Acknowledge feelings, Simplify drastically, Offer escalation",
+        "approach": "I'm really sorry this has been frustrating - let me sort it out for you right now in one simple step.",
+    },
+    "TRUST": {
+        "tone": "Confident & Professional",
+        "pace": "MODERATE",
+        "focus": "Reinforce credibility, Transparent terms, Move forward",
+        "approach": "Thank you for your confidence - here are the complete terms, with no hidden charges, so we can proceed.",
+    },
+    "URGENCY": {
+        "tone": "Efficient & Reassuring",
+        "pace": "FAST",
+        "focus": "Acknowledge timeline, Give clear ETA, Fast-track process",
+        "approach": "I understand you need this quickly - approval takes about 2 hours and funds reach you within 24 hours.",
+    },
+    "PRICE_CONCERN": {
+        "tone": "Practical & Value-Focused",
+        "pace": "MODERATE",
+        "focus": "Break down costs, Compare value, Highlight savings",
+        "approach": "Let me break it down - a longer tenure brings your EMI down, and our rate is below most credit cards.",
+    },
+    "NEUTRAL": {
+        "tone": "Professional & Friendly",
+        "pace": "MODERATE",
+        "focus": "Build rapport, Provide information, Move forward",
+        "approach": "Happy to help! Let me guide you through the next steps.",
+    },
+}
+
+TableKey = Tuple[str, Optional[str], Optional[str]]
+Strategy = Dict[str, Any]
+
+
+def is_high_value(pre_approved_limit: int, customer_profile: Optional[str] = None) -> bool:
+    """Whether a session should get live (per-message) strategy generation."""
+    return pre_approved_limit >= LIVE_STRATEGY_MIN_LIMIT or customer_profile in LIVE_STRATEGY_PROFILES
+
+
+def _generate_with_llm(sentiment_type: str, customer_profile: Optional[str], language: Optional[str]) -> Dict:
+    from .sentiment_analyzer import get_adaptive_strategy
+
+    return get_adaptive_strategy(sentiment_type, customer_profile=customer_profile, language=language)
+
+
+class StrategyTable:
+    """
+    Strategy per (sentiment type, customer profile, language), with fallback
+    to less specific entries. None in a key means "any profile" / the
+    default language.
+    """
+
+    def __init__(self, refresh_seconds: float = DEFAULT_REFRESH_SECONDS, profiles: Optional[List[str]] = None,
+                 languages: Optional[List[str]] = None,
+                 generate: Callable[[str, Optional[str], Optional[str]], Dict] = _generate_with_llm):
+        self.refresh_seconds = refresh_seconds
+        self.profiles = _profiles_from_env() if profiles is None else list(profiles)
+        self.languages = _languages_from_env() if languages is None else list(languages)
+        self.default_language = self.languages[0]
+        self.generate = generate
+        self.version = 0
+        self.last_refresh_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"lookups": 0, "exact_hits": 0, "fallbacks": 0, "refreshes": 0, "generated": 0, "generation_failures": 0}
+        self._table: Dict[TableKey, Strategy] = {}
+        self.warm()
+
+    def warm(self):
+        """(Re)load the built-in strategies; serves immediately, no LLM calls."""
+        table = {
+            (sentiment_type, None, None): {**strategy, "ai_generated": False}
+            for sentiment_type, strategy in BUILTIN_STRATEGIES.items()
+        }
+        self._table = table  # single reference assignment; readers see old or new table
+
+    def _language_key(self, language: Optional[str]) -> Optional[str]:
+        return None if language in (None, "", self.default_language) else language
+
+    def keys(self) -> List[TableKey]:
+        """Every entry a refresh generates."""
+        return [
+            (sentiment_type, profile, self._language_key(language))
+            for language in self.languages
+            for profile in [None] + self.profiles
+            for sentiment_type in SENTIMENT_TYPES
+        ]
+
+    def lookup(self, sentiment_type: str, customer_profile: Optional[str] = None, language: Optional[str] = None) -> Dict:
+        """
+        Strategy for a sentiment, most specific entry first.
+
+        Args:
+            sentiment_type: One of SENTIMENT_TYPES (unknown types get NEUTRAL)
+            customer_profile: Key from CUSTOMER_PROFILES
+            language: Language code/name (defaults to the table's default language)
+
+        Returns:
+            dict: tone, pace, focus, approach, ai_generated
+        """
+        table = self._table
+        language = self._language_key(language)
+        self.stats["lookups"] += 1
+        for index, key in enumerate((
+            (sentiment_type, customer_profile, language),
+            (sentiment_type, None, language),
+            (sentiment_type, customer_profile, None),
+            (sentiment_type, None, None),
+            ("NEUTRAL", None, None),
+        )):
+            strategy = table.get(key)
+            if strategy is not None:
+                self.stats["exact_hits" if index == 0 else "fallbacks"] += 1
+                return dict(strategy)  # entries are never mutated; callers get their own copy
+        return {**BUILTIN_STRATEGIES["NEUTRAL"], "ai_generated": False}
+
+    async def refresh(self) -> int:
+        """
+        Regenerate every entry with the LLM and publish the new table.
+
+        Returns:
+            int: Entries generated (failed entries keep their previous value)
+        """
+        table = dict(self._table)
+        generated = 0
+        for key in self.keys():
+            sentiment_type, profile, language = key
+            strategy = await asyncio.to_thread(self.generate, sentiment_type, profile, language or self.default_language)
+            # Failed or unparseable replies come back with "error"; keep the previous entry
+            if not strategy or "error" in strategy or not strategy.get("ai_generated"):
+                self.stats["generation_failures"] += 1
+                continue
+            table[key] = {**{name: strategy[name] for name in ("tone", "pace", "focus", "approach")}, "ai_generated": True}
+            generated += 1
+        self._table = table
+        self.version += 1
+        self.last_refresh_at = time.time()
+        self.stats["refreshes"] += 1
+        self.stats["generated"] += generated
+        print(f"🧭 Strategy table v{self.version}: {generated}/{len(self.keys())} entries generated")
+        return generated
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"⚠️  Strategy table refresh failed: {e}")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self):
+        """Start the background refresh on the running event loop (first refresh runs now)."""
+        if self.refresh_seconds > 0 and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        table = self._table
+        return {
+            "version": self.version,
+            "entries": len(table),
+            "ai_generated_entries": sum(1 for strategy in table.values() if strategy["ai_generated"]),
+            "last_refresh_at": self.last_refresh_at,
+            "refresh_seconds": self.refresh_seconds,
+            "profiles": self.profiles,
+            "languages": self.languages,
+            **self.stats,
+        }
+
+
+strategy_table = StrategyTable()
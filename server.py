@@ -4,7 +4,7 @@ import os
 import sys
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel
-from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, File
+from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, File, Header
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -17,74 +17,40 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
-import hashlib
 import litellm
 
 from loan_master_agent.agent import loan_master_agent
-from mock_data.customer_data import CUSTOMERS, get_customer_by_id
-from mock_data.offer_mart import get_pre_approved_offer
-from mock_data.campaign_data import get_campaign_data, get_personalized_opening
+from mock_data.customer_data import get_customer_by_id
+from mock_data import reference_data
+from mock_data.repository import DEFAULT_PAGE_SIZE, get_repository
+from mock_data.local_sentiment import get_local_model
+from mock_data.sentiment_analyzer import sentiment_batcher, sentiment_breaker, sentiment_tier_stats
+from mock_data.strategy_table import strategy_table
 from email_utils import send_email_with_attachment, send_sanction_letter_for_session
+from services.admission_control import PRIORITY_STATE_KEYS, AdmissionController, AdmissionRejected, classify_turn
+from services.data_sources import active_sources, configure_from_env
+from services.enrichment import EnrichmentPipeline
+from services.event_log import LOG_KEY_PREFIXES
+from services.llm_gateway import llm_gateway
+from services.model_router import model_router
+from services.memory_governor import MemoryGovernor
+from services.bureau_client import bureau_client
+from services.customer_360 import customer_360_store
+from services.prefetch_cache import kyc_prefetch_cache
+from services.session_bootstrap import bootstrap_session_state
+from services.session_state import StateBatch, read_session_state, session_exists
+from services.turn_coordinator import IdempotencyConflict, TurnCoordinator
 
 # Load environment variables
 load_dotenv(override=True)
 
-# Configure litellm for Mistral compatibility with short tool call IDs
-import litellm
+# Optionally route CRM / bureau / offer mart lookups through latency-injecting stand-ins
+configure_from_env()
+
+# Configure litellm for Mistral compatibility (tool call IDs are shortened by services.llm_gateway)
 litellm.drop_params = True  # Drop unsupported parameters
 os.environ["LITELLM_DROP_PARAMS"] = "True"
 
-# Patch ADK's tool call ID generation at the genai level
-from google import genai
-original_content_init = genai.types.Content.__init__ if hasattr(genai.types.Content, '__init__') else None
-
-# Monkey patch to fix tool call IDs for Mistral at multiple levels
-original_completion = litellm.completion
-tool_call_id_map = {}  # Map long IDs to short IDs
-
-def generate_short_id(long_id: str) -> str:
-    """Generate or retrieve a consistent 9-char ID for a long tool call ID."""
-    if long_id not in tool_call_id_map:
-        tool_call_id_map[long_id] = hashlib.md5(long_id.encode()).hexdigest()[:9]
-    return tool_call_id_map[long_id]
-
-def patched_completion(*args, **kwargs):
-    """Wrapper to ensure tool call IDs are Mistral-compatible (9 chars max)."""
-    # Fix tool call IDs in REQUEST (messages being sent TO Mistral)
-    if 'messages' in kwargs:
-        for message in kwargs['messages']:
-            if isinstance(message, dict):
-                # Fix tool_calls in assistant messages
-                if message.get('tool_calls'):
-                    for tool_call in message['tool_calls']:
-                        if 'id' in tool_call and len(tool_call['id']) > 9:
-                            tool_call['id'] = generate_short_id(tool_call['id'])
-                # Fix tool_call_id in tool result messages
-                if message.get('tool_call_id') and len(message['tool_call_id']) > 9:
-                    message['tool_call_id'] = generate_short_id(message['tool_call_id'])
-    
-    result = original_completion(*args, **kwargs)
-    
-    # Fix tool call IDs in RESPONSE (from Mistral)
-    if hasattr(result, 'choices') and result.choices:
-        for choice in result.choices:
-            if hasattr(choice, 'message') and hasattr(choice.message, 'tool_calls') and choice.message.tool_calls:
-                for tool_call in choice.message.tool_calls:
-                    if hasattr(tool_call, 'id') and len(tool_call.id) > 9:
-                        short_id = generate_short_id(tool_call.id)
-                        tool_call.id = short_id
-    
-    return result
-
-litellm.completion = patched_completion
-
-# Utility function to generate short tool call IDs for Mistral
-def generate_short_tool_call_id(original_id: str) -> str:
-    """Generate a 9-character tool call ID from the original ID for Mistral compatibility."""
-    # Use first 9 characters of MD5 hash (alphanumeric)
-    hash_obj = hashlib.md5(original_id.encode())
-    return hash_obj.hexdigest()[:9]
-
 app = FastAPI(title="Tata Capital Loan Assistant API")
 
 # Configure CORS
@@ -99,6 +65,37 @@ app.add_middleware(
 # Global services
 session_service = InMemorySessionService()
 APP_NAME = "Tata Capital Loan Assistant"
+memory_governor = MemoryGovernor(session_service, APP_NAME)
+turn_coordinator = TurnCoordinator()
+admission_controller = AdmissionController()
+enrichment = EnrichmentPipeline(session_service, APP_NAME)
+
+@app.on_event("startup")
+async def start_memory_governor():
+    """Start evicting idle sessions in the background."""
+    memory_governor.start()
+
+@app.on_event("startup")
+async def start_strategy_table_refresh():
+    """Refresh the adaptive strategy table from the LLM in the background."""
+    strategy_table.start()
+
+@app.on_event("startup")
+async def warm_local_sentiment_model():
+    """Load (or train) the local sentiment model before the first turn needs it."""
+    await asyncio.to_thread(get_local_model)
+
+@app.on_event("shutdown")
+async def stop_memory_governor():
+    await memory_governor.stop()
+
+@app.on_event("shutdown")
+async def stop_strategy_table_refresh():
+    await strategy_table.stop()
+
+@app.on_event("shutdown")
+async def stop_enrichment():
+    await enrichment.stop()
 
 # Models
 class Customer(BaseModel):
@@ -117,6 +114,7 @@ class ChatRequest(BaseModel):
     user_id: str
     message: str
     language: Optional[str] = "English"
+    idempotency_key: Optional[str] = None
 
 class ChatResponse(BaseModel):
     response: str
@@ -127,8 +125,8 @@ class StateResponse(BaseModel):
     state: Dict[str, Any]
 
 @app.get("/api/customers")
-async def get_customers():
-    """Get all available customers."""
+async def get_customers(limit: int = DEFAULT_PAGE_SIZE, offset: int = 0, city: Optional[str] = None):
+    """Get available customers (paginated, optionally filtered by city)."""
     return [
         {
             "id": customer_data["customer_id"],
@@ -138,7 +136,7 @@ async def get_customers():
             "credit_score": customer_data["credit_score"],
             "pre_approved_limit": customer_data["pre_approved_limit"]
         }
-        for customer_id, customer_data in CUSTOMERS.items()
+        for customer_data in get_repository().list_customers(limit=limit, offset=offset, city=city)
     ]
 
 @app.post("/api/session")
@@ -153,59 +151,9 @@ async def create_session(request: SessionInitRequest):
         # Generate session ID
         session_id = f"session_{request.customer_id}_{int(asyncio.get_event_loop().time())}"
         
-        # Get campaign data and offers
-        campaign_data = get_campaign_data(request.customer_id)
-        offers = get_pre_approved_offer(request.customer_id)
-        
-        # Get personalized opening
-        personalized_opening = get_personalized_opening(
-            request.customer_id,
-            customer["name"],
-            campaign_data
-        )
-        
-        # Create initial state with parallel processing pre-fetch
-        from mock_data.crm_data import get_kyc_data
-        from mock_data.credit_bureau import get_credit_score
-        
-        # Pre-fetch data in parallel
-        kyc_data = get_kyc_data(request.customer_id)
-        credit_data = get_credit_score(request.customer_id)
-        
-        initial_state = {
-            "customer_id": request.customer_id,
-            "customer_name": customer["name"],
-            "customer_phone": customer.get("phone", "N/A"),
-            "customer_city": customer["city"],
-            "customer_salary": customer["monthly_salary"],
-            "pre_approved_limit": customer["pre_approved_limit"],
-            "credit_score": customer["credit_score"],
-            "current_offer": offers.get("offer_1", {}),
-            "loan_application": {},
-            "application_status": "NOT_STARTED",
-            "interaction_history": [],
-            "campaign_source": campaign_data.get("source", "Direct"),
-            "customer_intent": campaign_data.get("intent", "GENERAL"),
-            "urgency_level": campaign_data.get("urgency_level", "MEDIUM"),
-            "campaign_keyword": campaign_data.get("keyword", "personal loan"),
-            "customer_type": campaign_data.get("customer_type", "NEW_CUSTOMER"),
-            "relationship_tenure_years": campaign_data.get("relationship_tenure_years", 0),
-            "payment_history": campaign_data.get("payment_history", "N/A"),
-            "current_loans_count": campaign_data.get("current_loans_count", 0),
-            "previous_interactions_count": campaign_data.get("previous_interactions_count", 0),
-            "offer_expiry_hours": campaign_data.get("offer_expiry_hours", 120),
-            "persuasion_strategy": "",
-            "personalized_opening": personalized_opening,
-            "objection_handling_context": "",
-            "sentiment_adaptive_strategy": "",
-            "history": [],
-            "kyc_data": {},  # Initialize empty kyc_data to prevent context variable errors
-            "eligibility_evaluation": {},  # Initialize empty eligibility_evaluation
-            "sanction_letter": {},  # Initialize empty sanction_letter
-            "_prefetched_kyc": kyc_data,
-            "_prefetched_credit": credit_data,
-            "_parallel_processing_enabled": True,
-        }
+        # Build initial state (source lookups run concurrently; base state cached per customer)
+        initial_state = await bootstrap_session_state(request.customer_id)
+        personalized_opening = initial_state["personalized_opening"]
         
         # Create session
         await session_service.create_session(
@@ -226,18 +174,21 @@ async def create_session(request: SessionInitRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/state/{session_id}")
-async def get_state(session_id: str, user_id: str):
-    """Get current session state."""
+async def get_state(session_id: str, user_id: str, keys: Optional[str] = None):
+    """Get current session state, optionally limited to comma-separated keys."""
     try:
-        session = await session_service.get_session(
-            app_name=APP_NAME,
-            user_id=user_id,
-            session_id=session_id
+        requested_keys = [key.strip() for key in keys.split(",") if key.strip()] if keys else None
+        state = await read_session_state(
+            session_service, APP_NAME, user_id, session_id, keys=requested_keys
         )
-        if session is None:
+        if state is None:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        return {"state": session.state if hasattr(session, 'state') else {}}
+        # Raw event-log records stay out of full-state polls; interaction_history carries the recent tail
+        if requested_keys is None:
+            state = state.without_prefixes(*LOG_KEY_PREFIXES)
+        
+        return {"state": state.to_dict()}
     except HTTPException:
         raise
     except Exception as e:
@@ -245,69 +196,43 @@ async def get_state(session_id: str, user_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
-    """Process a user message."""
+async def chat(request: ChatRequest, idempotency_key: Optional[str] = Header(None)):
+    """
+    Process a user message.
+    
+    Turns for one session run one at a time. A retry carrying the same idempotency
+    key (body field or Idempotency-Key header) returns the in-flight or cached reply.
+    Under overload the turn is rejected with 429 and a Retry-After header.
+    """
     try:
-        # Check if session exists, if not create it automatically
-        existing_session = await session_service.get_session(
-            app_name=APP_NAME,
-            user_id=request.user_id,
-            session_id=request.session_id
+        return await turn_coordinator.run(
+            (request.user_id, request.session_id),
+            lambda: _run_admitted_chat_turn(request),
+            idempotency_key=request.idempotency_key or idempotency_key,
+            payload=f"{request.language}|{request.message}",
         )
-        
-        if existing_session is None:
+    except IdempotencyConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=e.reason, headers={"Retry-After": e.retry_after_header})
+
+async def _run_admitted_chat_turn(request: ChatRequest) -> ChatResponse:
+    """Run a chat turn once the admission controller grants it a slot (by journey priority)."""
+    state = await read_session_state(
+        session_service, APP_NAME, request.user_id, request.session_id, keys=PRIORITY_STATE_KEYS
+    )
+    async with admission_controller.admit(request.user_id, classify_turn(state)):
+        return await _run_chat_turn(request)
+
+async def _run_chat_turn(request: ChatRequest) -> ChatResponse:
+    """Run one agent turn for a chat request (called with the session's turn lock held)."""
+    try:
+        # Check if session exists, if not create it automatically
+        if not await session_exists(session_service, APP_NAME, request.user_id, request.session_id):
             print(f"Session not found, creating new session: {request.session_id}")
             # Auto-create session with default state
-            customer = get_customer_by_id(request.user_id)
-            if customer:
-                campaign_data = get_campaign_data(request.user_id)
-                offers = get_pre_approved_offer(request.user_id)
-                from mock_data.crm_data import get_kyc_data
-                from mock_data.credit_bureau import get_credit_score
-                
-                kyc_data = get_kyc_data(request.user_id)
-                credit_data = get_credit_score(request.user_id)
-                personalized_opening = get_personalized_opening(
-                    request.user_id,
-                    customer["name"],
-                    campaign_data
-                )
-                
-                initial_state = {
-                    "customer_id": request.user_id,
-                    "customer_name": customer["name"],
-                    "customer_phone": customer.get("phone", "N/A"),
-                    "customer_city": customer["city"],
-                    "customer_salary": customer["monthly_salary"],
-                    "pre_approved_limit": customer["pre_approved_limit"],
-                    "credit_score": customer["credit_score"],
-                    "current_offer": offers.get("offer_1", {}),
-                    "loan_application": {},
-                    "application_status": "NOT_STARTED",
-                    "interaction_history": [],
-                    "campaign_source": campaign_data.get("source", "Direct"),
-                    "customer_intent": campaign_data.get("intent", "GENERAL"),
-                    "urgency_level": campaign_data.get("urgency_level", "MEDIUM"),
-                    "campaign_keyword": campaign_data.get("keyword", "personal loan"),
-                    "customer_type": campaign_data.get("customer_type", "NEW_CUSTOMER"),
-                    "relationship_tenure_years": campaign_data.get("relationship_tenure_years", 0),
-                    "payment_history": campaign_data.get("payment_history", "N/A"),
-                    "current_loans_count": campaign_data.get("current_loans_count", 0),
-                    "previous_interactions_count": campaign_data.get("previous_interactions_count", 0),
-                    "offer_expiry_hours": campaign_data.get("offer_expiry_hours", 120),
-                    "persuasion_strategy": "",
-                    "personalized_opening": personalized_opening,
-                    "objection_handling_context": "",
-                    "sentiment_adaptive_strategy": "",
-                    "history": [],
-                    "kyc_data": {},
-                    "eligibility_evaluation": {},
-                    "sanction_letter": {},
-                    "_prefetched_kyc": kyc_data,
-                    "_prefetched_credit": credit_data,
-                    "_parallel_processing_enabled": True,
-                }
-                
+            initial_state = await bootstrap_session_state(request.user_id)
+            if initial_state:
                 await session_service.create_session(
                     app_name=APP_NAME,
                     user_id=request.user_id,
@@ -316,6 +241,10 @@ async def chat(request: ChatRequest):
                 )
                 print(f"Session created successfully: {request.session_id}")
         
+        # Record the message (objections); sentiment enrichment runs alongside the agent turn
+        enrichment_task = await enrichment.start(request.user_id, request.session_id, request.message)
+        await enrichment.wait(enrichment_task)
+        
         # Create runner
         runner = Runner(
             agent=loan_master_agent,
@@ -378,11 +307,6 @@ async def upload_salary_slip(session_id: str, user_id: str, file: UploadFile = F
         with file_path.open("wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
         
-        # Get session to access tools
-        session = await session_service.get_session(
-            app_name=APP_NAME, user_id=user_id, session_id=session_id
-        )
-        
         # Return file path for agent to process
         return {
             "status": "success",
@@ -397,15 +321,15 @@ async def download_sanction_letter(session_id: str, user_id: str):
     """Download sanction letter PDF."""
     try:
         # Get session state
-        session = await session_service.get_session(
-            app_name=APP_NAME, user_id=user_id, session_id=session_id
+        state = await read_session_state(
+            session_service, APP_NAME, user_id, session_id, keys=("sanction_letter",)
         )
         
-        if session is None:
+        if state is None:
             print(f"ERROR: Session not found for session_id={session_id}, user_id={user_id}")
             raise HTTPException(status_code=404, detail="Session not found")
         
-        sanction_letter = session.state.get("sanction_letter", {})
+        sanction_letter = state.get("sanction_letter", {})
         print(f"DEBUG: sanction_letter data: {sanction_letter}")
         
         pdf_file_path = sanction_letter.get("pdf_file_path")
@@ -426,8 +350,9 @@ async def download_sanction_letter(session_id: str, user_id: str):
                     print(f"SUCCESS: Found PDF file at fallback location: {possible_path}")
                     pdf_file_path = str(possible_path)
                     # Update state for future requests
-                    sanction_letter["pdf_file_path"] = pdf_file_path
-                    session.state["sanction_letter"] = sanction_letter
+                    batch = StateBatch()
+                    batch.merge("sanction_letter", pdf_file_path=pdf_file_path)
+                    await batch.commit(session_service, APP_NAME, user_id, session_id)
                 else:
                     print(f"ERROR: PDF file not found even at fallback location")
                     raise HTTPException(
@@ -467,14 +392,13 @@ async def send_sanction_letter(session_id: str, user_id: str):
     """
     try:
         # Get session state
-        session = await session_service.get_session(
-            app_name=APP_NAME, user_id=user_id, session_id=session_id
+        state = await read_session_state(
+            session_service, APP_NAME, user_id, session_id,
+            keys=("sanction_letter", "customer_email", "customer_id", "customer_name"),
         )
-        if session is None:
+        if state is None:
             raise HTTPException(status_code=404, detail="Session not found")
 
-        state = session.state if hasattr(session, 'state') else {}
-
         sanction_letter = state.get("sanction_letter", {})
         pdf_file_path = sanction_letter.get("pdf_file_path")
         if not pdf_file_path or not Path(pdf_file_path).exists():
@@ -528,9 +452,8 @@ async def send_sanction_letter(session_id: str, user_id: str):
 
 # Admin API Endpoints
 @app.get("/api/admin/customers")
-async def get_admin_customers():
-    """Get all customers for admin panel."""
-    from mock_data.customer_data import CUSTOMERS
+async def get_admin_customers(limit: int = DEFAULT_PAGE_SIZE, offset: int = 0, city: Optional[str] = None):
+    """Get customers for admin panel (paginated, optionally filtered by city)."""
     return [
         {
             "id": customer_data["customer_id"],
@@ -541,17 +464,16 @@ async def get_admin_customers():
             "pre_approved_limit": customer_data["pre_approved_limit"],
             "monthly_salary": customer_data["monthly_salary"],
         }
-        for customer_id, customer_data in CUSTOMERS.items()
+        for customer_data in get_repository().list_customers(limit=limit, offset=offset, city=city)
     ]
 
 @app.get("/api/admin/offers")
-async def get_admin_offers():
-    """Get all offers from offer mart."""
-    from mock_data.offer_mart import LOAN_OFFERS
+async def get_admin_offers(limit: int = DEFAULT_PAGE_SIZE, offset: int = 0):
+    """Get offers from offer mart (paginated)."""
     offers = []
-    for customer_id, offer_data in LOAN_OFFERS.items():
+    for offer_data in get_repository().list_offers(limit=limit, offset=offset):
         offers.append({
-            "customer_id": customer_id,
+            "customer_id": offer_data["customer_id"],
             "amount": offer_data.get("pre_approved_amount", 0),
             "interest_rate": offer_data.get("interest_rate", 0),
             "tenure_options": f"{offer_data.get('max_tenure_months', 0)} months",
@@ -560,37 +482,80 @@ async def get_admin_offers():
     return offers
 
 @app.get("/api/admin/kyc")
-async def get_admin_kyc():
-    """Get all KYC data from CRM."""
-    from mock_data.crm_data import CRM_DATA
+async def get_admin_kyc(limit: int = DEFAULT_PAGE_SIZE, offset: int = 0):
+    """Get KYC data from CRM (paginated)."""
     return [
         {
-            "customer_id": customer_id,
+            "customer_id": kyc_data["customer_id"],
             "name": kyc_data.get("name", "N/A"),
             "pan_number": kyc_data.get("pan_number", "N/A"),
             "aadhar_number": kyc_data.get("aadhar_number", "N/A"),
             "phone_verified": kyc_data.get("phone_verified", False),
             "kyc_status": kyc_data.get("kyc_status", "PENDING"),
         }
-        for customer_id, kyc_data in CRM_DATA.items()
+        for kyc_data in get_repository().list_kyc_records(limit=limit, offset=offset)
     ]
 
 @app.get("/api/admin/credit")
-async def get_admin_credit():
-    """Get all credit scores from credit bureau."""
-    from mock_data.credit_bureau import CREDIT_SCORES
+async def get_admin_credit(limit: int = DEFAULT_PAGE_SIZE, offset: int = 0,
+                           min_score: Optional[int] = None, max_score: Optional[int] = None):
+    """Get credit scores from credit bureau (paginated, optionally within a score range)."""
     return [
         {
-            "customer_id": customer_id,
+            "customer_id": credit_data["customer_id"],
             "credit_score": credit_data.get("credit_score", 0),
             "score_range": credit_data.get("score_range", "N/A"),
             "total_accounts": credit_data.get("credit_history", {}).get("total_accounts", 0),
             "active_accounts": credit_data.get("credit_history", {}).get("active_accounts", 0),
             "payment_history": credit_data.get("credit_history", {}).get("payment_history", "N/A"),
         }
-        for customer_id, credit_data in CREDIT_SCORES.items()
+        for credit_data in get_repository().list_credit_reports(
+            limit=limit, offset=offset, min_score=min_score, max_score=max_score
+        )
     ]
 
+@app.get("/api/admin/memory")
+async def get_admin_memory():
+    """Get live session count and approximate memory held by sessions."""
+    return memory_governor.stats()
+
+@app.get("/api/admin/stats")
+async def get_admin_stats():
+    """Counters of the runtime subsystems, one block per subsystem."""
+    stats = {}
+    stats["llm_gateway"] = llm_gateway.snapshot()
+    stats["model_router"] = model_router.snapshot()
+    stats["sentiment_breaker"] = sentiment_breaker.snapshot()
+    stats["sentiment_batcher"] = sentiment_batcher.snapshot()
+    stats["enrichment"] = enrichment.snapshot()
+    stats["sentiment_tiers"] = sentiment_tier_stats()
+    stats["strategy_table"] = strategy_table.snapshot()
+    stats["turn_coordinator"] = turn_coordinator.snapshot()
+    stats["admission"] = admission_controller.snapshot()
+    stats["kyc_prefetch_cache"] = kyc_prefetch_cache.snapshot()
+    stats["bureau_client"] = bureau_client.snapshot()
+    stats["customer_360"] = customer_360_store.snapshot()
+    stats["data_sources"] = active_sources()
+    stats["reference_data"] = reference_data.current().summary()
+    return stats
+
+@app.get("/api/admin/reference-data")
+async def get_admin_reference_data():
+    """Version, checksum and dataset sizes of the live reference data snapshot."""
+    return reference_data.current().summary()
+
+@app.post("/api/admin/reference-data/reload")
+async def reload_admin_reference_data():
+    """
+    Rebuild reference data from REFERENCE_DATA_PATH and swap it in.
+    Sessions in flight keep working; new sessions use the new version.
+    """
+    try:
+        snapshot = await asyncio.to_thread(reference_data.reload)
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Reference data not reloaded: {e}")
+    return snapshot.summary()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
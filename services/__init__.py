@@ -0,0 +1,45 @@
+# Services Module for BFSI Loan Chatbot
+# Runtime infrastructure shared by the CLI (main.py) and the API server (server.py)
+
+from .admission_control import AdmissionController, AdmissionRejected, classify_turn
+from .bureau_client import BureauClient, bureau_client
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .customer_360 import Customer360, customer_360_store, get_customer_360
+from .event_log import event_count, get_events, iter_events, log_event
+from .lru_cache import LRUCache
+from .memory_governor import MemoryGovernor
+from .micro_batcher import MicroBatcher
+from .prefetch_cache import PrefetchCache, kyc_prefetch_cache
+from .session_bootstrap import bootstrap_session_state, invalidate_base_state
+from .session_state import StateBatch, StateView, read_session_state, session_exists
+from .turn_coordinator import IdempotencyConflict, TurnCoordinator
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionRejected",
+    "classify_turn",
+    "BureauClient",
+    "bureau_client",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "Customer360",
+    "customer_360_store",
+    "get_customer_360",
+    "event_count",
+    "get_events",
+    "iter_events",
+    "log_event",
+    "LRUCache",
+    "MemoryGovernor",
+    "MicroBatcher",
+    "PrefetchCache",
+    "kyc_prefetch_cache",
+    "IdempotencyConflict",
+    "bootstrap_session_state",
+    "invalidate_base_state",
+    "StateBatch",
+    "StateView",
+    "read_session_state",
+    "session_exists",
+    "TurnCoordinator",
+]
@@ -0,0 +1,297 @@
+"""
+Admission Control
+Bounds how many LLM-bound chat turns run at once. Turns beyond the limit wait
+in a bounded queue and are scheduled by priority class: weighted fair queuing
+between classes (near-conversion and urgent journeys get most of the freed
+slots), round-robin between users within a class, and aging so no turn
+starves. When the queue is full (or a turn has waited too long) the turn is
+rejected with a Retry-After estimate instead of joining an ever-growing
+backlog, which keeps tail latency of admitted turns predictable.
+
+Environment:
+- ADMISSION_MAX_INFLIGHT=8            turns running agent/LLM work at once
+- ADMISSION_MAX_QUEUE=64              turns allowed to wait; beyond this new turns are rejected
+- ADMISSION_MAX_QUEUE_PER_USER=2      waiting turns allowed per user
+- ADMISSION_MAX_WAIT_SECONDS=30       a waiting turn is rejected after this long
+- ADMISSION_AGING_SECONDS=5           a turn waiting this long is served next regardless of class
+"""
+
+import asyncio
+import math
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict, Hashable, Mapping, Optional, Tuple
+
+from .metrics import latency_ms
+
+DEFAULT_MAX_INFLIGHT = int(os.getenv("ADMISSION_MAX_INFLIGHT", "8"))
+DEFAULT_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "64"))
+DEFAULT_MAX_QUEUE_PER_USER = int(os.getenv("ADMISSION_MAX_QUEUE_PER_USER", "2"))
+DEFAULT_MAX_WAIT_SECONDS = float(os.getenv("ADMISSION_MAX_WAIT_SECONDS", "30"))
+DEFAULT_AGING_SECONDS = float(os.getenv("ADMISSION_AGING_SECONDS", "5"))
+
+# Priority classes and their share of freed slots when all are backlogged
+PRIORITY_WEIGHTS: Dict[str, int] = {
+    "closing": 8,       # approved, sanction letter pending or awaiting acceptance
+    "urgent": 4,        # HIGH-urgency campaign or offer expiring within a day
+    "in_progress": 2,   # application initiated / KYC done
+    "standard": 1,      # browsing, finished or rejected journeys
+}
+DEFAULT_PRIORITY = "standard"
+
+# Offers expiring within this many hours make a journey urgent
+URGENT_OFFER_EXPIRY_HOURS = 24
+
+# Session state keys classify_turn() reads
+PRIORITY_STATE_KEYS = ("application_status", "urgency_level", "offer_expiry_hours")
+
+# Recent samples kept per class for percentiles
+WAIT_SAMPLES = 1024
+
+# Smoothing for the running average turn duration used in Retry-After estimates
+DURATION_EWMA_ALPHA = 0.2
+
+Waiter = Tuple[asyncio.Future, float]
+
+
+class AdmissionRejected(Exception):
+    """A turn was not admitted; the client should retry after retry_after seconds."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+def classify_turn(state: Optional[Mapping[str, Any]]) -> str:
+    """
+    Priority class of a chat turn from its session state.
+
+    Args:
+        state: Session state (or a projection with PRIORITY_STATE_KEYS); None for a new session
+
+    Returns:
+        str: One of PRIORITY_WEIGHTS
+    """
+    if not state:
+        return DEFAULT_PRIORITY
+    status = state.get("application_status", "NOT_STARTED")
+    if status in ("APPROVED", "SANCTION_GENERATED"):
+        return "closing"
+    if status in ("REJECTED", "SANCTION_ACCEPTED"):
+        return "standard"
+    expiry = state.get("offer_expiry_hours")
+    if state.get("urgency_level") == "HIGH" or (expiry is not None and expiry <= URGENT_OFFER_EXPIRY_HOURS):
+        return "urgent"
+    if status in ("INITIATED", "KYC_VERIFIED"):
+        return "in_progress"
+    return DEFAULT_PRIORITY
+
+
+class AdmissionController:
+    """
+    Bounded, prioritized, per-user fair admission of turns.
+
+    - Up to max_inflight turns hold a slot at once.
+    - Waiting turns queue per priority class, and per user within a class.
+      A freed slot goes to the class with the lowest stride pass (each
+      dispatch advances a class by 1/weight), then to the next user of that
+      class in round-robin order.
+    - Aging: if the oldest waiting turn has waited aging_seconds, it is
+      served next whatever its class.
+    - A turn is rejected immediately when the queue is at max_queue or its
+      user already has max_queue_per_user waiting, and rejected after
+      max_wait_seconds if it is still queued.
+
+    Use from the event loop only: `async with controller.admit(user_id, priority): ...`
+    """
+
+    def __init__(
+        self,
+        max_inflight: int = DEFAULT_MAX_INFLIGHT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_queue_per_user: int = DEFAULT_MAX_QUEUE_PER_USER,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+        aging_seconds: float = DEFAULT_AGING_SECONDS,
+        weights: Optional[Dict[str, int]] = None,
+    ):
+        self.max_inflight = max_inflight
+        self.max_queue = max_queue
+        self.max_queue_per_user = max_queue_per_user
+        self.max_wait_seconds = max_wait_seconds
+        self.aging_seconds = aging_seconds
+        self.weights = dict(weights or PRIORITY_WEIGHTS)
+        self._inflight = 0
+        self._queued = 0
+        self._queues: Dict[str, "OrderedDict[Hashable, Deque[Waiter]]"] = {cls: OrderedDict() for cls in self.weights}
+        self._pass: Dict[str, float] = {cls: 0.0 for cls in self.weights}
+        self._virtual_time = 0.0
+        self._avg_turn_seconds = 5.0
+        self.stats = {"admitted": 0, "queued": 0, "rejected_queue_full": 0,
+                      "rejected_user_limit": 0, "rejected_timeout": 0, "aged_dispatches": 0}
+        self._class_stats = {
+            cls: {"admitted": 0, "rejected": 0, "waits": deque(maxlen=WAIT_SAMPLES), "turns": deque(maxlen=WAIT_SAMPLES)}
+            for cls in self.weights
+        }
+
+    def retry_after(self) -> float:
+        """Rough time until a newly queued turn would run."""
+        return (self._queued + 1) / max(1, self.max_inflight) * self._avg_turn_seconds
+
+    def _reject(self, priority: str, stat: str, reason: str):
+        self.stats[stat] += 1
+        self._class_stats[priority]["rejected"] += 1
+        raise AdmissionRejected(reason, self.retry_after())
+
+    def _oldest_class(self) -> Optional[str]:
+        """Class holding the longest-waiting turn, if it has waited past aging_seconds."""
+        oldest_cls, oldest_at = None, time.monotonic() - self.aging_seconds
+        for cls, users in self._queues.items():
+            for waiters in users.values():
+                queued_at = waiters[0][1]
+                if queued_at <= oldest_at:
+                    oldest_cls, oldest_at = cls, queued_at
+        return oldest_cls
+
+    def _next_class(self) -> Tuple[str, bool]:
+        """Class to serve next, and whether it was picked by aging."""
+        aged = self._oldest_class()
+        if aged is not None:
+            return aged, True
+        backlogged = [cls for cls, users in self._queues.items() if users]
+        return min(backlogged, key=lambda cls: (self._pass[cls], -self.weights[cls])), False
+
+    def _pop_waiter(self, cls: str, aged: bool) -> Waiter:
+        users = self._queues[cls]
+        if aged:
+            user_key = min(users, key=lambda key: users[key][0][1])
+        else:
+            user_key = next(iter(users))
+        waiters = users[user_key]
+        waiter = waiters.popleft()
+        if waiters:
+            users.move_to_end(user_key)
+        else:
+            del users[user_key]
+        return waiter
+
+    def _dispatch(self):
+        """Hand free slots to queued turns in priority/fairness order."""
+        while self._inflight < self.max_inflight and self._queued:
+            cls, aged = self._next_class()
+            if aged:
+                self.stats["aged_dispatches"] += 1
+            future, _ = self._pop_waiter(cls, aged)
+            self._queued -= 1
+            self._virtual_time = self._pass[cls]
+            self._pass[cls] += 1.0 / self.weights[cls]
+            if not future.done():
+                self._inflight += 1
+                future.set_result(None)
+
+    def _remove_waiter(self, priority: str, user_key: Hashable, waiter: Waiter) -> bool:
+        users = self._queues[priority]
+        waiters = users.get(user_key)
+        if waiters is None or waiter not in waiters:
+            return False
+        waiters.remove(waiter)
+        if not waiters:
+            del users[user_key]
+        self._queued -= 1
+        return True
+
+    async def _acquire(self, user_key: Hashable, priority: str):
+        if self._inflight < self.max_inflight and not self._queued:
+            self._inflight += 1
+            self._class_stats[priority]["waits"].append(0.0)
+            return
+        if self._queued >= self.max_queue:
+            self._reject(priority, "rejected_queue_full", "Server busy: too many queued requests")
+        users = self._queues[priority]
+        queued_for_user = sum(len(classes.get(user_key, ())) for classes in self._queues.values())
+        if queued_for_user >= self.max_queue_per_user:
+            self._reject(priority, "rejected_user_limit", "Too many pending requests for this user")
+
+        if not users:
+            # A class returning from idle does not get credit for the time it was idle
+            self._pass[priority] = max(self._pass[priority], self._virtual_time)
+        future = asyncio.get_running_loop().create_future()
+        queued_at = time.monotonic()
+        waiter = (future, queued_at)
+        users.setdefault(user_key, deque()).append(waiter)
+        self._queued += 1
+        self.stats["queued"] += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=self.max_wait_seconds)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if not self._remove_waiter(priority, user_key, waiter):
+                # The slot was handed over as the wait ended; give it back
+                self._release()
+            if isinstance(e, asyncio.TimeoutError):
+                self._reject(priority, "rejected_timeout", "Request waited too long in the queue")
+            raise
+        self._class_stats[priority]["waits"].append(time.monotonic() - queued_at)
+
+    def _release(self):
+        self._inflight -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def admit(self, user_key: Hashable, priority: str = DEFAULT_PRIORITY):
+        """
+        Hold a turn slot for the duration of the block.
+
+        Args:
+            user_key: Fairness key (the user ID)
+            priority: Priority class (see classify_turn); unknown classes are treated as standard
+
+        Raises:
+            AdmissionRejected: If the turn was not admitted
+        """
+        if priority not in self.weights:
+            priority = DEFAULT_PRIORITY
+        requested = time.monotonic()
+        await self._acquire(user_key, priority)
+        self.stats["admitted"] += 1
+        self._class_stats[priority]["admitted"] += 1
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            finished = time.monotonic()
+            self._avg_turn_seconds += DURATION_EWMA_ALPHA * (finished - started - self._avg_turn_seconds)
+            self._class_stats[priority]["turns"].append(finished - requested)
+            self._release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters, current load and per-class queue-wait / turn latency percentiles (ms)."""
+        all_waits = []
+        classes = {}
+        for cls, stats in self._class_stats.items():
+            waits = list(stats["waits"])
+            all_waits.extend(waits)
+            classes[cls] = {
+                "weight": self.weights[cls],
+                "admitted": stats["admitted"],
+                "rejected": stats["rejected"],
+                "queued": sum(len(waiters) for waiters in self._queues[cls].values()),
+                "queue_wait_ms": latency_ms(waits),
+                "turn_latency_ms": latency_ms(list(stats["turns"])),
+            }
+        return {
+            **self.stats,
+            "inflight": self._inflight,
+            "queue_depth": self._queued,
+            "queued_users": len({user for users in self._queues.values() for user in users}),
+            "max_inflight": self.max_inflight,
+            "max_queue": self.max_queue,
+            "avg_turn_seconds": round(self._avg_turn_seconds, 3),
+            "queue_wait_ms": latency_ms(all_waits),
+            "classes": classes,
+        }
@@ -0,0 +1,215 @@
+"""
+Credit Bureau Client
+Caching client in front of the credit bureau API: bounded LRU+TTL cache keyed
+by customer ID and PAN, coalescing of concurrent identical lookups,
+stale-while-revalidate refresh and hit-rate metrics. Usable from sync tools
+and async code alike; every bureau lookup in the app goes through it.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .data_sources import get_credit_score, get_credit_score_by_pan
+from .lru_cache import LRUCache
+
+# Reports younger than this are served from cache
+BUREAU_TTL_SECONDS = 900
+
+# Past the TTL, reports are still served for this long while a refresh runs in the background
+BUREAU_STALE_SECONDS = 3600
+
+# Cache entries (one per customer ID and one per PAN)
+BUREAU_CACHE_SIZE = 10000
+
+# Worker threads for bureau calls and background refreshes
+BUREAU_MAX_WORKERS = 8
+
+CacheKey = Tuple[str, str]
+
+
+class BureauClient:
+    """
+    Cached, coalescing access to credit bureau reports.
+
+    - Fresh hit: returned from cache
+    - Stale hit (within the stale window): returned from cache, refresh scheduled
+    - Miss: one bureau call per key, shared by every concurrent caller
+
+    Only successful reports are cached. Cached reports are shared and must be
+    treated as read-only.
+    """
+
+    def __init__(
+        self,
+        fetch_by_id: Callable[[str], dict] = get_credit_score,
+        fetch_by_pan: Callable[[str], dict] = get_credit_score_by_pan,
+        ttl_seconds: int = BUREAU_TTL_SECONDS,
+        stale_seconds: int = BUREAU_STALE_SECONDS,
+        maxsize: int = BUREAU_CACHE_SIZE,
+        max_workers: int = BUREAU_MAX_WORKERS,
+    ):
+        self.fetch_by_id = fetch_by_id
+        self.fetch_by_pan = fetch_by_pan
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._cache = LRUCache(maxsize=maxsize)
+        self._inflight: Dict[CacheKey, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bureau")
+        self._versions = itertools.count(1)
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "bureau_calls": 0,
+            "refreshes": 0,
+            "errors": 0,
+        }
+
+    # ------------------------------------------------------------------ cache
+
+    def _entry(self, key: CacheKey) -> Tuple[Optional[Tuple[dict, float, int]], str]:
+        """Return (entry, freshness) where freshness is 'fresh', 'stale' or 'missing'."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None, "missing"
+            age = time.monotonic() - entry[1]
+            if age <= self.ttl_seconds:
+                return entry, "fresh"
+            if age <= self.ttl_seconds + self.stale_seconds:
+                return entry, "stale"
+            self._cache.pop(key)
+            return None, "missing"
+
+    def _store(self, key: CacheKey, report: dict):
+        entry = (report, time.monotonic(), next(self._versions))
+        with self._lock:
+            self._cache.put(key, entry)
+            # A report fetched by PAN also answers lookups by customer ID
+            if key[0] == "pan" and report.get("customer_id"):
+                self._cache.put(("id", report["customer_id"]), entry)
+
+    # ---------------------------------------------------------------- loading
+
+    def _load(self, key: CacheKey, fetch: Callable[[str], dict]) -> dict:
+        try:
+            report = fetch(key[1])
+            with self._lock:
+                self.stats["bureau_calls"] += 1
+            if report.get("status") == "success":
+                self._store(key, report)
+            return report
+        except Exception:
+            with self._lock:
+                self.stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _submit(self, key: CacheKey, fetch: Callable[[str], dict]) -> Future:
+        """Start a bureau call for a key, or join the one already running."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.stats["coalesced"] += 1
+                return future
+            # Registered under the lock; _load's cleanup also takes it, so it cannot run first
+            future = self._executor.submit(self._load, key, fetch)
+            self._inflight[key] = future
+            return future
+
+    def _resolve(self, key: CacheKey, fetch: Callable[[str], dict]) -> Tuple[Optional[dict], Optional[Future]]:
+        """Serve from cache when possible; otherwise return the future to wait on."""
+        entry, freshness = self._entry(key)
+        with self._lock:
+            if freshness == "fresh":
+                self.stats["hits"] += 1
+            elif freshness == "stale":
+                self.stats["stale_hits"] += 1
+                self.stats["refreshes"] += 1
+            else:
+                self.stats["misses"] += 1
+
+        if freshness == "fresh":
+            return entry[0], None
+        if freshness == "stale":
+            self._submit(key, fetch)  # background refresh, not awaited
+            return entry[0], None
+        return None, self._submit(key, fetch)
+
+    def _lookup(self, key: CacheKey, fetch: Callable[[str], dict]) -> dict:
+        report, future = self._resolve(key, fetch)
+        return report if future is None else future.result()
+
+    async def _alookup(self, key: CacheKey, fetch: Callable[[str], dict]) -> dict:
+        report, future = self._resolve(key, fetch)
+        if future is None:
+            return report
+        # Shielded so a caller's timeout does not cancel the shared call
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    # ------------------------------------------------------------- public API
+
+    def get_credit_score(self, customer_id: str) -> dict:
+        """Credit report by customer ID (same result shape as the bureau API)."""
+        return self._lookup(("id", customer_id), self.fetch_by_id)
+
+    def get_credit_score_by_pan(self, pan_number: str) -> dict:
+        """Credit report by PAN (same result shape as the bureau API)."""
+        return self._lookup(("pan", pan_number), self.fetch_by_pan)
+
+    async def aget_credit_score(self, customer_id: str) -> dict:
+        return await self._alookup(("id", customer_id), self.fetch_by_id)
+
+    async def aget_credit_score_by_pan(self, pan_number: str) -> dict:
+        return await self._alookup(("pan", pan_number), self.fetch_by_pan)
+
+    def peek(self, customer_id: str) -> Optional[dict]:
+        """Cached report for a customer (fresh or stale), without calling the bureau."""
+        entry, freshness = self._entry(("id", customer_id))
+        return entry[0] if entry else None
+
+    def version(self, customer_id: str) -> Optional[int]:
+        """Version of the cached report for a customer, or None."""
+        entry, _ = self._entry(("id", customer_id))
+        return entry[2] if entry else None
+
+    async def prefetch(self, customer_id: str) -> Optional[int]:
+        """
+        Warm the cache for a customer.
+
+        Returns:
+            int: Version of the cached report, or None if the bureau has no report
+        """
+        report = await self.aget_credit_score(customer_id)
+        return self.version(customer_id) if report.get("status") == "success" else None
+
+    def invalidate(self, customer_id: Optional[str] = None):
+        """Drop one customer's cached report (by ID), or the whole cache."""
+        with self._lock:
+            if customer_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(("id", customer_id))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters plus cache size and hit rate (fresh + stale hits over all lookups)."""
+        with self._lock:
+            stats = dict(self.stats)
+            entries = len(self._cache)
+            inflight = len(self._inflight)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["stale_hits"]) / lookups, 4) if lookups else 0.0
+        stats["entries"] = entries
+        stats["inflight"] = inflight
+        return stats
+
+
+bureau_client = BureauClient()
@@ -0,0 +1,206 @@
+"""
+Circuit Breaker
+Stops calling a dependency that keeps failing or answering slowly. After
+`failure_threshold` consecutive failures or slow calls the breaker opens and
+calls are refused immediately (CircuitOpenError) so the caller can serve its
+local fallback. After `cooldown_seconds` it goes half-open and lets a trickle
+of probe calls through: a healthy probe closes it, a bad one re-opens it.
+
+Environment:
+- LLM_BREAKER_FAILURES=3            consecutive failed/slow calls before opening
+- LLM_BREAKER_SLOW_SECONDS=5        a successful call slower than this counts as a failure
+- LLM_BREAKER_COOLDOWN_SECONDS=30   time open before probing
+- LLM_BREAKER_HALF_OPEN_PROBES=1    probe calls allowed in flight while half-open
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional
+
+DEFAULT_FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURES", "3"))
+DEFAULT_SLOW_CALL_SECONDS = float(os.getenv("LLM_BREAKER_SLOW_SECONDS", "5"))
+DEFAULT_COOLDOWN_SECONDS = float(os.getenv("LLM_BREAKER_COOLDOWN_SECONDS", "30"))
+DEFAULT_HALF_OPEN_PROBES = int(os.getenv("LLM_BREAKER_HALF_OPEN_PROBES", "1"))
+
+CLOSED = "CLOSED"
+OPEN = "OPEN"
+HALF_OPEN = "HALF_OPEN"
+
+# Numeric state for dashboards/alerts
+STATE_CODES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the dependency while the breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"circuit '{name}' is open (next probe in {retry_in:.1f}s)")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class Permit(NamedTuple):
+    """Admission of one call: whether it holds a half-open probe slot, and the breaker epoch it started in."""
+    probe: bool
+    epoch: int
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker, usable from threads and event loops.
+
+    Wrap calls with call() / acall(), or use allow() + record_success() /
+    record_failure() / record_cancelled() directly, passing back the permit
+    allow() returned. Only probe results move a half-open breaker, and results
+    of calls admitted before the breaker last opened are ignored.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 slow_call_seconds: float = DEFAULT_SLOW_CALL_SECONDS,
+                 cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+                 half_open_probes: int = DEFAULT_HALF_OPEN_PROBES):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_probes = half_open_probes
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._epoch = 0  # bumped every time the breaker opens
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "successes": 0, "failures": 0, "slow_calls": 0,
+                      "short_circuited": 0, "probes": 0, "opened": 0}
+
+    def _transition_locked(self, state: str):
+        if state == self.state:
+            return
+        print(f"🔌 Circuit '{self.name}': {self.state} -> {state}")
+        self.state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            self._epoch += 1
+            self._probes_in_flight = 0  # probes of the old epoch are settled as stale
+            self.stats["opened"] += 1
+        if state == CLOSED:
+            self.consecutive_failures = 0
+
+    def allow(self) -> Optional[Permit]:
+        """
+        Admit a call now, or return None if it must be refused.
+
+        A probe permit (half-open) reserves a probe slot, which the record_*
+        call for the same permit releases.
+        """
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.cooldown_seconds:
+                self._transition_locked(HALF_OPEN)
+            if self.state == CLOSED:
+                self.stats["calls"] += 1
+                return Permit(probe=False, epoch=self._epoch)
+            if self.state == HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                self.stats["calls"] += 1
+                self.stats["probes"] += 1
+                return Permit(probe=True, epoch=self._epoch)
+            self.stats["short_circuited"] += 1
+            return None
+
+    def _settle_locked(self, permit: Permit) -> bool:
+        """Release the permit's probe slot; whether its result may change the state."""
+        if permit.epoch != self._epoch:
+            return False  # admitted before the breaker (re)opened: stale news
+        if permit.probe:
+            self._probes_in_flight -= 1
+        return True
+
+    def record_success(self, permit: Permit, duration: float = 0.0):
+        """A call completed; one slower than slow_call_seconds counts as a failure."""
+        if duration > self.slow_call_seconds:
+            with self._lock:
+                self.stats["slow_calls"] += 1
+            self.record_failure(permit, count_as_error=False)
+            return
+        with self._lock:
+            self.stats["successes"] += 1
+            if self._settle_locked(permit):
+                self.consecutive_failures = 0
+                if permit.probe:
+                    self._transition_locked(CLOSED)
+
+    def record_failure(self, permit: Permit, count_as_error: bool = True):
+        with self._lock:
+            if count_as_error:
+                self.stats["failures"] += 1
+            if not self._settle_locked(permit):
+                return
+            self.consecutive_failures += 1
+            if (permit.probe and self.state == HALF_OPEN) or self.consecutive_failures >= self.failure_threshold:
+                self._transition_locked(OPEN)
+
+    def record_cancelled(self, permit: Permit):
+        """The call was abandoned before it finished; says nothing about health."""
+        with self._lock:
+            self._settle_locked(permit)
+
+    def _refuse(self):
+        with self._lock:
+            retry_in = max(0.0, self.cooldown_seconds - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(self.name, retry_in)
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) through the breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker is open (fn is not called)
+        """
+        permit = self.allow()
+        if permit is None:
+            self._refuse()
+        started = time.monotonic()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                self.record_failure(permit)
+            else:
+                self.record_cancelled(permit)
+            raise
+        self.record_success(permit, time.monotonic() - started)
+        return result
+
+    async def acall(self, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """call() for coroutine functions; a cancelled call does not count against the breaker."""
+        permit = self.allow()
+        if permit is None:
+            self._refuse()
+        started = time.monotonic()
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            self.record_cancelled(permit)
+            raise
+        except Exception:
+            self.record_failure(permit)
+            raise
+        self.record_success(permit, time.monotonic() - started)
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.cooldown_seconds:
+                self._transition_locked(HALF_OPEN)
+            return {
+                "state": self.state,
+                "state_code": STATE_CODES[self.state],
+                "consecutive_failures": self.consecutive_failures,
+                "probes_in_flight": self._probes_in_flight,
+                **self.stats,
+                "failure_threshold": self.failure_threshold,
+                "slow_call_seconds": self.slow_call_seconds,
+                "cooldown_seconds": self.cooldown_seconds,
+            }
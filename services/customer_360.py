@@ -0,0 +1,239 @@
+"""
+Customer 360 View
+One immutable, slot-based record per customer joining the profile, pre-approved
+offer, credit bureau report, CRM (KYC) record and campaign journey. Built once
+per customer and data version, then shared by every agent tool, so a loan
+journey reads typed fields instead of repeating (and re-allocating) the same
+five lookups on every turn. Agent tools run on the event loop and must use
+aget_customer_360(), which never blocks it.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from mock_data.campaign_data import get_campaign_data
+from mock_data.reference_data import current as current_reference_data, freeze, thaw
+from mock_data.repository import get_repository
+
+from . import data_sources
+from .bureau_client import bureau_client
+from .lru_cache import LRUCache
+from .prefetch_cache import kyc_prefetch_cache
+
+# Views kept in memory
+CUSTOMER_360_CACHE_SIZE = 4096
+
+DataVersion = Tuple[int, int, Optional[int], Optional[int], int]
+
+
+class Customer360:
+    """
+    Immutable joined view of one customer.
+
+    Profile fields are plain attributes. offer, credit_report, kyc and campaign
+    are read-only mappings (None when the source had no record); profile is
+    the whole customer record as a read-only mapping. credit_score is the
+    bureau score when a report is available, else the score on the profile.
+    """
+
+    __slots__ = (
+        "customer_id", "name", "age", "city", "phone", "email", "pan_number", "aadhar_number",
+        "occupation", "employer", "monthly_salary", "employment_type", "years_with_current_employer",
+        "total_work_experience", "current_loans", "credit_score", "pre_approved_limit",
+        "account_number", "bank_name", "profile", "offer", "credit_report", "kyc", "campaign",
+        "complete", "data_version", "built_at",
+    )
+
+    def __init__(self, customer: dict, offer: Optional[dict], credit_report: Optional[dict],
+                 kyc: Optional[dict], campaign: Optional[dict], complete: bool, data_version: DataVersion):
+        fields = {
+            "customer_id": customer["customer_id"],
+            "name": customer["name"],
+            "age": customer.get("age"),
+            "city": customer.get("city"),
+            "phone": customer.get("phone"),
+            "email": customer.get("email"),
+            "pan_number": customer.get("pan_number"),
+            "aadhar_number": customer.get("aadhar_number"),
+            "occupation": customer.get("occupation"),
+            "employer": customer.get("employer"),
+            "monthly_salary": customer["monthly_salary"],
+            "employment_type": customer.get("employment_type", "SALARIED"),
+            "years_with_current_employer": customer.get("years_with_current_employer", 0),
+            "total_work_experience": customer.get("total_work_experience", 0),
+            "current_loans": freeze(customer.get("current_loans", [])),
+            "credit_score": credit_report["credit_score"] if credit_report else customer.get("credit_score"),
+            "pre_approved_limit": customer.get("pre_approved_limit", 0),
+            "account_number": customer.get("account_number"),
+            "bank_name": customer.get("bank_name"),
+            "profile": freeze(customer),
+            "offer": freeze(offer) if offer else None,
+            "credit_report": freeze(credit_report) if credit_report else None,
+            "kyc": freeze(kyc) if kyc else None,
+            "campaign": freeze(campaign) if campaign else None,
+            "complete": complete,
+            "data_version": data_version,
+            "built_at": time.time(),
+        }
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Customer360 is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Customer360 is immutable")
+
+    def __repr__(self):
+        return f"Customer360({self.customer_id!r}, version={self.data_version})"
+
+    def offer_result(self) -> dict:
+        """The offer in get_pre_approved_offer()'s result shape (mutable copy)."""
+        if self.offer is None:
+            return {"status": "error", "message": "No pre-approved offer found for this customer"}
+        return {"status": "success", "offer": thaw(self.offer)}
+
+
+class Customer360Store:
+    """
+    Builds and caches Customer360 views.
+
+    A cached view is reused while its data version matches: the repository's
+    data_version, the versions of the customer's cached bureau report and CRM
+    record, and the reference data snapshot (campaign catalog). A refresh of
+    any of them produces a new view on next access.
+    Views with a missing source (lookup error) are returned but not cached.
+    """
+
+    def __init__(self, maxsize: int = CUSTOMER_360_CACHE_SIZE):
+        self._views = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "builds": 0, "incomplete": 0}
+
+    @staticmethod
+    def _data_version(customer_id: str) -> DataVersion:
+        repository = get_repository()
+        return (
+            id(repository),
+            repository.data_version,
+            bureau_client.version(customer_id),
+            kyc_prefetch_cache.version(customer_id),
+            current_reference_data().version,
+        )
+
+    def _build(self, customer_id: str) -> Optional[Customer360]:
+        customer = get_repository().get_customer(customer_id)
+        if customer is None:
+            return None
+
+        results = {}
+        for source, lookup in (
+            ("offer", lambda: data_sources.get_pre_approved_offer(customer_id)),
+            ("bureau", lambda: bureau_client.get_credit_score(customer_id)),
+            ("CRM", lambda: kyc_prefetch_cache.peek(customer_id) or data_sources.get_kyc_data(customer_id)),
+        ):
+            try:
+                results[source] = lookup()
+            except Exception as e:
+                results[source] = e
+        return self._assemble(customer_id, customer, results)
+
+    async def _abuild(self, customer_id: str) -> Optional[Customer360]:
+        customer = get_repository().get_customer(customer_id)
+        if customer is None:
+            return None
+
+        # The three lookups run concurrently, off the event loop thread
+        offer, credit, kyc = await asyncio.gather(
+            asyncio.to_thread(data_sources.get_pre_approved_offer, customer_id),
+            bureau_client.aget_credit_score(customer_id),
+            kyc_prefetch_cache.get(customer_id),
+            return_exceptions=True,
+        )
+        return self._assemble(customer_id, customer, {"offer": offer, "bureau": credit, "CRM": kyc})
+
+    def _assemble(self, customer_id: str, customer: dict, results: Dict[str, Any]) -> Customer360:
+        """Join lookup results (or the exceptions they raised) into a view."""
+        complete = True
+        for source, result in results.items():
+            if isinstance(result, Exception):
+                print(f"⚠️ Customer 360: {source} lookup failed for {customer_id}: {result}")
+                results[source], complete = None, False
+
+        offer_result, credit_result = results["offer"], results["bureau"]
+        offer = offer_result["offer"] if offer_result and offer_result.get("status") == "success" else None
+        credit_report = credit_result if credit_result and credit_result.get("status") == "success" else None
+        campaign = get_campaign_data(customer_id)
+
+        # Versions are read after the lookups, which may have just populated the caches
+        return Customer360(customer, offer, credit_report, results["CRM"], campaign, complete,
+                           self._data_version(customer_id))
+
+    def _cached(self, customer_id: str) -> Optional[Customer360]:
+        with self._lock:
+            view = self._views.get(customer_id)
+        if view is not None and view.data_version == self._data_version(customer_id):
+            with self._lock:
+                self.stats["hits"] += 1
+            return view
+        return None
+
+    def _remember(self, customer_id: str, view: Optional[Customer360]):
+        with self._lock:
+            self.stats["builds"] += 1
+            if view is None:
+                self._views.pop(customer_id)
+            elif view.complete:
+                self._views.put(customer_id, view)
+            else:
+                self.stats["incomplete"] += 1
+
+    def get(self, customer_id: str) -> Optional[Customer360]:
+        """
+        Current view of a customer, building it if missing or out of date.
+
+        Blocks on the source lookups; use aget() on the event loop.
+
+        Returns:
+            Customer360: Shared, immutable view, or None if the customer does not exist
+        """
+        view = self._cached(customer_id)
+        if view is None:
+            view = self._build(customer_id)
+            self._remember(customer_id, view)
+        return view
+
+    async def aget(self, customer_id: str) -> Optional[Customer360]:
+        """Async get(): lookups run concurrently without blocking the event loop."""
+        view = self._cached(customer_id)
+        if view is None:
+            view = await self._abuild(customer_id)
+            self._remember(customer_id, view)
+        return view
+
+    def invalidate(self, customer_id: Optional[str] = None):
+        """Drop one customer's view, or all views."""
+        with self._lock:
+            if customer_id is None:
+                self._views.clear()
+            else:
+                self._views.pop(customer_id)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "entries": len(self._views)}
+
+
+customer_360_store = Customer360Store()
+
+
+def get_customer_360(customer_id: str) -> Optional[Customer360]:
+    """Shared Customer360 view for a customer (see Customer360Store.get); blocking."""
+    return customer_360_store.get(customer_id)
+
+
+async def aget_customer_360(customer_id: str) -> Optional[Customer360]:
+    """Shared Customer360 view for a customer, without blocking the event loop (for agent tools)."""
+    return await customer_360_store.aget(customer_id)
@@ -0,0 +1,91 @@
+"""
+Data Source Registry
+The CRM, credit bureau and offer mart lookups used by the runtime services
+(session bootstrap, prefetch cache, bureau client). Defaults to the mock
+lookups; can be switched to latency/fault-injecting stand-ins, in-process or
+over HTTP, for benchmarking.
+
+Environment:
+- STANDIN_PROFILE=realistic|degraded|instant  use in-process stand-ins
+- STANDIN_URL=http://127.0.0.1:8100           use stand-ins served over HTTP
+"""
+
+import os
+from typing import Callable, Dict, Optional
+
+from mock_data.credit_bureau import get_credit_score as _mock_get_credit_score
+from mock_data.credit_bureau import get_credit_score_by_pan as _mock_get_credit_score_by_pan
+from mock_data.crm_data import get_kyc_data as _mock_get_kyc_data
+from mock_data.offer_mart import get_pre_approved_offer as _mock_get_pre_approved_offer
+
+_MOCK_SOURCES: Dict[str, Callable] = {
+    "get_kyc_data": _mock_get_kyc_data,
+    "get_credit_score": _mock_get_credit_score,
+    "get_credit_score_by_pan": _mock_get_credit_score_by_pan,
+    "get_pre_approved_offer": _mock_get_pre_approved_offer,
+}
+
+_sources: Dict[str, Callable] = dict(_MOCK_SOURCES)
+_active = "mock"
+
+
+def get_kyc_data(customer_id: str) -> Optional[dict]:
+    """CRM KYC record for a customer."""
+    return _sources["get_kyc_data"](customer_id)
+
+
+def get_credit_score(customer_id: str) -> dict:
+    """Credit bureau report by customer ID."""
+    return _sources["get_credit_score"](customer_id)
+
+
+def get_credit_score_by_pan(pan_number: str) -> dict:
+    """Credit bureau report by PAN."""
+    return _sources["get_credit_score_by_pan"](pan_number)
+
+
+def get_pre_approved_offer(customer_id: str) -> dict:
+    """Offer mart lookup for a customer."""
+    return _sources["get_pre_approved_offer"](customer_id)
+
+
+def use_standins(services: Dict[str, object], label: str = "standin"):
+    """
+    Route lookups through stand-in services.
+
+    Args:
+        services: Output of build_standins() or build_http_clients()
+        label: Name reported by active_sources()
+    """
+    global _active
+    _sources.update({
+        "get_kyc_data": services["crm"].get_kyc_data,
+        "get_credit_score": services["bureau"].get_credit_score,
+        "get_credit_score_by_pan": services["bureau"].get_credit_score_by_pan,
+        "get_pre_approved_offer": services["offers"].get_pre_approved_offer,
+    })
+    _active = label
+
+
+def use_mock_sources():
+    """Route lookups back to the instant mock data."""
+    global _active
+    _sources.update(_MOCK_SOURCES)
+    _active = "mock"
+
+
+def active_sources() -> str:
+    """Which backend lookups currently go to."""
+    return _active
+
+
+def configure_from_env():
+    """Switch to stand-ins when STANDIN_URL or STANDIN_PROFILE is set."""
+    from mock_data.standin_services import build_http_clients, build_standins
+
+    if os.getenv("STANDIN_URL"):
+        use_standins(build_http_clients(os.environ["STANDIN_URL"]), label=f"http:{os.environ['STANDIN_URL']}")
+    elif os.getenv("STANDIN_PROFILE"):
+        profile = os.environ["STANDIN_PROFILE"]
+        use_standins(build_standins(profile), label=f"in-process:{profile}")
+
@@ -0,0 +1,237 @@
+"""
+Turn Enrichment Pipeline
+Objection and sentiment enrichment of each user message, kept off the chat
+critical path. Objection detection (a local phrase match) and the
+user_query event are committed before the agent turn starts; sentiment
+detection, which may call the LLM, runs concurrently with the turn and
+writes current_sentiment, sentiment_adaptive_strategy, sentiment_history and
+sentiment_trend when it finishes, for the next turn. A turn can wait a short
+budget for it, so results that are ready in time (e.g. from the local
+sentiment tier) are used in the same turn.
+
+Enrichment for one session commits in message order; only the pipeline
+writes the sentiment keys, and it logs no events after the turn starts, so
+it never races the agent's tools on the event log.
+
+The pipeline prints nothing: each message's task resolves to its objections,
+sentiment and trend risk level for the caller to show (the CLI does, via
+utils.display_enrichment_result); message content is never logged.
+
+Environment:
+- ENRICHMENT_WAIT_MS=50   how long a turn waits for sentiment before the agent runs (0 = never)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Hashable, List, Optional
+
+from mock_data.objection_handler import detect_objection, get_objection_handling_prompt
+from mock_data.sentiment_analyzer import adetect_sentiment, get_sentiment_context_for_agent
+from mock_data.sentiment_trend import summarize_sentiment_trend, update_sentiment_trend
+
+from .event_log import USER_QUERY, log_event, log_state_keys
+from .memory_governor import history_cap
+from .metrics import latency_ms
+from .session_state import StateBatch, read_session_state
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WAIT_SECONDS = float(os.getenv("ENRICHMENT_WAIT_MS", "50")) / 1000
+
+# Enrichment latencies kept for stats
+LATENCY_SAMPLES = 512
+
+# Recent messages given to the sentiment classifier as context
+CONTEXT_MESSAGES = 3
+
+
+class EnrichmentPipeline:
+    """
+    Per-session enrichment of user messages.
+
+    Call start() before running the agent turn, then wait() with the
+    returned task to give the sentiment result a chance to land in time.
+    """
+
+    def __init__(self, session_service, app_name: str, wait_seconds: float = DEFAULT_WAIT_SECONDS):
+        self.session_service = session_service
+        self.app_name = app_name
+        self.wait_seconds = wait_seconds
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.stats = {"started": 0, "completed": 0, "failed": 0, "in_turn": 0, "next_turn": 0, "objections": 0}
+
+    async def start(self, user_id: str, session_id: str, query: str) -> asyncio.Task:
+        """
+        Record the user message and start its sentiment enrichment.
+
+        Objections and the user_query event are committed before this
+        returns; sentiment runs in the returned background task.
+
+        Args:
+            user_id: The user ID
+            session_id: The session ID
+            query: The user's message
+
+        Returns:
+            asyncio.Task: Completes once the sentiment enrichment is committed, with
+                          the enrichment result (dict with objections, sentiment and
+                          risk_level; None if enrichment failed) for the caller to show
+
+        Raises:
+            ValueError: If the session does not exist
+        """
+        state = await read_session_state(
+            self.session_service, self.app_name, user_id, session_id, keys=log_state_keys(USER_QUERY)
+        )
+        if state is None:
+            raise ValueError(f"Session {session_id} not found")
+        self.stats["started"] += 1
+        batch = StateBatch()
+
+        # ⚠️ Real-time Objection Detection
+        detected_objections = detect_objection(query)
+        if detected_objections:
+            self.stats["objections"] += 1
+            batch.set("objection_handling_context", get_objection_handling_prompt(detected_objections))
+            batch.set("detected_objections", [
+                {
+                    "type": obj["type"],
+                    "category": obj["category"],
+                    "severity": obj["severity"],
+                    "confidence": obj["confidence"],
+                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                }
+                for obj in detected_objections
+            ])
+            logger.debug("Objection detected for session %s: %s", session_id, detected_objections[0]["type"])
+
+        log_event(batch, state, {
+            "action": USER_QUERY,
+            "query": query,
+            "objections_detected": len(detected_objections) if detected_objections else 0,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
+        await batch.commit(self.session_service, self.app_name, user_id, session_id)
+
+        # 💚 Sentiment runs alongside the agent turn, after this session's earlier messages
+        key = (user_id, session_id)
+        task = asyncio.get_running_loop().create_task(
+            self._enrich_sentiment(user_id, session_id, query, detected_objections, self._pending.get(key))
+        )
+        self._pending[key] = task
+        task.add_done_callback(lambda done: self._pending.pop(key, None) if self._pending.get(key) is done else None)
+        return task
+
+    async def wait(self, task: asyncio.Task, budget: Optional[float] = None) -> bool:
+        """
+        Give the enrichment up to `budget` seconds (default: wait_seconds) to finish.
+
+        Returns:
+            bool: True if it finished in time for the current turn
+        """
+        budget = self.wait_seconds if budget is None else budget
+        if not task.done() and budget > 0:
+            await asyncio.wait((task,), timeout=budget)
+        in_turn = task.done()
+        self.stats["in_turn" if in_turn else "next_turn"] += 1
+        return in_turn
+
+    async def _enrich_sentiment(self, user_id: str, session_id: str, query: str, objections: List[Dict],
+                                previous: Optional[asyncio.Task]) -> Optional[Dict[str, Any]]:
+        started = time.monotonic()
+        result = {"objections": objections, "sentiment": None, "risk_level": None}
+        try:
+            state = await read_session_state(
+                self.session_service, self.app_name, user_id, session_id,
+                keys=("history", "customer_profile", "customer_language", "high_value_session"),
+            )
+            if state is None:
+                return None
+
+            # Context-aware detection: the last few messages of the conversation
+            conversation_context = "\n".join(
+                f"{msg.get('role', 'unknown')}: {msg.get('content', '')[:150]}"
+                for msg in (state.get("history") or [])[-CONTEXT_MESSAGES:]
+            )
+            # Strategy comes from the precomputed table; high-value sessions get a live one
+            sentiment_result = await adetect_sentiment(
+                query,
+                conversation_context,
+                live_strategy=bool(state.get("high_value_session")),
+                customer_profile=state.get("customer_profile"),
+                language=state.get("customer_language"),
+            )
+
+            result["sentiment"] = sentiment_result
+            if previous is not None:
+                await asyncio.wait((previous,))  # keep sentiment_history in message order
+            if sentiment_result["status"] == "neutral":
+                self.stats["completed"] += 1
+                return result
+
+            batch = StateBatch()
+            batch.set("current_sentiment", sentiment_result)
+            batch.set("sentiment_adaptive_strategy", get_sentiment_context_for_agent(sentiment_result))
+            sentiment_entry = {
+                "query": query,
+                "sentiment_type": sentiment_result["primary_sentiment"],
+                "sentiment_score": sentiment_result["sentiment_score"],
+                "confidence": sentiment_result["confidence"],
+                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            batch.append("sentiment_history", sentiment_entry, maxlen=history_cap("sentiment_history"))
+
+            logger.debug("Sentiment for session %s: %s (%s tier)", session_id,
+                         sentiment_result["primary_sentiment"], sentiment_result.get("tier", "llm"))
+
+            # Trend is updated incrementally from the stored summary (no history walk)
+            stored = await read_session_state(
+                self.session_service, self.app_name, user_id, session_id, keys=("sentiment_trend",)
+            )
+            trend = update_sentiment_trend(
+                stored.get("sentiment_trend") if stored is not None else None, sentiment_result["sentiment_score"]
+            )
+            batch.set("sentiment_trend", trend)
+            result["risk_level"] = summarize_sentiment_trend(trend)["risk_level"]
+
+            await batch.commit(self.session_service, self.app_name, user_id, session_id)
+            self.stats["completed"] += 1
+            return result
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.warning("Sentiment enrichment failed for session %s: %s", session_id, e)
+            return None
+        finally:
+            self.latencies.append(time.monotonic() - started)
+
+    async def drain(self, user_id: Optional[str] = None, session_id: Optional[str] = None):
+        """Wait for pending enrichment (of one session, or all)."""
+        if user_id is not None:
+            tasks = [self._pending[(user_id, session_id)]] if (user_id, session_id) in self._pending else []
+        else:
+            tasks = list(self._pending.values())
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def stop(self):
+        """Cancel pending enrichment (server shutdown)."""
+        tasks = list(self._pending.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+
+    def snapshot(self) -> Dict[str, Any]:
+        waited = self.stats["in_turn"] + self.stats["next_turn"]
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            "in_turn_rate": round(self.stats["in_turn"] / waited, 4) if waited else None,
+            "latency_ms": latency_ms(list(self.latencies)),
+            "wait_ms": self.wait_seconds * 1000,
+        }
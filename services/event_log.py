@@ -0,0 +1,218 @@
+"""
+Session Event Log
+Append-only, sequence-numbered log of typed journey events (offer shown, KYC
+complete, credit fetched, approved, sanction generated, ...) kept in session state
+
+Layout in state:
+- "_log:<seq>"              one key per event, written once and never rewritten;
+                            each event carries "prev", the seq of the previous
+                            event of the same action (None for the first)
+- "_log_last:<action>"      seq of the latest event of that action
+- "interaction_seq"         last assigned sequence number
+- "interaction_started_at"  timestamp of the first event
+- "interaction_history"     bounded tail of recent events, used by agent prompts
+
+Appending an event writes a fixed number of keys (its own, its action's
+latest pointer, the counter and the bounded tail), so neither the number of
+keys touched nor the size of the state delta grows with the session. Queries
+by action type walk the "prev" chain instead of scanning every event. Old
+events may be dropped from state (services.memory_governor trims the log);
+chains simply end at the oldest retained event.
+"""
+
+import heapq
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from .session_state import StateBatch
+
+LOG_PREFIX = "_log:"
+LAST_PREFIX = "_log_last:"
+SEQ_KEY = "interaction_seq"
+START_KEY = "interaction_started_at"
+TAIL_KEY = "interaction_history"
+
+# Events kept in the prompt-facing interaction_history tail
+TAIL_SIZE = 20
+
+# Prefixes of the log's own keys, for callers that want to hide them (e.g. state polling)
+LOG_KEY_PREFIXES = (LOG_PREFIX, LAST_PREFIX)
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Event types
+USER_QUERY = "user_query"
+AGENT_RESPONSE = "agent_response"
+OFFER_SHOWN = "loan_offer_shown"
+APPLICATION_INITIATED = "loan_application_initiated"
+KYC_DETAILS_FETCHED = "kyc_details_fetched"
+PHONE_VERIFIED = "phone_verified"
+ADDRESS_VERIFIED = "address_verified"
+KYC_COMPLETE = "kyc_verification_complete"
+DOCUMENT_UPDATE_REQUESTED = "document_update_requested"
+CREDIT_FETCHED = "credit_score_fetched"
+ELIGIBILITY_EVALUATED = "eligibility_evaluated"
+SALARY_SLIP_REQUESTED = "salary_slip_requested"
+SALARY_SLIP_UPLOADED = "salary_slip_uploaded_and_verified"
+SALARY_SLIP_VERIFIED = "salary_slip_verified"
+LOAN_APPROVED = "loan_approved"
+LOAN_REJECTED = "loan_rejected"
+SANCTION_GENERATED = "sanction_letter_generated"
+SANCTION_SENT = "sanction_letter_sent"
+SANCTION_ACCEPTED = "sanction_accepted"
+CROSS_SELL_OFFERED = "cross_sell_offered"
+CROSS_SELL_RESPONSE = "cross_sell_response"
+
+# Events that close the underwriting decision
+DECISION_EVENTS = (LOAN_APPROVED, LOAN_REJECTED)
+
+
+def _event_key(seq: int) -> str:
+    return f"{LOG_PREFIX}{seq:08d}"
+
+
+def _last_key(action: str) -> str:
+    return f"{LAST_PREFIX}{action}"
+
+
+def event_seq(key: str) -> Optional[int]:
+    """Sequence number of an event key ("_log:<seq>"), or None for other keys."""
+    if not key.startswith(LOG_PREFIX):
+        return None
+    try:
+        return int(key[len(LOG_PREFIX):])
+    except ValueError:
+        return None
+
+
+def log_state_keys(*actions: str) -> List[str]:
+    """State keys log_event() reads for these actions (for projected reads)."""
+    return [SEQ_KEY, *(_last_key(action) for action in actions)]
+
+
+def log_event(batch: StateBatch, state: Mapping, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Stage an event on a batch.
+
+    Sequence numbers continue from the state's counter and from events already
+    staged on the same batch, so several events can be logged before one apply/commit.
+
+    Args:
+        batch: The batch the event is written through
+        state: Current state (tool_context.state, dict or StateView); only the keys
+            from log_state_keys(action) are read
+        entry: Event fields; must include "action"
+
+    Returns:
+        dict: The stored event, with "seq", "prev" and "timestamp" filled in
+    """
+    action = entry["action"]
+    last_seq = batch.pending(SEQ_KEY)
+    if last_seq is None:
+        last_seq = state.get(SEQ_KEY) or 0
+    seq = last_seq + 1
+    last_key = _last_key(action)
+    prev = batch.pending(last_key)
+    if prev is None:
+        prev = state.get(last_key)
+
+    event = {"seq": seq, "prev": prev, **entry}
+    event.setdefault("timestamp", datetime.now().strftime(TIMESTAMP_FORMAT))
+
+    batch.set(_event_key(seq), event)
+    batch.set(last_key, seq)
+    batch.set(SEQ_KEY, seq)
+    if seq == 1:
+        batch.set(START_KEY, event["timestamp"])
+    batch.append(TAIL_KEY, event, maxlen=TAIL_SIZE)
+    return event
+
+
+def event_count(state: Mapping) -> int:
+    """Number of events logged in the session (including any trimmed from state)."""
+    return state.get(SEQ_KEY) or 0
+
+
+def get_event(state: Mapping, seq: Optional[int]) -> Optional[Mapping]:
+    """Return one event by sequence number (None if unknown or trimmed)."""
+    return state.get(_event_key(seq)) if seq else None
+
+
+def _chain(state: Mapping, action: str) -> Iterator[Mapping]:
+    """Retained events of one type, newest first."""
+    event = get_event(state, state.get(_last_key(action)))
+    while event is not None:
+        yield event
+        event = get_event(state, event.get("prev"))
+
+
+def event_sequence_numbers(state: Mapping, action: str) -> List[int]:
+    """Sequence numbers of the retained events of one type, in order."""
+    return [event["seq"] for event in _chain(state, action)][::-1]
+
+
+def get_events(state: Mapping, action: str) -> List[Mapping]:
+    """Retained events of one type, in order. Costs O(events of that type)."""
+    return list(_chain(state, action))[::-1]
+
+
+def first_event(state: Mapping, action: str) -> Optional[Mapping]:
+    """Earliest retained event of a type, or None."""
+    first = None
+    for first in _chain(state, action):
+        pass
+    return first
+
+
+def last_event(state: Mapping, action: str) -> Optional[Mapping]:
+    """Most recent event of a type, or None."""
+    return get_event(state, state.get(_last_key(action)))
+
+
+def iter_events(state: Mapping, actions: Optional[Iterable[str]] = None) -> Iterator[Mapping]:
+    """
+    Iterate retained events in sequence order.
+
+    Args:
+        state: Session state
+        actions: Event types to include; every event when omitted
+
+    Yields:
+        Events of the requested types, merged by sequence number via their chains
+    """
+    if actions is None:
+        for seq in range(1, event_count(state) + 1):
+            event = get_event(state, seq)
+            if event is not None:
+                yield event
+        return
+
+    yield from heapq.merge(*(get_events(state, action) for action in actions), key=lambda event: event["seq"])
+
+
+def _parse_timestamp(event: Optional[Mapping]) -> Optional[datetime]:
+    if not event:
+        return None
+    try:
+        return datetime.strptime(str(event.get("timestamp")), TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def time_to_decision(state: Mapping) -> Optional[int]:
+    """
+    Seconds from the first logged event to the first approval/rejection.
+
+    Returns:
+        int: Elapsed seconds, or None if no decision has been logged yet
+    """
+    decisions = [event for event in (first_event(state, action) for action in DECISION_EVENTS) if event]
+    if not decisions:
+        return None
+    decision = min(decisions, key=lambda event: event["seq"])
+
+    started = _parse_timestamp({"timestamp": state.get(START_KEY)})
+    decided = _parse_timestamp(decision)
+    if started is None or decided is None:
+        return None
+    return max(0, int((decided - started).total_seconds()))
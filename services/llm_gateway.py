@@ -0,0 +1,338 @@
+"""
+LLM Gateway
+Single path for every outbound LLM call: the agents' LiteLlm models (through
+services.model_router), the sentiment analyzer and any other classifier.
+Provides completion() and acompletion() over pooled keep-alive HTTP
+connections, a global and per-model concurrency limit shared by threads and
+event loops, and the Mistral tool-call-ID fix on both paths.
+
+Environment:
+- LLM_MAX_CONCURRENCY=32         in-flight LLM calls across all models
+- LLM_MODEL_CONCURRENCY=16       default in-flight calls per model
+- LLM_MODEL_LIMITS=mistral/mistral-large-2411=8,...  per-model overrides
+- LLM_POOL_CONNECTIONS=64        pooled HTTP connections per client
+- LLM_KEEPALIVE_SECONDS=30       idle keep-alive before a pooled connection closes
+- LLM_TIMEOUT_SECONDS=60         per-request timeout
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, List, Optional
+
+import httpx
+import litellm
+from google.adk.models.lite_llm import LiteLLMClient
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
+
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "32"))
+DEFAULT_MODEL_CONCURRENCY = int(os.getenv("LLM_MODEL_CONCURRENCY", "16"))
+DEFAULT_POOL_CONNECTIONS = int(os.getenv("LLM_POOL_CONNECTIONS", "64"))
+DEFAULT_KEEPALIVE_SECONDS = float(os.getenv("LLM_KEEPALIVE_SECONDS", "30"))
+DEFAULT_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+
+# Mistral rejects tool call IDs longer than this
+MAX_TOOL_CALL_ID_LENGTH = 9
+
+
+
+def short_tool_call_id(long_id: str) -> str:
+    """Consistent 9-char ID for a long tool call ID (a pure hash, so nothing needs to be stored)."""
+    return hashlib.md5(long_id.encode()).hexdigest()[:MAX_TOOL_CALL_ID_LENGTH]
+
+
+def shorten_request_tool_call_ids(messages: Optional[List[Any]]):
+    """Shorten tool call IDs in messages being sent (assistant tool_calls and tool results)."""
+    for message in messages or ():
+        if not isinstance(message, dict):
+            continue
+        for tool_call in message.get("tool_calls") or ():
+            if isinstance(tool_call, dict) and len(tool_call.get("id") or "") > MAX_TOOL_CALL_ID_LENGTH:
+                tool_call["id"] = short_tool_call_id(tool_call["id"])
+        if len(message.get("tool_call_id") or "") > MAX_TOOL_CALL_ID_LENGTH:
+            message["tool_call_id"] = short_tool_call_id(message["tool_call_id"])
+
+
+def shorten_response_tool_call_ids(response: Any):
+    """Shorten tool call IDs in a response or streaming chunk."""
+    for choice in getattr(response, "choices", None) or ():
+        message = getattr(choice, "message", None) or getattr(choice, "delta", None)
+        for tool_call in getattr(message, "tool_calls", None) or ():
+            if len(getattr(tool_call, "id", None) or "") > MAX_TOOL_CALL_ID_LENGTH:
+                tool_call.id = short_tool_call_id(tool_call.id)
+
+
+def parse_model_limits(spec: str) -> Dict[str, int]:
+    """Parse "model=limit,model=limit" (as in LLM_MODEL_LIMITS)."""
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        model, _, limit = item.rpartition("=")
+        limits[model.strip()] = int(limit)
+    return limits
+
+
+class ConcurrencyLimit:
+    """
+    Counting semaphore shared by threads and event loops.
+
+    acquire() blocks a thread; acquire_async() suspends a task without
+    blocking its loop. Waiters are served first come, first served, and a
+    released slot is handed straight to the next waiter.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self.peak = 0
+        self.waited = 0
+        self._waiters: deque = deque()
+        self._lock = threading.Lock()
+
+    def _take_locked(self) -> bool:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            return True
+        self.waited += 1
+        return False
+
+    def acquire(self):
+        with self._lock:
+            if self._take_locked():
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+
+    async def acquire_async(self):
+        with self._lock:
+            if self._take_locked():
+                return
+            future = asyncio.get_running_loop().create_future()
+            waiter = (future.get_loop(), future)
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+            if not queued and future.done() and not future.cancelled():
+                self.release()  # the slot was handed over just before the cancellation
+            raise
+
+    def _hand_over(self, future: asyncio.Future):
+        # Runs on the waiter's loop; a waiter cancelled meanwhile passes the slot on
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+    def release(self):
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                    return
+                loop, future = waiter
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(self._hand_over, future)
+                    return
+            self.active -= 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"limit": self.limit, "active": self.active, "waiting": len(self._waiters),
+                    "peak": self.peak, "waited": self.waited}
+
+
+class LLMGateway:
+    """
+    Concurrency-limited, connection-pooled access to litellm.
+
+    Each call holds one per-model slot and one global slot (acquired in that
+    order) for its whole duration, including the full stream for streaming
+    calls. Callers that pass their own `client` keep it; everyone else shares
+    the gateway's pooled clients (one async pool per event loop).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        model_concurrency: int = DEFAULT_MODEL_CONCURRENCY,
+        model_limits: Optional[Dict[str, int]] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        keepalive_seconds: float = DEFAULT_KEEPALIVE_SECONDS,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    ):
+        self.model_concurrency = model_concurrency
+        self.model_limits = dict(model_limits if model_limits is not None
+                                 else parse_model_limits(os.getenv("LLM_MODEL_LIMITS", "")))
+        self.timeout_seconds = timeout_seconds
+        self._pool_limits = httpx.Limits(
+            max_connections=pool_connections,
+            max_keepalive_connections=pool_connections,
+            keepalive_expiry=keepalive_seconds,
+        )
+        self._global = ConcurrencyLimit(max_concurrency)
+        self._per_model: Dict[str, ConcurrencyLimit] = {}
+        self._sync_client: Optional[HTTPHandler] = None
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHTTPHandler]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "async_calls": 0, "streams": 0, "errors": 0}
+
+    def _limit_for(self, model: str) -> ConcurrencyLimit:
+        with self._lock:
+            limit = self._per_model.get(model)
+            if limit is None:
+                limit = self._per_model[model] = ConcurrencyLimit(self.model_limits.get(model, self.model_concurrency))
+            return limit
+
+    def _sync_http_client(self) -> HTTPHandler:
+        with self._lock:
+            if self._sync_client is None:
+                self._sync_client = HTTPHandler(
+                    timeout=self.timeout_seconds,
+                    client=httpx.Client(limits=self._pool_limits, timeout=self.timeout_seconds),
+                )
+            return self._sync_client
+
+    def _async_http_client(self) -> AsyncHTTPHandler:
+        # httpx async pools are bound to the loop that opened their connections
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._async_clients[loop] = AsyncHTTPHandler(
+                    timeout=self.timeout_seconds,
+                    transport=httpx.AsyncHTTPTransport(limits=self._pool_limits),
+                )
+            return client
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    @contextmanager
+    def _slot(self, model: str):
+        model_limit = self._limit_for(model)
+        model_limit.acquire()
+        try:
+            self._global.acquire()
+            try:
+                yield
+            finally:
+                self._global.release()
+        finally:
+            model_limit.release()
+
+    @asynccontextmanager
+    async def _async_slot(self, model: str):
+        model_limit = self._limit_for(model)
+        await model_limit.acquire_async()
+        try:
+            await self._global.acquire_async()
+            try:
+                yield
+            finally:
+                self._global.release()
+        finally:
+            model_limit.release()
+
+    def completion(self, model: str, messages: List[Any], **kwargs) -> Any:
+        """
+        Blocking litellm.completion through the gateway (for sync callers only;
+        async code should use acompletion).
+
+        Args:
+            model: litellm model name, e.g. "mistral/mistral-large-2411"
+            messages: Chat messages (tool call IDs are shortened in place)
+            **kwargs: Passed through to litellm.completion
+
+        Returns:
+            The litellm response, or a stream wrapper when stream=True
+        """
+        self._count("calls")
+        shorten_request_tool_call_ids(messages)
+        kwargs.setdefault("client", self._sync_http_client())
+        if kwargs.get("stream"):
+            return self._stream(model, messages, kwargs)
+        with self._slot(model):
+            try:
+                response = litellm.completion(model=model, messages=messages, **kwargs)
+            except Exception:
+                self._count("errors")
+                raise
+        shorten_response_tool_call_ids(response)
+        return response
+
+    def _stream(self, model: str, messages: List[Any], kwargs: Dict[str, Any]):
+        self._count("streams")
+        with self._slot(model):
+            for chunk in litellm.completion(model=model, messages=messages, **kwargs):
+                shorten_response_tool_call_ids(chunk)
+                yield chunk
+
+    async def acompletion(self, model: str, messages: List[Any], **kwargs) -> Any:
+        """
+        litellm.acompletion through the gateway.
+
+        Args:
+            model: litellm model name, e.g. "mistral/mistral-large-2411"
+            messages: Chat messages (tool call IDs are shortened in place)
+            **kwargs: Passed through to litellm.acompletion
+
+        Returns:
+            The litellm response, or an async iterator of chunks when stream=True
+        """
+        self._count("async_calls")
+        shorten_request_tool_call_ids(messages)
+        kwargs.setdefault("client", self._async_http_client())
+        if kwargs.get("stream"):
+            return self._astream(model, messages, kwargs)
+        async with self._async_slot(model):
+            try:
+                response = await litellm.acompletion(model=model, messages=messages, **kwargs)
+            except Exception:
+                self._count("errors")
+                raise
+        shorten_response_tool_call_ids(response)
+        return response
+
+    async def _astream(self, model: str, messages: List[Any], kwargs: Dict[str, Any]):
+        self._count("streams")
+        async with self._async_slot(model):
+            async for chunk in await litellm.acompletion(model=model, messages=messages, **kwargs):
+                shorten_response_tool_call_ids(chunk)
+                yield chunk
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            per_model = dict(self._per_model)
+        stats["global"] = self._global.snapshot()
+        stats["models"] = {model: limit.snapshot() for model, limit in per_model.items()}
+        return stats
+
+
+class GatewayLiteLLMClient(LiteLLMClient):
+    """ADK LiteLlm client that sends every model call through the gateway."""
+
+    def __init__(self, gateway: Optional[LLMGateway] = None):
+        self.gateway = gateway
+
+    async def acompletion(self, model, messages, tools, **kwargs):
+        return await (self.gateway or llm_gateway).acompletion(model, messages, tools=tools, **kwargs)
+
+    def completion(self, model, messages, tools, stream=False, **kwargs):
+        return (self.gateway or llm_gateway).completion(model, messages, tools=tools, stream=stream, **kwargs)
+
+
+llm_gateway = LLMGateway()
+gateway_llm_client = GatewayLiteLLMClient()
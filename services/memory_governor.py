@@ -0,0 +1,373 @@
+"""
+Session Memory Governor
+Keeps a long-running server at steady-state memory: evicts idle sessions from
+the in-memory session service (archiving them first when an archive directory
+is configured), caps per-session history lists, the session event log
+(services.event_log) and the ADK event list, and reports memory usage
+
+History caps go through the session service as state-delta events. State
+deltas cannot delete keys and there is no API to drop events, so the event log
+and ADK event list are trimmed in place on the stored sessions; that is only
+done for ADK's InMemorySessionService, whose stored sessions are plain objects
+owned by this process. Durable session services keep sessions outside the
+process and are not trimmed.
+
+Environment:
+- SESSION_IDLE_TTL_SECONDS=1800      evict sessions idle longer than this
+- SESSION_SWEEP_INTERVAL_SECONDS=60  how often the sweep runs
+- SESSION_ARCHIVE_DIR=               write evicted sessions / trimmed entries here first
+- SESSION_HISTORY_CAP=50             items kept per capped history list
+- SESSION_LOG_CAP=200                journey events kept in the session event log
+- SESSION_EVENTS_CAP=200             ADK events kept per session
+- SESSION_SIZE_SAMPLE=50             sessions whose deep size is measured per stats() call
+- SESSION_SIZE_TTL_SECONDS=30        how long a size estimate is reused
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from google.adk.sessions import InMemorySessionService
+
+from .event_log import LAST_PREFIX, event_seq
+from .session_state import StateBatch, _is_in_memory
+
+# Idle time after which a session is evicted
+DEFAULT_IDLE_TTL_SECONDS = int(os.getenv("SESSION_IDLE_TTL_SECONDS", "1800"))
+
+# How often the background sweep runs
+DEFAULT_SWEEP_INTERVAL_SECONDS = int(os.getenv("SESSION_SWEEP_INTERVAL_SECONDS", "60"))
+
+# Where evicted sessions are written before removal (disabled when unset)
+DEFAULT_ARCHIVE_DIR = os.getenv("SESSION_ARCHIVE_DIR")
+
+# Default cap for list-valued history keys in session state
+DEFAULT_HISTORY_CAP = int(os.getenv("SESSION_HISTORY_CAP", "50"))
+
+# Journey events kept in a session's event log (older ones are archived, then dropped)
+DEFAULT_LOG_CAP = int(os.getenv("SESSION_LOG_CAP", "200"))
+
+# ADK events kept per session (older turns are archived, then dropped)
+DEFAULT_EVENTS_CAP = int(os.getenv("SESSION_EVENTS_CAP", "200"))
+
+# Sessions whose deep size is walked for stats (the total is extrapolated)
+DEFAULT_SIZE_SAMPLE = int(os.getenv("SESSION_SIZE_SAMPLE", "50"))
+
+# How long a size estimate is reused before sessions are walked again
+DEFAULT_SIZE_TTL_SECONDS = float(os.getenv("SESSION_SIZE_TTL_SECONDS", "30"))
+
+# Per-key caps; other list-valued keys written through StateBatch.append get the default cap
+HISTORY_CAPS: Dict[str, int] = {
+    "sentiment_history": DEFAULT_HISTORY_CAP,
+    "detected_objections": DEFAULT_HISTORY_CAP,
+    "pending_document_updates": DEFAULT_HISTORY_CAP,
+    "history": DEFAULT_HISTORY_CAP,
+}
+
+
+def history_cap(key: str) -> int:
+    """Maximum number of items kept for a list-valued state key."""
+    return HISTORY_CAPS.get(key, DEFAULT_HISTORY_CAP)
+
+
+def approximate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """
+    Approximate deep size of an object in bytes.
+
+    Walks dicts, lists, tuples, sets and pydantic models; shared objects are
+    counted once. Good enough for trend monitoring, not exact accounting.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(approximate_size(k, _seen) + approximate_size(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(approximate_size(item, _seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += approximate_size(vars(obj), _seen)
+    return size
+
+
+class MemoryGovernor:
+    """
+    Evicts idle sessions and enforces per-session caps.
+
+    Only the ADK in-memory session service is governed; durable session
+    services already keep sessions outside the process.
+    """
+
+    def __init__(
+        self,
+        session_service,
+        app_name: str,
+        idle_ttl_seconds: int = DEFAULT_IDLE_TTL_SECONDS,
+        sweep_interval_seconds: int = DEFAULT_SWEEP_INTERVAL_SECONDS,
+        archive_dir: Optional[str] = DEFAULT_ARCHIVE_DIR,
+        log_cap: int = DEFAULT_LOG_CAP,
+        events_cap: int = DEFAULT_EVENTS_CAP,
+        size_sample: int = DEFAULT_SIZE_SAMPLE,
+        size_ttl_seconds: float = DEFAULT_SIZE_TTL_SECONDS,
+    ):
+        self.session_service = session_service
+        self.app_name = app_name
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self.log_cap = log_cap
+        self.events_cap = events_cap
+        self.size_sample = size_sample
+        self.size_ttl_seconds = size_ttl_seconds
+        self._size_estimate: Optional[Dict[str, Any]] = None
+        self._size_estimated_at = 0.0
+        self.evicted_sessions = 0
+        self.trimmed_log_events = 0
+        self.compacted_events = 0
+        self.last_sweep_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return _is_in_memory(self.session_service)
+
+    @property
+    def trims_in_place(self) -> bool:
+        """Whether the event log and ADK events may be trimmed on the stored sessions (ADK in-memory service only)."""
+        return isinstance(self.session_service, InMemorySessionService)
+
+    def _sessions(self) -> List[Any]:
+        """Stored session objects for this app (not copies)."""
+        users = self.session_service.sessions.get(self.app_name, {})
+        return [session for sessions in users.values() for session in sessions.values()]
+
+    def _archive(self, session) -> Optional[Path]:
+        """Write a session's state and events to the archive directory."""
+        if self.archive_dir is None:
+            return None
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        path = self.archive_dir / f"{session.user_id}__{session.id}.json"
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "session_id": session.id,
+                    "user_id": session.user_id,
+                    "last_update_time": session.last_update_time,
+                    "state": session.state,
+                    "events": [event.model_dump(mode="json", exclude_none=True) for event in session.events],
+                },
+                f,
+                default=str,
+            )
+        return path
+
+    def _archive_lines(self, session, kind: str, records: List[Dict[str, Any]]) -> Optional[Path]:
+        """Append trimmed records (log entries or ADK events) to the session's JSONL archive."""
+        if self.archive_dir is None or not records:
+            return None
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        path = self.archive_dir / f"{session.user_id}__{session.id}.{kind}.jsonl"
+        with open(path, "a") as f:
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+        return path
+
+    async def evict_idle_sessions(self, now: Optional[float] = None) -> int:
+        """
+        Archive (if configured) and delete sessions idle longer than the TTL.
+
+        Returns:
+            int: Number of sessions evicted
+        """
+        if not self.enabled:
+            return 0
+        now = now or time.time()
+        idle = [s for s in self._sessions() if now - s.last_update_time > self.idle_ttl_seconds]
+
+        evicted = 0
+        for session in idle:
+            try:
+                self._archive(session)
+            except Exception as e:
+                # Keep the session in memory rather than lose it
+                print(f"⚠️  Could not archive session {session.id}, skipping eviction: {e}")
+                continue
+            await self.session_service.delete_session(
+                app_name=self.app_name, user_id=session.user_id, session_id=session.id
+            )
+            evicted += 1
+
+        self.evicted_sessions += evicted
+        return evicted
+
+    async def enforce_caps(self) -> int:
+        """
+        Trim capped history lists, the event log and the ADK event list.
+
+        History lists are trimmed through the session service as state-delta
+        events. State deltas cannot delete keys, so with InMemorySessionService
+        old event log entries (and pointers to them) are removed from the
+        stored session directly, as are old ADK events; both are archived
+        first when an archive directory is set. Other services only get the
+        history caps.
+
+        Returns:
+            int: Number of sessions that were trimmed
+        """
+        if not self.enabled:
+            return 0
+
+        trimmed = 0
+        for session in self._sessions():
+            state = session.state
+            batch = StateBatch()
+            for key, cap in HISTORY_CAPS.items():
+                value = state.get(key)
+                if isinstance(value, list) and len(value) > cap:
+                    batch.set(key, value[-cap:])
+
+            changed = False
+            try:
+                if self.trims_in_place:
+                    changed = self._trim_log(session)
+                    changed = self._compact_events(session) or changed
+            except Exception as e:
+                # Keep the data in memory rather than lose it
+                print(f"⚠️  Could not archive trimmed history of session {session.id}, skipping: {e}")
+                changed = False
+
+            if batch:
+                await batch.commit(
+                    self.session_service, self.app_name, session.user_id, session.id, author="memory_governor"
+                )
+            if batch or changed:
+                trimmed += 1
+        return trimmed
+
+    def _trim_log(self, session) -> bool:
+        """
+        Drop event log entries beyond the newest log_cap, and pointers to dropped entries.
+
+        Deletes keys from the stored InMemorySessionService session (see enforce_caps).
+        """
+        state = session.state
+        entries = sorted((seq, key) for seq, key in ((event_seq(key), key) for key in list(state)) if seq is not None)
+        if len(entries) <= self.log_cap:
+            return False
+        dropped = entries[:len(entries) - self.log_cap]
+        self._archive_lines(session, "log", [state[key] for _, key in dropped])
+
+        floor = dropped[-1][0]
+        for _, key in dropped:
+            del state[key]
+        for key in [key for key in state if key.startswith(LAST_PREFIX) and (state[key] or 0) <= floor]:
+            del state[key]
+        self.trimmed_log_events += len(dropped)
+        return True
+
+    def _compact_events(self, session) -> bool:
+        """
+        Drop ADK events beyond the newest events_cap.
+
+        The cut is moved forward to the next user message so a turn's model
+        and tool events are never split; the agent sees the remaining turns.
+        Edits the stored InMemorySessionService session (see enforce_caps).
+        """
+        events = session.events
+        if len(events) <= self.events_cap:
+            return False
+        cut = len(events) - self.events_cap
+        while cut < len(events) and not (events[cut].author == "user" and events[cut].content is not None):
+            cut += 1
+        if cut >= len(events):
+            return False
+        self._archive_lines(session, "events", [event.model_dump(mode="json", exclude_none=True) for event in events[:cut]])
+        del events[:cut]
+        self.compacted_events += cut
+        return True
+
+    async def sweep(self) -> Dict[str, int]:
+        """Run one eviction + cap enforcement pass."""
+        evicted = await self.evict_idle_sessions()
+        trimmed = await self.enforce_caps()
+        self.last_sweep_at = time.time()
+        return {"evicted": evicted, "trimmed": trimmed}
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval_seconds)
+            try:
+                result = await self.sweep()
+                if result["evicted"] or result["trimmed"]:
+                    print(f"🧹 Memory sweep: evicted {result['evicted']} idle session(s), trimmed {result['trimmed']}")
+            except Exception as e:
+                print(f"⚠️  Memory sweep failed: {e}")
+
+    def start(self):
+        """Start the background sweep on the running event loop."""
+        if self.enabled and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _estimate_size(self, sessions: List[Any]) -> Dict[str, Any]:
+        """Deep size of up to size_sample sessions, extrapolated to all of them; reused for size_ttl_seconds."""
+        now = time.monotonic()
+        if self._size_estimate is not None and now - self._size_estimated_at <= self.size_ttl_seconds:
+            return self._size_estimate
+        sample = sessions if len(sessions) <= self.size_sample else random.sample(sessions, self.size_sample)
+        scale = len(sessions) / len(sample) if sample else 0
+        state_bytes = int(sum(approximate_size(s.state) for s in sample) * scale)
+        event_bytes = int(sum(approximate_size(s.events) for s in sample) * scale)
+        self._size_estimate = {
+            "approx_state_bytes": state_bytes,
+            "approx_event_bytes": event_bytes,
+            "approx_total_bytes": state_bytes + event_bytes,
+            "size_sampled_sessions": len(sample),
+        }
+        self._size_estimated_at = now
+        return self._size_estimate
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Live session count and approximate memory held by sessions.
+
+        Byte counts are estimated from a sample of sessions and cached for
+        size_ttl_seconds, so polling this stays cheap with many sessions.
+
+        Returns:
+            dict: Session count, event count, approximate bytes and governor settings
+        """
+        if not self.enabled:
+            return {"governed": False}
+
+        sessions = self._sessions()
+        return {
+            "governed": True,
+            "trims_in_place": self.trims_in_place,
+            "live_sessions": len(sessions),
+            "total_events": sum(len(s.events) for s in sessions),
+            **self._estimate_size(sessions),
+            "evicted_sessions": self.evicted_sessions,
+            "trimmed_log_events": self.trimmed_log_events,
+            "compacted_events": self.compacted_events,
+            "idle_ttl_seconds": self.idle_ttl_seconds,
+            "log_cap": self.log_cap,
+            "events_cap": self.events_cap,
+            "last_sweep_at": self.last_sweep_at,
+        }
@@ -0,0 +1,24 @@
+"""
+Latency Metrics
+Percentile helpers shared by the services' stats snapshots and the benchmarks
+"""
+
+from typing import Dict, Iterable
+
+
+def percentile(samples: Iterable[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples` (0.0 when there are none)."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def latency_ms(samples: Iterable[float]) -> Dict[str, float]:
+    """p50/p95/p99 in milliseconds of durations recorded in seconds."""
+    ordered = sorted(samples)
+    return {
+        "p50": round(percentile(ordered, 50) * 1000, 1),
+        "p95": round(percentile(ordered, 95) * 1000, 1),
+        "p99": round(percentile(ordered, 99) * 1000, 1),
+    }
@@ -0,0 +1,139 @@
+"""
+Micro-Batcher
+Coalesces concurrent requests into batches: items submitted within
+`max_wait_seconds` of the first one (or until `max_batch_size` items are
+waiting) are handed to one run_batch() call, and each caller's future gets
+its own result back. Identical items in a batch share one slot. Items the
+batch could not answer (a None result, or a ValueError for the whole batch,
+e.g. an unparseable reply) are retried one by one with run_single(); any
+other batch error is raised to every caller.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+DEFAULT_MAX_BATCH_SIZE = 8
+DEFAULT_MAX_WAIT_SECONDS = 0.005
+
+
+class MicroBatcher:
+    """
+    Batches submit() calls made on one event loop.
+
+    run_batch(items) must return one result per item, in order (None for
+    items it could not answer); run_single(item) answers one item.
+    """
+
+    def __init__(self, name: str, run_batch: Callable[[List[Hashable]], Awaitable[Sequence[Optional[Any]]]],
+                 run_single: Callable[[Hashable], Awaitable[Any]],
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS):
+        self.name = name
+        self.run_batch = run_batch
+        self.run_single = run_single
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max_wait_seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[Hashable, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+        self.stats = {"submitted": 0, "batches": 0, "batched_items": 0, "deduplicated": 0,
+                      "single_calls": 0, "fallback_items": 0, "batch_parse_failures": 0, "batch_errors": 0}
+
+    async def submit(self, item: Hashable) -> Any:
+        """
+        Queue an item and wait for its result.
+
+        Raises:
+            Exception: Whatever the underlying call raised for this item
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Pending items belong to the previous loop, which is no longer running them
+            self._loop, self._pending, self._timer = loop, [], None
+        future = loop.create_future()
+        self._pending.append((item, future))
+        self.stats["submitted"] += 1
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = self._loop.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Hashable, asyncio.Future]]):
+        # The shared call runs to completion even if some callers give up
+        slots: Dict[Hashable, List[asyncio.Future]] = {}
+        for item, future in batch:
+            slots.setdefault(item, []).append(future)
+        items = list(slots)
+        self.stats["deduplicated"] += len(batch) - len(items)
+
+        if len(items) == 1:
+            await self._run_single(items[0], slots[items[0]])
+            return
+
+        self.stats["batches"] += 1
+        self.stats["batched_items"] += len(items)
+        try:
+            results = list(await self.run_batch(items))
+            if len(results) != len(items):
+                raise ValueError(f"batch returned {len(results)} results for {len(items)} items")
+        except ValueError as e:
+            self.stats["batch_parse_failures"] += 1
+            print(f"⚠️ {self.name} batch of {len(items)} unusable, falling back to single calls: {e}")
+            results = [None] * len(items)
+        except Exception as e:
+            self.stats["batch_errors"] += 1
+            for futures in slots.values():
+                _settle(futures, error=e)
+            return
+
+        retries = []
+        for item, result in zip(items, results):
+            if result is None:
+                self.stats["fallback_items"] += 1
+                retries.append(self._run_single(item, slots[item]))
+            else:
+                _settle(slots[item], result=result)
+        if retries:
+            await asyncio.gather(*retries)
+
+    async def _run_single(self, item: Hashable, futures: List[asyncio.Future]):
+        self.stats["single_calls"] += 1
+        try:
+            result = await self.run_single(item)
+        except Exception as e:
+            _settle(futures, error=e)
+        else:
+            _settle(futures, result=result)
+
+    def snapshot(self) -> Dict[str, Any]:
+        outbound = self.stats["batches"] + self.stats["single_calls"]
+        return {
+            **self.stats,
+            "outbound_calls": outbound,
+            "calls_saved": self.stats["submitted"] - outbound,
+            "mean_batch_size": round(self.stats["batched_items"] / self.stats["batches"], 2) if self.stats["batches"] else None,
+            "pending": len(self._pending),
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+        }
+
+
+def _settle(futures: List[asyncio.Future], result: Any = None, error: Optional[BaseException] = None):
+    for future in futures:
+        if future.done():
+            continue  # the caller was cancelled
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
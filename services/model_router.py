@@ -0,0 +1,284 @@
+"""
+Model Router
+Routes each LLM call to an ordered list of endpoints (primary first) through
+the LLM gateway. A call still running past its endpoint's latency budget is
+hedged to the next endpoint; the first answer wins and the loser is
+cancelled. A failed call fails over to the next endpoint immediately.
+Per-endpoint success, failure and latency stats feed the hedge delay: the
+observed p95 once enough samples exist, never more than the budget.
+
+Without LLM_ROUTES every model is routed only to itself, so nothing is hedged
+or failed over to a different model. Cross-model hedging changes answer
+quality and can double token spend on slow calls, so it is opt-in.
+
+Environment:
+- LLM_LATENCY_BUDGET_SECONDS=8    default budget before a call is hedged
+- LLM_ROUTES='{"mistral/mistral-large-2411": [{"model": "mistral/mistral-large-2411", "budget_seconds": 8},
+               {"model": "mistral/mistral-medium-latest"}]}'
+  Opt-in route per requested model (default: none); endpoint keys: model,
+  name, budget_seconds, and any litellm call parameters (api_base, api_key, ...)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from google.adk.models.lite_llm import LiteLLMClient
+
+from .llm_gateway import LLMGateway, llm_gateway
+from .metrics import latency_ms, percentile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LATENCY_BUDGET_SECONDS = float(os.getenv("LLM_LATENCY_BUDGET_SECONDS", "8"))
+
+# Default routes: none, every model goes only to itself (see LLM_ROUTES)
+DEFAULT_ROUTES: Dict[str, List[dict]] = {}
+
+# Successful-call latencies kept per endpoint
+LATENCY_SAMPLES = 512
+
+# Samples needed before the observed p95 replaces the configured budget
+MIN_SAMPLES_FOR_P95 = 20
+
+# Calls in flight for one request (primary + hedges)
+MAX_PARALLEL_ATTEMPTS = 2
+
+
+class ModelEndpoint:
+    """One place a call can go: a litellm model plus call parameters (api_base, api_key, ...)."""
+
+    def __init__(self, model: str, name: Optional[str] = None,
+                 budget_seconds: float = DEFAULT_LATENCY_BUDGET_SECONDS, **params):
+        self.model = model
+        self.name = name or (f"{model}@{params['api_base']}" if params.get("api_base") else model)
+        self.budget_seconds = budget_seconds
+        self.params = params
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.stats = {"calls": 0, "successes": 0, "failures": 0, "cancelled": 0, "hedges": 0, "wins": 0}
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for this endpoint before hedging: observed p95, capped at the budget."""
+        if len(self.latencies) >= MIN_SAMPLES_FOR_P95:
+            return min(self.budget_seconds, percentile(self.latencies, 95))
+        return self.budget_seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        calls = self.stats["successes"] + self.stats["failures"]
+        return {
+            **self.stats,
+            "success_rate": round(self.stats["successes"] / calls, 4) if calls else None,
+            "latency_ms": latency_ms(self.latencies),
+            "budget_seconds": self.budget_seconds,
+            "hedge_delay_seconds": round(self.hedge_delay(), 3),
+        }
+
+
+class ModelRouter:
+    """
+    Hedged, failover routing of LLM calls over the gateway.
+
+    Calls for a model without a route go straight to that model (stats are
+    still kept). Streaming and blocking calls fail over between endpoints but
+    are never hedged.
+    """
+
+    def __init__(self, gateway: Optional[LLMGateway] = None, routes: Optional[Dict[str, List[dict]]] = None,
+                 max_parallel: int = MAX_PARALLEL_ATTEMPTS):
+        self.gateway = gateway or llm_gateway
+        self.max_parallel = max_parallel
+        self._routes: Dict[str, List[ModelEndpoint]] = {}
+        self._endpoints: Dict[str, ModelEndpoint] = {}
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "hedged_requests": 0, "failovers": 0, "exhausted": 0}
+        if routes is None:
+            routes = json.loads(os.getenv("LLM_ROUTES")) if os.getenv("LLM_ROUTES") else DEFAULT_ROUTES
+        for model, endpoints in routes.items():
+            self.set_route(model, endpoints)
+
+    def _endpoint(self, spec: dict) -> ModelEndpoint:
+        endpoint = ModelEndpoint(**spec)
+        return self._endpoints.setdefault(endpoint.name, endpoint)
+
+    def set_route(self, model: str, endpoints: List[dict]):
+        """Route calls for `model` to `endpoints` (dicts of ModelEndpoint arguments), primary first."""
+        with self._lock:
+            self._routes[model] = [self._endpoint(dict(spec)) for spec in endpoints]
+
+    def route_for(self, model: str) -> List[ModelEndpoint]:
+        with self._lock:
+            route = self._routes.get(model)
+            if route is None:
+                route = self._routes[model] = [self._endpoint({"model": model})]
+            return route
+
+    async def _attempt(self, endpoint: ModelEndpoint, messages: List[Any], kwargs: Dict[str, Any]):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        endpoint.stats["calls"] += 1
+        try:
+            response = await self.gateway.acompletion(endpoint.model, list(messages), **{**kwargs, **endpoint.params})
+        except asyncio.CancelledError:
+            endpoint.stats["cancelled"] += 1
+            raise
+        except Exception:
+            endpoint.stats["failures"] += 1
+            raise
+        endpoint.stats["successes"] += 1
+        endpoint.latencies.append(loop.time() - started)
+        return response
+
+    async def acompletion(self, model: str, messages: List[Any], **kwargs) -> Any:
+        """
+        Complete via the model's route.
+
+        Args:
+            model: Requested model (route key)
+            messages: Chat messages
+            **kwargs: Passed through to the gateway / litellm
+
+        Returns:
+            The first successful response
+
+        Raises:
+            Exception: The last endpoint's error if every endpoint failed
+        """
+        self.stats["requests"] += 1
+        route = self.route_for(model)
+        if kwargs.get("stream"):
+            return await self._failover_stream(route, messages, kwargs)
+
+        pending: Dict[asyncio.Task, ModelEndpoint] = {}
+        next_index = 0
+        last_error: Optional[BaseException] = None
+        hedged = False
+
+        def launch():
+            nonlocal next_index
+            endpoint = route[next_index]
+            next_index += 1
+            pending[asyncio.create_task(self._attempt(endpoint, messages, kwargs))] = endpoint
+            return endpoint
+
+        newest = launch()
+        try:
+            while pending:
+                can_hedge = next_index < len(route) and len(pending) < self.max_parallel
+                done, _ = await asyncio.wait(
+                    pending, timeout=newest.hedge_delay() if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    # Over budget: race the next endpoint against the slow one
+                    newest = launch()
+                    newest.stats["hedges"] += 1
+                    if not hedged:
+                        hedged = True
+                        self.stats["hedged_requests"] += 1
+                    continue
+                for task in done:
+                    endpoint = pending.pop(task)
+                    if task.exception() is None:
+                        endpoint.stats["wins"] += 1
+                        return task.result()
+                    last_error = task.exception()
+                    logger.warning("LLM endpoint %s failed: %s", endpoint.name, last_error)
+                if not pending and next_index < len(route):
+                    self.stats["failovers"] += 1
+                    newest = launch()
+            self.stats["exhausted"] += 1
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _failover_stream(self, route: List[ModelEndpoint], messages: List[Any], kwargs: Dict[str, Any]):
+        # Gateway streams are lazy and only fail on the first chunk, so an
+        # endpoint is committed to once it has produced one
+        last_error: Optional[BaseException] = None
+        for index, endpoint in enumerate(route):
+            if index:
+                self.stats["failovers"] += 1
+            endpoint.stats["calls"] += 1
+            try:
+                stream = await self.gateway.acompletion(endpoint.model, list(messages), **{**kwargs, **endpoint.params})
+                first = await stream.__anext__()
+            except StopAsyncIteration:
+                first = None
+            except Exception as e:
+                endpoint.stats["failures"] += 1
+                last_error = e
+                logger.warning("LLM endpoint %s failed: %s", endpoint.name, e)
+                continue
+            endpoint.stats["successes"] += 1
+            endpoint.stats["wins"] += 1
+            return _prepend_async(first, stream)
+        self.stats["exhausted"] += 1
+        raise last_error
+
+    def completion(self, model: str, messages: List[Any], **kwargs) -> Any:
+        """Blocking completion with failover (no hedging); for sync callers only."""
+        self.stats["requests"] += 1
+        last_error: Optional[BaseException] = None
+        for index, endpoint in enumerate(self.route_for(model)):
+            if index:
+                self.stats["failovers"] += 1
+            endpoint.stats["calls"] += 1
+            try:
+                response = self.gateway.completion(endpoint.model, list(messages), **{**kwargs, **endpoint.params})
+                if kwargs.get("stream"):
+                    response = _prepend(next(response, None), response)
+            except Exception as e:
+                endpoint.stats["failures"] += 1
+                last_error = e
+                logger.warning("LLM endpoint %s failed: %s", endpoint.name, e)
+                continue
+            endpoint.stats["successes"] += 1
+            endpoint.stats["wins"] += 1
+            return response
+        self.stats["exhausted"] += 1
+        raise last_error
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            routes = {model: [endpoint.name for endpoint in route] for model, route in self._routes.items()}
+            endpoints = dict(self._endpoints)
+        return {
+            **self.stats,
+            "routes": routes,
+            "endpoints": {name: endpoint.snapshot() for name, endpoint in endpoints.items()},
+        }
+
+
+def _prepend(first, stream):
+    if first is not None:
+        yield first
+    yield from stream
+
+
+async def _prepend_async(first, stream):
+    if first is not None:
+        yield first
+    async for chunk in stream:
+        yield chunk
+
+
+class RoutedLiteLLMClient(LiteLLMClient):
+    """ADK LiteLlm client that sends every model call through the model router."""
+
+    def __init__(self, router: Optional[ModelRouter] = None):
+        self.router = router
+
+    async def acompletion(self, model, messages, tools, **kwargs):
+        return await (self.router or model_router).acompletion(model, messages, tools=tools, **kwargs)
+
+    def completion(self, model, messages, tools, stream=False, **kwargs):
+        return (self.router or model_router).completion(model, messages, tools=tools, stream=stream, **kwargs)
+
+
+model_router = ModelRouter()
+routed_llm_client = RoutedLiteLLMClient()
@@ -0,0 +1,138 @@
+"""
+Prefetch Cache
+Process-wide, TTL-bounded cache of CRM (KYC) lookups keyed by customer ID.
+Session bootstrap warms it with single-flight loading; the verification tools
+read it directly and load through it on a miss. Sessions only record the
+version of the entry that was prefetched for them. (Credit bureau reports are
+cached by services.bureau_client.)
+"""
+
+import asyncio
+import itertools
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .data_sources import get_kyc_data
+from .lru_cache import LRUCache
+
+# How long a prefetched lookup stays valid
+PREFETCH_TTL_SECONDS = 600
+
+# Customers kept per cache
+PREFETCH_CACHE_SIZE = 4096
+
+
+class PrefetchCache:
+    """
+    TTL + LRU cache around a blocking per-customer lookup.
+
+    - prefetch(): async, single-flight; concurrent callers for the same customer
+      share one load, run in a worker thread
+    - get(): async, returns the cached value, loading it through prefetch() on a miss
+    - peek(): sync, returns a fresh cached value or None
+
+    Cached values are shared between sessions and must be treated as read-only.
+    The loader returns None for lookups that should not be cached (not found, errors).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[str], Any],
+        ttl_seconds: int = PREFETCH_TTL_SECONDS,
+        maxsize: int = PREFETCH_CACHE_SIZE,
+    ):
+        self.name = name
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+        self._entries = LRUCache(maxsize=maxsize)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._versions = itertools.count(1)
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "coalesced": 0}
+
+    def _fresh_entry(self, customer_id: str) -> Optional[Tuple[Any, int, float]]:
+        entry = self._entries.get(customer_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[2] > self.ttl_seconds:
+            self._entries.pop(customer_id)
+            return None
+        return entry
+
+    def peek(self, customer_id: str) -> Optional[Any]:
+        """Return the cached value if present and fresh, without loading."""
+        entry = self._fresh_entry(customer_id)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return entry[0]
+
+    def version(self, customer_id: str) -> Optional[int]:
+        """Version of the fresh cached entry, or None."""
+        entry = self._fresh_entry(customer_id)
+        return entry[1] if entry else None
+
+    async def _load(self, customer_id: str) -> Optional[int]:
+        try:
+            value = await asyncio.to_thread(self.loader, customer_id)
+            self.stats["loads"] += 1
+            if value is None:
+                return None
+            version = next(self._versions)
+            self._entries.put(customer_id, (value, version, time.monotonic()))
+            return version
+        finally:
+            self._inflight.pop(customer_id, None)
+
+    async def prefetch(self, customer_id: str) -> Optional[int]:
+        """
+        Make sure a fresh entry exists, loading it at most once across concurrent callers.
+
+        Returns:
+            int: Version of the cached entry, or None if the lookup returned nothing
+        """
+        entry = self._fresh_entry(customer_id)
+        if entry is not None:
+            return entry[1]
+
+        task = self._inflight.get(customer_id)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._load(customer_id))
+            self._inflight[customer_id] = task
+        else:
+            self.stats["coalesced"] += 1
+        # Shielded so a caller's timeout does not cancel the shared load
+        return await asyncio.shield(task)
+
+    async def get(self, customer_id: str) -> Optional[Any]:
+        """
+        Cached value for a customer, loaded (single-flight) if missing or expired.
+
+        Returns:
+            The value, or None if the lookup returned nothing
+
+        Raises:
+            Whatever the loader raised (shared by every caller waiting on the load)
+        """
+        entry = self._fresh_entry(customer_id)
+        if entry is None:
+            self.stats["misses"] += 1
+            await self.prefetch(customer_id)
+            entry = self._fresh_entry(customer_id)
+        else:
+            self.stats["hits"] += 1
+        return entry[0] if entry else None
+
+    def invalidate(self, customer_id: Optional[str] = None):
+        """Drop one customer's entry, or all entries."""
+        if customer_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(customer_id)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self._entries), "inflight": len(self._inflight)}
+
+
+kyc_prefetch_cache = PrefetchCache("crm", get_kyc_data)
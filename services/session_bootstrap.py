@@ -0,0 +1,290 @@
+"""
+Session Bootstrap
+Builds the initial session state for a customer. CRM, credit bureau, offer mart
+and campaign lookups run concurrently with per-source timeouts, and the
+resulting base state is cached per customer so repeat sessions skip the lookups.
+Concurrent sessions for a customer whose base state is not cached share one
+build. Sessions get the base copy-on-write: a per-session top-level dict over
+the shared, read-only nested values; state deltas replace a key's value rather
+than mutating it, so a session's writes never reach the cached base.
+Each session records the reference data snapshot version it was built from; a
+reference data reload makes cached base states stale.
+Every entry point (CLI and API server) creates sessions through this module.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Dict, Optional, Tuple
+
+from mock_data.campaign_data import get_campaign_data, get_personalized_opening
+from mock_data.customer_data import get_customer_by_id
+from mock_data.persuasion_strategy import determine_customer_profile
+from mock_data.reference_data import current as current_reference_data
+from mock_data.sentiment_trend import new_sentiment_trend
+from mock_data.strategy_table import is_high_value
+
+from .lru_cache import LRUCache
+from .bureau_client import bureau_client
+from .data_sources import get_pre_approved_offer
+from .prefetch_cache import kyc_prefetch_cache
+
+# Per-source lookup timeouts (seconds); a source that times out is treated as unavailable
+SOURCE_TIMEOUTS: Dict[str, float] = {
+    "crm": 2.0,
+    "bureau": 3.0,
+    "offers": 1.5,
+    "campaign": 1.5,
+}
+
+# How long a customer's base state is reused before the sources are queried again
+BASE_STATE_TTL_SECONDS = 300
+
+# Customers whose base state is kept in memory
+BASE_STATE_CACHE_SIZE = 1024
+
+_base_state_cache = LRUCache(maxsize=BASE_STATE_CACHE_SIZE)
+
+# Base state builds in flight, keyed by (customer ID, reference data version)
+_inflight_builds: Dict[Tuple[str, int], asyncio.Task] = {}
+
+
+async def _fetch_source(name: str, customer_id: str, lookup: Awaitable) -> Any:
+    """Await one source lookup, bounded by its timeout."""
+    try:
+        return await asyncio.wait_for(lookup, timeout=SOURCE_TIMEOUTS[name])
+    except asyncio.TimeoutError:
+        print(f"⚠️  {name} lookup timed out after {SOURCE_TIMEOUTS[name]}s for {customer_id}")
+    except Exception as e:
+        print(f"⚠️  {name} lookup failed for {customer_id}: {e}")
+    return None
+
+
+async def fetch_customer_sources(customer_id: str) -> Dict[str, Any]:
+    """
+    Query CRM, credit bureau, offer mart and campaign data concurrently.
+
+    CRM and bureau results go into the shared prefetch cache and bureau client
+    cache (the tools read them from there); only their cache versions are returned. Offer mart and
+    campaign lookups run in worker threads.
+
+    Args:
+        customer_id: The customer's unique ID
+
+    Returns:
+        dict: Result per source ("crm", "bureau", "offers", "campaign"); None for failed sources
+    """
+    crm, bureau, offers, campaign = await asyncio.gather(
+        _fetch_source("crm", customer_id, kyc_prefetch_cache.prefetch(customer_id)),
+        _fetch_source("bureau", customer_id, bureau_client.prefetch(customer_id)),
+        _fetch_source("offers", customer_id, asyncio.to_thread(get_pre_approved_offer, customer_id)),
+        _fetch_source("campaign", customer_id, asyncio.to_thread(get_campaign_data, customer_id)),
+    )
+    return {"crm": crm, "bureau": bureau, "offers": offers, "campaign": campaign}
+
+
+def _persuasion_context(customer: dict, campaign_data: dict) -> str:
+    """Customer context the agents use to adapt their sales approach."""
+    credit_score = customer.get("credit_score", 750)
+    return f"""
+CUSTOMER CONTEXT FOR INTELLIGENT ADAPTATION:
+- Credit Score: {credit_score} ({"Excellent" if credit_score >= 800 else "Good" if credit_score >= 750 else "Fair" if credit_score >= 700 else "Needs Improvement"})
+- Income: ₹{customer.get('monthly_salary', 0):,}/month ({"High" if customer.get('monthly_salary', 0) >= 100000 else "Medium" if customer.get('monthly_salary', 0) >= 50000 else "Budget-conscious"})
+- Campaign: {campaign_data.get('campaign', {}).get('source', 'Direct')} - {campaign_data.get('campaign', {}).get('keyword', 'personal loan')}
+- Intent: {campaign_data.get('campaign', {}).get('intent', 'GENERAL_PURPOSE')}
+- Urgency: {campaign_data.get('campaign', {}).get('urgency_level', 'MEDIUM')}
+- Customer Type: {campaign_data.get('customer_type', 'FIRST_TIME')}
+- Payment History: {campaign_data.get('journey', {}).get('payment_history', 'N/A')}
+
+ADAPT YOUR APPROACH INTELLIGENTLY:
+- If urgent need → Emphasize speed ("2-hour approval, 24-hour disbursement")
+- If repeat customer → Show appreciation ("As a valued customer for X years...")
+- If high credit score → Highlight premium rates ("Your excellent score qualifies you for our best 10.99% rate")
+- If budget-conscious → Focus on EMI affordability ("Just ₹X/month - less than dining expenses")
+- If skeptical/researcher → Provide transparency ("Complete breakdown, zero hidden charges")
+- If first-time borrower → Be educational and patient
+"""
+
+
+def build_base_state(customer: dict, sources: Dict[str, Any], reference_data_version: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Assemble a customer's initial session state from the source lookups.
+
+    Args:
+        customer: Customer record from the customer database
+        sources: Output of fetch_customer_sources
+        reference_data_version: Snapshot version the sources were read with
+            (defaults to the current snapshot)
+
+    Returns:
+        dict: Initial session state
+    """
+    customer_id = customer["customer_id"]
+    offer_result = sources.get("offers") or {}
+    offer = offer_result.get("offer", {}) if offer_result.get("status") == "success" else {}
+
+    # 🎯 Pre-Conversation Intelligence Layer
+    campaign_data = sources.get("campaign") or {}
+    campaign = campaign_data.get("campaign", {})
+    journey = campaign_data.get("journey", {})
+    personalized_opening = (
+        get_personalized_opening(customer_id, customer["name"], campaign_data)
+        if campaign_data
+        else f"Hi {customer['name']}! I'm Priya Sharma from Tata Capital. Welcome! "
+    )
+
+    # Profile keys the adaptive strategy table (intent/urgency live under the campaign)
+    customer_profile = determine_customer_profile(customer, {**campaign_data, **campaign}, customer["credit_score"])
+
+    # ⚡ CRM and bureau data live in the shared caches; state only records their versions
+    kyc_version = sources.get("crm")
+    credit_version = sources.get("bureau")
+
+    return {
+        # Customer information
+        "customer_id": customer_id,
+        "customer_name": customer["name"],
+        "customer_phone": customer.get("phone", "N/A"),
+        "customer_email": customer.get("email", ""),
+        "customer_city": customer["city"],
+        "customer_salary": customer["monthly_salary"],
+        "customer_occupation": customer.get("occupation", ""),
+        "customer_employer": customer.get("employer", ""),
+        "customer_pan": customer.get("pan_number", ""),
+        "customer_bank": customer.get("bank_name", ""),
+        "customer_account": customer.get("account_number", ""),
+
+        # Pre-approved offer
+        "pre_approved_limit": customer["pre_approved_limit"],
+        "credit_score": customer["credit_score"],
+        "current_offer": offer,
+
+        # 🎯 Pre-Conversation Intelligence
+        "campaign_source": campaign.get("source", "Direct"),
+        "campaign_keyword": campaign.get("keyword", "personal loan"),
+        "customer_intent": campaign.get("intent", "GENERAL_PURPOSE"),
+        "urgency_level": campaign.get("urgency_level", "MEDIUM"),
+        "customer_type": campaign_data.get("customer_type", "FIRST_TIME"),
+        "relationship_tenure_years": journey.get("relationship_tenure_years", 0),
+        "payment_history": journey.get("payment_history", "N/A"),
+        "current_loans_count": len(journey.get("current_loans", [])),
+        "previous_interactions_count": len(journey.get("previous_interactions", [])),
+        "offer_expiry_hours": campaign.get("offer_expiry_hours", 48),
+
+        # 🧠 Persuasion Strategy (Smart, LLM-driven)
+        "persuasion_strategy": _persuasion_context(customer, campaign_data),
+        "personalized_opening": personalized_opening,
+
+        # ⚠️ Objection Handling
+        "objection_handling_context": "No objections detected yet. Monitor customer responses.",
+        "detected_objections": [],
+
+        # 💚 Emotional Intelligence
+        "current_sentiment": {"status": "neutral", "primary_sentiment": "NEUTRAL"},
+        "sentiment_adaptive_strategy": "No strong sentiment detected. Maintain professional, balanced tone.",
+        "sentiment_history": [],
+        "sentiment_trend": new_sentiment_trend(),
+        "customer_profile": customer_profile,
+        "customer_language": customer.get("preferred_language", "en"),
+        "high_value_session": is_high_value(customer["pre_approved_limit"], customer_profile),
+
+        # Application tracking
+        "loan_application": {},
+        "application_status": "NOT_STARTED",
+        "application_initiated": False,
+
+        # Verification status
+        "kyc_verified": False,
+        "kyc_data": {},
+
+        # Underwriting status
+        "eligibility_evaluation": {},
+        "loan_approved": False,
+
+        # Sanction letter
+        "sanction_letter": {},
+
+        # Interaction tracking
+        "interaction_history": [],
+        "history": [],
+        "offer_shown": False,
+
+        # 📚 Reference data (campaigns, rate card, offer rules, ...) this session was built from
+        "reference_data_version": reference_data_version if reference_data_version is not None else current_reference_data().version,
+
+        # ⚡ Parallel processing
+        "_prefetch_versions": {"kyc": kyc_version, "credit": credit_version},
+        "_parallel_processing_enabled": kyc_version is not None and credit_version is not None,
+    }
+
+
+async def _build_base_state(customer_id: str, reference_data_version: int) -> Optional[Dict[str, Any]]:
+    try:
+        customer = await asyncio.to_thread(get_customer_by_id, customer_id)
+        if not customer:
+            return None
+
+        sources = await fetch_customer_sources(customer_id)
+        base = build_base_state(customer, sources, reference_data_version)
+
+        # Partial results (a source timed out or failed) are not cached, so the next session retries
+        if all(result is not None for result in sources.values()):
+            _base_state_cache.put(customer_id, (base, time.monotonic()))
+        return base
+    finally:
+        _inflight_builds.pop((customer_id, reference_data_version), None)
+
+
+async def get_base_state(customer_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached base state for a customer, building it on a miss.
+    A cached state built from an older reference data snapshot is rebuilt.
+    Concurrent callers for the same customer share one build.
+
+    The cached dict is shared and must not be mutated; use
+    bootstrap_session_state() to get a per-session state.
+
+    Returns:
+        dict: Base state, or None if the customer does not exist
+    """
+    reference_data_version = current_reference_data().version
+    cached = _base_state_cache.get(customer_id)
+    if cached is not None:
+        base, built_at = cached
+        if (time.monotonic() - built_at <= BASE_STATE_TTL_SECONDS
+                and base["reference_data_version"] == reference_data_version):
+            return base
+        _base_state_cache.pop(customer_id)
+
+    key = (customer_id, reference_data_version)
+    task = _inflight_builds.get(key)
+    if task is None:
+        task = asyncio.get_running_loop().create_task(_build_base_state(customer_id, reference_data_version))
+        _inflight_builds[key] = task
+    # Shielded so one caller's cancellation does not cancel the shared build
+    return await asyncio.shield(task)
+
+
+async def bootstrap_session_state(customer_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Initial state for a new session.
+
+    The returned dict is the session's own (adding or replacing keys does not
+    touch the cached base), but its values are shared with other sessions and
+    must be replaced, never mutated in place.
+
+    Args:
+        customer_id: The customer's unique ID
+
+    Returns:
+        dict: A copy-on-write view of the customer's base state, or None if the customer does not exist
+    """
+    base = await get_base_state(customer_id)
+    return dict(base) if base is not None else None
+
+
+def invalidate_base_state(customer_id: Optional[str] = None):
+    """Drop one customer's cached base state, or all of them."""
+    if customer_id is None:
+        _base_state_cache.clear()
+    else:
+        _base_state_cache.pop(customer_id)
@@ -0,0 +1,346 @@
+"""
+Session State Access Layer
+Cheap, read-only projections of session state that never copy event history,
+plus a batched mutation API that commits a turn's state changes in one event
+"""
+
+import copy
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from google.adk.events import Event, EventActions
+from google.adk.sessions import Session
+from google.adk.sessions.base_session_service import GetSessionConfig
+
+# Scoped state prefixes used by ADK session services
+APP_PREFIX = "app:"
+USER_PREFIX = "user:"
+
+
+def _freeze(value: Any) -> Any:
+    """Wrap mutable containers in read-only views (lazily, no copying)."""
+    if isinstance(value, dict):
+        return StateView(value)
+    if isinstance(value, list):
+        return FrozenList(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Convert a frozen value back into plain, independently owned data."""
+    if isinstance(value, StateView):
+        return value.to_dict()
+    if isinstance(value, FrozenList):
+        return value.to_list()
+    return copy.deepcopy(value)
+
+
+class FrozenList(Sequence):
+    """Read-only view over a list stored in session state."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: list):
+        self._items = items
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FrozenList(self._items[index])
+        return _freeze(self._items[index])
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"FrozenList({self._items!r})"
+
+    def to_list(self) -> List[Any]:
+        """Return a plain, JSON-serializable deep copy of the list."""
+        return [_thaw(item) for item in self._items]
+
+
+class StateView(Mapping):
+    """
+    Immutable projection of session state.
+
+    Values are wrapped on access, so nested dicts and lists cannot be mutated
+    through the view. Building a view costs O(number of projected keys) and is
+    independent of how many events the session has accumulated.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping):
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        return _freeze(self._data[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"StateView({self._data!r})"
+
+    def without_prefixes(self, *prefixes: str) -> "StateView":
+        """Return a view that hides keys starting with any of the prefixes."""
+        return StateView({key: value for key, value in self._data.items() if not key.startswith(prefixes)})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a plain, JSON-serializable deep copy of the projected keys."""
+        return {key: _thaw(value) for key, value in self._data.items()}
+
+
+def _is_in_memory(session_service) -> bool:
+    """Whether the service keeps sessions in the ADK in-memory layout."""
+    return isinstance(getattr(session_service, "sessions", None), dict)
+
+
+def _storage_session(session_service, app_name: str, user_id: str, session_id: str):
+    """Return the stored (uncopied) session object, or None if it does not exist."""
+    return session_service.sessions.get(app_name, {}).get(user_id, {}).get(session_id)
+
+
+def _project(session_state: Mapping, app_state: Mapping, user_state: Mapping,
+             keys: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """Shallow-merge session, app and user state, optionally limited to keys."""
+    if keys is None:
+        projection = dict(session_state)
+        for key, value in app_state.items():
+            projection[APP_PREFIX + key] = value
+        for key, value in user_state.items():
+            projection[USER_PREFIX + key] = value
+        return projection
+
+    projection = {}
+    for key in keys:
+        if key.startswith(APP_PREFIX):
+            source, lookup = app_state, key[len(APP_PREFIX):]
+        elif key.startswith(USER_PREFIX):
+            source, lookup = user_state, key[len(USER_PREFIX):]
+        else:
+            source, lookup = session_state, key
+        if lookup in source:
+            projection[key] = source[lookup]
+    return projection
+
+
+async def read_session_state(
+    session_service,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    keys: Optional[Iterable[str]] = None,
+) -> Optional[StateView]:
+    """
+    Read a session's state without deep-copying the session or its events.
+
+    Args:
+        session_service: The session service instance
+        app_name: The application name
+        user_id: The user ID
+        session_id: The session ID
+        keys: Optional state keys to project; all keys when omitted
+
+    Returns:
+        StateView: Read-only state projection, or None if the session does not exist
+    """
+    if _is_in_memory(session_service):
+        session = _storage_session(session_service, app_name, user_id, session_id)
+        if session is None:
+            return None
+        app_state = getattr(session_service, "app_state", {}).get(app_name, {})
+        user_state = getattr(session_service, "user_state", {}).get(app_name, {}).get(user_id, {})
+        return StateView(_project(session.state, app_state, user_state, keys))
+
+    # Other session services: ask for the session without any events
+    session = await session_service.get_session(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        config=GetSessionConfig(num_recent_events=0),
+    )
+    if session is None:
+        return None
+    return StateView(_project(session.state, {}, {}, keys))
+
+
+async def session_exists(session_service, app_name: str, user_id: str, session_id: str) -> bool:
+    """Check whether a session exists without materializing its state."""
+    if _is_in_memory(session_service):
+        return _storage_session(session_service, app_name, user_id, session_id) is not None
+    return await read_session_state(session_service, app_name, user_id, session_id, keys=()) is not None
+
+
+def _raw_value(state: Mapping, key: str) -> Any:
+    """Read a value from a state mapping without read-only wrapping."""
+    if isinstance(state, StateView):
+        return state._data.get(key)
+    return state.get(key)
+
+
+class StateBatch:
+    """
+    Accumulates state updates during a turn and writes them in one go.
+
+    - set(): replace a key
+    - merge(): update fields of a dict-valued key (e.g. loan_application)
+    - append(): add items to a list-valued key, keeping only the last maxlen items
+
+    State deltas carry whole values, so an append rewrites the key's list;
+    maxlen is required so that cost (and the key) stays bounded. Use one key
+    per entry for unbounded logs (see services.event_log).
+
+    Use apply() inside tools (writes into tool_context.state, which ADK records
+    on the tool's own event) and commit() from CLI helpers and endpoints (one
+    state-delta event appended through the session service).
+    """
+
+    def __init__(self):
+        self._updates: Dict[str, Any] = {}
+        self._merges: Dict[str, Dict[str, Any]] = {}
+        self._appends: Dict[str, List[Any]] = {}
+        self._maxlen: Dict[str, int] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._updates or self._merges or self._appends)
+
+    def keys(self) -> List[str]:
+        """State keys touched by this batch."""
+        return list(dict.fromkeys([*self._updates, *self._merges, *self._appends]))
+
+    def pending(self, key: str, default: Any = None) -> Any:
+        """Value staged for a key with set(), or default."""
+        return self._updates.get(key, default)
+
+    def set(self, key: str, value: Any) -> "StateBatch":
+        self._updates[key] = value
+        self._merges.pop(key, None)
+        self._appends.pop(key, None)
+        self._maxlen.pop(key, None)
+        return self
+
+    def update(self, values: Mapping) -> "StateBatch":
+        for key, value in values.items():
+            self.set(key, value)
+        return self
+
+    def merge(self, key: str, **fields) -> "StateBatch":
+        self._merges.setdefault(key, {}).update(fields)
+        return self
+
+    def append(self, key: str, item: Any, maxlen: int) -> "StateBatch":
+        if maxlen < 1:
+            raise ValueError(f"maxlen must be positive, got {maxlen}")
+        self._appends.setdefault(key, []).append(item)
+        self._maxlen[key] = maxlen
+        return self
+
+    def clear(self):
+        self._updates.clear()
+        self._merges.clear()
+        self._appends.clear()
+        self._maxlen.clear()
+
+    def to_delta(self, state: Mapping) -> Dict[str, Any]:
+        """
+        Resolve pending operations against the current state.
+
+        Args:
+            state: Current state (dict, ADK State or StateView)
+
+        Returns:
+            dict: Full values for every touched key, ready to use as a state delta
+        """
+        delta = dict(self._updates)
+        for key, fields in self._merges.items():
+            base = delta[key] if key in delta else _raw_value(state, key)
+            delta[key] = {**(base or {}), **fields}
+        for key, items in self._appends.items():
+            base = delta[key] if key in delta else _raw_value(state, key)
+            # Only the items that survive the cap are copied
+            maxlen = self._maxlen[key]
+            base = base or []
+            kept = max(0, maxlen - len(items))
+            delta[key] = [*base[max(0, len(base) - kept):], *items] if kept else items[-maxlen:]
+        return delta
+
+    def apply(self, state) -> Dict[str, Any]:
+        """Write the batch into a mutable state mapping (e.g. tool_context.state)."""
+        delta = self.to_delta(state)
+        for key, value in delta.items():
+            state[key] = value
+        self.clear()
+        return delta
+
+    async def commit(
+        self,
+        session_service,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        author: str = "user",
+    ) -> Dict[str, Any]:
+        """
+        Commit the batch as a single state-delta event.
+
+        Args:
+            session_service: The session service instance
+            app_name: The application name
+            user_id: The user ID
+            session_id: The session ID
+            author: Event author recorded on the state-delta event
+
+        Returns:
+            dict: The committed state delta (empty if nothing was pending)
+        """
+        if not self:
+            return {}
+
+        current = await read_session_state(
+            session_service, app_name, user_id, session_id, keys=self.keys()
+        )
+        if current is None:
+            raise ValueError(f"Session {session_id} not found")
+
+        delta = self.to_delta(current)
+        event = Event(
+            invocation_id=Event.new_id(),
+            author=author,
+            actions=EventActions(state_delta=delta),
+            timestamp=time.time(),
+        )
+        session = await _session_handle(session_service, app_name, user_id, session_id)
+        await session_service.append_event(session, event)
+        self.clear()
+        return delta
+
+
+async def _session_handle(session_service, app_name: str, user_id: str, session_id: str) -> Session:
+    """
+    Session object to pass to append_event.
+
+    The in-memory service applies deltas to its stored session regardless of the
+    object passed in, so a bare handle avoids copying the stored session.
+    """
+    if _is_in_memory(session_service):
+        stored = _storage_session(session_service, app_name, user_id, session_id)
+        return Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            last_update_time=stored.last_update_time,
+        )
+    return await session_service.get_session(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        config=GetSessionConfig(num_recent_events=0),
+    )
@@ -0,0 +1,165 @@
+"""
+Turn Coordinator
+Runs agent turns for the same session strictly one at a time and coalesces
+client retries that carry the same idempotency key
+"""
+
+import asyncio
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from .lru_cache import LRUCache
+
+# How long a finished turn's result is returned for a retried idempotency key
+DEFAULT_RESULT_TTL_SECONDS = 300
+
+# Maximum number of finished results kept for retries
+DEFAULT_MAX_CACHED_RESULTS = 2048
+
+
+class IdempotencyConflict(ValueError):
+    """An idempotency key was reused with a different message."""
+
+
+class _TurnCancelled(Exception):
+    """Set on an in-flight turn's future when the request running it was cancelled."""
+
+
+def _fingerprint(payload: str) -> str:
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class TurnCoordinator:
+    """
+    Per-session turn serialization with idempotent retries.
+
+    - Turns for one session key wait on that session's lock, so they run in
+      arrival order and never interleave tool writes.
+    - A turn submitted with an idempotency key is registered while it runs;
+      a retry with the same key awaits the in-flight turn, and later retries
+      get the cached result until it expires.
+    - Failed turns are not cached, so the client can retry them.
+    - If the request running a turn is cancelled (e.g. the client
+      disconnected), retries waiting on it run the turn themselves.
+    """
+
+    def __init__(
+        self,
+        result_ttl_seconds: int = DEFAULT_RESULT_TTL_SECONDS,
+        max_cached_results: int = DEFAULT_MAX_CACHED_RESULTS,
+    ):
+        self.result_ttl_seconds = result_ttl_seconds
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._lock_users: Dict[Hashable, int] = {}
+        self._inflight: Dict[Tuple[Hashable, str], Tuple[str, asyncio.Future]] = {}
+        self._results = LRUCache(maxsize=max_cached_results)
+        self.stats = {"turns_run": 0, "coalesced_inflight": 0, "served_from_cache": 0, "rerun_after_cancel": 0}
+
+    async def _run_serialized(self, session_key: Hashable, turn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a turn while holding the session's lock; drop the lock when nobody else needs it."""
+        lock = self._locks.setdefault(session_key, asyncio.Lock())
+        self._lock_users[session_key] = self._lock_users.get(session_key, 0) + 1
+        try:
+            async with lock:
+                self.stats["turns_run"] += 1
+                return await turn()
+        finally:
+            self._lock_users[session_key] -= 1
+            if self._lock_users[session_key] == 0:
+                del self._lock_users[session_key]
+                del self._locks[session_key]
+
+    def _cached_result(self, key: Tuple[Hashable, str], fingerprint: str) -> Tuple[bool, Any]:
+        entry = self._results.get(key)
+        if entry is None:
+            return False, None
+        cached_fingerprint, result, finished_at = entry
+        if time.monotonic() - finished_at > self.result_ttl_seconds:
+            self._results.pop(key)
+            return False, None
+        if cached_fingerprint != fingerprint:
+            raise IdempotencyConflict("Idempotency key was already used for a different message")
+        return True, result
+
+    async def run(
+        self,
+        session_key: Hashable,
+        turn: Callable[[], Awaitable[Any]],
+        idempotency_key: Optional[str] = None,
+        payload: str = "",
+    ) -> Any:
+        """
+        Run a turn for a session.
+
+        Args:
+            session_key: Identifies the session (e.g. (user_id, session_id))
+            turn: Zero-argument coroutine function that performs the turn
+            idempotency_key: Optional client-supplied key for retry coalescing
+            payload: The message the key was issued for; reusing a key with a
+                different payload raises IdempotencyConflict
+
+        Returns:
+            The turn's result (or the in-flight/cached result for a retried key)
+        """
+        if not idempotency_key:
+            return await self._run_serialized(session_key, turn)
+
+        key = (session_key, idempotency_key)
+        fingerprint = _fingerprint(payload)
+
+        while True:
+            found, result = self._cached_result(key, fingerprint)
+            if found:
+                self.stats["served_from_cache"] += 1
+                return result
+
+            if key not in self._inflight:
+                return await self._run_registered(key, fingerprint, session_key, turn)
+
+            inflight_fingerprint, future = self._inflight[key]
+            if inflight_fingerprint != fingerprint:
+                raise IdempotencyConflict("Idempotency key was already used for a different message")
+            self.stats["coalesced_inflight"] += 1
+            try:
+                return await asyncio.shield(future)
+            except _TurnCancelled:
+                # The original request went away; run the turn (or join whoever does)
+                self.stats["rerun_after_cancel"] += 1
+
+    async def _run_registered(
+        self,
+        key: Tuple[Hashable, str],
+        fingerprint: str,
+        session_key: Hashable,
+        turn: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run a turn registered as in flight under its idempotency key."""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = (fingerprint, future)
+        try:
+            result = await self._run_serialized(session_key, turn)
+        except asyncio.CancelledError:
+            # Waiting retries must not die with this request
+            future.set_exception(_TurnCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # retrieved here so an unawaited failure is not logged again
+            raise
+        else:
+            future.set_result(result)
+            self._results.put(key, (fingerprint, result, time.monotonic()))
+            return result
+        finally:
+            del self._inflight[key]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters plus current lock/in-flight/cache sizes."""
+        return {
+            **self.stats,
+            "active_sessions": len(self._locks),
+            "inflight_keys": len(self._inflight),
+            "cached_results": len(self._results),
+        }
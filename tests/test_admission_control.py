@@ -0,0 +1,111 @@
+"""Admission control: queueing, cancellation and timeouts racing the slot handoff."""
+
+import asyncio
+import time
+
+from services.admission_control import AdmissionController, AdmissionRejected
+
+
+async def _turn(controller, user, priority="standard", order=None):
+    async with controller.admit(user, priority):
+        if order is not None:
+            order.append(user)
+
+
+async def _hold(controller, user="holder"):
+    """Enter a slot by hand so the test decides exactly when it is released."""
+    slot = controller.admit(user)
+    await slot.__aenter__()
+    return slot
+
+
+def test_rejects_when_queue_or_user_limit_is_full():
+    async def run():
+        controller = AdmissionController(max_inflight=1, max_queue=2, max_queue_per_user=1)
+        slot = await _hold(controller)
+        waiting = [asyncio.create_task(_turn(controller, user)) for user in ("a", "a", "b", "c")]
+        await asyncio.sleep(0)
+        results = [task.exception() if task.done() else None for task in waiting]
+        await slot.__aexit__(None, None, None)
+        await asyncio.gather(*waiting, return_exceptions=True)
+        return controller, results
+
+    controller, results = asyncio.run(run())
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], AdmissionRejected) and isinstance(results[3], AdmissionRejected)
+    assert controller.stats["rejected_user_limit"] == 1 and controller.stats["rejected_queue_full"] == 1
+    assert controller.snapshot()["inflight"] == 0
+
+
+def test_higher_class_is_served_first():
+    async def run():
+        controller = AdmissionController(max_inflight=1)
+        slot = await _hold(controller)
+        order = []
+        tasks = [asyncio.create_task(_turn(controller, "browser", "standard", order)),
+                 asyncio.create_task(_turn(controller, "closer", "closing", order))]
+        await asyncio.sleep(0)
+        await slot.__aexit__(None, None, None)
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == ["closer", "browser"]
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def run():
+        controller = AdmissionController(max_inflight=1)
+        slot = await _hold(controller)
+        waiter = asyncio.create_task(_turn(controller, "a"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        queued_after_cancel = controller.snapshot()["queue_depth"]
+        await slot.__aexit__(None, None, None)
+        return controller, queued_after_cancel
+
+    controller, queued_after_cancel = asyncio.run(run())
+    assert queued_after_cancel == 0
+    assert controller.snapshot()["inflight"] == 0
+
+
+def test_cancel_racing_the_handoff_gives_the_slot_to_the_next_waiter():
+    async def run():
+        controller = AdmissionController(max_inflight=1)
+        slot = await _hold(controller)
+        order = []
+        first = asyncio.create_task(_turn(controller, "a", order=order))
+        second = asyncio.create_task(_turn(controller, "b", order=order))
+        await asyncio.sleep(0)
+        # Cancel "a" and hand it the slot in the same step, before it can run
+        first.cancel()
+        await slot.__aexit__(None, None, None)
+        await asyncio.gather(first, second, return_exceptions=True)
+        return controller, order, first
+
+    controller, order, first = asyncio.run(run())
+    assert "b" in order
+    assert first.cancelled() or order == ["a", "b"]
+    assert controller.snapshot()["inflight"] == 0
+
+
+def test_timeout_racing_the_handoff_returns_the_slot():
+    async def run():
+        controller = AdmissionController(max_inflight=1, max_wait_seconds=0.05)
+        controller._inflight = 1  # a turn holding the only slot, released below via _release()
+        waiter = asyncio.create_task(_turn(controller, "a"))
+        await asyncio.sleep(0)
+        # The wait timer and the release fall due in the same loop iteration, timer first,
+        # so the slot is handed to "a" after its wait has already timed out
+        asyncio.get_running_loop().call_later(0.06, controller._release)
+        time.sleep(0.1)
+        await asyncio.gather(waiter, return_exceptions=True)
+        inflight = controller.snapshot()["inflight"]
+        started = time.monotonic()
+        await _turn(controller, "b")
+        return waiter, inflight, time.monotonic() - started
+
+    waiter, inflight, next_wait = asyncio.run(run())
+    assert isinstance(waiter.exception(), AdmissionRejected)
+    assert inflight == 0
+    assert next_wait < 0.05
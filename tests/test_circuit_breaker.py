@@ -0,0 +1,101 @@
+"""Circuit breaker: half-open probe permits, stale results and cancellation."""
+
+import asyncio
+import threading
+
+import pytest
+
+from services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+def _open(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure(breaker.allow())
+    assert breaker.state == OPEN
+
+
+def test_opens_after_threshold_and_refuses():
+    breaker = CircuitBreaker("t", failure_threshold=2, cooldown_seconds=60)
+    _open(breaker)
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "never")
+    assert breaker.stats["short_circuited"] == 1
+
+
+def test_slow_success_counts_as_failure():
+    breaker = CircuitBreaker("t", failure_threshold=1, slow_call_seconds=1, cooldown_seconds=60)
+    breaker.record_success(breaker.allow(), duration=2)
+    assert breaker.state == OPEN
+    assert breaker.stats["slow_calls"] == 1 and breaker.stats["failures"] == 0
+
+
+def test_racing_threads_get_only_the_probe_permits():
+    breaker = CircuitBreaker("t", failure_threshold=1, cooldown_seconds=0, half_open_probes=2)
+    _open(breaker)
+    barrier = threading.Barrier(16)
+    permits = []
+
+    def contend():
+        barrier.wait()
+        permits.append(breaker.allow())
+
+    threads = [threading.Thread(target=contend) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    granted = [permit for permit in permits if permit is not None]
+    assert len(granted) == 2 and all(permit.probe for permit in granted)
+    assert breaker.state == HALF_OPEN
+    assert breaker.snapshot()["probes_in_flight"] == 2
+
+
+def test_failed_probe_reopens_and_healthy_probe_closes():
+    breaker = CircuitBreaker("t", failure_threshold=1, cooldown_seconds=0)
+    _open(breaker)
+    breaker.record_failure(breaker.allow())
+    assert breaker.state == OPEN and breaker.stats["opened"] == 2
+    breaker.record_success(breaker.allow())
+    assert breaker.state == CLOSED and breaker.consecutive_failures == 0
+
+
+def test_cancelled_probe_frees_its_slot_without_moving_the_state():
+    breaker = CircuitBreaker("t", failure_threshold=1, cooldown_seconds=0)
+    _open(breaker)
+    probe = breaker.allow()
+    assert breaker.allow() is None
+    breaker.record_cancelled(probe)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow().probe
+
+
+def test_results_from_before_the_breaker_opened_are_ignored():
+    breaker = CircuitBreaker("t", failure_threshold=1, cooldown_seconds=0)
+    stale = breaker.allow()
+    _open(breaker)
+    probe = breaker.allow()
+    assert probe.probe and probe.epoch != stale.epoch
+
+    breaker.record_success(stale)
+    assert breaker.state == HALF_OPEN
+    assert breaker.snapshot()["probes_in_flight"] == 1
+    breaker.record_failure(stale)
+    assert breaker.state == HALF_OPEN
+
+    breaker.record_success(probe)
+    assert breaker.state == CLOSED
+
+
+def test_cancelled_async_call_does_not_count():
+    breaker = CircuitBreaker("t", failure_threshold=1, cooldown_seconds=60)
+
+    async def run():
+        task = asyncio.create_task(breaker.acall(asyncio.sleep, 10))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert breaker.state == CLOSED and breaker.stats["failures"] == 0
@@ -0,0 +1,65 @@
+"""Local sentiment tier: negation handling and escalation."""
+
+import pytest
+
+from mock_data.local_sentiment import extract_features, get_local_model
+from mock_data.sentiment_analyzer import _escalation_reason, get_sentiment_context_for_agent
+
+NEGATED = [
+    "not happy at all",
+    "this is not great",
+    "i dont trust you",
+    "not fine",
+    "not excited",
+    "I am not happy with this",
+]
+
+
+def test_negated_cues_are_marked_and_not_counted():
+    features, cues, negated_cues = extract_features("I am not happy with this")
+    assert negated_cues == ["happy"]
+    assert "happy" not in cues
+    assert "neg:happy" in features and "w:happy" not in features
+    assert "lex:EXCITEMENT" not in features
+
+
+def test_cues_that_contain_the_negator_are_ordinary():
+    _, cues, negated_cues = extract_features("i am not sure")
+    assert "not_sure" in cues
+    assert negated_cues == []
+
+
+def test_negation_stops_at_clause_boundary():
+    _, cues, negated_cues = extract_features("no problem, go ahead")
+    assert "go_ahead" in cues
+    assert negated_cues == []
+
+
+@pytest.mark.parametrize("message", NEGATED)
+def test_negated_messages_are_not_served_locally(message):
+    prediction = get_local_model().predict(message)
+    assert prediction["sentiment"] not in ("EXCITEMENT", "TRUST")
+    assert _escalation_reason(prediction) is not None
+
+
+@pytest.mark.parametrize("message, sentiment", [("great!", "EXCITEMENT"), ("ok", "TRUST"), ("i am not sure", "HESITATION")])
+def test_clear_messages_are_served_locally(message, sentiment):
+    prediction = get_local_model().predict(message)
+    assert prediction["sentiment"] == sentiment
+    assert _escalation_reason(prediction) is None
+
+
+def test_agent_context_names_the_local_tier_and_curated_strategy():
+    result = {
+        "status": "detected", "primary_sentiment": "TRUST", "sentiment_score": 0.6, "confidence": 0.98,
+        "emoji": "👍", "reasoning": "Local classifier (cues: ok)", "tier": "local",
+        "adaptive_strategy": {"tone": "t", "pace": "p", "focus": "f", "approach": "a", "ai_generated": False},
+    }
+    context = get_sentiment_context_for_agent(result)
+    assert "MISTRAL" not in context.upper()
+    assert "LOCAL SENTIMENT CLASSIFIER" in context and "curated strategy" in context
+
+    result.update(tier="llm", adaptive_strategy={**result["adaptive_strategy"], "ai_generated": True})
+    context = get_sentiment_context_for_agent(result)
+    assert "MISTRAL AI EMOTIONAL INTELLIGENCE DETECTED" in context
+    assert "Mistral AI-generated strategy" in context
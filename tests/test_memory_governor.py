@@ -0,0 +1,87 @@
+"""Memory governor: event log / ADK event trims and size estimates."""
+
+import asyncio
+
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from services.event_log import event_count, last_event
+from services.memory_governor import MemoryGovernor
+from services.session_state import read_session_state
+from utils import update_interaction_history
+
+APP = "app"
+
+
+async def _session_with_history(service, session_id="s", events=300):
+    await service.create_session(app_name=APP, user_id="u", session_id=session_id, state={})
+    for index in range(events):
+        if index % 10 == 0:
+            session = await service.get_session(app_name=APP, user_id="u", session_id=session_id)
+            content = types.Content(role="user", parts=[types.Part(text=f"message {index}")])
+            await service.append_event(session, Event(author="user", content=content))
+        await update_interaction_history(service, APP, "u", session_id, {"action": "user_query", "index": index})
+
+
+class DelegatingService:
+    """A session service that is not InMemorySessionService but exposes the same layout."""
+
+    def __init__(self, inner):
+        self._inner = inner
+        self.sessions = inner.sessions
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+
+def test_log_and_events_are_trimmed_with_in_memory_service(tmp_path):
+    async def run():
+        service = InMemorySessionService()
+        await _session_with_history(service)
+        governor = MemoryGovernor(service, APP, archive_dir=str(tmp_path), log_cap=50, events_cap=25)
+        assert await governor.enforce_caps() == 1
+        stored = service.sessions[APP]["u"]["s"]
+        view = await read_session_state(service, APP, "u", "s")
+        return stored, view, governor
+
+    stored, view, governor = asyncio.run(run())
+    assert sum(key.startswith("_log:") for key in stored.state) == 50
+    assert len(stored.events) <= 25 and stored.events[0].author == "user"
+    assert last_event(view, "user_query")["index"] == 299
+    assert event_count(view) == 300
+    assert governor.stats()["trimmed_log_events"] == 250
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["u__s.events.jsonl", "u__s.log.jsonl"]
+
+
+def test_other_services_are_not_trimmed_in_place():
+    async def run():
+        inner = InMemorySessionService()
+        await _session_with_history(inner, events=100)
+        stored = inner.sessions[APP]["u"]["s"]
+        events_before = len(stored.events)
+        governor = MemoryGovernor(DelegatingService(inner), APP, log_cap=10, events_cap=2)
+        await governor.enforce_caps()
+        return stored, events_before, governor
+
+    stored, events_before, governor = asyncio.run(run())
+    assert not governor.trims_in_place
+    assert sum(key.startswith("_log:") for key in stored.state) == 100
+    assert len(stored.events) >= events_before
+
+
+def test_size_estimate_is_sampled_and_cached():
+    async def run():
+        service = InMemorySessionService()
+        for index in range(20):
+            await service.create_session(app_name=APP, user_id="u", session_id=f"s{index}", state={"blob": "x" * 1000})
+        governor = MemoryGovernor(service, APP, size_sample=5, size_ttl_seconds=60)
+        first = governor.stats()
+        await service.create_session(app_name=APP, user_id="u", session_id="late", state={"blob": "x" * 1000})
+        return first, governor.stats()
+
+    first, second = asyncio.run(run())
+    assert first["size_sampled_sessions"] == 5
+    assert first["approx_state_bytes"] > 20 * 1000
+    assert second["live_sessions"] == 21
+    assert second["approx_state_bytes"] == first["approx_state_bytes"]
@@ -0,0 +1,147 @@
+"""Micro-batcher: coalescing, fallbacks, and callers cancelled before or during a flush."""
+
+import asyncio
+
+import pytest
+
+from services.micro_batcher import MicroBatcher
+
+
+class Backend:
+    """run_batch/run_single that record their calls; items in `unanswered` get None from the batch."""
+
+    def __init__(self, delay=0.0, unanswered=(), batch_error=None):
+        self.delay = delay
+        self.unanswered = set(unanswered)
+        self.batch_error = batch_error
+        self.batches = []
+        self.singles = []
+
+    async def run_batch(self, items):
+        self.batches.append(list(items))
+        await asyncio.sleep(self.delay)
+        if self.batch_error is not None:
+            raise self.batch_error
+        return [None if item in self.unanswered else item.upper() for item in items]
+
+    async def run_single(self, item):
+        self.singles.append(item)
+        return item.upper()
+
+
+def _batcher(backend, **kwargs):
+    return MicroBatcher("test", backend.run_batch, backend.run_single, **kwargs)
+
+
+def test_concurrent_items_share_one_batch_and_duplicates_one_slot():
+    backend = Backend()
+    batcher = _batcher(backend, max_wait_seconds=0.01)
+
+    async def run():
+        return await asyncio.gather(*(batcher.submit(item) for item in ("a", "b", "a", "c")))
+
+    assert asyncio.run(run()) == ["A", "B", "A", "C"]
+    assert backend.batches == [["a", "b", "c"]] and backend.singles == []
+    assert batcher.stats["deduplicated"] == 1
+
+
+def test_full_batch_flushes_without_waiting():
+    backend = Backend()
+    batcher = _batcher(backend, max_batch_size=2, max_wait_seconds=60)
+
+    async def run():
+        return await asyncio.wait_for(asyncio.gather(batcher.submit("a"), batcher.submit("b")), timeout=1)
+
+    assert asyncio.run(run()) == ["A", "B"]
+
+
+def test_unanswered_items_and_unusable_batches_fall_back_to_single_calls():
+    backend = Backend(unanswered={"b"})
+    batcher = _batcher(backend)
+
+    async def run():
+        return await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+    assert asyncio.run(run()) == ["A", "B"]
+    assert backend.singles == ["b"]
+
+    backend = Backend(batch_error=ValueError("unparseable"))
+    batcher = _batcher(backend)
+    assert asyncio.run(run()) == ["A", "B"]
+    assert sorted(backend.singles) == ["a", "b"] and batcher.stats["batch_parse_failures"] == 1
+
+
+def test_other_batch_errors_reach_every_caller():
+    batcher = _batcher(Backend(batch_error=ConnectionError("down")))
+
+    async def run():
+        return await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+
+    assert all(isinstance(result, ConnectionError) for result in asyncio.run(run()))
+
+
+def test_caller_cancelled_before_the_flush_does_not_break_the_batch():
+    backend = Backend()
+    batcher = _batcher(backend, max_wait_seconds=0.01)
+
+    async def run():
+        callers = [asyncio.create_task(batcher.submit(item)) for item in ("a", "b", "c")]
+        await asyncio.sleep(0)
+        callers[1].cancel()
+        results = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), timeout=1)
+        return callers, results
+
+    callers, results = asyncio.run(run())
+    assert callers[1].cancelled()
+    assert results[0] == "A" and results[2] == "C"
+    assert backend.batches == [["a", "b", "c"]]
+
+
+def test_caller_cancelled_during_the_batch_call_leaves_it_running():
+    backend = Backend(delay=0.05)
+    batcher = _batcher(backend, max_wait_seconds=0.001)
+
+    async def run():
+        callers = [asyncio.create_task(batcher.submit(item)) for item in ("a", "b")]
+        await asyncio.sleep(0.02)
+        assert backend.batches == [["a", "b"]]
+        callers[0].cancel()
+        survivor = await asyncio.wait_for(callers[1], timeout=1)
+        await asyncio.gather(*batcher._tasks)
+        return callers[0], survivor
+
+    cancelled, survivor = asyncio.run(run())
+    assert cancelled.cancelled()
+    assert survivor == "B"
+    assert batcher.snapshot()["pending"] == 0
+
+
+def test_every_caller_cancelled_still_runs_the_flushed_batch():
+    backend = Backend(delay=0.01)
+    batcher = _batcher(backend, max_wait_seconds=0.001)
+
+    async def run():
+        callers = [asyncio.create_task(batcher.submit(item)) for item in ("a", "b")]
+        await asyncio.sleep(0.005)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        tasks = list(batcher._tasks)
+        await asyncio.gather(*tasks)
+        return tasks
+
+    tasks = asyncio.run(run())
+    assert backend.batches == [["a", "b"]]
+    assert all(task.exception() is None for task in tasks)
+
+
+@pytest.mark.parametrize("max_batch_size", [1, 3])
+def test_batch_size_bound(max_batch_size):
+    backend = Backend()
+    batcher = _batcher(backend, max_batch_size=max_batch_size, max_wait_seconds=0.01)
+
+    async def run():
+        return await asyncio.gather(*(batcher.submit(item) for item in "abcdef"))
+
+    assert asyncio.run(run()) == list("ABCDEF")
+    assert all(len(batch) <= max_batch_size for batch in backend.batches)
@@ -0,0 +1,50 @@
+"""Model router: default routes and streaming failover."""
+
+import asyncio
+
+from services.model_router import ModelRouter
+
+
+class FakeGateway:
+    """acompletion() that fails for the models in `broken` (at stream creation) and streams two chunks otherwise."""
+
+    def __init__(self, broken=()):
+        self.broken = set(broken)
+        self.calls = []
+
+    async def acompletion(self, model, messages, **kwargs):
+        self.calls.append(model)
+        if model in self.broken:
+            raise ConnectionError(f"{model} unavailable")
+        if kwargs.get("stream"):
+            return self._stream(model)
+        return f"answer from {model}"
+
+    async def _stream(self, model):
+        yield f"{model}:1"
+        yield f"{model}:2"
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+def test_models_route_only_to_themselves_by_default(monkeypatch):
+    monkeypatch.delenv("LLM_ROUTES", raising=False)
+    gateway = FakeGateway()
+    router = ModelRouter(gateway=gateway)
+    assert asyncio.run(router.acompletion("mistral/mistral-large-2411", [])) == "answer from mistral/mistral-large-2411"
+    assert [endpoint.model for endpoint in router.route_for("mistral/mistral-large-2411")] == ["mistral/mistral-large-2411"]
+
+
+def test_stream_creation_error_fails_over():
+    gateway = FakeGateway(broken={"primary"})
+    router = ModelRouter(gateway=gateway, routes={"primary": [{"model": "primary"}, {"model": "backup"}]})
+
+    async def run():
+        return await _collect(await router.acompletion("primary", [], stream=True))
+
+    assert asyncio.run(run()) == ["backup:1", "backup:2"]
+    assert gateway.calls == ["primary", "backup"]
+    assert router.stats["failovers"] == 1
+    assert router.route_for("primary")[0].stats["failures"] == 1
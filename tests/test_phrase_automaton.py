@@ -0,0 +1,62 @@
+"""Phrase automaton: whole-token matching, typos and real words that are not typos."""
+
+import pytest
+
+from mock_data.objection_handler import detect_objection, objection_automaton
+from mock_data.phrase_automaton import KNOWN_WORDS, PhraseAutomaton
+
+PHRASES = {
+    "rate": ["interest rate seems high", "too expensive"],
+    "score": ["credit score not good"],
+    "repay": ["cant repay", "need money"],
+}
+
+# Real words one edit away from a phrase word, none of them in the old hand-picked list
+REAL_WORDS = ["rely", "scores", "scored", "cared", "extensive", "looming", "payments", "charged", "approve"]
+
+
+def _types(message):
+    return [objection["type"] for objection in detect_objection(message)]
+
+
+def test_whole_tokens_case_and_apostrophes():
+    automaton = PhraseAutomaton(PHRASES)
+    assert automaton.find("I CAN'T repay this") == {"repay": [0]}
+    assert automaton.find("is it too expensively priced") == {}
+
+
+@pytest.mark.parametrize("message, label", [
+    ("the intrest rate seems high", "rate"),
+    ("way too expensve", "rate"),
+    ("credit scroe not good", "score"),
+    ("need mony", "repay"),
+])
+def test_typos_match(message, label):
+    assert label in PhraseAutomaton(PHRASES).find(message)
+
+
+@pytest.mark.parametrize("message", [
+    "credit scores not good",
+    "i cant rely on this",
+    "too extensive",
+    "need honey",
+    "cant reply",
+])
+def test_real_words_are_not_typos(message):
+    assert PhraseAutomaton(PHRASES).find(message) == {}
+
+
+def test_word_list_is_a_real_dictionary():
+    assert len(KNOWN_WORDS) > 10000
+    assert set(REAL_WORDS) <= KNOWN_WORDS
+    assert not {"intrest", "expensve", "scroe", "mony"} & KNOWN_WORDS
+
+
+@pytest.mark.parametrize("word", REAL_WORDS)
+def test_objection_phrases_ignore_real_words(word):
+    assert objection_automaton().canonical(word) in (None, word)
+
+
+def test_objection_typos_still_detected():
+    assert "INTEREST_RATE_HIGH" in _types("the intrest rate seems high")
+    assert _types("credit scores not good") == []
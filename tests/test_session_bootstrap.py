@@ -0,0 +1,60 @@
+"""Session bootstrap: single-flight base state builds and per-session state."""
+
+import asyncio
+
+import pytest
+
+from services import session_bootstrap
+from services.session_bootstrap import bootstrap_session_state, invalidate_base_state
+
+
+@pytest.fixture
+def counted_sources(monkeypatch):
+    """Replace the source lookups with a slow stub that counts calls."""
+    calls = []
+
+    async def fetch(customer_id):
+        calls.append(customer_id)
+        await asyncio.sleep(0.05)
+        return {"crm": 1, "bureau": 1, "offers": None, "campaign": {}}
+
+    invalidate_base_state()
+    monkeypatch.setattr(session_bootstrap, "fetch_customer_sources", fetch)
+    yield calls
+    invalidate_base_state()
+
+
+def test_concurrent_sessions_share_one_build(counted_sources):
+    async def run():
+        return await asyncio.gather(*(bootstrap_session_state("CUST001") for _ in range(10)))
+
+    states = asyncio.run(run())
+    assert counted_sources == ["CUST001"]
+    assert all(state["customer_id"] == "CUST001" for state in states)
+    assert len({id(state) for state in states}) == 10
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_build(counted_sources):
+    async def run():
+        first = asyncio.create_task(bootstrap_session_state("CUST001"))
+        second = asyncio.create_task(bootstrap_session_state("CUST001"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run())["customer_id"] == "CUST001"
+    assert counted_sources == ["CUST001"]
+
+
+def test_session_writes_do_not_reach_the_base(counted_sources):
+    async def run():
+        first = await bootstrap_session_state("CUST001")
+        first["application_status"] = "APPROVED"
+        return await bootstrap_session_state("CUST001")
+
+    assert asyncio.run(run())["application_status"] == "NOT_STARTED"
+
+
+def test_unknown_customer(counted_sources):
+    assert asyncio.run(bootstrap_session_state("NOPE")) is None
+    assert counted_sources == []
@@ -0,0 +1,113 @@
+"""Turn coordinator: per-session serialization and single-flight idempotent retries."""
+
+import asyncio
+
+import pytest
+
+from services.turn_coordinator import IdempotencyConflict, TurnCoordinator
+
+
+class Turns:
+    """Turn factory recording how many turns ran and how many overlapped."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.started = 0
+        self.running = 0
+        self.max_running = 0
+
+    def make(self, result="done", error=None):
+        async def turn():
+            self.started += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            try:
+                await asyncio.sleep(self.delay)
+                if error is not None:
+                    raise error
+                return result
+            finally:
+                self.running -= 1
+        return turn
+
+
+def test_turns_of_one_session_never_overlap():
+    coordinator, turns = TurnCoordinator(), Turns()
+
+    async def run():
+        return await asyncio.gather(*(coordinator.run("s", turns.make(index)) for index in range(5)))
+
+    assert asyncio.run(run()) == [0, 1, 2, 3, 4]
+    assert turns.max_running == 1
+    assert coordinator.snapshot()["active_sessions"] == 0
+
+
+def test_different_sessions_run_concurrently():
+    coordinator, turns = TurnCoordinator(), Turns()
+
+    async def run():
+        await asyncio.gather(*(coordinator.run(f"s{index}", turns.make()) for index in range(3)))
+
+    asyncio.run(run())
+    assert turns.max_running == 3
+
+
+def test_retries_share_the_in_flight_turn_then_the_cached_result():
+    coordinator, turns = TurnCoordinator(), Turns()
+
+    async def run():
+        first = await asyncio.gather(*(coordinator.run("s", turns.make(), "key", "hi") for _ in range(3)))
+        later = await coordinator.run("s", turns.make("other"), "key", "hi")
+        return first, later
+
+    first, later = asyncio.run(run())
+    assert first == ["done"] * 3 and later == "done"
+    assert turns.started == 1
+    assert coordinator.stats["coalesced_inflight"] == 2 and coordinator.stats["served_from_cache"] == 1
+
+
+def test_reused_key_with_a_different_message_conflicts():
+    coordinator, turns = TurnCoordinator(), Turns()
+
+    async def run():
+        owner = asyncio.create_task(coordinator.run("s", turns.make(), "key", "hi"))
+        await asyncio.sleep(0)
+        with pytest.raises(IdempotencyConflict):
+            await coordinator.run("s", turns.make(), "key", "bye")
+        await owner
+        with pytest.raises(IdempotencyConflict):
+            await coordinator.run("s", turns.make(), "key", "bye")
+
+    asyncio.run(run())
+
+
+def test_cancelled_owner_hands_the_turn_to_a_waiting_retry():
+    coordinator, turns = TurnCoordinator(), Turns()
+
+    async def run():
+        owner = asyncio.create_task(coordinator.run("s", turns.make(), "key", "hi"))
+        await asyncio.sleep(0.005)
+        retries = [asyncio.create_task(coordinator.run("s", turns.make(), "key", "hi")) for _ in range(2)]
+        await asyncio.sleep(0)
+        owner.cancel()
+        results = await asyncio.gather(*retries)
+        return owner, results
+
+    owner, results = asyncio.run(run())
+    assert owner.cancelled()
+    assert results == ["done", "done"]
+    assert turns.started == 2
+    assert coordinator.stats["rerun_after_cancel"] == 2
+    assert coordinator.snapshot()["inflight_keys"] == 0
+
+
+def test_failed_turns_are_not_cached():
+    coordinator, turns = TurnCoordinator(), Turns()
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await coordinator.run("s", turns.make(error=RuntimeError("boom")), "key", "hi")
+        return await coordinator.run("s", turns.make(), "key", "hi")
+
+    assert asyncio.run(run()) == "done"
+    assert turns.started == 2
@@ -11,8 +11,8 @@ import os
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from mock_data.objection_handler import detect_objection, get_objection_handling_prompt
-from mock_data.sentiment_analyzer import detect_sentiment, get_sentiment_context_for_agent, track_sentiment_evolution
+from services.event_log import log_event, log_state_keys
+from services.session_state import StateBatch, read_session_state
 
 def display_parallel_processing_status(enabled: bool):
     """Display parallel processing capability status."""
@@ -56,7 +56,7 @@ class Colors:
 
 
 async def update_interaction_history(session_service, app_name, user_id, session_id, entry):
-    """Add an entry to the interaction history in state.
+    """Log an entry to the session's event log (and its interaction_history tail).
 
     Args:
         session_service: The session service instance
@@ -66,107 +66,19 @@ async def update_interaction_history(session_service, app_name, user_id, session
         entry: A dictionary containing the interaction data
     """
     try:
-        session = await session_service.get_session(
-            app_name=app_name, user_id=user_id, session_id=session_id
-        )
-
-        interaction_history = session.state.get("interaction_history", [])
-
         if "timestamp" not in entry:
             entry["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        interaction_history.append(entry)
-
-        # Update the state directly on the session object
-        session.state["interaction_history"] = interaction_history
+        state = await read_session_state(
+            session_service, app_name, user_id, session_id, keys=log_state_keys(entry["action"])
+        )
+        batch = StateBatch()
+        log_event(batch, state, entry)
+        await batch.commit(session_service, app_name, user_id, session_id)
     except Exception as e:
         print(f"Error updating interaction history: {e}")
 
 
-async def add_user_query_to_history(session_service, app_name, user_id, session_id, query):
-    """Add a user query to the interaction history and detect objections & sentiment."""
-    
-    session = await session_service.get_session(
-        app_name=app_name, user_id=user_id, session_id=session_id
-    )
-    
-    # ⚠️ Real-time Objection Detection
-    detected_objections = detect_objection(query)
-    
-    # 💚 AI-Powered Real-time Sentiment Analysis with Context
-    # Get recent conversation history for context-aware sentiment detection
-    conversation_context = ""
-    if "history" in session.state and len(session.state["history"]) > 0:
-        recent_history = session.state["history"][-3:]  # Last 3 messages
-        conversation_context = "\n".join([
-            f"{msg.get('role', 'unknown')}: {msg.get('content', '')[:150]}" 
-            for msg in recent_history
-        ])
-    
-    sentiment_result = detect_sentiment(query, conversation_context)
-    
-    # Store detected objections in session state
-    if detected_objections:
-        # Update objection handling context
-        objection_prompt = get_objection_handling_prompt(detected_objections)
-        session.state["objection_handling_context"] = objection_prompt
-        session.state["detected_objections"] = [
-            {
-                "type": obj["type"],
-                "category": obj["category"],
-                "severity": obj["severity"],
-                "confidence": obj["confidence"],
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            for obj in detected_objections
-        ]
-        
-        print(f"{Colors.YELLOW}⚠️  Objection Detected: {detected_objections[0]['type'].replace('_', ' ').title()} (Confidence: {detected_objections[0]['confidence']:.0%}){Colors.RESET}")
-    
-    # Store sentiment in session state
-    if sentiment_result["status"] != "neutral":
-        sentiment_context = get_sentiment_context_for_agent(sentiment_result)
-        session.state["current_sentiment"] = sentiment_result
-        session.state["sentiment_adaptive_strategy"] = sentiment_context
-        
-        # Add to sentiment history for trend tracking
-        if "sentiment_history" not in session.state:
-            session.state["sentiment_history"] = []
-        
-        session.state["sentiment_history"].append({
-            "query": query,
-            "sentiment_type": sentiment_result["primary_sentiment"],
-            "sentiment_score": sentiment_result["sentiment_score"],
-            "confidence": sentiment_result["confidence"],
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        })
-        
-        # Display AI sentiment detection with reasoning
-        ai_marker = "🤖 " if sentiment_result.get("ai_powered") else ""
-        print(f"{Colors.MAGENTA}💚 {ai_marker}Sentiment: {sentiment_result['emoji']} {sentiment_result['primary_sentiment']} (Confidence: {sentiment_result['confidence']:.0%}){Colors.RESET}")
-        if sentiment_result.get("reasoning"):
-            print(f"{Colors.CYAN}   └─ AI: {sentiment_result['reasoning']}{Colors.RESET}")
-        
-        # Check sentiment trend
-        sentiment_trend = track_sentiment_evolution(session.state.get("sentiment_history", []))
-        if sentiment_trend.get("risk_level") == "CRITICAL":
-            print(f"{Colors.RED}🚨 ALERT: Customer sentiment is critically negative! Consider human escalation.{Colors.RESET}")
-        elif sentiment_trend.get("risk_level") == "HIGH":
-            print(f"{Colors.YELLOW}⚠️  WARNING: Customer sentiment declining. Apply empathy strategies.{Colors.RESET}")
-    
-    await update_interaction_history(
-        session_service,
-        app_name,
-        user_id,
-        session_id,
-        {
-            "action": "user_query",
-            "query": query,
-            "objections_detected": len(detected_objections) if detected_objections else 0
-        },
-    )
-
-
 async def add_agent_response_to_history(
     session_service, app_name, user_id, session_id, agent_name, response
 ):
@@ -189,32 +101,30 @@ async def display_state(
 ):
     """Display the current session state in a formatted way."""
     try:
-        session = await session_service.get_session(
-            app_name=app_name, user_id=user_id, session_id=session_id
-        )
+        state = await read_session_state(session_service, app_name, user_id, session_id)
 
         print(f"\n{Colors.YELLOW}{'-' * 10} {label} {'-' * 10}{Colors.RESET}")
 
         # Customer info
-        customer_name = session.state.get("customer_name", "Unknown")
-        customer_id = session.state.get("customer_id", "Unknown")
+        customer_name = state.get("customer_name", "Unknown")
+        customer_id = state.get("customer_id", "Unknown")
         print(f"{Colors.CYAN}👤 Customer:{Colors.RESET} {customer_name} ({customer_id})")
 
         # Application status
-        app_status = session.state.get("application_status", "NOT_STARTED")
+        app_status = state.get("application_status", "NOT_STARTED")
         status_color = Colors.GREEN if app_status in ["APPROVED", "SANCTION_GENERATED", "SANCTION_ACCEPTED"] else (
             Colors.RED if app_status == "REJECTED" else Colors.YELLOW
         )
         print(f"{Colors.CYAN}📋 Status:{Colors.RESET} {status_color}{app_status}{Colors.RESET}")
 
         # Loan application if exists
-        loan_app = session.state.get("loan_application", {})
+        loan_app = state.get("loan_application", {})
         if loan_app:
             print(f"{Colors.CYAN}💰 Loan Amount:{Colors.RESET} ₹{loan_app.get('loan_amount', 0):,.0f}")
             print(f"{Colors.CYAN}📅 Tenure:{Colors.RESET} {loan_app.get('tenure_months', 0)} months")
 
         # Credit score if available
-        credit_score = session.state.get("credit_score")
+        credit_score = state.get("credit_score")
         if credit_score:
             score_color = Colors.GREEN if credit_score >= 750 else (
                 Colors.YELLOW if credit_score >= 700 else Colors.RED
@@ -222,7 +132,7 @@ async def display_state(
             print(f"{Colors.CYAN}📊 Credit Score:{Colors.RESET} {score_color}{credit_score}{Colors.RESET}")
 
         # KYC status
-        kyc_verified = session.state.get("kyc_verified", False)
+        kyc_verified = state.get("kyc_verified", False)
         kyc_status = "✓ Verified" if kyc_verified else "⏳ Pending"
         print(f"{Colors.CYAN}🔐 KYC:{Colors.RESET} {kyc_status}")
 
@@ -231,6 +141,31 @@ async def display_state(
         print(f"Error displaying state: {e}")
 
 
+def display_enrichment_result(task):
+    """Show a finished enrichment task's objection, sentiment and trend alert (done callback for the CLI)."""
+    if task.cancelled() or task.exception() is not None or task.result() is None:
+        return
+    result = task.result()
+
+    objections = result["objections"]
+    if objections:
+        print(f"{Colors.YELLOW}⚠️  Objection Detected: {objections[0]['type'].replace('_', ' ').title()} "
+              f"(Confidence: {objections[0]['confidence']:.0%}){Colors.RESET}")
+
+    sentiment_result = result["sentiment"]
+    if sentiment_result and sentiment_result["status"] != "neutral":
+        ai_marker = "🤖 " if sentiment_result.get("ai_powered") else ""
+        print(f"{Colors.MAGENTA}💚 {ai_marker}Sentiment: {sentiment_result['emoji']} {sentiment_result['primary_sentiment']} "
+              f"(Confidence: {sentiment_result['confidence']:.0%}){Colors.RESET}")
+        if sentiment_result.get("reasoning"):
+            print(f"{Colors.CYAN}   └─ AI: {sentiment_result['reasoning']}{Colors.RESET}")
+
+    if result["risk_level"] == "CRITICAL":
+        print(f"{Colors.RED}🚨 ALERT: Customer sentiment is critically negative! Consider human escalation.{Colors.RESET}")
+    elif result["risk_level"] == "HIGH":
+        print(f"{Colors.YELLOW}⚠️  WARNING: Customer sentiment declining. Apply empathy strategies.{Colors.RESET}")
+
+
 def display_intelligence_dashboard(initial_state: dict):
     """Display the pre-conversation intelligence dashboard."""
     print(f"\n{Colors.CYAN}{Colors.BOLD}{'='*80}{Colors.RESET}")